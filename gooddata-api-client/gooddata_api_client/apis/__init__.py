@@ -1,83 +1,95 @@
 
 # flake8: noqa
 
-# Import all APIs into this package.
-# If you have many APIs here with many many models used in each API this may
-# raise a `RecursionError`.
-# In order to avoid this, import only the API that you directly need like:
+# All APIs are available in this package. They are imported lazily on the first access,
+# importing all of them up front takes a considerable time. The APIs are imported the same way
+# when imported directly like:
 #
 #   from gooddata_api_client.api.ai_api import AIApi
-#
-# or import this package, but before doing it, use:
-#
-#   import sys
-#   sys.setrecursionlimit(n)
 
-# Import APIs into API package:
-from gooddata_api_client.api.ai_api import AIApi
-from gooddata_api_client.api.api_tokens_api import APITokensApi
-from gooddata_api_client.api.analytics_model_api import AnalyticsModelApi
-from gooddata_api_client.api.appearance_api import AppearanceApi
-from gooddata_api_client.api.attribute_hierarchies_api import AttributeHierarchiesApi
-from gooddata_api_client.api.attributes_api import AttributesApi
-from gooddata_api_client.api.automations_api import AutomationsApi
-from gooddata_api_client.api.available_drivers_api import AvailableDriversApi
-from gooddata_api_client.api.csp_directives_api import CSPDirectivesApi
-from gooddata_api_client.api.computation_api import ComputationApi
-from gooddata_api_client.api.context_filters_api import ContextFiltersApi
-from gooddata_api_client.api.cookie_security_configuration_api import CookieSecurityConfigurationApi
-from gooddata_api_client.api.dashboards_api import DashboardsApi
-from gooddata_api_client.api.data_filters_api import DataFiltersApi
-from gooddata_api_client.api.data_source_declarative_apis_api import DataSourceDeclarativeAPIsApi
-from gooddata_api_client.api.data_source_entity_apis_api import DataSourceEntityAPIsApi
-from gooddata_api_client.api.datasets_api import DatasetsApi
-from gooddata_api_client.api.dependency_graph_api import DependencyGraphApi
-from gooddata_api_client.api.entitlement_api import EntitlementApi
-from gooddata_api_client.api.export_definitions_api import ExportDefinitionsApi
-from gooddata_api_client.api.facts_api import FactsApi
-from gooddata_api_client.api.filter_views_api import FilterViewsApi
-from gooddata_api_client.api.generate_logical_data_model_api import GenerateLogicalDataModelApi
-from gooddata_api_client.api.hierarchy_api import HierarchyApi
-from gooddata_api_client.api.identity_providers_api import IdentityProvidersApi
-from gooddata_api_client.api.invalidate_cache_api import InvalidateCacheApi
-from gooddata_api_client.api.jwks_api import JWKSApi
-from gooddata_api_client.api.ldm_declarative_apis_api import LDMDeclarativeAPIsApi
-from gooddata_api_client.api.llm_endpoints_api import LLMEndpointsApi
-from gooddata_api_client.api.labels_api import LabelsApi
-from gooddata_api_client.api.manage_permissions_api import ManagePermissionsApi
-from gooddata_api_client.api.metadata_sync_api import MetadataSyncApi
-from gooddata_api_client.api.metrics_api import MetricsApi
-from gooddata_api_client.api.notification_channels_api import NotificationChannelsApi
-from gooddata_api_client.api.options_api import OptionsApi
-from gooddata_api_client.api.organization_declarative_apis_api import OrganizationDeclarativeAPIsApi
-from gooddata_api_client.api.organization_entity_apis_api import OrganizationEntityAPIsApi
-from gooddata_api_client.api.permissions_api import PermissionsApi
-from gooddata_api_client.api.plugins_api import PluginsApi
-from gooddata_api_client.api.reporting_settings_api import ReportingSettingsApi
-from gooddata_api_client.api.scanning_api import ScanningApi
-from gooddata_api_client.api.smart_functions_api import SmartFunctionsApi
-from gooddata_api_client.api.tabular_export_api import TabularExportApi
-from gooddata_api_client.api.test_connection_api import TestConnectionApi
-from gooddata_api_client.api.translations_api import TranslationsApi
-from gooddata_api_client.api.unsubscribe_api import UnsubscribeApi
-from gooddata_api_client.api.usage_api import UsageApi
-from gooddata_api_client.api.user_groups_declarative_apis_api import UserGroupsDeclarativeAPIsApi
-from gooddata_api_client.api.user_groups_entity_apis_api import UserGroupsEntityAPIsApi
-from gooddata_api_client.api.user_data_filters_api import UserDataFiltersApi
-from gooddata_api_client.api.user_identifiers_api import UserIdentifiersApi
-from gooddata_api_client.api.user_settings_api import UserSettingsApi
-from gooddata_api_client.api.user_management_api import UserManagementApi
-from gooddata_api_client.api.users_declarative_apis_api import UsersDeclarativeAPIsApi
-from gooddata_api_client.api.users_entity_apis_api import UsersEntityAPIsApi
-from gooddata_api_client.api.visual_export_api import VisualExportApi
-from gooddata_api_client.api.visualization_object_api import VisualizationObjectApi
-from gooddata_api_client.api.workspaces_declarative_apis_api import WorkspacesDeclarativeAPIsApi
-from gooddata_api_client.api.workspaces_entity_apis_api import WorkspacesEntityAPIsApi
-from gooddata_api_client.api.workspaces_settings_api import WorkspacesSettingsApi
-from gooddata_api_client.api.actions_api import ActionsApi
-from gooddata_api_client.api.entities_api import EntitiesApi
-from gooddata_api_client.api.layout_api import LayoutApi
-from gooddata_api_client.api.organization_controller_api import OrganizationControllerApi
-from gooddata_api_client.api.organization_model_controller_api import OrganizationModelControllerApi
-from gooddata_api_client.api.user_model_controller_api import UserModelControllerApi
-from gooddata_api_client.api.workspace_object_controller_api import WorkspaceObjectControllerApi
+import importlib
+
+_APIS = {
+    "AIApi": "ai_api",
+    "APITokensApi": "api_tokens_api",
+    "AnalyticsModelApi": "analytics_model_api",
+    "AppearanceApi": "appearance_api",
+    "AttributeHierarchiesApi": "attribute_hierarchies_api",
+    "AttributesApi": "attributes_api",
+    "AutomationsApi": "automations_api",
+    "AvailableDriversApi": "available_drivers_api",
+    "CSPDirectivesApi": "csp_directives_api",
+    "ComputationApi": "computation_api",
+    "ContextFiltersApi": "context_filters_api",
+    "CookieSecurityConfigurationApi": "cookie_security_configuration_api",
+    "DashboardsApi": "dashboards_api",
+    "DataFiltersApi": "data_filters_api",
+    "DataSourceDeclarativeAPIsApi": "data_source_declarative_apis_api",
+    "DataSourceEntityAPIsApi": "data_source_entity_apis_api",
+    "DatasetsApi": "datasets_api",
+    "DependencyGraphApi": "dependency_graph_api",
+    "EntitlementApi": "entitlement_api",
+    "ExportDefinitionsApi": "export_definitions_api",
+    "FactsApi": "facts_api",
+    "FilterViewsApi": "filter_views_api",
+    "GenerateLogicalDataModelApi": "generate_logical_data_model_api",
+    "HierarchyApi": "hierarchy_api",
+    "IdentityProvidersApi": "identity_providers_api",
+    "InvalidateCacheApi": "invalidate_cache_api",
+    "JWKSApi": "jwks_api",
+    "LDMDeclarativeAPIsApi": "ldm_declarative_apis_api",
+    "LLMEndpointsApi": "llm_endpoints_api",
+    "LabelsApi": "labels_api",
+    "ManagePermissionsApi": "manage_permissions_api",
+    "MetadataSyncApi": "metadata_sync_api",
+    "MetricsApi": "metrics_api",
+    "NotificationChannelsApi": "notification_channels_api",
+    "OptionsApi": "options_api",
+    "OrganizationDeclarativeAPIsApi": "organization_declarative_apis_api",
+    "OrganizationEntityAPIsApi": "organization_entity_apis_api",
+    "PermissionsApi": "permissions_api",
+    "PluginsApi": "plugins_api",
+    "ReportingSettingsApi": "reporting_settings_api",
+    "ScanningApi": "scanning_api",
+    "SmartFunctionsApi": "smart_functions_api",
+    "TabularExportApi": "tabular_export_api",
+    "TestConnectionApi": "test_connection_api",
+    "TranslationsApi": "translations_api",
+    "UnsubscribeApi": "unsubscribe_api",
+    "UsageApi": "usage_api",
+    "UserGroupsDeclarativeAPIsApi": "user_groups_declarative_apis_api",
+    "UserGroupsEntityAPIsApi": "user_groups_entity_apis_api",
+    "UserDataFiltersApi": "user_data_filters_api",
+    "UserIdentifiersApi": "user_identifiers_api",
+    "UserSettingsApi": "user_settings_api",
+    "UserManagementApi": "user_management_api",
+    "UsersDeclarativeAPIsApi": "users_declarative_apis_api",
+    "UsersEntityAPIsApi": "users_entity_apis_api",
+    "VisualExportApi": "visual_export_api",
+    "VisualizationObjectApi": "visualization_object_api",
+    "WorkspacesDeclarativeAPIsApi": "workspaces_declarative_apis_api",
+    "WorkspacesEntityAPIsApi": "workspaces_entity_apis_api",
+    "WorkspacesSettingsApi": "workspaces_settings_api",
+    "ActionsApi": "actions_api",
+    "EntitiesApi": "entities_api",
+    "LayoutApi": "layout_api",
+    "OrganizationControllerApi": "organization_controller_api",
+    "OrganizationModelControllerApi": "organization_model_controller_api",
+    "UserModelControllerApi": "user_model_controller_api",
+    "WorkspaceObjectControllerApi": "workspace_object_controller_api",
+}
+
+__all__ = list(_APIS)
+
+
+def __getattr__(name):
+    module_name = _APIS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"gooddata_api_client.api.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return __all__
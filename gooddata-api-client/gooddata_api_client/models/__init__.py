@@ -1,840 +1,855 @@
 # flake8: noqa
 
-# import all models into this package
-# if you have many models here with many references from one model to another this may
-# raise a RecursionError
-# to avoid this, import only the models that you directly need like:
-# from from gooddata_api_client.model.pet import Pet
-# or import this package, but before doing it, use:
-# import sys
-# sys.setrecursionlimit(n)
+# All models are available in this package. They are imported lazily on the first access,
+# importing all of them up front takes a considerable time. The models are imported the same way
+# when imported directly like:
+# from gooddata_api_client.model.pet import Pet
 
-from gooddata_api_client.model.afm import AFM
-from gooddata_api_client.model.absolute_date_filter import AbsoluteDateFilter
-from gooddata_api_client.model.absolute_date_filter_absolute_date_filter import AbsoluteDateFilterAbsoluteDateFilter
-from gooddata_api_client.model.abstract_measure_value_filter import AbstractMeasureValueFilter
-from gooddata_api_client.model.active_object_identification import ActiveObjectIdentification
-from gooddata_api_client.model.afm_execution import AfmExecution
-from gooddata_api_client.model.afm_execution_response import AfmExecutionResponse
-from gooddata_api_client.model.afm_identifier import AfmIdentifier
-from gooddata_api_client.model.afm_local_identifier import AfmLocalIdentifier
-from gooddata_api_client.model.afm_object_identifier import AfmObjectIdentifier
-from gooddata_api_client.model.afm_object_identifier_attribute import AfmObjectIdentifierAttribute
-from gooddata_api_client.model.afm_object_identifier_attribute_identifier import AfmObjectIdentifierAttributeIdentifier
-from gooddata_api_client.model.afm_object_identifier_core import AfmObjectIdentifierCore
-from gooddata_api_client.model.afm_object_identifier_core_identifier import AfmObjectIdentifierCoreIdentifier
-from gooddata_api_client.model.afm_object_identifier_dataset import AfmObjectIdentifierDataset
-from gooddata_api_client.model.afm_object_identifier_dataset_identifier import AfmObjectIdentifierDatasetIdentifier
-from gooddata_api_client.model.afm_object_identifier_identifier import AfmObjectIdentifierIdentifier
-from gooddata_api_client.model.afm_object_identifier_label import AfmObjectIdentifierLabel
-from gooddata_api_client.model.afm_object_identifier_label_identifier import AfmObjectIdentifierLabelIdentifier
-from gooddata_api_client.model.afm_valid_descendants_query import AfmValidDescendantsQuery
-from gooddata_api_client.model.afm_valid_descendants_response import AfmValidDescendantsResponse
-from gooddata_api_client.model.afm_valid_objects_query import AfmValidObjectsQuery
-from gooddata_api_client.model.afm_valid_objects_response import AfmValidObjectsResponse
-from gooddata_api_client.model.alert_afm import AlertAfm
-from gooddata_api_client.model.alert_condition import AlertCondition
-from gooddata_api_client.model.alert_condition_operand import AlertConditionOperand
-from gooddata_api_client.model.anomaly_detection_request import AnomalyDetectionRequest
-from gooddata_api_client.model.anomaly_detection_result import AnomalyDetectionResult
-from gooddata_api_client.model.api_entitlement import ApiEntitlement
-from gooddata_api_client.model.arithmetic_measure import ArithmeticMeasure
-from gooddata_api_client.model.arithmetic_measure_definition import ArithmeticMeasureDefinition
-from gooddata_api_client.model.arithmetic_measure_definition_arithmetic_measure import ArithmeticMeasureDefinitionArithmeticMeasure
-from gooddata_api_client.model.assignee_identifier import AssigneeIdentifier
-from gooddata_api_client.model.assignee_rule import AssigneeRule
-from gooddata_api_client.model.attribute_execution_result_header import AttributeExecutionResultHeader
-from gooddata_api_client.model.attribute_filter import AttributeFilter
-from gooddata_api_client.model.attribute_filter_elements import AttributeFilterElements
-from gooddata_api_client.model.attribute_format import AttributeFormat
-from gooddata_api_client.model.attribute_header_out import AttributeHeaderOut
-from gooddata_api_client.model.attribute_header_out_attribute_header import AttributeHeaderOutAttributeHeader
-from gooddata_api_client.model.attribute_item import AttributeItem
-from gooddata_api_client.model.attribute_negative_filter import AttributeNegativeFilter
-from gooddata_api_client.model.attribute_negative_filter_all_of import AttributeNegativeFilterAllOf
-from gooddata_api_client.model.attribute_positive_filter import AttributePositiveFilter
-from gooddata_api_client.model.attribute_positive_filter_all_of import AttributePositiveFilterAllOf
-from gooddata_api_client.model.attribute_result_header import AttributeResultHeader
-from gooddata_api_client.model.automation_alert import AutomationAlert
-from gooddata_api_client.model.automation_alert_condition import AutomationAlertCondition
-from gooddata_api_client.model.automation_schedule import AutomationSchedule
-from gooddata_api_client.model.automation_tabular_export import AutomationTabularExport
-from gooddata_api_client.model.automation_visual_export import AutomationVisualExport
-from gooddata_api_client.model.available_assignees import AvailableAssignees
-from gooddata_api_client.model.chat_history_interaction import ChatHistoryInteraction
-from gooddata_api_client.model.chat_history_request import ChatHistoryRequest
-from gooddata_api_client.model.chat_history_result import ChatHistoryResult
-from gooddata_api_client.model.chat_request import ChatRequest
-from gooddata_api_client.model.chat_result import ChatResult
-from gooddata_api_client.model.clustering_request import ClusteringRequest
-from gooddata_api_client.model.clustering_result import ClusteringResult
-from gooddata_api_client.model.column_location import ColumnLocation
-from gooddata_api_client.model.column_override import ColumnOverride
-from gooddata_api_client.model.column_statistic import ColumnStatistic
-from gooddata_api_client.model.column_statistic_warning import ColumnStatisticWarning
-from gooddata_api_client.model.column_statistics_request import ColumnStatisticsRequest
-from gooddata_api_client.model.column_statistics_request_from import ColumnStatisticsRequestFrom
-from gooddata_api_client.model.column_statistics_response import ColumnStatisticsResponse
-from gooddata_api_client.model.column_warning import ColumnWarning
-from gooddata_api_client.model.comparison import Comparison
-from gooddata_api_client.model.comparison_measure_value_filter import ComparisonMeasureValueFilter
-from gooddata_api_client.model.comparison_measure_value_filter_comparison_measure_value_filter import ComparisonMeasureValueFilterComparisonMeasureValueFilter
-from gooddata_api_client.model.comparison_wrapper import ComparisonWrapper
-from gooddata_api_client.model.created_visualization import CreatedVisualization
-from gooddata_api_client.model.created_visualization_filters_inner import CreatedVisualizationFiltersInner
-from gooddata_api_client.model.created_visualizations import CreatedVisualizations
-from gooddata_api_client.model.custom_label import CustomLabel
-from gooddata_api_client.model.custom_metric import CustomMetric
-from gooddata_api_client.model.custom_override import CustomOverride
-from gooddata_api_client.model.dashboard_permissions import DashboardPermissions
-from gooddata_api_client.model.dashboard_permissions_assignment import DashboardPermissionsAssignment
-from gooddata_api_client.model.data_column_locator import DataColumnLocator
-from gooddata_api_client.model.data_column_locators import DataColumnLocators
-from gooddata_api_client.model.data_source_parameter import DataSourceParameter
-from gooddata_api_client.model.data_source_permission_assignment import DataSourcePermissionAssignment
-from gooddata_api_client.model.data_source_schemata import DataSourceSchemata
-from gooddata_api_client.model.data_source_table_identifier import DataSourceTableIdentifier
-from gooddata_api_client.model.dataset_grain import DatasetGrain
-from gooddata_api_client.model.dataset_reference_identifier import DatasetReferenceIdentifier
-from gooddata_api_client.model.dataset_workspace_data_filter_identifier import DatasetWorkspaceDataFilterIdentifier
-from gooddata_api_client.model.date_absolute_filter import DateAbsoluteFilter
-from gooddata_api_client.model.date_absolute_filter_all_of import DateAbsoluteFilterAllOf
-from gooddata_api_client.model.date_filter import DateFilter
-from gooddata_api_client.model.date_relative_filter import DateRelativeFilter
-from gooddata_api_client.model.date_relative_filter_all_of import DateRelativeFilterAllOf
-from gooddata_api_client.model.declarative_analytical_dashboard import DeclarativeAnalyticalDashboard
-from gooddata_api_client.model.declarative_analytical_dashboard_extension import DeclarativeAnalyticalDashboardExtension
-from gooddata_api_client.model.declarative_analytical_dashboard_identifier import DeclarativeAnalyticalDashboardIdentifier
-from gooddata_api_client.model.declarative_analytical_dashboard_permission_assignment import DeclarativeAnalyticalDashboardPermissionAssignment
-from gooddata_api_client.model.declarative_analytical_dashboard_permission_for_assignee import DeclarativeAnalyticalDashboardPermissionForAssignee
-from gooddata_api_client.model.declarative_analytical_dashboard_permission_for_assignee_all_of import DeclarativeAnalyticalDashboardPermissionForAssigneeAllOf
-from gooddata_api_client.model.declarative_analytical_dashboard_permission_for_assignee_rule import DeclarativeAnalyticalDashboardPermissionForAssigneeRule
-from gooddata_api_client.model.declarative_analytical_dashboard_permission_for_assignee_rule_all_of import DeclarativeAnalyticalDashboardPermissionForAssigneeRuleAllOf
-from gooddata_api_client.model.declarative_analytical_dashboard_permissions_inner import DeclarativeAnalyticalDashboardPermissionsInner
-from gooddata_api_client.model.declarative_analytics import DeclarativeAnalytics
-from gooddata_api_client.model.declarative_analytics_layer import DeclarativeAnalyticsLayer
-from gooddata_api_client.model.declarative_attribute import DeclarativeAttribute
-from gooddata_api_client.model.declarative_attribute_hierarchy import DeclarativeAttributeHierarchy
-from gooddata_api_client.model.declarative_automation import DeclarativeAutomation
-from gooddata_api_client.model.declarative_color_palette import DeclarativeColorPalette
-from gooddata_api_client.model.declarative_column import DeclarativeColumn
-from gooddata_api_client.model.declarative_csp_directive import DeclarativeCspDirective
-from gooddata_api_client.model.declarative_custom_application_setting import DeclarativeCustomApplicationSetting
-from gooddata_api_client.model.declarative_dashboard_plugin import DeclarativeDashboardPlugin
-from gooddata_api_client.model.declarative_data_source import DeclarativeDataSource
-from gooddata_api_client.model.declarative_data_source_permission import DeclarativeDataSourcePermission
-from gooddata_api_client.model.declarative_data_source_permissions import DeclarativeDataSourcePermissions
-from gooddata_api_client.model.declarative_data_sources import DeclarativeDataSources
-from gooddata_api_client.model.declarative_dataset import DeclarativeDataset
-from gooddata_api_client.model.declarative_dataset_extension import DeclarativeDatasetExtension
-from gooddata_api_client.model.declarative_dataset_sql import DeclarativeDatasetSql
-from gooddata_api_client.model.declarative_date_dataset import DeclarativeDateDataset
-from gooddata_api_client.model.declarative_export_definition import DeclarativeExportDefinition
-from gooddata_api_client.model.declarative_export_definition_identifier import DeclarativeExportDefinitionIdentifier
-from gooddata_api_client.model.declarative_export_definition_request_payload import DeclarativeExportDefinitionRequestPayload
-from gooddata_api_client.model.declarative_fact import DeclarativeFact
-from gooddata_api_client.model.declarative_filter_context import DeclarativeFilterContext
-from gooddata_api_client.model.declarative_filter_view import DeclarativeFilterView
-from gooddata_api_client.model.declarative_identity_provider import DeclarativeIdentityProvider
-from gooddata_api_client.model.declarative_jwk import DeclarativeJwk
-from gooddata_api_client.model.declarative_jwk_specification import DeclarativeJwkSpecification
-from gooddata_api_client.model.declarative_label import DeclarativeLabel
-from gooddata_api_client.model.declarative_ldm import DeclarativeLdm
-from gooddata_api_client.model.declarative_metric import DeclarativeMetric
-from gooddata_api_client.model.declarative_model import DeclarativeModel
-from gooddata_api_client.model.declarative_notification_channel import DeclarativeNotificationChannel
-from gooddata_api_client.model.declarative_notification_channel_destination import DeclarativeNotificationChannelDestination
-from gooddata_api_client.model.declarative_notification_channel_identifier import DeclarativeNotificationChannelIdentifier
-from gooddata_api_client.model.declarative_notification_channels import DeclarativeNotificationChannels
-from gooddata_api_client.model.declarative_organization import DeclarativeOrganization
-from gooddata_api_client.model.declarative_organization_info import DeclarativeOrganizationInfo
-from gooddata_api_client.model.declarative_organization_permission import DeclarativeOrganizationPermission
-from gooddata_api_client.model.declarative_reference import DeclarativeReference
-from gooddata_api_client.model.declarative_reference_source import DeclarativeReferenceSource
-from gooddata_api_client.model.declarative_rsa_specification import DeclarativeRsaSpecification
-from gooddata_api_client.model.declarative_setting import DeclarativeSetting
-from gooddata_api_client.model.declarative_single_workspace_permission import DeclarativeSingleWorkspacePermission
-from gooddata_api_client.model.declarative_table import DeclarativeTable
-from gooddata_api_client.model.declarative_tables import DeclarativeTables
-from gooddata_api_client.model.declarative_theme import DeclarativeTheme
-from gooddata_api_client.model.declarative_user import DeclarativeUser
-from gooddata_api_client.model.declarative_user_data_filter import DeclarativeUserDataFilter
-from gooddata_api_client.model.declarative_user_data_filters import DeclarativeUserDataFilters
-from gooddata_api_client.model.declarative_user_group import DeclarativeUserGroup
-from gooddata_api_client.model.declarative_user_group_identifier import DeclarativeUserGroupIdentifier
-from gooddata_api_client.model.declarative_user_group_permission import DeclarativeUserGroupPermission
-from gooddata_api_client.model.declarative_user_group_permissions import DeclarativeUserGroupPermissions
-from gooddata_api_client.model.declarative_user_groups import DeclarativeUserGroups
-from gooddata_api_client.model.declarative_user_identifier import DeclarativeUserIdentifier
-from gooddata_api_client.model.declarative_user_permission import DeclarativeUserPermission
-from gooddata_api_client.model.declarative_user_permissions import DeclarativeUserPermissions
-from gooddata_api_client.model.declarative_users import DeclarativeUsers
-from gooddata_api_client.model.declarative_users_user_groups import DeclarativeUsersUserGroups
-from gooddata_api_client.model.declarative_visualization_object import DeclarativeVisualizationObject
-from gooddata_api_client.model.declarative_workspace import DeclarativeWorkspace
-from gooddata_api_client.model.declarative_workspace_data_filter import DeclarativeWorkspaceDataFilter
-from gooddata_api_client.model.declarative_workspace_data_filter_column import DeclarativeWorkspaceDataFilterColumn
-from gooddata_api_client.model.declarative_workspace_data_filter_references import DeclarativeWorkspaceDataFilterReferences
-from gooddata_api_client.model.declarative_workspace_data_filter_setting import DeclarativeWorkspaceDataFilterSetting
-from gooddata_api_client.model.declarative_workspace_data_filters import DeclarativeWorkspaceDataFilters
-from gooddata_api_client.model.declarative_workspace_hierarchy_permission import DeclarativeWorkspaceHierarchyPermission
-from gooddata_api_client.model.declarative_workspace_model import DeclarativeWorkspaceModel
-from gooddata_api_client.model.declarative_workspace_permissions import DeclarativeWorkspacePermissions
-from gooddata_api_client.model.declarative_workspaces import DeclarativeWorkspaces
-from gooddata_api_client.model.default_smtp import DefaultSmtp
-from gooddata_api_client.model.default_smtp_all_of import DefaultSmtpAllOf
-from gooddata_api_client.model.dependent_entities_graph import DependentEntitiesGraph
-from gooddata_api_client.model.dependent_entities_node import DependentEntitiesNode
-from gooddata_api_client.model.dependent_entities_request import DependentEntitiesRequest
-from gooddata_api_client.model.dependent_entities_response import DependentEntitiesResponse
-from gooddata_api_client.model.depends_on import DependsOn
-from gooddata_api_client.model.depends_on_all_of import DependsOnAllOf
-from gooddata_api_client.model.depends_on_date_filter import DependsOnDateFilter
-from gooddata_api_client.model.depends_on_date_filter_all_of import DependsOnDateFilterAllOf
-from gooddata_api_client.model.depends_on_item import DependsOnItem
-from gooddata_api_client.model.dim_attribute import DimAttribute
-from gooddata_api_client.model.dimension import Dimension
-from gooddata_api_client.model.dimension_header import DimensionHeader
-from gooddata_api_client.model.element import Element
-from gooddata_api_client.model.elements_request import ElementsRequest
-from gooddata_api_client.model.elements_request_depends_on_inner import ElementsRequestDependsOnInner
-from gooddata_api_client.model.elements_response import ElementsResponse
-from gooddata_api_client.model.entitlements_request import EntitlementsRequest
-from gooddata_api_client.model.entity_identifier import EntityIdentifier
-from gooddata_api_client.model.execution_links import ExecutionLinks
-from gooddata_api_client.model.execution_response import ExecutionResponse
-from gooddata_api_client.model.execution_result import ExecutionResult
-from gooddata_api_client.model.execution_result_grand_total import ExecutionResultGrandTotal
-from gooddata_api_client.model.execution_result_header import ExecutionResultHeader
-from gooddata_api_client.model.execution_result_paging import ExecutionResultPaging
-from gooddata_api_client.model.execution_settings import ExecutionSettings
-from gooddata_api_client.model.export_request import ExportRequest
-from gooddata_api_client.model.export_response import ExportResponse
-from gooddata_api_client.model.file import File
-from gooddata_api_client.model.filter import Filter
-from gooddata_api_client.model.filter_by import FilterBy
-from gooddata_api_client.model.filter_definition import FilterDefinition
-from gooddata_api_client.model.filter_definition_for_simple_measure import FilterDefinitionForSimpleMeasure
-from gooddata_api_client.model.forecast_request import ForecastRequest
-from gooddata_api_client.model.forecast_result import ForecastResult
-from gooddata_api_client.model.found_objects import FoundObjects
-from gooddata_api_client.model.frequency import Frequency
-from gooddata_api_client.model.frequency_bucket import FrequencyBucket
-from gooddata_api_client.model.frequency_properties import FrequencyProperties
-from gooddata_api_client.model.generate_ldm_request import GenerateLdmRequest
-from gooddata_api_client.model.grain_identifier import GrainIdentifier
-from gooddata_api_client.model.granted_permission import GrantedPermission
-from gooddata_api_client.model.granularities_formatting import GranularitiesFormatting
-from gooddata_api_client.model.header_group import HeaderGroup
-from gooddata_api_client.model.hierarchy_object_identification import HierarchyObjectIdentification
-from gooddata_api_client.model.histogram import Histogram
-from gooddata_api_client.model.histogram_bucket import HistogramBucket
-from gooddata_api_client.model.histogram_properties import HistogramProperties
-from gooddata_api_client.model.identifier_duplications import IdentifierDuplications
-from gooddata_api_client.model.in_platform import InPlatform
-from gooddata_api_client.model.in_platform_all_of import InPlatformAllOf
-from gooddata_api_client.model.inline_filter_definition import InlineFilterDefinition
-from gooddata_api_client.model.inline_filter_definition_inline import InlineFilterDefinitionInline
-from gooddata_api_client.model.inline_measure_definition import InlineMeasureDefinition
-from gooddata_api_client.model.inline_measure_definition_inline import InlineMeasureDefinitionInline
-from gooddata_api_client.model.json_api_analytical_dashboard_in import JsonApiAnalyticalDashboardIn
-from gooddata_api_client.model.json_api_analytical_dashboard_in_attributes import JsonApiAnalyticalDashboardInAttributes
-from gooddata_api_client.model.json_api_analytical_dashboard_in_document import JsonApiAnalyticalDashboardInDocument
-from gooddata_api_client.model.json_api_analytical_dashboard_linkage import JsonApiAnalyticalDashboardLinkage
-from gooddata_api_client.model.json_api_analytical_dashboard_out import JsonApiAnalyticalDashboardOut
-from gooddata_api_client.model.json_api_analytical_dashboard_out_attributes import JsonApiAnalyticalDashboardOutAttributes
-from gooddata_api_client.model.json_api_analytical_dashboard_out_document import JsonApiAnalyticalDashboardOutDocument
-from gooddata_api_client.model.json_api_analytical_dashboard_out_includes import JsonApiAnalyticalDashboardOutIncludes
-from gooddata_api_client.model.json_api_analytical_dashboard_out_list import JsonApiAnalyticalDashboardOutList
-from gooddata_api_client.model.json_api_analytical_dashboard_out_list_meta import JsonApiAnalyticalDashboardOutListMeta
-from gooddata_api_client.model.json_api_analytical_dashboard_out_meta import JsonApiAnalyticalDashboardOutMeta
-from gooddata_api_client.model.json_api_analytical_dashboard_out_meta_access_info import JsonApiAnalyticalDashboardOutMetaAccessInfo
-from gooddata_api_client.model.json_api_analytical_dashboard_out_meta_origin import JsonApiAnalyticalDashboardOutMetaOrigin
-from gooddata_api_client.model.json_api_analytical_dashboard_out_relationships import JsonApiAnalyticalDashboardOutRelationships
-from gooddata_api_client.model.json_api_analytical_dashboard_out_relationships_analytical_dashboards import JsonApiAnalyticalDashboardOutRelationshipsAnalyticalDashboards
-from gooddata_api_client.model.json_api_analytical_dashboard_out_relationships_created_by import JsonApiAnalyticalDashboardOutRelationshipsCreatedBy
-from gooddata_api_client.model.json_api_analytical_dashboard_out_relationships_dashboard_plugins import JsonApiAnalyticalDashboardOutRelationshipsDashboardPlugins
-from gooddata_api_client.model.json_api_analytical_dashboard_out_relationships_datasets import JsonApiAnalyticalDashboardOutRelationshipsDatasets
-from gooddata_api_client.model.json_api_analytical_dashboard_out_relationships_filter_contexts import JsonApiAnalyticalDashboardOutRelationshipsFilterContexts
-from gooddata_api_client.model.json_api_analytical_dashboard_out_relationships_labels import JsonApiAnalyticalDashboardOutRelationshipsLabels
-from gooddata_api_client.model.json_api_analytical_dashboard_out_relationships_metrics import JsonApiAnalyticalDashboardOutRelationshipsMetrics
-from gooddata_api_client.model.json_api_analytical_dashboard_out_relationships_visualization_objects import JsonApiAnalyticalDashboardOutRelationshipsVisualizationObjects
-from gooddata_api_client.model.json_api_analytical_dashboard_out_with_links import JsonApiAnalyticalDashboardOutWithLinks
-from gooddata_api_client.model.json_api_analytical_dashboard_patch import JsonApiAnalyticalDashboardPatch
-from gooddata_api_client.model.json_api_analytical_dashboard_patch_attributes import JsonApiAnalyticalDashboardPatchAttributes
-from gooddata_api_client.model.json_api_analytical_dashboard_patch_document import JsonApiAnalyticalDashboardPatchDocument
-from gooddata_api_client.model.json_api_analytical_dashboard_post_optional_id import JsonApiAnalyticalDashboardPostOptionalId
-from gooddata_api_client.model.json_api_analytical_dashboard_post_optional_id_document import JsonApiAnalyticalDashboardPostOptionalIdDocument
-from gooddata_api_client.model.json_api_analytical_dashboard_to_many_linkage import JsonApiAnalyticalDashboardToManyLinkage
-from gooddata_api_client.model.json_api_analytical_dashboard_to_one_linkage import JsonApiAnalyticalDashboardToOneLinkage
-from gooddata_api_client.model.json_api_api_token_in import JsonApiApiTokenIn
-from gooddata_api_client.model.json_api_api_token_in_document import JsonApiApiTokenInDocument
-from gooddata_api_client.model.json_api_api_token_out import JsonApiApiTokenOut
-from gooddata_api_client.model.json_api_api_token_out_attributes import JsonApiApiTokenOutAttributes
-from gooddata_api_client.model.json_api_api_token_out_document import JsonApiApiTokenOutDocument
-from gooddata_api_client.model.json_api_api_token_out_list import JsonApiApiTokenOutList
-from gooddata_api_client.model.json_api_api_token_out_with_links import JsonApiApiTokenOutWithLinks
-from gooddata_api_client.model.json_api_attribute_hierarchy_in import JsonApiAttributeHierarchyIn
-from gooddata_api_client.model.json_api_attribute_hierarchy_in_attributes import JsonApiAttributeHierarchyInAttributes
-from gooddata_api_client.model.json_api_attribute_hierarchy_in_document import JsonApiAttributeHierarchyInDocument
-from gooddata_api_client.model.json_api_attribute_hierarchy_linkage import JsonApiAttributeHierarchyLinkage
-from gooddata_api_client.model.json_api_attribute_hierarchy_out import JsonApiAttributeHierarchyOut
-from gooddata_api_client.model.json_api_attribute_hierarchy_out_attributes import JsonApiAttributeHierarchyOutAttributes
-from gooddata_api_client.model.json_api_attribute_hierarchy_out_document import JsonApiAttributeHierarchyOutDocument
-from gooddata_api_client.model.json_api_attribute_hierarchy_out_includes import JsonApiAttributeHierarchyOutIncludes
-from gooddata_api_client.model.json_api_attribute_hierarchy_out_list import JsonApiAttributeHierarchyOutList
-from gooddata_api_client.model.json_api_attribute_hierarchy_out_meta import JsonApiAttributeHierarchyOutMeta
-from gooddata_api_client.model.json_api_attribute_hierarchy_out_relationships import JsonApiAttributeHierarchyOutRelationships
-from gooddata_api_client.model.json_api_attribute_hierarchy_out_relationships_attributes import JsonApiAttributeHierarchyOutRelationshipsAttributes
-from gooddata_api_client.model.json_api_attribute_hierarchy_out_with_links import JsonApiAttributeHierarchyOutWithLinks
-from gooddata_api_client.model.json_api_attribute_hierarchy_patch import JsonApiAttributeHierarchyPatch
-from gooddata_api_client.model.json_api_attribute_hierarchy_patch_document import JsonApiAttributeHierarchyPatchDocument
-from gooddata_api_client.model.json_api_attribute_hierarchy_to_many_linkage import JsonApiAttributeHierarchyToManyLinkage
-from gooddata_api_client.model.json_api_attribute_linkage import JsonApiAttributeLinkage
-from gooddata_api_client.model.json_api_attribute_out import JsonApiAttributeOut
-from gooddata_api_client.model.json_api_attribute_out_attributes import JsonApiAttributeOutAttributes
-from gooddata_api_client.model.json_api_attribute_out_document import JsonApiAttributeOutDocument
-from gooddata_api_client.model.json_api_attribute_out_includes import JsonApiAttributeOutIncludes
-from gooddata_api_client.model.json_api_attribute_out_list import JsonApiAttributeOutList
-from gooddata_api_client.model.json_api_attribute_out_relationships import JsonApiAttributeOutRelationships
-from gooddata_api_client.model.json_api_attribute_out_relationships_attribute_hierarchies import JsonApiAttributeOutRelationshipsAttributeHierarchies
-from gooddata_api_client.model.json_api_attribute_out_relationships_dataset import JsonApiAttributeOutRelationshipsDataset
-from gooddata_api_client.model.json_api_attribute_out_relationships_default_view import JsonApiAttributeOutRelationshipsDefaultView
-from gooddata_api_client.model.json_api_attribute_out_with_links import JsonApiAttributeOutWithLinks
-from gooddata_api_client.model.json_api_attribute_to_many_linkage import JsonApiAttributeToManyLinkage
-from gooddata_api_client.model.json_api_attribute_to_one_linkage import JsonApiAttributeToOneLinkage
-from gooddata_api_client.model.json_api_automation_in import JsonApiAutomationIn
-from gooddata_api_client.model.json_api_automation_in_attributes import JsonApiAutomationInAttributes
-from gooddata_api_client.model.json_api_automation_in_attributes_alert import JsonApiAutomationInAttributesAlert
-from gooddata_api_client.model.json_api_automation_in_attributes_schedule import JsonApiAutomationInAttributesSchedule
-from gooddata_api_client.model.json_api_automation_in_attributes_tabular_exports_inner import JsonApiAutomationInAttributesTabularExportsInner
-from gooddata_api_client.model.json_api_automation_in_attributes_visual_exports_inner import JsonApiAutomationInAttributesVisualExportsInner
-from gooddata_api_client.model.json_api_automation_in_document import JsonApiAutomationInDocument
-from gooddata_api_client.model.json_api_automation_in_relationships import JsonApiAutomationInRelationships
-from gooddata_api_client.model.json_api_automation_in_relationships_analytical_dashboard import JsonApiAutomationInRelationshipsAnalyticalDashboard
-from gooddata_api_client.model.json_api_automation_in_relationships_export_definitions import JsonApiAutomationInRelationshipsExportDefinitions
-from gooddata_api_client.model.json_api_automation_in_relationships_notification_channel import JsonApiAutomationInRelationshipsNotificationChannel
-from gooddata_api_client.model.json_api_automation_in_relationships_recipients import JsonApiAutomationInRelationshipsRecipients
-from gooddata_api_client.model.json_api_automation_linkage import JsonApiAutomationLinkage
-from gooddata_api_client.model.json_api_automation_out import JsonApiAutomationOut
-from gooddata_api_client.model.json_api_automation_out_attributes import JsonApiAutomationOutAttributes
-from gooddata_api_client.model.json_api_automation_out_document import JsonApiAutomationOutDocument
-from gooddata_api_client.model.json_api_automation_out_includes import JsonApiAutomationOutIncludes
-from gooddata_api_client.model.json_api_automation_out_list import JsonApiAutomationOutList
-from gooddata_api_client.model.json_api_automation_out_relationships import JsonApiAutomationOutRelationships
-from gooddata_api_client.model.json_api_automation_out_with_links import JsonApiAutomationOutWithLinks
-from gooddata_api_client.model.json_api_automation_patch import JsonApiAutomationPatch
-from gooddata_api_client.model.json_api_automation_patch_document import JsonApiAutomationPatchDocument
-from gooddata_api_client.model.json_api_automation_to_one_linkage import JsonApiAutomationToOneLinkage
-from gooddata_api_client.model.json_api_color_palette_in import JsonApiColorPaletteIn
-from gooddata_api_client.model.json_api_color_palette_in_attributes import JsonApiColorPaletteInAttributes
-from gooddata_api_client.model.json_api_color_palette_in_document import JsonApiColorPaletteInDocument
-from gooddata_api_client.model.json_api_color_palette_out import JsonApiColorPaletteOut
-from gooddata_api_client.model.json_api_color_palette_out_document import JsonApiColorPaletteOutDocument
-from gooddata_api_client.model.json_api_color_palette_out_list import JsonApiColorPaletteOutList
-from gooddata_api_client.model.json_api_color_palette_out_with_links import JsonApiColorPaletteOutWithLinks
-from gooddata_api_client.model.json_api_color_palette_patch import JsonApiColorPalettePatch
-from gooddata_api_client.model.json_api_color_palette_patch_attributes import JsonApiColorPalettePatchAttributes
-from gooddata_api_client.model.json_api_color_palette_patch_document import JsonApiColorPalettePatchDocument
-from gooddata_api_client.model.json_api_cookie_security_configuration_in import JsonApiCookieSecurityConfigurationIn
-from gooddata_api_client.model.json_api_cookie_security_configuration_in_attributes import JsonApiCookieSecurityConfigurationInAttributes
-from gooddata_api_client.model.json_api_cookie_security_configuration_in_document import JsonApiCookieSecurityConfigurationInDocument
-from gooddata_api_client.model.json_api_cookie_security_configuration_out import JsonApiCookieSecurityConfigurationOut
-from gooddata_api_client.model.json_api_cookie_security_configuration_out_document import JsonApiCookieSecurityConfigurationOutDocument
-from gooddata_api_client.model.json_api_cookie_security_configuration_patch import JsonApiCookieSecurityConfigurationPatch
-from gooddata_api_client.model.json_api_cookie_security_configuration_patch_document import JsonApiCookieSecurityConfigurationPatchDocument
-from gooddata_api_client.model.json_api_csp_directive_in import JsonApiCspDirectiveIn
-from gooddata_api_client.model.json_api_csp_directive_in_attributes import JsonApiCspDirectiveInAttributes
-from gooddata_api_client.model.json_api_csp_directive_in_document import JsonApiCspDirectiveInDocument
-from gooddata_api_client.model.json_api_csp_directive_out import JsonApiCspDirectiveOut
-from gooddata_api_client.model.json_api_csp_directive_out_document import JsonApiCspDirectiveOutDocument
-from gooddata_api_client.model.json_api_csp_directive_out_list import JsonApiCspDirectiveOutList
-from gooddata_api_client.model.json_api_csp_directive_out_with_links import JsonApiCspDirectiveOutWithLinks
-from gooddata_api_client.model.json_api_csp_directive_patch import JsonApiCspDirectivePatch
-from gooddata_api_client.model.json_api_csp_directive_patch_attributes import JsonApiCspDirectivePatchAttributes
-from gooddata_api_client.model.json_api_csp_directive_patch_document import JsonApiCspDirectivePatchDocument
-from gooddata_api_client.model.json_api_custom_application_setting_in import JsonApiCustomApplicationSettingIn
-from gooddata_api_client.model.json_api_custom_application_setting_in_attributes import JsonApiCustomApplicationSettingInAttributes
-from gooddata_api_client.model.json_api_custom_application_setting_in_document import JsonApiCustomApplicationSettingInDocument
-from gooddata_api_client.model.json_api_custom_application_setting_out import JsonApiCustomApplicationSettingOut
-from gooddata_api_client.model.json_api_custom_application_setting_out_document import JsonApiCustomApplicationSettingOutDocument
-from gooddata_api_client.model.json_api_custom_application_setting_out_list import JsonApiCustomApplicationSettingOutList
-from gooddata_api_client.model.json_api_custom_application_setting_out_with_links import JsonApiCustomApplicationSettingOutWithLinks
-from gooddata_api_client.model.json_api_custom_application_setting_patch import JsonApiCustomApplicationSettingPatch
-from gooddata_api_client.model.json_api_custom_application_setting_patch_attributes import JsonApiCustomApplicationSettingPatchAttributes
-from gooddata_api_client.model.json_api_custom_application_setting_patch_document import JsonApiCustomApplicationSettingPatchDocument
-from gooddata_api_client.model.json_api_custom_application_setting_post_optional_id import JsonApiCustomApplicationSettingPostOptionalId
-from gooddata_api_client.model.json_api_custom_application_setting_post_optional_id_document import JsonApiCustomApplicationSettingPostOptionalIdDocument
-from gooddata_api_client.model.json_api_dashboard_plugin_in import JsonApiDashboardPluginIn
-from gooddata_api_client.model.json_api_dashboard_plugin_in_attributes import JsonApiDashboardPluginInAttributes
-from gooddata_api_client.model.json_api_dashboard_plugin_in_document import JsonApiDashboardPluginInDocument
-from gooddata_api_client.model.json_api_dashboard_plugin_linkage import JsonApiDashboardPluginLinkage
-from gooddata_api_client.model.json_api_dashboard_plugin_out import JsonApiDashboardPluginOut
-from gooddata_api_client.model.json_api_dashboard_plugin_out_attributes import JsonApiDashboardPluginOutAttributes
-from gooddata_api_client.model.json_api_dashboard_plugin_out_document import JsonApiDashboardPluginOutDocument
-from gooddata_api_client.model.json_api_dashboard_plugin_out_list import JsonApiDashboardPluginOutList
-from gooddata_api_client.model.json_api_dashboard_plugin_out_relationships import JsonApiDashboardPluginOutRelationships
-from gooddata_api_client.model.json_api_dashboard_plugin_out_with_links import JsonApiDashboardPluginOutWithLinks
-from gooddata_api_client.model.json_api_dashboard_plugin_patch import JsonApiDashboardPluginPatch
-from gooddata_api_client.model.json_api_dashboard_plugin_patch_document import JsonApiDashboardPluginPatchDocument
-from gooddata_api_client.model.json_api_dashboard_plugin_post_optional_id import JsonApiDashboardPluginPostOptionalId
-from gooddata_api_client.model.json_api_dashboard_plugin_post_optional_id_document import JsonApiDashboardPluginPostOptionalIdDocument
-from gooddata_api_client.model.json_api_dashboard_plugin_to_many_linkage import JsonApiDashboardPluginToManyLinkage
-from gooddata_api_client.model.json_api_data_source_identifier_out import JsonApiDataSourceIdentifierOut
-from gooddata_api_client.model.json_api_data_source_identifier_out_attributes import JsonApiDataSourceIdentifierOutAttributes
-from gooddata_api_client.model.json_api_data_source_identifier_out_document import JsonApiDataSourceIdentifierOutDocument
-from gooddata_api_client.model.json_api_data_source_identifier_out_list import JsonApiDataSourceIdentifierOutList
-from gooddata_api_client.model.json_api_data_source_identifier_out_meta import JsonApiDataSourceIdentifierOutMeta
-from gooddata_api_client.model.json_api_data_source_identifier_out_with_links import JsonApiDataSourceIdentifierOutWithLinks
-from gooddata_api_client.model.json_api_data_source_in import JsonApiDataSourceIn
-from gooddata_api_client.model.json_api_data_source_in_attributes import JsonApiDataSourceInAttributes
-from gooddata_api_client.model.json_api_data_source_in_attributes_parameters_inner import JsonApiDataSourceInAttributesParametersInner
-from gooddata_api_client.model.json_api_data_source_in_document import JsonApiDataSourceInDocument
-from gooddata_api_client.model.json_api_data_source_out import JsonApiDataSourceOut
-from gooddata_api_client.model.json_api_data_source_out_attributes import JsonApiDataSourceOutAttributes
-from gooddata_api_client.model.json_api_data_source_out_document import JsonApiDataSourceOutDocument
-from gooddata_api_client.model.json_api_data_source_out_list import JsonApiDataSourceOutList
-from gooddata_api_client.model.json_api_data_source_out_with_links import JsonApiDataSourceOutWithLinks
-from gooddata_api_client.model.json_api_data_source_patch import JsonApiDataSourcePatch
-from gooddata_api_client.model.json_api_data_source_patch_attributes import JsonApiDataSourcePatchAttributes
-from gooddata_api_client.model.json_api_data_source_patch_document import JsonApiDataSourcePatchDocument
-from gooddata_api_client.model.json_api_dataset_linkage import JsonApiDatasetLinkage
-from gooddata_api_client.model.json_api_dataset_out import JsonApiDatasetOut
-from gooddata_api_client.model.json_api_dataset_out_attributes import JsonApiDatasetOutAttributes
-from gooddata_api_client.model.json_api_dataset_out_attributes_grain_inner import JsonApiDatasetOutAttributesGrainInner
-from gooddata_api_client.model.json_api_dataset_out_attributes_reference_properties_inner import JsonApiDatasetOutAttributesReferencePropertiesInner
-from gooddata_api_client.model.json_api_dataset_out_attributes_sql import JsonApiDatasetOutAttributesSql
-from gooddata_api_client.model.json_api_dataset_out_attributes_workspace_data_filter_columns_inner import JsonApiDatasetOutAttributesWorkspaceDataFilterColumnsInner
-from gooddata_api_client.model.json_api_dataset_out_attributes_workspace_data_filter_references_inner import JsonApiDatasetOutAttributesWorkspaceDataFilterReferencesInner
-from gooddata_api_client.model.json_api_dataset_out_document import JsonApiDatasetOutDocument
-from gooddata_api_client.model.json_api_dataset_out_includes import JsonApiDatasetOutIncludes
-from gooddata_api_client.model.json_api_dataset_out_list import JsonApiDatasetOutList
-from gooddata_api_client.model.json_api_dataset_out_relationships import JsonApiDatasetOutRelationships
-from gooddata_api_client.model.json_api_dataset_out_relationships_facts import JsonApiDatasetOutRelationshipsFacts
-from gooddata_api_client.model.json_api_dataset_out_relationships_workspace_data_filters import JsonApiDatasetOutRelationshipsWorkspaceDataFilters
-from gooddata_api_client.model.json_api_dataset_out_with_links import JsonApiDatasetOutWithLinks
-from gooddata_api_client.model.json_api_dataset_to_many_linkage import JsonApiDatasetToManyLinkage
-from gooddata_api_client.model.json_api_dataset_to_one_linkage import JsonApiDatasetToOneLinkage
-from gooddata_api_client.model.json_api_entitlement_out import JsonApiEntitlementOut
-from gooddata_api_client.model.json_api_entitlement_out_attributes import JsonApiEntitlementOutAttributes
-from gooddata_api_client.model.json_api_entitlement_out_document import JsonApiEntitlementOutDocument
-from gooddata_api_client.model.json_api_entitlement_out_list import JsonApiEntitlementOutList
-from gooddata_api_client.model.json_api_entitlement_out_with_links import JsonApiEntitlementOutWithLinks
-from gooddata_api_client.model.json_api_export_definition_in import JsonApiExportDefinitionIn
-from gooddata_api_client.model.json_api_export_definition_in_attributes import JsonApiExportDefinitionInAttributes
-from gooddata_api_client.model.json_api_export_definition_in_attributes_request_payload import JsonApiExportDefinitionInAttributesRequestPayload
-from gooddata_api_client.model.json_api_export_definition_in_document import JsonApiExportDefinitionInDocument
-from gooddata_api_client.model.json_api_export_definition_in_relationships import JsonApiExportDefinitionInRelationships
-from gooddata_api_client.model.json_api_export_definition_in_relationships_visualization_object import JsonApiExportDefinitionInRelationshipsVisualizationObject
-from gooddata_api_client.model.json_api_export_definition_linkage import JsonApiExportDefinitionLinkage
-from gooddata_api_client.model.json_api_export_definition_out import JsonApiExportDefinitionOut
-from gooddata_api_client.model.json_api_export_definition_out_attributes import JsonApiExportDefinitionOutAttributes
-from gooddata_api_client.model.json_api_export_definition_out_document import JsonApiExportDefinitionOutDocument
-from gooddata_api_client.model.json_api_export_definition_out_includes import JsonApiExportDefinitionOutIncludes
-from gooddata_api_client.model.json_api_export_definition_out_list import JsonApiExportDefinitionOutList
-from gooddata_api_client.model.json_api_export_definition_out_relationships import JsonApiExportDefinitionOutRelationships
-from gooddata_api_client.model.json_api_export_definition_out_relationships_automation import JsonApiExportDefinitionOutRelationshipsAutomation
-from gooddata_api_client.model.json_api_export_definition_out_with_links import JsonApiExportDefinitionOutWithLinks
-from gooddata_api_client.model.json_api_export_definition_patch import JsonApiExportDefinitionPatch
-from gooddata_api_client.model.json_api_export_definition_patch_document import JsonApiExportDefinitionPatchDocument
-from gooddata_api_client.model.json_api_export_definition_post_optional_id import JsonApiExportDefinitionPostOptionalId
-from gooddata_api_client.model.json_api_export_definition_post_optional_id_document import JsonApiExportDefinitionPostOptionalIdDocument
-from gooddata_api_client.model.json_api_export_definition_to_many_linkage import JsonApiExportDefinitionToManyLinkage
-from gooddata_api_client.model.json_api_fact_linkage import JsonApiFactLinkage
-from gooddata_api_client.model.json_api_fact_out import JsonApiFactOut
-from gooddata_api_client.model.json_api_fact_out_attributes import JsonApiFactOutAttributes
-from gooddata_api_client.model.json_api_fact_out_document import JsonApiFactOutDocument
-from gooddata_api_client.model.json_api_fact_out_list import JsonApiFactOutList
-from gooddata_api_client.model.json_api_fact_out_relationships import JsonApiFactOutRelationships
-from gooddata_api_client.model.json_api_fact_out_with_links import JsonApiFactOutWithLinks
-from gooddata_api_client.model.json_api_fact_to_many_linkage import JsonApiFactToManyLinkage
-from gooddata_api_client.model.json_api_filter_context_in import JsonApiFilterContextIn
-from gooddata_api_client.model.json_api_filter_context_in_document import JsonApiFilterContextInDocument
-from gooddata_api_client.model.json_api_filter_context_linkage import JsonApiFilterContextLinkage
-from gooddata_api_client.model.json_api_filter_context_out import JsonApiFilterContextOut
-from gooddata_api_client.model.json_api_filter_context_out_document import JsonApiFilterContextOutDocument
-from gooddata_api_client.model.json_api_filter_context_out_includes import JsonApiFilterContextOutIncludes
-from gooddata_api_client.model.json_api_filter_context_out_list import JsonApiFilterContextOutList
-from gooddata_api_client.model.json_api_filter_context_out_relationships import JsonApiFilterContextOutRelationships
-from gooddata_api_client.model.json_api_filter_context_out_with_links import JsonApiFilterContextOutWithLinks
-from gooddata_api_client.model.json_api_filter_context_patch import JsonApiFilterContextPatch
-from gooddata_api_client.model.json_api_filter_context_patch_document import JsonApiFilterContextPatchDocument
-from gooddata_api_client.model.json_api_filter_context_post_optional_id import JsonApiFilterContextPostOptionalId
-from gooddata_api_client.model.json_api_filter_context_post_optional_id_document import JsonApiFilterContextPostOptionalIdDocument
-from gooddata_api_client.model.json_api_filter_context_to_many_linkage import JsonApiFilterContextToManyLinkage
-from gooddata_api_client.model.json_api_filter_view_in import JsonApiFilterViewIn
-from gooddata_api_client.model.json_api_filter_view_in_attributes import JsonApiFilterViewInAttributes
-from gooddata_api_client.model.json_api_filter_view_in_document import JsonApiFilterViewInDocument
-from gooddata_api_client.model.json_api_filter_view_in_relationships import JsonApiFilterViewInRelationships
-from gooddata_api_client.model.json_api_filter_view_in_relationships_user import JsonApiFilterViewInRelationshipsUser
-from gooddata_api_client.model.json_api_filter_view_out import JsonApiFilterViewOut
-from gooddata_api_client.model.json_api_filter_view_out_document import JsonApiFilterViewOutDocument
-from gooddata_api_client.model.json_api_filter_view_out_includes import JsonApiFilterViewOutIncludes
-from gooddata_api_client.model.json_api_filter_view_out_list import JsonApiFilterViewOutList
-from gooddata_api_client.model.json_api_filter_view_out_with_links import JsonApiFilterViewOutWithLinks
-from gooddata_api_client.model.json_api_filter_view_patch import JsonApiFilterViewPatch
-from gooddata_api_client.model.json_api_filter_view_patch_attributes import JsonApiFilterViewPatchAttributes
-from gooddata_api_client.model.json_api_filter_view_patch_document import JsonApiFilterViewPatchDocument
-from gooddata_api_client.model.json_api_identity_provider_in import JsonApiIdentityProviderIn
-from gooddata_api_client.model.json_api_identity_provider_in_attributes import JsonApiIdentityProviderInAttributes
-from gooddata_api_client.model.json_api_identity_provider_in_document import JsonApiIdentityProviderInDocument
-from gooddata_api_client.model.json_api_identity_provider_out import JsonApiIdentityProviderOut
-from gooddata_api_client.model.json_api_identity_provider_out_attributes import JsonApiIdentityProviderOutAttributes
-from gooddata_api_client.model.json_api_identity_provider_out_document import JsonApiIdentityProviderOutDocument
-from gooddata_api_client.model.json_api_identity_provider_out_list import JsonApiIdentityProviderOutList
-from gooddata_api_client.model.json_api_identity_provider_out_with_links import JsonApiIdentityProviderOutWithLinks
-from gooddata_api_client.model.json_api_identity_provider_patch import JsonApiIdentityProviderPatch
-from gooddata_api_client.model.json_api_identity_provider_patch_document import JsonApiIdentityProviderPatchDocument
-from gooddata_api_client.model.json_api_jwk_in import JsonApiJwkIn
-from gooddata_api_client.model.json_api_jwk_in_attributes import JsonApiJwkInAttributes
-from gooddata_api_client.model.json_api_jwk_in_attributes_content import JsonApiJwkInAttributesContent
-from gooddata_api_client.model.json_api_jwk_in_document import JsonApiJwkInDocument
-from gooddata_api_client.model.json_api_jwk_out import JsonApiJwkOut
-from gooddata_api_client.model.json_api_jwk_out_document import JsonApiJwkOutDocument
-from gooddata_api_client.model.json_api_jwk_out_list import JsonApiJwkOutList
-from gooddata_api_client.model.json_api_jwk_out_with_links import JsonApiJwkOutWithLinks
-from gooddata_api_client.model.json_api_jwk_patch import JsonApiJwkPatch
-from gooddata_api_client.model.json_api_jwk_patch_document import JsonApiJwkPatchDocument
-from gooddata_api_client.model.json_api_label_linkage import JsonApiLabelLinkage
-from gooddata_api_client.model.json_api_label_out import JsonApiLabelOut
-from gooddata_api_client.model.json_api_label_out_attributes import JsonApiLabelOutAttributes
-from gooddata_api_client.model.json_api_label_out_document import JsonApiLabelOutDocument
-from gooddata_api_client.model.json_api_label_out_list import JsonApiLabelOutList
-from gooddata_api_client.model.json_api_label_out_relationships import JsonApiLabelOutRelationships
-from gooddata_api_client.model.json_api_label_out_relationships_attribute import JsonApiLabelOutRelationshipsAttribute
-from gooddata_api_client.model.json_api_label_out_with_links import JsonApiLabelOutWithLinks
-from gooddata_api_client.model.json_api_label_to_many_linkage import JsonApiLabelToManyLinkage
-from gooddata_api_client.model.json_api_label_to_one_linkage import JsonApiLabelToOneLinkage
-from gooddata_api_client.model.json_api_llm_endpoint_in import JsonApiLlmEndpointIn
-from gooddata_api_client.model.json_api_llm_endpoint_in_attributes import JsonApiLlmEndpointInAttributes
-from gooddata_api_client.model.json_api_llm_endpoint_in_document import JsonApiLlmEndpointInDocument
-from gooddata_api_client.model.json_api_llm_endpoint_out import JsonApiLlmEndpointOut
-from gooddata_api_client.model.json_api_llm_endpoint_out_attributes import JsonApiLlmEndpointOutAttributes
-from gooddata_api_client.model.json_api_llm_endpoint_out_document import JsonApiLlmEndpointOutDocument
-from gooddata_api_client.model.json_api_llm_endpoint_out_list import JsonApiLlmEndpointOutList
-from gooddata_api_client.model.json_api_llm_endpoint_out_with_links import JsonApiLlmEndpointOutWithLinks
-from gooddata_api_client.model.json_api_llm_endpoint_patch import JsonApiLlmEndpointPatch
-from gooddata_api_client.model.json_api_llm_endpoint_patch_attributes import JsonApiLlmEndpointPatchAttributes
-from gooddata_api_client.model.json_api_llm_endpoint_patch_document import JsonApiLlmEndpointPatchDocument
-from gooddata_api_client.model.json_api_metric_in import JsonApiMetricIn
-from gooddata_api_client.model.json_api_metric_in_attributes import JsonApiMetricInAttributes
-from gooddata_api_client.model.json_api_metric_in_attributes_content import JsonApiMetricInAttributesContent
-from gooddata_api_client.model.json_api_metric_in_document import JsonApiMetricInDocument
-from gooddata_api_client.model.json_api_metric_linkage import JsonApiMetricLinkage
-from gooddata_api_client.model.json_api_metric_out import JsonApiMetricOut
-from gooddata_api_client.model.json_api_metric_out_attributes import JsonApiMetricOutAttributes
-from gooddata_api_client.model.json_api_metric_out_document import JsonApiMetricOutDocument
-from gooddata_api_client.model.json_api_metric_out_includes import JsonApiMetricOutIncludes
-from gooddata_api_client.model.json_api_metric_out_list import JsonApiMetricOutList
-from gooddata_api_client.model.json_api_metric_out_relationships import JsonApiMetricOutRelationships
-from gooddata_api_client.model.json_api_metric_out_with_links import JsonApiMetricOutWithLinks
-from gooddata_api_client.model.json_api_metric_patch import JsonApiMetricPatch
-from gooddata_api_client.model.json_api_metric_patch_attributes import JsonApiMetricPatchAttributes
-from gooddata_api_client.model.json_api_metric_patch_document import JsonApiMetricPatchDocument
-from gooddata_api_client.model.json_api_metric_post_optional_id import JsonApiMetricPostOptionalId
-from gooddata_api_client.model.json_api_metric_post_optional_id_document import JsonApiMetricPostOptionalIdDocument
-from gooddata_api_client.model.json_api_metric_to_many_linkage import JsonApiMetricToManyLinkage
-from gooddata_api_client.model.json_api_notification_channel_in import JsonApiNotificationChannelIn
-from gooddata_api_client.model.json_api_notification_channel_in_attributes import JsonApiNotificationChannelInAttributes
-from gooddata_api_client.model.json_api_notification_channel_in_attributes_destination import JsonApiNotificationChannelInAttributesDestination
-from gooddata_api_client.model.json_api_notification_channel_in_document import JsonApiNotificationChannelInDocument
-from gooddata_api_client.model.json_api_notification_channel_linkage import JsonApiNotificationChannelLinkage
-from gooddata_api_client.model.json_api_notification_channel_out import JsonApiNotificationChannelOut
-from gooddata_api_client.model.json_api_notification_channel_out_document import JsonApiNotificationChannelOutDocument
-from gooddata_api_client.model.json_api_notification_channel_out_list import JsonApiNotificationChannelOutList
-from gooddata_api_client.model.json_api_notification_channel_out_with_links import JsonApiNotificationChannelOutWithLinks
-from gooddata_api_client.model.json_api_notification_channel_patch import JsonApiNotificationChannelPatch
-from gooddata_api_client.model.json_api_notification_channel_patch_document import JsonApiNotificationChannelPatchDocument
-from gooddata_api_client.model.json_api_notification_channel_post_optional_id import JsonApiNotificationChannelPostOptionalId
-from gooddata_api_client.model.json_api_notification_channel_post_optional_id_document import JsonApiNotificationChannelPostOptionalIdDocument
-from gooddata_api_client.model.json_api_notification_channel_to_one_linkage import JsonApiNotificationChannelToOneLinkage
-from gooddata_api_client.model.json_api_organization_in import JsonApiOrganizationIn
-from gooddata_api_client.model.json_api_organization_in_attributes import JsonApiOrganizationInAttributes
-from gooddata_api_client.model.json_api_organization_in_document import JsonApiOrganizationInDocument
-from gooddata_api_client.model.json_api_organization_out import JsonApiOrganizationOut
-from gooddata_api_client.model.json_api_organization_out_attributes import JsonApiOrganizationOutAttributes
-from gooddata_api_client.model.json_api_organization_out_attributes_cache_settings import JsonApiOrganizationOutAttributesCacheSettings
-from gooddata_api_client.model.json_api_organization_out_document import JsonApiOrganizationOutDocument
-from gooddata_api_client.model.json_api_organization_out_includes import JsonApiOrganizationOutIncludes
-from gooddata_api_client.model.json_api_organization_out_meta import JsonApiOrganizationOutMeta
-from gooddata_api_client.model.json_api_organization_out_relationships import JsonApiOrganizationOutRelationships
-from gooddata_api_client.model.json_api_organization_out_relationships_bootstrap_user_group import JsonApiOrganizationOutRelationshipsBootstrapUserGroup
-from gooddata_api_client.model.json_api_organization_patch import JsonApiOrganizationPatch
-from gooddata_api_client.model.json_api_organization_patch_document import JsonApiOrganizationPatchDocument
-from gooddata_api_client.model.json_api_organization_setting_in import JsonApiOrganizationSettingIn
-from gooddata_api_client.model.json_api_organization_setting_in_attributes import JsonApiOrganizationSettingInAttributes
-from gooddata_api_client.model.json_api_organization_setting_in_document import JsonApiOrganizationSettingInDocument
-from gooddata_api_client.model.json_api_organization_setting_out import JsonApiOrganizationSettingOut
-from gooddata_api_client.model.json_api_organization_setting_out_document import JsonApiOrganizationSettingOutDocument
-from gooddata_api_client.model.json_api_organization_setting_out_list import JsonApiOrganizationSettingOutList
-from gooddata_api_client.model.json_api_organization_setting_out_with_links import JsonApiOrganizationSettingOutWithLinks
-from gooddata_api_client.model.json_api_organization_setting_patch import JsonApiOrganizationSettingPatch
-from gooddata_api_client.model.json_api_organization_setting_patch_document import JsonApiOrganizationSettingPatchDocument
-from gooddata_api_client.model.json_api_theme_in import JsonApiThemeIn
-from gooddata_api_client.model.json_api_theme_in_document import JsonApiThemeInDocument
-from gooddata_api_client.model.json_api_theme_out import JsonApiThemeOut
-from gooddata_api_client.model.json_api_theme_out_document import JsonApiThemeOutDocument
-from gooddata_api_client.model.json_api_theme_out_list import JsonApiThemeOutList
-from gooddata_api_client.model.json_api_theme_out_with_links import JsonApiThemeOutWithLinks
-from gooddata_api_client.model.json_api_theme_patch import JsonApiThemePatch
-from gooddata_api_client.model.json_api_theme_patch_document import JsonApiThemePatchDocument
-from gooddata_api_client.model.json_api_user_data_filter_in import JsonApiUserDataFilterIn
-from gooddata_api_client.model.json_api_user_data_filter_in_attributes import JsonApiUserDataFilterInAttributes
-from gooddata_api_client.model.json_api_user_data_filter_in_document import JsonApiUserDataFilterInDocument
-from gooddata_api_client.model.json_api_user_data_filter_in_relationships import JsonApiUserDataFilterInRelationships
-from gooddata_api_client.model.json_api_user_data_filter_out import JsonApiUserDataFilterOut
-from gooddata_api_client.model.json_api_user_data_filter_out_document import JsonApiUserDataFilterOutDocument
-from gooddata_api_client.model.json_api_user_data_filter_out_includes import JsonApiUserDataFilterOutIncludes
-from gooddata_api_client.model.json_api_user_data_filter_out_list import JsonApiUserDataFilterOutList
-from gooddata_api_client.model.json_api_user_data_filter_out_relationships import JsonApiUserDataFilterOutRelationships
-from gooddata_api_client.model.json_api_user_data_filter_out_with_links import JsonApiUserDataFilterOutWithLinks
-from gooddata_api_client.model.json_api_user_data_filter_patch import JsonApiUserDataFilterPatch
-from gooddata_api_client.model.json_api_user_data_filter_patch_attributes import JsonApiUserDataFilterPatchAttributes
-from gooddata_api_client.model.json_api_user_data_filter_patch_document import JsonApiUserDataFilterPatchDocument
-from gooddata_api_client.model.json_api_user_data_filter_post_optional_id import JsonApiUserDataFilterPostOptionalId
-from gooddata_api_client.model.json_api_user_data_filter_post_optional_id_document import JsonApiUserDataFilterPostOptionalIdDocument
-from gooddata_api_client.model.json_api_user_group_in import JsonApiUserGroupIn
-from gooddata_api_client.model.json_api_user_group_in_attributes import JsonApiUserGroupInAttributes
-from gooddata_api_client.model.json_api_user_group_in_document import JsonApiUserGroupInDocument
-from gooddata_api_client.model.json_api_user_group_in_relationships import JsonApiUserGroupInRelationships
-from gooddata_api_client.model.json_api_user_group_in_relationships_parents import JsonApiUserGroupInRelationshipsParents
-from gooddata_api_client.model.json_api_user_group_linkage import JsonApiUserGroupLinkage
-from gooddata_api_client.model.json_api_user_group_out import JsonApiUserGroupOut
-from gooddata_api_client.model.json_api_user_group_out_document import JsonApiUserGroupOutDocument
-from gooddata_api_client.model.json_api_user_group_out_list import JsonApiUserGroupOutList
-from gooddata_api_client.model.json_api_user_group_out_with_links import JsonApiUserGroupOutWithLinks
-from gooddata_api_client.model.json_api_user_group_patch import JsonApiUserGroupPatch
-from gooddata_api_client.model.json_api_user_group_patch_document import JsonApiUserGroupPatchDocument
-from gooddata_api_client.model.json_api_user_group_to_many_linkage import JsonApiUserGroupToManyLinkage
-from gooddata_api_client.model.json_api_user_group_to_one_linkage import JsonApiUserGroupToOneLinkage
-from gooddata_api_client.model.json_api_user_identifier_linkage import JsonApiUserIdentifierLinkage
-from gooddata_api_client.model.json_api_user_identifier_out import JsonApiUserIdentifierOut
-from gooddata_api_client.model.json_api_user_identifier_out_attributes import JsonApiUserIdentifierOutAttributes
-from gooddata_api_client.model.json_api_user_identifier_out_document import JsonApiUserIdentifierOutDocument
-from gooddata_api_client.model.json_api_user_identifier_out_list import JsonApiUserIdentifierOutList
-from gooddata_api_client.model.json_api_user_identifier_out_with_links import JsonApiUserIdentifierOutWithLinks
-from gooddata_api_client.model.json_api_user_identifier_to_one_linkage import JsonApiUserIdentifierToOneLinkage
-from gooddata_api_client.model.json_api_user_in import JsonApiUserIn
-from gooddata_api_client.model.json_api_user_in_attributes import JsonApiUserInAttributes
-from gooddata_api_client.model.json_api_user_in_document import JsonApiUserInDocument
-from gooddata_api_client.model.json_api_user_in_relationships import JsonApiUserInRelationships
-from gooddata_api_client.model.json_api_user_linkage import JsonApiUserLinkage
-from gooddata_api_client.model.json_api_user_out import JsonApiUserOut
-from gooddata_api_client.model.json_api_user_out_document import JsonApiUserOutDocument
-from gooddata_api_client.model.json_api_user_out_list import JsonApiUserOutList
-from gooddata_api_client.model.json_api_user_out_with_links import JsonApiUserOutWithLinks
-from gooddata_api_client.model.json_api_user_patch import JsonApiUserPatch
-from gooddata_api_client.model.json_api_user_patch_document import JsonApiUserPatchDocument
-from gooddata_api_client.model.json_api_user_setting_in import JsonApiUserSettingIn
-from gooddata_api_client.model.json_api_user_setting_in_document import JsonApiUserSettingInDocument
-from gooddata_api_client.model.json_api_user_setting_out import JsonApiUserSettingOut
-from gooddata_api_client.model.json_api_user_setting_out_document import JsonApiUserSettingOutDocument
-from gooddata_api_client.model.json_api_user_setting_out_list import JsonApiUserSettingOutList
-from gooddata_api_client.model.json_api_user_setting_out_with_links import JsonApiUserSettingOutWithLinks
-from gooddata_api_client.model.json_api_user_to_many_linkage import JsonApiUserToManyLinkage
-from gooddata_api_client.model.json_api_user_to_one_linkage import JsonApiUserToOneLinkage
-from gooddata_api_client.model.json_api_visualization_object_in import JsonApiVisualizationObjectIn
-from gooddata_api_client.model.json_api_visualization_object_in_document import JsonApiVisualizationObjectInDocument
-from gooddata_api_client.model.json_api_visualization_object_linkage import JsonApiVisualizationObjectLinkage
-from gooddata_api_client.model.json_api_visualization_object_out import JsonApiVisualizationObjectOut
-from gooddata_api_client.model.json_api_visualization_object_out_document import JsonApiVisualizationObjectOutDocument
-from gooddata_api_client.model.json_api_visualization_object_out_list import JsonApiVisualizationObjectOutList
-from gooddata_api_client.model.json_api_visualization_object_out_with_links import JsonApiVisualizationObjectOutWithLinks
-from gooddata_api_client.model.json_api_visualization_object_patch import JsonApiVisualizationObjectPatch
-from gooddata_api_client.model.json_api_visualization_object_patch_document import JsonApiVisualizationObjectPatchDocument
-from gooddata_api_client.model.json_api_visualization_object_post_optional_id import JsonApiVisualizationObjectPostOptionalId
-from gooddata_api_client.model.json_api_visualization_object_post_optional_id_document import JsonApiVisualizationObjectPostOptionalIdDocument
-from gooddata_api_client.model.json_api_visualization_object_to_many_linkage import JsonApiVisualizationObjectToManyLinkage
-from gooddata_api_client.model.json_api_visualization_object_to_one_linkage import JsonApiVisualizationObjectToOneLinkage
-from gooddata_api_client.model.json_api_workspace_data_filter_in import JsonApiWorkspaceDataFilterIn
-from gooddata_api_client.model.json_api_workspace_data_filter_in_attributes import JsonApiWorkspaceDataFilterInAttributes
-from gooddata_api_client.model.json_api_workspace_data_filter_in_document import JsonApiWorkspaceDataFilterInDocument
-from gooddata_api_client.model.json_api_workspace_data_filter_in_relationships import JsonApiWorkspaceDataFilterInRelationships
-from gooddata_api_client.model.json_api_workspace_data_filter_in_relationships_filter_settings import JsonApiWorkspaceDataFilterInRelationshipsFilterSettings
-from gooddata_api_client.model.json_api_workspace_data_filter_linkage import JsonApiWorkspaceDataFilterLinkage
-from gooddata_api_client.model.json_api_workspace_data_filter_out import JsonApiWorkspaceDataFilterOut
-from gooddata_api_client.model.json_api_workspace_data_filter_out_document import JsonApiWorkspaceDataFilterOutDocument
-from gooddata_api_client.model.json_api_workspace_data_filter_out_list import JsonApiWorkspaceDataFilterOutList
-from gooddata_api_client.model.json_api_workspace_data_filter_out_with_links import JsonApiWorkspaceDataFilterOutWithLinks
-from gooddata_api_client.model.json_api_workspace_data_filter_patch import JsonApiWorkspaceDataFilterPatch
-from gooddata_api_client.model.json_api_workspace_data_filter_patch_document import JsonApiWorkspaceDataFilterPatchDocument
-from gooddata_api_client.model.json_api_workspace_data_filter_setting_in import JsonApiWorkspaceDataFilterSettingIn
-from gooddata_api_client.model.json_api_workspace_data_filter_setting_in_attributes import JsonApiWorkspaceDataFilterSettingInAttributes
-from gooddata_api_client.model.json_api_workspace_data_filter_setting_in_document import JsonApiWorkspaceDataFilterSettingInDocument
-from gooddata_api_client.model.json_api_workspace_data_filter_setting_in_relationships import JsonApiWorkspaceDataFilterSettingInRelationships
-from gooddata_api_client.model.json_api_workspace_data_filter_setting_in_relationships_workspace_data_filter import JsonApiWorkspaceDataFilterSettingInRelationshipsWorkspaceDataFilter
-from gooddata_api_client.model.json_api_workspace_data_filter_setting_linkage import JsonApiWorkspaceDataFilterSettingLinkage
-from gooddata_api_client.model.json_api_workspace_data_filter_setting_out import JsonApiWorkspaceDataFilterSettingOut
-from gooddata_api_client.model.json_api_workspace_data_filter_setting_out_document import JsonApiWorkspaceDataFilterSettingOutDocument
-from gooddata_api_client.model.json_api_workspace_data_filter_setting_out_list import JsonApiWorkspaceDataFilterSettingOutList
-from gooddata_api_client.model.json_api_workspace_data_filter_setting_out_with_links import JsonApiWorkspaceDataFilterSettingOutWithLinks
-from gooddata_api_client.model.json_api_workspace_data_filter_setting_patch import JsonApiWorkspaceDataFilterSettingPatch
-from gooddata_api_client.model.json_api_workspace_data_filter_setting_patch_document import JsonApiWorkspaceDataFilterSettingPatchDocument
-from gooddata_api_client.model.json_api_workspace_data_filter_setting_to_many_linkage import JsonApiWorkspaceDataFilterSettingToManyLinkage
-from gooddata_api_client.model.json_api_workspace_data_filter_to_many_linkage import JsonApiWorkspaceDataFilterToManyLinkage
-from gooddata_api_client.model.json_api_workspace_data_filter_to_one_linkage import JsonApiWorkspaceDataFilterToOneLinkage
-from gooddata_api_client.model.json_api_workspace_in import JsonApiWorkspaceIn
-from gooddata_api_client.model.json_api_workspace_in_attributes import JsonApiWorkspaceInAttributes
-from gooddata_api_client.model.json_api_workspace_in_attributes_data_source import JsonApiWorkspaceInAttributesDataSource
-from gooddata_api_client.model.json_api_workspace_in_document import JsonApiWorkspaceInDocument
-from gooddata_api_client.model.json_api_workspace_in_relationships import JsonApiWorkspaceInRelationships
-from gooddata_api_client.model.json_api_workspace_in_relationships_parent import JsonApiWorkspaceInRelationshipsParent
-from gooddata_api_client.model.json_api_workspace_linkage import JsonApiWorkspaceLinkage
-from gooddata_api_client.model.json_api_workspace_out import JsonApiWorkspaceOut
-from gooddata_api_client.model.json_api_workspace_out_document import JsonApiWorkspaceOutDocument
-from gooddata_api_client.model.json_api_workspace_out_list import JsonApiWorkspaceOutList
-from gooddata_api_client.model.json_api_workspace_out_meta import JsonApiWorkspaceOutMeta
-from gooddata_api_client.model.json_api_workspace_out_meta_config import JsonApiWorkspaceOutMetaConfig
-from gooddata_api_client.model.json_api_workspace_out_meta_data_model import JsonApiWorkspaceOutMetaDataModel
-from gooddata_api_client.model.json_api_workspace_out_meta_hierarchy import JsonApiWorkspaceOutMetaHierarchy
-from gooddata_api_client.model.json_api_workspace_out_with_links import JsonApiWorkspaceOutWithLinks
-from gooddata_api_client.model.json_api_workspace_patch import JsonApiWorkspacePatch
-from gooddata_api_client.model.json_api_workspace_patch_document import JsonApiWorkspacePatchDocument
-from gooddata_api_client.model.json_api_workspace_setting_in import JsonApiWorkspaceSettingIn
-from gooddata_api_client.model.json_api_workspace_setting_in_document import JsonApiWorkspaceSettingInDocument
-from gooddata_api_client.model.json_api_workspace_setting_out import JsonApiWorkspaceSettingOut
-from gooddata_api_client.model.json_api_workspace_setting_out_document import JsonApiWorkspaceSettingOutDocument
-from gooddata_api_client.model.json_api_workspace_setting_out_list import JsonApiWorkspaceSettingOutList
-from gooddata_api_client.model.json_api_workspace_setting_out_with_links import JsonApiWorkspaceSettingOutWithLinks
-from gooddata_api_client.model.json_api_workspace_setting_patch import JsonApiWorkspaceSettingPatch
-from gooddata_api_client.model.json_api_workspace_setting_patch_document import JsonApiWorkspaceSettingPatchDocument
-from gooddata_api_client.model.json_api_workspace_setting_post_optional_id import JsonApiWorkspaceSettingPostOptionalId
-from gooddata_api_client.model.json_api_workspace_setting_post_optional_id_document import JsonApiWorkspaceSettingPostOptionalIdDocument
-from gooddata_api_client.model.json_api_workspace_to_one_linkage import JsonApiWorkspaceToOneLinkage
-from gooddata_api_client.model.json_node import JsonNode
-from gooddata_api_client.model.key_drivers_dimension import KeyDriversDimension
-from gooddata_api_client.model.key_drivers_request import KeyDriversRequest
-from gooddata_api_client.model.key_drivers_response import KeyDriversResponse
-from gooddata_api_client.model.key_drivers_result import KeyDriversResult
-from gooddata_api_client.model.label_identifier import LabelIdentifier
-from gooddata_api_client.model.list_links import ListLinks
-from gooddata_api_client.model.list_links_all_of import ListLinksAllOf
-from gooddata_api_client.model.local_identifier import LocalIdentifier
-from gooddata_api_client.model.locale_request import LocaleRequest
-from gooddata_api_client.model.manage_dashboard_permissions_request_inner import ManageDashboardPermissionsRequestInner
-from gooddata_api_client.model.measure_definition import MeasureDefinition
-from gooddata_api_client.model.measure_execution_result_header import MeasureExecutionResultHeader
-from gooddata_api_client.model.measure_group_headers import MeasureGroupHeaders
-from gooddata_api_client.model.measure_header_out import MeasureHeaderOut
-from gooddata_api_client.model.measure_item import MeasureItem
-from gooddata_api_client.model.measure_result_header import MeasureResultHeader
-from gooddata_api_client.model.measure_value_filter import MeasureValueFilter
-from gooddata_api_client.model.metric import Metric
-from gooddata_api_client.model.negative_attribute_filter import NegativeAttributeFilter
-from gooddata_api_client.model.negative_attribute_filter_negative_attribute_filter import NegativeAttributeFilterNegativeAttributeFilter
-from gooddata_api_client.model.note import Note
-from gooddata_api_client.model.notes import Notes
-from gooddata_api_client.model.notification_channel_destination import NotificationChannelDestination
-from gooddata_api_client.model.object_links import ObjectLinks
-from gooddata_api_client.model.object_links_container import ObjectLinksContainer
-from gooddata_api_client.model.organization_permission_assignment import OrganizationPermissionAssignment
-from gooddata_api_client.model.page_metadata import PageMetadata
-from gooddata_api_client.model.paging import Paging
-from gooddata_api_client.model.parameter import Parameter
-from gooddata_api_client.model.pdf_table_style import PdfTableStyle
-from gooddata_api_client.model.pdf_table_style_property import PdfTableStyleProperty
-from gooddata_api_client.model.pdm_ldm_request import PdmLdmRequest
-from gooddata_api_client.model.pdm_sql import PdmSql
-from gooddata_api_client.model.permissions_assignment import PermissionsAssignment
-from gooddata_api_client.model.permissions_for_assignee import PermissionsForAssignee
-from gooddata_api_client.model.permissions_for_assignee_rule import PermissionsForAssigneeRule
-from gooddata_api_client.model.platform_usage import PlatformUsage
-from gooddata_api_client.model.platform_usage_request import PlatformUsageRequest
-from gooddata_api_client.model.pop_dataset import PopDataset
-from gooddata_api_client.model.pop_dataset_measure_definition import PopDatasetMeasureDefinition
-from gooddata_api_client.model.pop_dataset_measure_definition_previous_period_measure import PopDatasetMeasureDefinitionPreviousPeriodMeasure
-from gooddata_api_client.model.pop_date import PopDate
-from gooddata_api_client.model.pop_date_measure_definition import PopDateMeasureDefinition
-from gooddata_api_client.model.pop_date_measure_definition_over_period_measure import PopDateMeasureDefinitionOverPeriodMeasure
-from gooddata_api_client.model.pop_measure_definition import PopMeasureDefinition
-from gooddata_api_client.model.positive_attribute_filter import PositiveAttributeFilter
-from gooddata_api_client.model.positive_attribute_filter_positive_attribute_filter import PositiveAttributeFilterPositiveAttributeFilter
-from gooddata_api_client.model.range import Range
-from gooddata_api_client.model.range_measure_value_filter import RangeMeasureValueFilter
-from gooddata_api_client.model.range_measure_value_filter_range_measure_value_filter import RangeMeasureValueFilterRangeMeasureValueFilter
-from gooddata_api_client.model.range_wrapper import RangeWrapper
-from gooddata_api_client.model.ranking_filter import RankingFilter
-from gooddata_api_client.model.ranking_filter_ranking_filter import RankingFilterRankingFilter
-from gooddata_api_client.model.reference_identifier import ReferenceIdentifier
-from gooddata_api_client.model.reference_source_column import ReferenceSourceColumn
-from gooddata_api_client.model.relative import Relative
-from gooddata_api_client.model.relative_date_filter import RelativeDateFilter
-from gooddata_api_client.model.relative_date_filter_relative_date_filter import RelativeDateFilterRelativeDateFilter
-from gooddata_api_client.model.relative_wrapper import RelativeWrapper
-from gooddata_api_client.model.resolve_settings_request import ResolveSettingsRequest
-from gooddata_api_client.model.resolved_setting import ResolvedSetting
-from gooddata_api_client.model.rest_api_identifier import RestApiIdentifier
-from gooddata_api_client.model.result_cache_metadata import ResultCacheMetadata
-from gooddata_api_client.model.result_dimension import ResultDimension
-from gooddata_api_client.model.result_dimension_header import ResultDimensionHeader
-from gooddata_api_client.model.result_spec import ResultSpec
-from gooddata_api_client.model.route_request import RouteRequest
-from gooddata_api_client.model.route_result import RouteResult
-from gooddata_api_client.model.rsa_specification import RsaSpecification
-from gooddata_api_client.model.rule_permission import RulePermission
-from gooddata_api_client.model.scan_request import ScanRequest
-from gooddata_api_client.model.scan_result_pdm import ScanResultPdm
-from gooddata_api_client.model.scan_sql_request import ScanSqlRequest
-from gooddata_api_client.model.scan_sql_response import ScanSqlResponse
-from gooddata_api_client.model.search_relationship_object import SearchRelationshipObject
-from gooddata_api_client.model.search_request import SearchRequest
-from gooddata_api_client.model.search_result import SearchResult
-from gooddata_api_client.model.search_result_object import SearchResultObject
-from gooddata_api_client.model.settings import Settings
-from gooddata_api_client.model.simple_measure_definition import SimpleMeasureDefinition
-from gooddata_api_client.model.simple_measure_definition_measure import SimpleMeasureDefinitionMeasure
-from gooddata_api_client.model.skeleton import Skeleton
-from gooddata_api_client.model.smart_function_response import SmartFunctionResponse
-from gooddata_api_client.model.smtp import Smtp
-from gooddata_api_client.model.smtp_all_of import SmtpAllOf
-from gooddata_api_client.model.sort_key import SortKey
-from gooddata_api_client.model.sort_key_attribute import SortKeyAttribute
-from gooddata_api_client.model.sort_key_attribute_attribute import SortKeyAttributeAttribute
-from gooddata_api_client.model.sort_key_total import SortKeyTotal
-from gooddata_api_client.model.sort_key_total_total import SortKeyTotalTotal
-from gooddata_api_client.model.sort_key_value import SortKeyValue
-from gooddata_api_client.model.sort_key_value_value import SortKeyValueValue
-from gooddata_api_client.model.sql_column import SqlColumn
-from gooddata_api_client.model.sql_query import SqlQuery
-from gooddata_api_client.model.sql_query_all_of import SqlQueryAllOf
-from gooddata_api_client.model.table import Table
-from gooddata_api_client.model.table_all_of import TableAllOf
-from gooddata_api_client.model.table_override import TableOverride
-from gooddata_api_client.model.table_warning import TableWarning
-from gooddata_api_client.model.tabular_export_request import TabularExportRequest
-from gooddata_api_client.model.test_definition_request import TestDefinitionRequest
-from gooddata_api_client.model.test_query_duration import TestQueryDuration
-from gooddata_api_client.model.test_request import TestRequest
-from gooddata_api_client.model.test_response import TestResponse
-from gooddata_api_client.model.total import Total
-from gooddata_api_client.model.total_dimension import TotalDimension
-from gooddata_api_client.model.total_execution_result_header import TotalExecutionResultHeader
-from gooddata_api_client.model.total_result_header import TotalResultHeader
-from gooddata_api_client.model.user_assignee import UserAssignee
-from gooddata_api_client.model.user_context import UserContext
-from gooddata_api_client.model.user_group_assignee import UserGroupAssignee
-from gooddata_api_client.model.user_group_identifier import UserGroupIdentifier
-from gooddata_api_client.model.user_group_permission import UserGroupPermission
-from gooddata_api_client.model.user_management_data_source_permission_assignment import UserManagementDataSourcePermissionAssignment
-from gooddata_api_client.model.user_management_permission_assignments import UserManagementPermissionAssignments
-from gooddata_api_client.model.user_management_user_group_member import UserManagementUserGroupMember
-from gooddata_api_client.model.user_management_user_group_members import UserManagementUserGroupMembers
-from gooddata_api_client.model.user_management_user_groups import UserManagementUserGroups
-from gooddata_api_client.model.user_management_user_groups_item import UserManagementUserGroupsItem
-from gooddata_api_client.model.user_management_users import UserManagementUsers
-from gooddata_api_client.model.user_management_users_item import UserManagementUsersItem
-from gooddata_api_client.model.user_management_workspace_permission_assignment import UserManagementWorkspacePermissionAssignment
-from gooddata_api_client.model.user_permission import UserPermission
-from gooddata_api_client.model.validate_by_item import ValidateByItem
-from gooddata_api_client.model.value import Value
-from gooddata_api_client.model.visual_export_request import VisualExportRequest
-from gooddata_api_client.model.webhook import Webhook
-from gooddata_api_client.model.webhook_all_of import WebhookAllOf
-from gooddata_api_client.model.workspace_data_source import WorkspaceDataSource
-from gooddata_api_client.model.workspace_identifier import WorkspaceIdentifier
-from gooddata_api_client.model.workspace_permission_assignment import WorkspacePermissionAssignment
-from gooddata_api_client.model.workspace_user import WorkspaceUser
-from gooddata_api_client.model.workspace_user_group import WorkspaceUserGroup
-from gooddata_api_client.model.workspace_user_groups import WorkspaceUserGroups
-from gooddata_api_client.model.workspace_users import WorkspaceUsers
-from gooddata_api_client.model.xliff import Xliff
+import importlib
+
+_MODELS = {
+    "AFM": "afm",
+    "AbsoluteDateFilter": "absolute_date_filter",
+    "AbsoluteDateFilterAbsoluteDateFilter": "absolute_date_filter_absolute_date_filter",
+    "AbstractMeasureValueFilter": "abstract_measure_value_filter",
+    "ActiveObjectIdentification": "active_object_identification",
+    "AfmExecution": "afm_execution",
+    "AfmExecutionResponse": "afm_execution_response",
+    "AfmIdentifier": "afm_identifier",
+    "AfmLocalIdentifier": "afm_local_identifier",
+    "AfmObjectIdentifier": "afm_object_identifier",
+    "AfmObjectIdentifierAttribute": "afm_object_identifier_attribute",
+    "AfmObjectIdentifierAttributeIdentifier": "afm_object_identifier_attribute_identifier",
+    "AfmObjectIdentifierCore": "afm_object_identifier_core",
+    "AfmObjectIdentifierCoreIdentifier": "afm_object_identifier_core_identifier",
+    "AfmObjectIdentifierDataset": "afm_object_identifier_dataset",
+    "AfmObjectIdentifierDatasetIdentifier": "afm_object_identifier_dataset_identifier",
+    "AfmObjectIdentifierIdentifier": "afm_object_identifier_identifier",
+    "AfmObjectIdentifierLabel": "afm_object_identifier_label",
+    "AfmObjectIdentifierLabelIdentifier": "afm_object_identifier_label_identifier",
+    "AfmValidDescendantsQuery": "afm_valid_descendants_query",
+    "AfmValidDescendantsResponse": "afm_valid_descendants_response",
+    "AfmValidObjectsQuery": "afm_valid_objects_query",
+    "AfmValidObjectsResponse": "afm_valid_objects_response",
+    "AlertAfm": "alert_afm",
+    "AlertCondition": "alert_condition",
+    "AlertConditionOperand": "alert_condition_operand",
+    "AnomalyDetectionRequest": "anomaly_detection_request",
+    "AnomalyDetectionResult": "anomaly_detection_result",
+    "ApiEntitlement": "api_entitlement",
+    "ArithmeticMeasure": "arithmetic_measure",
+    "ArithmeticMeasureDefinition": "arithmetic_measure_definition",
+    "ArithmeticMeasureDefinitionArithmeticMeasure": "arithmetic_measure_definition_arithmetic_measure",
+    "AssigneeIdentifier": "assignee_identifier",
+    "AssigneeRule": "assignee_rule",
+    "AttributeExecutionResultHeader": "attribute_execution_result_header",
+    "AttributeFilter": "attribute_filter",
+    "AttributeFilterElements": "attribute_filter_elements",
+    "AttributeFormat": "attribute_format",
+    "AttributeHeaderOut": "attribute_header_out",
+    "AttributeHeaderOutAttributeHeader": "attribute_header_out_attribute_header",
+    "AttributeItem": "attribute_item",
+    "AttributeNegativeFilter": "attribute_negative_filter",
+    "AttributeNegativeFilterAllOf": "attribute_negative_filter_all_of",
+    "AttributePositiveFilter": "attribute_positive_filter",
+    "AttributePositiveFilterAllOf": "attribute_positive_filter_all_of",
+    "AttributeResultHeader": "attribute_result_header",
+    "AutomationAlert": "automation_alert",
+    "AutomationAlertCondition": "automation_alert_condition",
+    "AutomationSchedule": "automation_schedule",
+    "AutomationTabularExport": "automation_tabular_export",
+    "AutomationVisualExport": "automation_visual_export",
+    "AvailableAssignees": "available_assignees",
+    "ChatHistoryInteraction": "chat_history_interaction",
+    "ChatHistoryRequest": "chat_history_request",
+    "ChatHistoryResult": "chat_history_result",
+    "ChatRequest": "chat_request",
+    "ChatResult": "chat_result",
+    "ClusteringRequest": "clustering_request",
+    "ClusteringResult": "clustering_result",
+    "ColumnLocation": "column_location",
+    "ColumnOverride": "column_override",
+    "ColumnStatistic": "column_statistic",
+    "ColumnStatisticWarning": "column_statistic_warning",
+    "ColumnStatisticsRequest": "column_statistics_request",
+    "ColumnStatisticsRequestFrom": "column_statistics_request_from",
+    "ColumnStatisticsResponse": "column_statistics_response",
+    "ColumnWarning": "column_warning",
+    "Comparison": "comparison",
+    "ComparisonMeasureValueFilter": "comparison_measure_value_filter",
+    "ComparisonMeasureValueFilterComparisonMeasureValueFilter": "comparison_measure_value_filter_comparison_measure_value_filter",
+    "ComparisonWrapper": "comparison_wrapper",
+    "CreatedVisualization": "created_visualization",
+    "CreatedVisualizationFiltersInner": "created_visualization_filters_inner",
+    "CreatedVisualizations": "created_visualizations",
+    "CustomLabel": "custom_label",
+    "CustomMetric": "custom_metric",
+    "CustomOverride": "custom_override",
+    "DashboardPermissions": "dashboard_permissions",
+    "DashboardPermissionsAssignment": "dashboard_permissions_assignment",
+    "DataColumnLocator": "data_column_locator",
+    "DataColumnLocators": "data_column_locators",
+    "DataSourceParameter": "data_source_parameter",
+    "DataSourcePermissionAssignment": "data_source_permission_assignment",
+    "DataSourceSchemata": "data_source_schemata",
+    "DataSourceTableIdentifier": "data_source_table_identifier",
+    "DatasetGrain": "dataset_grain",
+    "DatasetReferenceIdentifier": "dataset_reference_identifier",
+    "DatasetWorkspaceDataFilterIdentifier": "dataset_workspace_data_filter_identifier",
+    "DateAbsoluteFilter": "date_absolute_filter",
+    "DateAbsoluteFilterAllOf": "date_absolute_filter_all_of",
+    "DateFilter": "date_filter",
+    "DateRelativeFilter": "date_relative_filter",
+    "DateRelativeFilterAllOf": "date_relative_filter_all_of",
+    "DeclarativeAnalyticalDashboard": "declarative_analytical_dashboard",
+    "DeclarativeAnalyticalDashboardExtension": "declarative_analytical_dashboard_extension",
+    "DeclarativeAnalyticalDashboardIdentifier": "declarative_analytical_dashboard_identifier",
+    "DeclarativeAnalyticalDashboardPermissionAssignment": "declarative_analytical_dashboard_permission_assignment",
+    "DeclarativeAnalyticalDashboardPermissionForAssignee": "declarative_analytical_dashboard_permission_for_assignee",
+    "DeclarativeAnalyticalDashboardPermissionForAssigneeAllOf": "declarative_analytical_dashboard_permission_for_assignee_all_of",
+    "DeclarativeAnalyticalDashboardPermissionForAssigneeRule": "declarative_analytical_dashboard_permission_for_assignee_rule",
+    "DeclarativeAnalyticalDashboardPermissionForAssigneeRuleAllOf": "declarative_analytical_dashboard_permission_for_assignee_rule_all_of",
+    "DeclarativeAnalyticalDashboardPermissionsInner": "declarative_analytical_dashboard_permissions_inner",
+    "DeclarativeAnalytics": "declarative_analytics",
+    "DeclarativeAnalyticsLayer": "declarative_analytics_layer",
+    "DeclarativeAttribute": "declarative_attribute",
+    "DeclarativeAttributeHierarchy": "declarative_attribute_hierarchy",
+    "DeclarativeAutomation": "declarative_automation",
+    "DeclarativeColorPalette": "declarative_color_palette",
+    "DeclarativeColumn": "declarative_column",
+    "DeclarativeCspDirective": "declarative_csp_directive",
+    "DeclarativeCustomApplicationSetting": "declarative_custom_application_setting",
+    "DeclarativeDashboardPlugin": "declarative_dashboard_plugin",
+    "DeclarativeDataSource": "declarative_data_source",
+    "DeclarativeDataSourcePermission": "declarative_data_source_permission",
+    "DeclarativeDataSourcePermissions": "declarative_data_source_permissions",
+    "DeclarativeDataSources": "declarative_data_sources",
+    "DeclarativeDataset": "declarative_dataset",
+    "DeclarativeDatasetExtension": "declarative_dataset_extension",
+    "DeclarativeDatasetSql": "declarative_dataset_sql",
+    "DeclarativeDateDataset": "declarative_date_dataset",
+    "DeclarativeExportDefinition": "declarative_export_definition",
+    "DeclarativeExportDefinitionIdentifier": "declarative_export_definition_identifier",
+    "DeclarativeExportDefinitionRequestPayload": "declarative_export_definition_request_payload",
+    "DeclarativeFact": "declarative_fact",
+    "DeclarativeFilterContext": "declarative_filter_context",
+    "DeclarativeFilterView": "declarative_filter_view",
+    "DeclarativeIdentityProvider": "declarative_identity_provider",
+    "DeclarativeJwk": "declarative_jwk",
+    "DeclarativeJwkSpecification": "declarative_jwk_specification",
+    "DeclarativeLabel": "declarative_label",
+    "DeclarativeLdm": "declarative_ldm",
+    "DeclarativeMetric": "declarative_metric",
+    "DeclarativeModel": "declarative_model",
+    "DeclarativeNotificationChannel": "declarative_notification_channel",
+    "DeclarativeNotificationChannelDestination": "declarative_notification_channel_destination",
+    "DeclarativeNotificationChannelIdentifier": "declarative_notification_channel_identifier",
+    "DeclarativeNotificationChannels": "declarative_notification_channels",
+    "DeclarativeOrganization": "declarative_organization",
+    "DeclarativeOrganizationInfo": "declarative_organization_info",
+    "DeclarativeOrganizationPermission": "declarative_organization_permission",
+    "DeclarativeReference": "declarative_reference",
+    "DeclarativeReferenceSource": "declarative_reference_source",
+    "DeclarativeRsaSpecification": "declarative_rsa_specification",
+    "DeclarativeSetting": "declarative_setting",
+    "DeclarativeSingleWorkspacePermission": "declarative_single_workspace_permission",
+    "DeclarativeTable": "declarative_table",
+    "DeclarativeTables": "declarative_tables",
+    "DeclarativeTheme": "declarative_theme",
+    "DeclarativeUser": "declarative_user",
+    "DeclarativeUserDataFilter": "declarative_user_data_filter",
+    "DeclarativeUserDataFilters": "declarative_user_data_filters",
+    "DeclarativeUserGroup": "declarative_user_group",
+    "DeclarativeUserGroupIdentifier": "declarative_user_group_identifier",
+    "DeclarativeUserGroupPermission": "declarative_user_group_permission",
+    "DeclarativeUserGroupPermissions": "declarative_user_group_permissions",
+    "DeclarativeUserGroups": "declarative_user_groups",
+    "DeclarativeUserIdentifier": "declarative_user_identifier",
+    "DeclarativeUserPermission": "declarative_user_permission",
+    "DeclarativeUserPermissions": "declarative_user_permissions",
+    "DeclarativeUsers": "declarative_users",
+    "DeclarativeUsersUserGroups": "declarative_users_user_groups",
+    "DeclarativeVisualizationObject": "declarative_visualization_object",
+    "DeclarativeWorkspace": "declarative_workspace",
+    "DeclarativeWorkspaceDataFilter": "declarative_workspace_data_filter",
+    "DeclarativeWorkspaceDataFilterColumn": "declarative_workspace_data_filter_column",
+    "DeclarativeWorkspaceDataFilterReferences": "declarative_workspace_data_filter_references",
+    "DeclarativeWorkspaceDataFilterSetting": "declarative_workspace_data_filter_setting",
+    "DeclarativeWorkspaceDataFilters": "declarative_workspace_data_filters",
+    "DeclarativeWorkspaceHierarchyPermission": "declarative_workspace_hierarchy_permission",
+    "DeclarativeWorkspaceModel": "declarative_workspace_model",
+    "DeclarativeWorkspacePermissions": "declarative_workspace_permissions",
+    "DeclarativeWorkspaces": "declarative_workspaces",
+    "DefaultSmtp": "default_smtp",
+    "DefaultSmtpAllOf": "default_smtp_all_of",
+    "DependentEntitiesGraph": "dependent_entities_graph",
+    "DependentEntitiesNode": "dependent_entities_node",
+    "DependentEntitiesRequest": "dependent_entities_request",
+    "DependentEntitiesResponse": "dependent_entities_response",
+    "DependsOn": "depends_on",
+    "DependsOnAllOf": "depends_on_all_of",
+    "DependsOnDateFilter": "depends_on_date_filter",
+    "DependsOnDateFilterAllOf": "depends_on_date_filter_all_of",
+    "DependsOnItem": "depends_on_item",
+    "DimAttribute": "dim_attribute",
+    "Dimension": "dimension",
+    "DimensionHeader": "dimension_header",
+    "Element": "element",
+    "ElementsRequest": "elements_request",
+    "ElementsRequestDependsOnInner": "elements_request_depends_on_inner",
+    "ElementsResponse": "elements_response",
+    "EntitlementsRequest": "entitlements_request",
+    "EntityIdentifier": "entity_identifier",
+    "ExecutionLinks": "execution_links",
+    "ExecutionResponse": "execution_response",
+    "ExecutionResult": "execution_result",
+    "ExecutionResultGrandTotal": "execution_result_grand_total",
+    "ExecutionResultHeader": "execution_result_header",
+    "ExecutionResultPaging": "execution_result_paging",
+    "ExecutionSettings": "execution_settings",
+    "ExportRequest": "export_request",
+    "ExportResponse": "export_response",
+    "File": "file",
+    "Filter": "filter",
+    "FilterBy": "filter_by",
+    "FilterDefinition": "filter_definition",
+    "FilterDefinitionForSimpleMeasure": "filter_definition_for_simple_measure",
+    "ForecastRequest": "forecast_request",
+    "ForecastResult": "forecast_result",
+    "FoundObjects": "found_objects",
+    "Frequency": "frequency",
+    "FrequencyBucket": "frequency_bucket",
+    "FrequencyProperties": "frequency_properties",
+    "GenerateLdmRequest": "generate_ldm_request",
+    "GrainIdentifier": "grain_identifier",
+    "GrantedPermission": "granted_permission",
+    "GranularitiesFormatting": "granularities_formatting",
+    "HeaderGroup": "header_group",
+    "HierarchyObjectIdentification": "hierarchy_object_identification",
+    "Histogram": "histogram",
+    "HistogramBucket": "histogram_bucket",
+    "HistogramProperties": "histogram_properties",
+    "IdentifierDuplications": "identifier_duplications",
+    "InPlatform": "in_platform",
+    "InPlatformAllOf": "in_platform_all_of",
+    "InlineFilterDefinition": "inline_filter_definition",
+    "InlineFilterDefinitionInline": "inline_filter_definition_inline",
+    "InlineMeasureDefinition": "inline_measure_definition",
+    "InlineMeasureDefinitionInline": "inline_measure_definition_inline",
+    "JsonApiAnalyticalDashboardIn": "json_api_analytical_dashboard_in",
+    "JsonApiAnalyticalDashboardInAttributes": "json_api_analytical_dashboard_in_attributes",
+    "JsonApiAnalyticalDashboardInDocument": "json_api_analytical_dashboard_in_document",
+    "JsonApiAnalyticalDashboardLinkage": "json_api_analytical_dashboard_linkage",
+    "JsonApiAnalyticalDashboardOut": "json_api_analytical_dashboard_out",
+    "JsonApiAnalyticalDashboardOutAttributes": "json_api_analytical_dashboard_out_attributes",
+    "JsonApiAnalyticalDashboardOutDocument": "json_api_analytical_dashboard_out_document",
+    "JsonApiAnalyticalDashboardOutIncludes": "json_api_analytical_dashboard_out_includes",
+    "JsonApiAnalyticalDashboardOutList": "json_api_analytical_dashboard_out_list",
+    "JsonApiAnalyticalDashboardOutListMeta": "json_api_analytical_dashboard_out_list_meta",
+    "JsonApiAnalyticalDashboardOutMeta": "json_api_analytical_dashboard_out_meta",
+    "JsonApiAnalyticalDashboardOutMetaAccessInfo": "json_api_analytical_dashboard_out_meta_access_info",
+    "JsonApiAnalyticalDashboardOutMetaOrigin": "json_api_analytical_dashboard_out_meta_origin",
+    "JsonApiAnalyticalDashboardOutRelationships": "json_api_analytical_dashboard_out_relationships",
+    "JsonApiAnalyticalDashboardOutRelationshipsAnalyticalDashboards": "json_api_analytical_dashboard_out_relationships_analytical_dashboards",
+    "JsonApiAnalyticalDashboardOutRelationshipsCreatedBy": "json_api_analytical_dashboard_out_relationships_created_by",
+    "JsonApiAnalyticalDashboardOutRelationshipsDashboardPlugins": "json_api_analytical_dashboard_out_relationships_dashboard_plugins",
+    "JsonApiAnalyticalDashboardOutRelationshipsDatasets": "json_api_analytical_dashboard_out_relationships_datasets",
+    "JsonApiAnalyticalDashboardOutRelationshipsFilterContexts": "json_api_analytical_dashboard_out_relationships_filter_contexts",
+    "JsonApiAnalyticalDashboardOutRelationshipsLabels": "json_api_analytical_dashboard_out_relationships_labels",
+    "JsonApiAnalyticalDashboardOutRelationshipsMetrics": "json_api_analytical_dashboard_out_relationships_metrics",
+    "JsonApiAnalyticalDashboardOutRelationshipsVisualizationObjects": "json_api_analytical_dashboard_out_relationships_visualization_objects",
+    "JsonApiAnalyticalDashboardOutWithLinks": "json_api_analytical_dashboard_out_with_links",
+    "JsonApiAnalyticalDashboardPatch": "json_api_analytical_dashboard_patch",
+    "JsonApiAnalyticalDashboardPatchAttributes": "json_api_analytical_dashboard_patch_attributes",
+    "JsonApiAnalyticalDashboardPatchDocument": "json_api_analytical_dashboard_patch_document",
+    "JsonApiAnalyticalDashboardPostOptionalId": "json_api_analytical_dashboard_post_optional_id",
+    "JsonApiAnalyticalDashboardPostOptionalIdDocument": "json_api_analytical_dashboard_post_optional_id_document",
+    "JsonApiAnalyticalDashboardToManyLinkage": "json_api_analytical_dashboard_to_many_linkage",
+    "JsonApiAnalyticalDashboardToOneLinkage": "json_api_analytical_dashboard_to_one_linkage",
+    "JsonApiApiTokenIn": "json_api_api_token_in",
+    "JsonApiApiTokenInDocument": "json_api_api_token_in_document",
+    "JsonApiApiTokenOut": "json_api_api_token_out",
+    "JsonApiApiTokenOutAttributes": "json_api_api_token_out_attributes",
+    "JsonApiApiTokenOutDocument": "json_api_api_token_out_document",
+    "JsonApiApiTokenOutList": "json_api_api_token_out_list",
+    "JsonApiApiTokenOutWithLinks": "json_api_api_token_out_with_links",
+    "JsonApiAttributeHierarchyIn": "json_api_attribute_hierarchy_in",
+    "JsonApiAttributeHierarchyInAttributes": "json_api_attribute_hierarchy_in_attributes",
+    "JsonApiAttributeHierarchyInDocument": "json_api_attribute_hierarchy_in_document",
+    "JsonApiAttributeHierarchyLinkage": "json_api_attribute_hierarchy_linkage",
+    "JsonApiAttributeHierarchyOut": "json_api_attribute_hierarchy_out",
+    "JsonApiAttributeHierarchyOutAttributes": "json_api_attribute_hierarchy_out_attributes",
+    "JsonApiAttributeHierarchyOutDocument": "json_api_attribute_hierarchy_out_document",
+    "JsonApiAttributeHierarchyOutIncludes": "json_api_attribute_hierarchy_out_includes",
+    "JsonApiAttributeHierarchyOutList": "json_api_attribute_hierarchy_out_list",
+    "JsonApiAttributeHierarchyOutMeta": "json_api_attribute_hierarchy_out_meta",
+    "JsonApiAttributeHierarchyOutRelationships": "json_api_attribute_hierarchy_out_relationships",
+    "JsonApiAttributeHierarchyOutRelationshipsAttributes": "json_api_attribute_hierarchy_out_relationships_attributes",
+    "JsonApiAttributeHierarchyOutWithLinks": "json_api_attribute_hierarchy_out_with_links",
+    "JsonApiAttributeHierarchyPatch": "json_api_attribute_hierarchy_patch",
+    "JsonApiAttributeHierarchyPatchDocument": "json_api_attribute_hierarchy_patch_document",
+    "JsonApiAttributeHierarchyToManyLinkage": "json_api_attribute_hierarchy_to_many_linkage",
+    "JsonApiAttributeLinkage": "json_api_attribute_linkage",
+    "JsonApiAttributeOut": "json_api_attribute_out",
+    "JsonApiAttributeOutAttributes": "json_api_attribute_out_attributes",
+    "JsonApiAttributeOutDocument": "json_api_attribute_out_document",
+    "JsonApiAttributeOutIncludes": "json_api_attribute_out_includes",
+    "JsonApiAttributeOutList": "json_api_attribute_out_list",
+    "JsonApiAttributeOutRelationships": "json_api_attribute_out_relationships",
+    "JsonApiAttributeOutRelationshipsAttributeHierarchies": "json_api_attribute_out_relationships_attribute_hierarchies",
+    "JsonApiAttributeOutRelationshipsDataset": "json_api_attribute_out_relationships_dataset",
+    "JsonApiAttributeOutRelationshipsDefaultView": "json_api_attribute_out_relationships_default_view",
+    "JsonApiAttributeOutWithLinks": "json_api_attribute_out_with_links",
+    "JsonApiAttributeToManyLinkage": "json_api_attribute_to_many_linkage",
+    "JsonApiAttributeToOneLinkage": "json_api_attribute_to_one_linkage",
+    "JsonApiAutomationIn": "json_api_automation_in",
+    "JsonApiAutomationInAttributes": "json_api_automation_in_attributes",
+    "JsonApiAutomationInAttributesAlert": "json_api_automation_in_attributes_alert",
+    "JsonApiAutomationInAttributesSchedule": "json_api_automation_in_attributes_schedule",
+    "JsonApiAutomationInAttributesTabularExportsInner": "json_api_automation_in_attributes_tabular_exports_inner",
+    "JsonApiAutomationInAttributesVisualExportsInner": "json_api_automation_in_attributes_visual_exports_inner",
+    "JsonApiAutomationInDocument": "json_api_automation_in_document",
+    "JsonApiAutomationInRelationships": "json_api_automation_in_relationships",
+    "JsonApiAutomationInRelationshipsAnalyticalDashboard": "json_api_automation_in_relationships_analytical_dashboard",
+    "JsonApiAutomationInRelationshipsExportDefinitions": "json_api_automation_in_relationships_export_definitions",
+    "JsonApiAutomationInRelationshipsNotificationChannel": "json_api_automation_in_relationships_notification_channel",
+    "JsonApiAutomationInRelationshipsRecipients": "json_api_automation_in_relationships_recipients",
+    "JsonApiAutomationLinkage": "json_api_automation_linkage",
+    "JsonApiAutomationOut": "json_api_automation_out",
+    "JsonApiAutomationOutAttributes": "json_api_automation_out_attributes",
+    "JsonApiAutomationOutDocument": "json_api_automation_out_document",
+    "JsonApiAutomationOutIncludes": "json_api_automation_out_includes",
+    "JsonApiAutomationOutList": "json_api_automation_out_list",
+    "JsonApiAutomationOutRelationships": "json_api_automation_out_relationships",
+    "JsonApiAutomationOutWithLinks": "json_api_automation_out_with_links",
+    "JsonApiAutomationPatch": "json_api_automation_patch",
+    "JsonApiAutomationPatchDocument": "json_api_automation_patch_document",
+    "JsonApiAutomationToOneLinkage": "json_api_automation_to_one_linkage",
+    "JsonApiColorPaletteIn": "json_api_color_palette_in",
+    "JsonApiColorPaletteInAttributes": "json_api_color_palette_in_attributes",
+    "JsonApiColorPaletteInDocument": "json_api_color_palette_in_document",
+    "JsonApiColorPaletteOut": "json_api_color_palette_out",
+    "JsonApiColorPaletteOutDocument": "json_api_color_palette_out_document",
+    "JsonApiColorPaletteOutList": "json_api_color_palette_out_list",
+    "JsonApiColorPaletteOutWithLinks": "json_api_color_palette_out_with_links",
+    "JsonApiColorPalettePatch": "json_api_color_palette_patch",
+    "JsonApiColorPalettePatchAttributes": "json_api_color_palette_patch_attributes",
+    "JsonApiColorPalettePatchDocument": "json_api_color_palette_patch_document",
+    "JsonApiCookieSecurityConfigurationIn": "json_api_cookie_security_configuration_in",
+    "JsonApiCookieSecurityConfigurationInAttributes": "json_api_cookie_security_configuration_in_attributes",
+    "JsonApiCookieSecurityConfigurationInDocument": "json_api_cookie_security_configuration_in_document",
+    "JsonApiCookieSecurityConfigurationOut": "json_api_cookie_security_configuration_out",
+    "JsonApiCookieSecurityConfigurationOutDocument": "json_api_cookie_security_configuration_out_document",
+    "JsonApiCookieSecurityConfigurationPatch": "json_api_cookie_security_configuration_patch",
+    "JsonApiCookieSecurityConfigurationPatchDocument": "json_api_cookie_security_configuration_patch_document",
+    "JsonApiCspDirectiveIn": "json_api_csp_directive_in",
+    "JsonApiCspDirectiveInAttributes": "json_api_csp_directive_in_attributes",
+    "JsonApiCspDirectiveInDocument": "json_api_csp_directive_in_document",
+    "JsonApiCspDirectiveOut": "json_api_csp_directive_out",
+    "JsonApiCspDirectiveOutDocument": "json_api_csp_directive_out_document",
+    "JsonApiCspDirectiveOutList": "json_api_csp_directive_out_list",
+    "JsonApiCspDirectiveOutWithLinks": "json_api_csp_directive_out_with_links",
+    "JsonApiCspDirectivePatch": "json_api_csp_directive_patch",
+    "JsonApiCspDirectivePatchAttributes": "json_api_csp_directive_patch_attributes",
+    "JsonApiCspDirectivePatchDocument": "json_api_csp_directive_patch_document",
+    "JsonApiCustomApplicationSettingIn": "json_api_custom_application_setting_in",
+    "JsonApiCustomApplicationSettingInAttributes": "json_api_custom_application_setting_in_attributes",
+    "JsonApiCustomApplicationSettingInDocument": "json_api_custom_application_setting_in_document",
+    "JsonApiCustomApplicationSettingOut": "json_api_custom_application_setting_out",
+    "JsonApiCustomApplicationSettingOutDocument": "json_api_custom_application_setting_out_document",
+    "JsonApiCustomApplicationSettingOutList": "json_api_custom_application_setting_out_list",
+    "JsonApiCustomApplicationSettingOutWithLinks": "json_api_custom_application_setting_out_with_links",
+    "JsonApiCustomApplicationSettingPatch": "json_api_custom_application_setting_patch",
+    "JsonApiCustomApplicationSettingPatchAttributes": "json_api_custom_application_setting_patch_attributes",
+    "JsonApiCustomApplicationSettingPatchDocument": "json_api_custom_application_setting_patch_document",
+    "JsonApiCustomApplicationSettingPostOptionalId": "json_api_custom_application_setting_post_optional_id",
+    "JsonApiCustomApplicationSettingPostOptionalIdDocument": "json_api_custom_application_setting_post_optional_id_document",
+    "JsonApiDashboardPluginIn": "json_api_dashboard_plugin_in",
+    "JsonApiDashboardPluginInAttributes": "json_api_dashboard_plugin_in_attributes",
+    "JsonApiDashboardPluginInDocument": "json_api_dashboard_plugin_in_document",
+    "JsonApiDashboardPluginLinkage": "json_api_dashboard_plugin_linkage",
+    "JsonApiDashboardPluginOut": "json_api_dashboard_plugin_out",
+    "JsonApiDashboardPluginOutAttributes": "json_api_dashboard_plugin_out_attributes",
+    "JsonApiDashboardPluginOutDocument": "json_api_dashboard_plugin_out_document",
+    "JsonApiDashboardPluginOutList": "json_api_dashboard_plugin_out_list",
+    "JsonApiDashboardPluginOutRelationships": "json_api_dashboard_plugin_out_relationships",
+    "JsonApiDashboardPluginOutWithLinks": "json_api_dashboard_plugin_out_with_links",
+    "JsonApiDashboardPluginPatch": "json_api_dashboard_plugin_patch",
+    "JsonApiDashboardPluginPatchDocument": "json_api_dashboard_plugin_patch_document",
+    "JsonApiDashboardPluginPostOptionalId": "json_api_dashboard_plugin_post_optional_id",
+    "JsonApiDashboardPluginPostOptionalIdDocument": "json_api_dashboard_plugin_post_optional_id_document",
+    "JsonApiDashboardPluginToManyLinkage": "json_api_dashboard_plugin_to_many_linkage",
+    "JsonApiDataSourceIdentifierOut": "json_api_data_source_identifier_out",
+    "JsonApiDataSourceIdentifierOutAttributes": "json_api_data_source_identifier_out_attributes",
+    "JsonApiDataSourceIdentifierOutDocument": "json_api_data_source_identifier_out_document",
+    "JsonApiDataSourceIdentifierOutList": "json_api_data_source_identifier_out_list",
+    "JsonApiDataSourceIdentifierOutMeta": "json_api_data_source_identifier_out_meta",
+    "JsonApiDataSourceIdentifierOutWithLinks": "json_api_data_source_identifier_out_with_links",
+    "JsonApiDataSourceIn": "json_api_data_source_in",
+    "JsonApiDataSourceInAttributes": "json_api_data_source_in_attributes",
+    "JsonApiDataSourceInAttributesParametersInner": "json_api_data_source_in_attributes_parameters_inner",
+    "JsonApiDataSourceInDocument": "json_api_data_source_in_document",
+    "JsonApiDataSourceOut": "json_api_data_source_out",
+    "JsonApiDataSourceOutAttributes": "json_api_data_source_out_attributes",
+    "JsonApiDataSourceOutDocument": "json_api_data_source_out_document",
+    "JsonApiDataSourceOutList": "json_api_data_source_out_list",
+    "JsonApiDataSourceOutWithLinks": "json_api_data_source_out_with_links",
+    "JsonApiDataSourcePatch": "json_api_data_source_patch",
+    "JsonApiDataSourcePatchAttributes": "json_api_data_source_patch_attributes",
+    "JsonApiDataSourcePatchDocument": "json_api_data_source_patch_document",
+    "JsonApiDatasetLinkage": "json_api_dataset_linkage",
+    "JsonApiDatasetOut": "json_api_dataset_out",
+    "JsonApiDatasetOutAttributes": "json_api_dataset_out_attributes",
+    "JsonApiDatasetOutAttributesGrainInner": "json_api_dataset_out_attributes_grain_inner",
+    "JsonApiDatasetOutAttributesReferencePropertiesInner": "json_api_dataset_out_attributes_reference_properties_inner",
+    "JsonApiDatasetOutAttributesSql": "json_api_dataset_out_attributes_sql",
+    "JsonApiDatasetOutAttributesWorkspaceDataFilterColumnsInner": "json_api_dataset_out_attributes_workspace_data_filter_columns_inner",
+    "JsonApiDatasetOutAttributesWorkspaceDataFilterReferencesInner": "json_api_dataset_out_attributes_workspace_data_filter_references_inner",
+    "JsonApiDatasetOutDocument": "json_api_dataset_out_document",
+    "JsonApiDatasetOutIncludes": "json_api_dataset_out_includes",
+    "JsonApiDatasetOutList": "json_api_dataset_out_list",
+    "JsonApiDatasetOutRelationships": "json_api_dataset_out_relationships",
+    "JsonApiDatasetOutRelationshipsFacts": "json_api_dataset_out_relationships_facts",
+    "JsonApiDatasetOutRelationshipsWorkspaceDataFilters": "json_api_dataset_out_relationships_workspace_data_filters",
+    "JsonApiDatasetOutWithLinks": "json_api_dataset_out_with_links",
+    "JsonApiDatasetToManyLinkage": "json_api_dataset_to_many_linkage",
+    "JsonApiDatasetToOneLinkage": "json_api_dataset_to_one_linkage",
+    "JsonApiEntitlementOut": "json_api_entitlement_out",
+    "JsonApiEntitlementOutAttributes": "json_api_entitlement_out_attributes",
+    "JsonApiEntitlementOutDocument": "json_api_entitlement_out_document",
+    "JsonApiEntitlementOutList": "json_api_entitlement_out_list",
+    "JsonApiEntitlementOutWithLinks": "json_api_entitlement_out_with_links",
+    "JsonApiExportDefinitionIn": "json_api_export_definition_in",
+    "JsonApiExportDefinitionInAttributes": "json_api_export_definition_in_attributes",
+    "JsonApiExportDefinitionInAttributesRequestPayload": "json_api_export_definition_in_attributes_request_payload",
+    "JsonApiExportDefinitionInDocument": "json_api_export_definition_in_document",
+    "JsonApiExportDefinitionInRelationships": "json_api_export_definition_in_relationships",
+    "JsonApiExportDefinitionInRelationshipsVisualizationObject": "json_api_export_definition_in_relationships_visualization_object",
+    "JsonApiExportDefinitionLinkage": "json_api_export_definition_linkage",
+    "JsonApiExportDefinitionOut": "json_api_export_definition_out",
+    "JsonApiExportDefinitionOutAttributes": "json_api_export_definition_out_attributes",
+    "JsonApiExportDefinitionOutDocument": "json_api_export_definition_out_document",
+    "JsonApiExportDefinitionOutIncludes": "json_api_export_definition_out_includes",
+    "JsonApiExportDefinitionOutList": "json_api_export_definition_out_list",
+    "JsonApiExportDefinitionOutRelationships": "json_api_export_definition_out_relationships",
+    "JsonApiExportDefinitionOutRelationshipsAutomation": "json_api_export_definition_out_relationships_automation",
+    "JsonApiExportDefinitionOutWithLinks": "json_api_export_definition_out_with_links",
+    "JsonApiExportDefinitionPatch": "json_api_export_definition_patch",
+    "JsonApiExportDefinitionPatchDocument": "json_api_export_definition_patch_document",
+    "JsonApiExportDefinitionPostOptionalId": "json_api_export_definition_post_optional_id",
+    "JsonApiExportDefinitionPostOptionalIdDocument": "json_api_export_definition_post_optional_id_document",
+    "JsonApiExportDefinitionToManyLinkage": "json_api_export_definition_to_many_linkage",
+    "JsonApiFactLinkage": "json_api_fact_linkage",
+    "JsonApiFactOut": "json_api_fact_out",
+    "JsonApiFactOutAttributes": "json_api_fact_out_attributes",
+    "JsonApiFactOutDocument": "json_api_fact_out_document",
+    "JsonApiFactOutList": "json_api_fact_out_list",
+    "JsonApiFactOutRelationships": "json_api_fact_out_relationships",
+    "JsonApiFactOutWithLinks": "json_api_fact_out_with_links",
+    "JsonApiFactToManyLinkage": "json_api_fact_to_many_linkage",
+    "JsonApiFilterContextIn": "json_api_filter_context_in",
+    "JsonApiFilterContextInDocument": "json_api_filter_context_in_document",
+    "JsonApiFilterContextLinkage": "json_api_filter_context_linkage",
+    "JsonApiFilterContextOut": "json_api_filter_context_out",
+    "JsonApiFilterContextOutDocument": "json_api_filter_context_out_document",
+    "JsonApiFilterContextOutIncludes": "json_api_filter_context_out_includes",
+    "JsonApiFilterContextOutList": "json_api_filter_context_out_list",
+    "JsonApiFilterContextOutRelationships": "json_api_filter_context_out_relationships",
+    "JsonApiFilterContextOutWithLinks": "json_api_filter_context_out_with_links",
+    "JsonApiFilterContextPatch": "json_api_filter_context_patch",
+    "JsonApiFilterContextPatchDocument": "json_api_filter_context_patch_document",
+    "JsonApiFilterContextPostOptionalId": "json_api_filter_context_post_optional_id",
+    "JsonApiFilterContextPostOptionalIdDocument": "json_api_filter_context_post_optional_id_document",
+    "JsonApiFilterContextToManyLinkage": "json_api_filter_context_to_many_linkage",
+    "JsonApiFilterViewIn": "json_api_filter_view_in",
+    "JsonApiFilterViewInAttributes": "json_api_filter_view_in_attributes",
+    "JsonApiFilterViewInDocument": "json_api_filter_view_in_document",
+    "JsonApiFilterViewInRelationships": "json_api_filter_view_in_relationships",
+    "JsonApiFilterViewInRelationshipsUser": "json_api_filter_view_in_relationships_user",
+    "JsonApiFilterViewOut": "json_api_filter_view_out",
+    "JsonApiFilterViewOutDocument": "json_api_filter_view_out_document",
+    "JsonApiFilterViewOutIncludes": "json_api_filter_view_out_includes",
+    "JsonApiFilterViewOutList": "json_api_filter_view_out_list",
+    "JsonApiFilterViewOutWithLinks": "json_api_filter_view_out_with_links",
+    "JsonApiFilterViewPatch": "json_api_filter_view_patch",
+    "JsonApiFilterViewPatchAttributes": "json_api_filter_view_patch_attributes",
+    "JsonApiFilterViewPatchDocument": "json_api_filter_view_patch_document",
+    "JsonApiIdentityProviderIn": "json_api_identity_provider_in",
+    "JsonApiIdentityProviderInAttributes": "json_api_identity_provider_in_attributes",
+    "JsonApiIdentityProviderInDocument": "json_api_identity_provider_in_document",
+    "JsonApiIdentityProviderOut": "json_api_identity_provider_out",
+    "JsonApiIdentityProviderOutAttributes": "json_api_identity_provider_out_attributes",
+    "JsonApiIdentityProviderOutDocument": "json_api_identity_provider_out_document",
+    "JsonApiIdentityProviderOutList": "json_api_identity_provider_out_list",
+    "JsonApiIdentityProviderOutWithLinks": "json_api_identity_provider_out_with_links",
+    "JsonApiIdentityProviderPatch": "json_api_identity_provider_patch",
+    "JsonApiIdentityProviderPatchDocument": "json_api_identity_provider_patch_document",
+    "JsonApiJwkIn": "json_api_jwk_in",
+    "JsonApiJwkInAttributes": "json_api_jwk_in_attributes",
+    "JsonApiJwkInAttributesContent": "json_api_jwk_in_attributes_content",
+    "JsonApiJwkInDocument": "json_api_jwk_in_document",
+    "JsonApiJwkOut": "json_api_jwk_out",
+    "JsonApiJwkOutDocument": "json_api_jwk_out_document",
+    "JsonApiJwkOutList": "json_api_jwk_out_list",
+    "JsonApiJwkOutWithLinks": "json_api_jwk_out_with_links",
+    "JsonApiJwkPatch": "json_api_jwk_patch",
+    "JsonApiJwkPatchDocument": "json_api_jwk_patch_document",
+    "JsonApiLabelLinkage": "json_api_label_linkage",
+    "JsonApiLabelOut": "json_api_label_out",
+    "JsonApiLabelOutAttributes": "json_api_label_out_attributes",
+    "JsonApiLabelOutDocument": "json_api_label_out_document",
+    "JsonApiLabelOutList": "json_api_label_out_list",
+    "JsonApiLabelOutRelationships": "json_api_label_out_relationships",
+    "JsonApiLabelOutRelationshipsAttribute": "json_api_label_out_relationships_attribute",
+    "JsonApiLabelOutWithLinks": "json_api_label_out_with_links",
+    "JsonApiLabelToManyLinkage": "json_api_label_to_many_linkage",
+    "JsonApiLabelToOneLinkage": "json_api_label_to_one_linkage",
+    "JsonApiLlmEndpointIn": "json_api_llm_endpoint_in",
+    "JsonApiLlmEndpointInAttributes": "json_api_llm_endpoint_in_attributes",
+    "JsonApiLlmEndpointInDocument": "json_api_llm_endpoint_in_document",
+    "JsonApiLlmEndpointOut": "json_api_llm_endpoint_out",
+    "JsonApiLlmEndpointOutAttributes": "json_api_llm_endpoint_out_attributes",
+    "JsonApiLlmEndpointOutDocument": "json_api_llm_endpoint_out_document",
+    "JsonApiLlmEndpointOutList": "json_api_llm_endpoint_out_list",
+    "JsonApiLlmEndpointOutWithLinks": "json_api_llm_endpoint_out_with_links",
+    "JsonApiLlmEndpointPatch": "json_api_llm_endpoint_patch",
+    "JsonApiLlmEndpointPatchAttributes": "json_api_llm_endpoint_patch_attributes",
+    "JsonApiLlmEndpointPatchDocument": "json_api_llm_endpoint_patch_document",
+    "JsonApiMetricIn": "json_api_metric_in",
+    "JsonApiMetricInAttributes": "json_api_metric_in_attributes",
+    "JsonApiMetricInAttributesContent": "json_api_metric_in_attributes_content",
+    "JsonApiMetricInDocument": "json_api_metric_in_document",
+    "JsonApiMetricLinkage": "json_api_metric_linkage",
+    "JsonApiMetricOut": "json_api_metric_out",
+    "JsonApiMetricOutAttributes": "json_api_metric_out_attributes",
+    "JsonApiMetricOutDocument": "json_api_metric_out_document",
+    "JsonApiMetricOutIncludes": "json_api_metric_out_includes",
+    "JsonApiMetricOutList": "json_api_metric_out_list",
+    "JsonApiMetricOutRelationships": "json_api_metric_out_relationships",
+    "JsonApiMetricOutWithLinks": "json_api_metric_out_with_links",
+    "JsonApiMetricPatch": "json_api_metric_patch",
+    "JsonApiMetricPatchAttributes": "json_api_metric_patch_attributes",
+    "JsonApiMetricPatchDocument": "json_api_metric_patch_document",
+    "JsonApiMetricPostOptionalId": "json_api_metric_post_optional_id",
+    "JsonApiMetricPostOptionalIdDocument": "json_api_metric_post_optional_id_document",
+    "JsonApiMetricToManyLinkage": "json_api_metric_to_many_linkage",
+    "JsonApiNotificationChannelIn": "json_api_notification_channel_in",
+    "JsonApiNotificationChannelInAttributes": "json_api_notification_channel_in_attributes",
+    "JsonApiNotificationChannelInAttributesDestination": "json_api_notification_channel_in_attributes_destination",
+    "JsonApiNotificationChannelInDocument": "json_api_notification_channel_in_document",
+    "JsonApiNotificationChannelLinkage": "json_api_notification_channel_linkage",
+    "JsonApiNotificationChannelOut": "json_api_notification_channel_out",
+    "JsonApiNotificationChannelOutDocument": "json_api_notification_channel_out_document",
+    "JsonApiNotificationChannelOutList": "json_api_notification_channel_out_list",
+    "JsonApiNotificationChannelOutWithLinks": "json_api_notification_channel_out_with_links",
+    "JsonApiNotificationChannelPatch": "json_api_notification_channel_patch",
+    "JsonApiNotificationChannelPatchDocument": "json_api_notification_channel_patch_document",
+    "JsonApiNotificationChannelPostOptionalId": "json_api_notification_channel_post_optional_id",
+    "JsonApiNotificationChannelPostOptionalIdDocument": "json_api_notification_channel_post_optional_id_document",
+    "JsonApiNotificationChannelToOneLinkage": "json_api_notification_channel_to_one_linkage",
+    "JsonApiOrganizationIn": "json_api_organization_in",
+    "JsonApiOrganizationInAttributes": "json_api_organization_in_attributes",
+    "JsonApiOrganizationInDocument": "json_api_organization_in_document",
+    "JsonApiOrganizationOut": "json_api_organization_out",
+    "JsonApiOrganizationOutAttributes": "json_api_organization_out_attributes",
+    "JsonApiOrganizationOutAttributesCacheSettings": "json_api_organization_out_attributes_cache_settings",
+    "JsonApiOrganizationOutDocument": "json_api_organization_out_document",
+    "JsonApiOrganizationOutIncludes": "json_api_organization_out_includes",
+    "JsonApiOrganizationOutMeta": "json_api_organization_out_meta",
+    "JsonApiOrganizationOutRelationships": "json_api_organization_out_relationships",
+    "JsonApiOrganizationOutRelationshipsBootstrapUserGroup": "json_api_organization_out_relationships_bootstrap_user_group",
+    "JsonApiOrganizationPatch": "json_api_organization_patch",
+    "JsonApiOrganizationPatchDocument": "json_api_organization_patch_document",
+    "JsonApiOrganizationSettingIn": "json_api_organization_setting_in",
+    "JsonApiOrganizationSettingInAttributes": "json_api_organization_setting_in_attributes",
+    "JsonApiOrganizationSettingInDocument": "json_api_organization_setting_in_document",
+    "JsonApiOrganizationSettingOut": "json_api_organization_setting_out",
+    "JsonApiOrganizationSettingOutDocument": "json_api_organization_setting_out_document",
+    "JsonApiOrganizationSettingOutList": "json_api_organization_setting_out_list",
+    "JsonApiOrganizationSettingOutWithLinks": "json_api_organization_setting_out_with_links",
+    "JsonApiOrganizationSettingPatch": "json_api_organization_setting_patch",
+    "JsonApiOrganizationSettingPatchDocument": "json_api_organization_setting_patch_document",
+    "JsonApiThemeIn": "json_api_theme_in",
+    "JsonApiThemeInDocument": "json_api_theme_in_document",
+    "JsonApiThemeOut": "json_api_theme_out",
+    "JsonApiThemeOutDocument": "json_api_theme_out_document",
+    "JsonApiThemeOutList": "json_api_theme_out_list",
+    "JsonApiThemeOutWithLinks": "json_api_theme_out_with_links",
+    "JsonApiThemePatch": "json_api_theme_patch",
+    "JsonApiThemePatchDocument": "json_api_theme_patch_document",
+    "JsonApiUserDataFilterIn": "json_api_user_data_filter_in",
+    "JsonApiUserDataFilterInAttributes": "json_api_user_data_filter_in_attributes",
+    "JsonApiUserDataFilterInDocument": "json_api_user_data_filter_in_document",
+    "JsonApiUserDataFilterInRelationships": "json_api_user_data_filter_in_relationships",
+    "JsonApiUserDataFilterOut": "json_api_user_data_filter_out",
+    "JsonApiUserDataFilterOutDocument": "json_api_user_data_filter_out_document",
+    "JsonApiUserDataFilterOutIncludes": "json_api_user_data_filter_out_includes",
+    "JsonApiUserDataFilterOutList": "json_api_user_data_filter_out_list",
+    "JsonApiUserDataFilterOutRelationships": "json_api_user_data_filter_out_relationships",
+    "JsonApiUserDataFilterOutWithLinks": "json_api_user_data_filter_out_with_links",
+    "JsonApiUserDataFilterPatch": "json_api_user_data_filter_patch",
+    "JsonApiUserDataFilterPatchAttributes": "json_api_user_data_filter_patch_attributes",
+    "JsonApiUserDataFilterPatchDocument": "json_api_user_data_filter_patch_document",
+    "JsonApiUserDataFilterPostOptionalId": "json_api_user_data_filter_post_optional_id",
+    "JsonApiUserDataFilterPostOptionalIdDocument": "json_api_user_data_filter_post_optional_id_document",
+    "JsonApiUserGroupIn": "json_api_user_group_in",
+    "JsonApiUserGroupInAttributes": "json_api_user_group_in_attributes",
+    "JsonApiUserGroupInDocument": "json_api_user_group_in_document",
+    "JsonApiUserGroupInRelationships": "json_api_user_group_in_relationships",
+    "JsonApiUserGroupInRelationshipsParents": "json_api_user_group_in_relationships_parents",
+    "JsonApiUserGroupLinkage": "json_api_user_group_linkage",
+    "JsonApiUserGroupOut": "json_api_user_group_out",
+    "JsonApiUserGroupOutDocument": "json_api_user_group_out_document",
+    "JsonApiUserGroupOutList": "json_api_user_group_out_list",
+    "JsonApiUserGroupOutWithLinks": "json_api_user_group_out_with_links",
+    "JsonApiUserGroupPatch": "json_api_user_group_patch",
+    "JsonApiUserGroupPatchDocument": "json_api_user_group_patch_document",
+    "JsonApiUserGroupToManyLinkage": "json_api_user_group_to_many_linkage",
+    "JsonApiUserGroupToOneLinkage": "json_api_user_group_to_one_linkage",
+    "JsonApiUserIdentifierLinkage": "json_api_user_identifier_linkage",
+    "JsonApiUserIdentifierOut": "json_api_user_identifier_out",
+    "JsonApiUserIdentifierOutAttributes": "json_api_user_identifier_out_attributes",
+    "JsonApiUserIdentifierOutDocument": "json_api_user_identifier_out_document",
+    "JsonApiUserIdentifierOutList": "json_api_user_identifier_out_list",
+    "JsonApiUserIdentifierOutWithLinks": "json_api_user_identifier_out_with_links",
+    "JsonApiUserIdentifierToOneLinkage": "json_api_user_identifier_to_one_linkage",
+    "JsonApiUserIn": "json_api_user_in",
+    "JsonApiUserInAttributes": "json_api_user_in_attributes",
+    "JsonApiUserInDocument": "json_api_user_in_document",
+    "JsonApiUserInRelationships": "json_api_user_in_relationships",
+    "JsonApiUserLinkage": "json_api_user_linkage",
+    "JsonApiUserOut": "json_api_user_out",
+    "JsonApiUserOutDocument": "json_api_user_out_document",
+    "JsonApiUserOutList": "json_api_user_out_list",
+    "JsonApiUserOutWithLinks": "json_api_user_out_with_links",
+    "JsonApiUserPatch": "json_api_user_patch",
+    "JsonApiUserPatchDocument": "json_api_user_patch_document",
+    "JsonApiUserSettingIn": "json_api_user_setting_in",
+    "JsonApiUserSettingInDocument": "json_api_user_setting_in_document",
+    "JsonApiUserSettingOut": "json_api_user_setting_out",
+    "JsonApiUserSettingOutDocument": "json_api_user_setting_out_document",
+    "JsonApiUserSettingOutList": "json_api_user_setting_out_list",
+    "JsonApiUserSettingOutWithLinks": "json_api_user_setting_out_with_links",
+    "JsonApiUserToManyLinkage": "json_api_user_to_many_linkage",
+    "JsonApiUserToOneLinkage": "json_api_user_to_one_linkage",
+    "JsonApiVisualizationObjectIn": "json_api_visualization_object_in",
+    "JsonApiVisualizationObjectInDocument": "json_api_visualization_object_in_document",
+    "JsonApiVisualizationObjectLinkage": "json_api_visualization_object_linkage",
+    "JsonApiVisualizationObjectOut": "json_api_visualization_object_out",
+    "JsonApiVisualizationObjectOutDocument": "json_api_visualization_object_out_document",
+    "JsonApiVisualizationObjectOutList": "json_api_visualization_object_out_list",
+    "JsonApiVisualizationObjectOutWithLinks": "json_api_visualization_object_out_with_links",
+    "JsonApiVisualizationObjectPatch": "json_api_visualization_object_patch",
+    "JsonApiVisualizationObjectPatchDocument": "json_api_visualization_object_patch_document",
+    "JsonApiVisualizationObjectPostOptionalId": "json_api_visualization_object_post_optional_id",
+    "JsonApiVisualizationObjectPostOptionalIdDocument": "json_api_visualization_object_post_optional_id_document",
+    "JsonApiVisualizationObjectToManyLinkage": "json_api_visualization_object_to_many_linkage",
+    "JsonApiVisualizationObjectToOneLinkage": "json_api_visualization_object_to_one_linkage",
+    "JsonApiWorkspaceDataFilterIn": "json_api_workspace_data_filter_in",
+    "JsonApiWorkspaceDataFilterInAttributes": "json_api_workspace_data_filter_in_attributes",
+    "JsonApiWorkspaceDataFilterInDocument": "json_api_workspace_data_filter_in_document",
+    "JsonApiWorkspaceDataFilterInRelationships": "json_api_workspace_data_filter_in_relationships",
+    "JsonApiWorkspaceDataFilterInRelationshipsFilterSettings": "json_api_workspace_data_filter_in_relationships_filter_settings",
+    "JsonApiWorkspaceDataFilterLinkage": "json_api_workspace_data_filter_linkage",
+    "JsonApiWorkspaceDataFilterOut": "json_api_workspace_data_filter_out",
+    "JsonApiWorkspaceDataFilterOutDocument": "json_api_workspace_data_filter_out_document",
+    "JsonApiWorkspaceDataFilterOutList": "json_api_workspace_data_filter_out_list",
+    "JsonApiWorkspaceDataFilterOutWithLinks": "json_api_workspace_data_filter_out_with_links",
+    "JsonApiWorkspaceDataFilterPatch": "json_api_workspace_data_filter_patch",
+    "JsonApiWorkspaceDataFilterPatchDocument": "json_api_workspace_data_filter_patch_document",
+    "JsonApiWorkspaceDataFilterSettingIn": "json_api_workspace_data_filter_setting_in",
+    "JsonApiWorkspaceDataFilterSettingInAttributes": "json_api_workspace_data_filter_setting_in_attributes",
+    "JsonApiWorkspaceDataFilterSettingInDocument": "json_api_workspace_data_filter_setting_in_document",
+    "JsonApiWorkspaceDataFilterSettingInRelationships": "json_api_workspace_data_filter_setting_in_relationships",
+    "JsonApiWorkspaceDataFilterSettingInRelationshipsWorkspaceDataFilter": "json_api_workspace_data_filter_setting_in_relationships_workspace_data_filter",
+    "JsonApiWorkspaceDataFilterSettingLinkage": "json_api_workspace_data_filter_setting_linkage",
+    "JsonApiWorkspaceDataFilterSettingOut": "json_api_workspace_data_filter_setting_out",
+    "JsonApiWorkspaceDataFilterSettingOutDocument": "json_api_workspace_data_filter_setting_out_document",
+    "JsonApiWorkspaceDataFilterSettingOutList": "json_api_workspace_data_filter_setting_out_list",
+    "JsonApiWorkspaceDataFilterSettingOutWithLinks": "json_api_workspace_data_filter_setting_out_with_links",
+    "JsonApiWorkspaceDataFilterSettingPatch": "json_api_workspace_data_filter_setting_patch",
+    "JsonApiWorkspaceDataFilterSettingPatchDocument": "json_api_workspace_data_filter_setting_patch_document",
+    "JsonApiWorkspaceDataFilterSettingToManyLinkage": "json_api_workspace_data_filter_setting_to_many_linkage",
+    "JsonApiWorkspaceDataFilterToManyLinkage": "json_api_workspace_data_filter_to_many_linkage",
+    "JsonApiWorkspaceDataFilterToOneLinkage": "json_api_workspace_data_filter_to_one_linkage",
+    "JsonApiWorkspaceIn": "json_api_workspace_in",
+    "JsonApiWorkspaceInAttributes": "json_api_workspace_in_attributes",
+    "JsonApiWorkspaceInAttributesDataSource": "json_api_workspace_in_attributes_data_source",
+    "JsonApiWorkspaceInDocument": "json_api_workspace_in_document",
+    "JsonApiWorkspaceInRelationships": "json_api_workspace_in_relationships",
+    "JsonApiWorkspaceInRelationshipsParent": "json_api_workspace_in_relationships_parent",
+    "JsonApiWorkspaceLinkage": "json_api_workspace_linkage",
+    "JsonApiWorkspaceOut": "json_api_workspace_out",
+    "JsonApiWorkspaceOutDocument": "json_api_workspace_out_document",
+    "JsonApiWorkspaceOutList": "json_api_workspace_out_list",
+    "JsonApiWorkspaceOutMeta": "json_api_workspace_out_meta",
+    "JsonApiWorkspaceOutMetaConfig": "json_api_workspace_out_meta_config",
+    "JsonApiWorkspaceOutMetaDataModel": "json_api_workspace_out_meta_data_model",
+    "JsonApiWorkspaceOutMetaHierarchy": "json_api_workspace_out_meta_hierarchy",
+    "JsonApiWorkspaceOutWithLinks": "json_api_workspace_out_with_links",
+    "JsonApiWorkspacePatch": "json_api_workspace_patch",
+    "JsonApiWorkspacePatchDocument": "json_api_workspace_patch_document",
+    "JsonApiWorkspaceSettingIn": "json_api_workspace_setting_in",
+    "JsonApiWorkspaceSettingInDocument": "json_api_workspace_setting_in_document",
+    "JsonApiWorkspaceSettingOut": "json_api_workspace_setting_out",
+    "JsonApiWorkspaceSettingOutDocument": "json_api_workspace_setting_out_document",
+    "JsonApiWorkspaceSettingOutList": "json_api_workspace_setting_out_list",
+    "JsonApiWorkspaceSettingOutWithLinks": "json_api_workspace_setting_out_with_links",
+    "JsonApiWorkspaceSettingPatch": "json_api_workspace_setting_patch",
+    "JsonApiWorkspaceSettingPatchDocument": "json_api_workspace_setting_patch_document",
+    "JsonApiWorkspaceSettingPostOptionalId": "json_api_workspace_setting_post_optional_id",
+    "JsonApiWorkspaceSettingPostOptionalIdDocument": "json_api_workspace_setting_post_optional_id_document",
+    "JsonApiWorkspaceToOneLinkage": "json_api_workspace_to_one_linkage",
+    "JsonNode": "json_node",
+    "KeyDriversDimension": "key_drivers_dimension",
+    "KeyDriversRequest": "key_drivers_request",
+    "KeyDriversResponse": "key_drivers_response",
+    "KeyDriversResult": "key_drivers_result",
+    "LabelIdentifier": "label_identifier",
+    "ListLinks": "list_links",
+    "ListLinksAllOf": "list_links_all_of",
+    "LocalIdentifier": "local_identifier",
+    "LocaleRequest": "locale_request",
+    "ManageDashboardPermissionsRequestInner": "manage_dashboard_permissions_request_inner",
+    "MeasureDefinition": "measure_definition",
+    "MeasureExecutionResultHeader": "measure_execution_result_header",
+    "MeasureGroupHeaders": "measure_group_headers",
+    "MeasureHeaderOut": "measure_header_out",
+    "MeasureItem": "measure_item",
+    "MeasureResultHeader": "measure_result_header",
+    "MeasureValueFilter": "measure_value_filter",
+    "Metric": "metric",
+    "NegativeAttributeFilter": "negative_attribute_filter",
+    "NegativeAttributeFilterNegativeAttributeFilter": "negative_attribute_filter_negative_attribute_filter",
+    "Note": "note",
+    "Notes": "notes",
+    "NotificationChannelDestination": "notification_channel_destination",
+    "ObjectLinks": "object_links",
+    "ObjectLinksContainer": "object_links_container",
+    "OrganizationPermissionAssignment": "organization_permission_assignment",
+    "PageMetadata": "page_metadata",
+    "Paging": "paging",
+    "Parameter": "parameter",
+    "PdfTableStyle": "pdf_table_style",
+    "PdfTableStyleProperty": "pdf_table_style_property",
+    "PdmLdmRequest": "pdm_ldm_request",
+    "PdmSql": "pdm_sql",
+    "PermissionsAssignment": "permissions_assignment",
+    "PermissionsForAssignee": "permissions_for_assignee",
+    "PermissionsForAssigneeRule": "permissions_for_assignee_rule",
+    "PlatformUsage": "platform_usage",
+    "PlatformUsageRequest": "platform_usage_request",
+    "PopDataset": "pop_dataset",
+    "PopDatasetMeasureDefinition": "pop_dataset_measure_definition",
+    "PopDatasetMeasureDefinitionPreviousPeriodMeasure": "pop_dataset_measure_definition_previous_period_measure",
+    "PopDate": "pop_date",
+    "PopDateMeasureDefinition": "pop_date_measure_definition",
+    "PopDateMeasureDefinitionOverPeriodMeasure": "pop_date_measure_definition_over_period_measure",
+    "PopMeasureDefinition": "pop_measure_definition",
+    "PositiveAttributeFilter": "positive_attribute_filter",
+    "PositiveAttributeFilterPositiveAttributeFilter": "positive_attribute_filter_positive_attribute_filter",
+    "Range": "range",
+    "RangeMeasureValueFilter": "range_measure_value_filter",
+    "RangeMeasureValueFilterRangeMeasureValueFilter": "range_measure_value_filter_range_measure_value_filter",
+    "RangeWrapper": "range_wrapper",
+    "RankingFilter": "ranking_filter",
+    "RankingFilterRankingFilter": "ranking_filter_ranking_filter",
+    "ReferenceIdentifier": "reference_identifier",
+    "ReferenceSourceColumn": "reference_source_column",
+    "Relative": "relative",
+    "RelativeDateFilter": "relative_date_filter",
+    "RelativeDateFilterRelativeDateFilter": "relative_date_filter_relative_date_filter",
+    "RelativeWrapper": "relative_wrapper",
+    "ResolveSettingsRequest": "resolve_settings_request",
+    "ResolvedSetting": "resolved_setting",
+    "RestApiIdentifier": "rest_api_identifier",
+    "ResultCacheMetadata": "result_cache_metadata",
+    "ResultDimension": "result_dimension",
+    "ResultDimensionHeader": "result_dimension_header",
+    "ResultSpec": "result_spec",
+    "RouteRequest": "route_request",
+    "RouteResult": "route_result",
+    "RsaSpecification": "rsa_specification",
+    "RulePermission": "rule_permission",
+    "ScanRequest": "scan_request",
+    "ScanResultPdm": "scan_result_pdm",
+    "ScanSqlRequest": "scan_sql_request",
+    "ScanSqlResponse": "scan_sql_response",
+    "SearchRelationshipObject": "search_relationship_object",
+    "SearchRequest": "search_request",
+    "SearchResult": "search_result",
+    "SearchResultObject": "search_result_object",
+    "Settings": "settings",
+    "SimpleMeasureDefinition": "simple_measure_definition",
+    "SimpleMeasureDefinitionMeasure": "simple_measure_definition_measure",
+    "Skeleton": "skeleton",
+    "SmartFunctionResponse": "smart_function_response",
+    "Smtp": "smtp",
+    "SmtpAllOf": "smtp_all_of",
+    "SortKey": "sort_key",
+    "SortKeyAttribute": "sort_key_attribute",
+    "SortKeyAttributeAttribute": "sort_key_attribute_attribute",
+    "SortKeyTotal": "sort_key_total",
+    "SortKeyTotalTotal": "sort_key_total_total",
+    "SortKeyValue": "sort_key_value",
+    "SortKeyValueValue": "sort_key_value_value",
+    "SqlColumn": "sql_column",
+    "SqlQuery": "sql_query",
+    "SqlQueryAllOf": "sql_query_all_of",
+    "Table": "table",
+    "TableAllOf": "table_all_of",
+    "TableOverride": "table_override",
+    "TableWarning": "table_warning",
+    "TabularExportRequest": "tabular_export_request",
+    "TestDefinitionRequest": "test_definition_request",
+    "TestQueryDuration": "test_query_duration",
+    "TestRequest": "test_request",
+    "TestResponse": "test_response",
+    "Total": "total",
+    "TotalDimension": "total_dimension",
+    "TotalExecutionResultHeader": "total_execution_result_header",
+    "TotalResultHeader": "total_result_header",
+    "UserAssignee": "user_assignee",
+    "UserContext": "user_context",
+    "UserGroupAssignee": "user_group_assignee",
+    "UserGroupIdentifier": "user_group_identifier",
+    "UserGroupPermission": "user_group_permission",
+    "UserManagementDataSourcePermissionAssignment": "user_management_data_source_permission_assignment",
+    "UserManagementPermissionAssignments": "user_management_permission_assignments",
+    "UserManagementUserGroupMember": "user_management_user_group_member",
+    "UserManagementUserGroupMembers": "user_management_user_group_members",
+    "UserManagementUserGroups": "user_management_user_groups",
+    "UserManagementUserGroupsItem": "user_management_user_groups_item",
+    "UserManagementUsers": "user_management_users",
+    "UserManagementUsersItem": "user_management_users_item",
+    "UserManagementWorkspacePermissionAssignment": "user_management_workspace_permission_assignment",
+    "UserPermission": "user_permission",
+    "ValidateByItem": "validate_by_item",
+    "Value": "value",
+    "VisualExportRequest": "visual_export_request",
+    "Webhook": "webhook",
+    "WebhookAllOf": "webhook_all_of",
+    "WorkspaceDataSource": "workspace_data_source",
+    "WorkspaceIdentifier": "workspace_identifier",
+    "WorkspacePermissionAssignment": "workspace_permission_assignment",
+    "WorkspaceUser": "workspace_user",
+    "WorkspaceUserGroup": "workspace_user_group",
+    "WorkspaceUserGroups": "workspace_user_groups",
+    "WorkspaceUsers": "workspace_users",
+    "Xliff": "xliff",
+}
+
+__all__ = list(_MODELS)
+
+
+def __getattr__(name):
+    module_name = _MODELS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"gooddata_api_client.model.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return __all__
@@ -25,7 +25,7 @@ VERSION = "1.32.2"
 # http://pypi.python.org/pypi/setuptools
 
 REQUIRES = [
-  "urllib3 >= 1.25.3",
+  "urllib3 >= 1.26.0",
   "python-dateutil",
 ]
 
@@ -0,0 +1,151 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from functools import cached_property
+from typing import Optional
+
+from gooddata_sdk import GoodDataSdk
+
+from gooddata_fdw.environment import ColumnDefinition, Qual
+from gooddata_fdw.pg_logging import _log_debug, _log_warn
+
+DEFAULT_ELEMENTS_COUNT = 100
+"""
+Number of distinct values assumed for a label whose elements cannot be counted.
+"""
+
+MAX_ESTIMATED_ROWS = 100_000_000
+"""
+Upper bound of the estimated number of rows - the product of label element counts grows very fast.
+"""
+
+DEFAULT_SELECTIVITY = 1 / 3
+"""
+Selectivity of quals which cannot be estimated, the same value is used by postgres for inequalities.
+"""
+
+_TYPE_WIDTHS = {
+    "boolean": 1,
+    "smallint": 2,
+    "integer": 4,
+    "int": 4,
+    "date": 4,
+    "real": 4,
+    "bigint": 8,
+    "double precision": 8,
+    "timestamp": 8,
+    "timestamp without time zone": 8,
+    "timestamp with time zone": 8,
+}
+_NUMERIC_WIDTH = 16
+_DEFAULT_TEXT_WIDTH = 32
+_TYPE_LENGTH = re.compile(r"\((\d+)")
+
+
+def _column_width(column: ColumnDefinition) -> int:
+    base_type_name = column.base_type_name.lower()
+    if base_type_name in _TYPE_WIDTHS:
+        return _TYPE_WIDTHS[base_type_name]
+    if base_type_name.startswith(("numeric", "decimal")):
+        return _NUMERIC_WIDTH
+
+    # text values are usually much shorter than the declared maximum length
+    length = _TYPE_LENGTH.search(column.type_name)
+    return min(int(length.group(1)), _DEFAULT_TEXT_WIDTH) if length else _DEFAULT_TEXT_WIDTH
+
+
+class RelSizeEstimator:
+    """
+    Estimates the number of rows and their width for the postgres planner.
+
+    The planner asks for the estimates repeatedly, so nothing is computed. The row count of a set of attribute
+    columns is known exactly once such table was read without filters - the total size is part of the paging
+    of the execution result. Until then, the row count is estimated as the product of element counts of
+    the labels. The element counts are read once and kept for the lifetime of the estimator.
+    """
+
+    def __init__(self, sdk: GoodDataSdk, workspace: str, table_columns: dict[str, ColumnDefinition]) -> None:
+        self._sdk = sdk
+        self._workspace = workspace
+        self._table_columns = table_columns
+        self._elements_counts: dict[str, int] = {}
+        self._observed_rows: dict[frozenset[str], int] = {}
+
+    @cached_property
+    def _label_columns(self) -> dict[str, str]:
+        return {
+            name: col.options["id"]
+            for name, col in self._table_columns.items()
+            if col.options.get("id", "").startswith("label/")
+        }
+
+    @property
+    def label_columns(self) -> list[str]:
+        return list(self._label_columns)
+
+    def record_rows(self, columns: Iterable[str], rows: int) -> None:
+        """
+        Records the number of rows of a result computed from the given columns without any filter.
+        """
+        self._observed_rows[self._attribute_key(columns)] = rows
+
+    def elements_count(self, column_name: str) -> int:
+        count = self._elements_counts.get(column_name)
+        if count is None:
+            try:
+                count = self._sdk.catalog_workspace_content.get_label_elements_count(
+                    self._workspace, self._label_columns[column_name]
+                )
+            except Exception as e:
+                # estimates must never break planning of the query
+                _log_warn(f"unable to count elements of {column_name}, using default estimate; {e}")
+                count = DEFAULT_ELEMENTS_COUNT
+            count = max(count, 1)
+            self._elements_counts[column_name] = count
+        return count
+
+    def estimate_rows(self, columns: Iterable[str], quals: Optional[list[Qual]] = None) -> int:
+        """
+        Estimates the number of rows of a result computed from the given columns and filtered by quals.
+        """
+        key = self._attribute_key(columns)
+        rows = self._observed_rows.get(key)
+        if rows is None:
+            rows = 1
+            for column_name in key:
+                rows = min(rows * self.elements_count(column_name), MAX_ESTIMATED_ROWS)
+
+        selectivity = 1.0
+        for qual in quals or []:
+            selectivity *= self._qual_selectivity(qual)
+        estimate = max(int(rows * selectivity), 1)
+        _log_debug(f"estimated {estimate} rows for columns {sorted(key)} and quals {quals}")
+        return estimate
+
+    def estimate_width(self, columns: Iterable[str]) -> int:
+        return sum(_column_width(self._table_columns[c]) for c in columns if c in self._table_columns)
+
+    def _attribute_key(self, columns: Iterable[str]) -> frozenset[str]:
+        # metric columns do not change the number of rows, only the attributes do
+        return frozenset(c for c in columns if c in self._label_columns)
+
+    def _qual_selectivity(self, qual: Qual) -> float:
+        if qual.field_name not in self._label_columns:
+            return DEFAULT_SELECTIVITY
+
+        elements = self.elements_count(qual.field_name)
+        if isinstance(qual.operator, tuple):
+            # <op> ANY/ALL (values), the second item is True for ANY
+            operator, is_any = qual.operator
+            matching = min(len(qual.value) / elements, 1.0)
+            if operator == "=" and is_any:
+                return matching
+            if operator == "<>" and not is_any:
+                return 1.0 - matching
+        elif qual.operator == "=":
+            return 1 / elements
+        elif qual.operator == "<>":
+            return 1.0 - 1 / elements
+        return DEFAULT_SELECTIVITY
@@ -1,16 +1,19 @@
 # (C) 2022 GoodData Corporation
 from __future__ import annotations
 
-from collections.abc import Generator
+import itertools
+from collections.abc import Iterator
 from typing import Any, NamedTuple, Optional
 
-from gooddata_sdk import GoodDataSdk
+from gooddata_sdk import GoodDataSdk, SortDirection
 
 import gooddata_fdw.column_validation as col_val
 from gooddata_fdw import column_utils
-from gooddata_fdw.environment import ColumnDefinition, Qual
+from gooddata_fdw.environment import ColumnDefinition, Qual, SortKey
+from gooddata_fdw.estimates import MAX_ESTIMATED_ROWS, RelSizeEstimator
 from gooddata_fdw.filter import extract_filters_from_quals
 from gooddata_fdw.options import ServerOptions, TableOptions
+from gooddata_fdw.pg_logging import _log_debug
 from gooddata_fdw.result_reader import InsightTableResultReader, TableResultReader
 
 
@@ -21,6 +24,10 @@ class InitData(NamedTuple):
     columns: dict[str, ColumnDefinition]
 
 
+def _apply_offset(rows: Iterator[dict[str, Any]], offset: Optional[int]) -> Iterator[dict[str, Any]]:
+    return itertools.islice(rows, offset, None) if offset else rows
+
+
 class Executor:
     def __init__(self, inputs: InitData, column_validators: list[col_val.ColumnValidator]) -> None:
         self._sdk = inputs.sdk
@@ -36,11 +43,134 @@ class Executor:
             for validator in self._column_validators:
                 validator.validate(column_name, column_def)
 
+    def get_rel_size(self, quals: list[Qual], columns: list[str]) -> tuple[int, int]:
+        """
+        Returns estimated number of rows and their width in bytes for the postgres planner.
+        """
+        return MAX_ESTIMATED_ROWS, len(columns) * 100
+
+    def get_path_keys(self) -> list[tuple[tuple[str, ...], int]]:
+        """
+        Returns columns which can be used for lookups together with the estimated number of rows per lookup.
+        """
+        return []
+
+    def can_sort(self, sort_keys: list[SortKey]) -> list[SortKey]:
+        """
+        Returns the sort keys which the executor is able to push down. By default, postgres sorts the rows itself.
+        """
+        return []
+
+    def can_limit(self, limit: Optional[int], offset: Optional[int]) -> bool:
+        """
+        Returns True if the executor is able to push down LIMIT and OFFSET. By default, postgres applies them itself.
+        """
+        return False
+
     def execute(
-        self, quals: list[Qual], columns: list[str], sort_keys: Optional[list[Any]] = None
-    ) -> Generator[dict[str, Any], None, None]:
+        self,
+        quals: list[Qual],
+        columns: list[str],
+        sort_keys: Optional[list[Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> Iterator[dict[str, Any]]:
+        raise NotImplementedError()
+
+
+class ComputableExecutor(Executor):
+    """
+    Base for executors computing table columns mapped to labels, facts and metrics. The sorting and limit
+    is pushed down to the computation so that the server sorts the result and only the needed pages are read.
+
+    The server sorts labels by the sort column defined in the LDM using its own collation, which does not have to
+    match the order in which postgres sorts the label values. Sorting by label columns is therefore pushed down
+    only when enabled by the `push_down_label_sort` table option.
+    """
+
+    def __init__(self, inputs: InitData, column_validators: list[col_val.ColumnValidator]) -> None:
+        super().__init__(inputs, column_validators)
+        self._workspace = inputs.table_options.workspace
+        self._results_reader = TableResultReader(self._table_columns)
+        self._estimator = RelSizeEstimator(self._sdk, self._workspace, self._table_columns)
+        self._push_down_label_sort = inputs.table_options.push_down_label_sort
+        self._quals_pushed_down = False
+
+    def get_rel_size(self, quals: list[Qual], columns: list[str]) -> tuple[int, int]:
+        # postgres plans the limit after the relation size; see can_limit
+        self._quals_pushed_down = len(extract_filters_from_quals(quals, self._table_columns)) == len(quals)
+        rows = self._estimator.estimate_rows(self._columns_to_compute(columns), quals)
+        return rows, self._estimator.estimate_width(columns)
+
+    def get_path_keys(self) -> list[tuple[tuple[str, ...], int]]:
+        # equality quals on label columns are pushed down as attribute filters
+        rows = self._estimator.estimate_rows(self._table_columns)
+        return [
+            ((column_name,), max(rows // self._estimator.elements_count(column_name), 1))
+            for column_name in self._estimator.label_columns
+        ]
+
+    def can_sort(self, sort_keys: list[SortKey]) -> list[SortKey]:
+        # postgres requires that the pushed down sort keys are a prefix of the requested ones. Only the default
+        # collation and null ordering (NULLS LAST for ASC, NULLS FIRST for DESC) can be pushed down.
+        supported = []
+        for sort_key in sort_keys:
+            if (
+                not self._can_sort_column(sort_key.attname)
+                or sort_key.collate is not None
+                or sort_key.nulls_first != sort_key.is_reversed
+            ):
+                break
+            supported.append(sort_key)
+        return supported
+
+    def _can_sort_column(self, column_name: str) -> bool:
+        column = self._table_columns.get(column_name)
+        if column is None:
+            return False
+        return self._push_down_label_sort or not column.options.get("id", "").startswith("label/")
+
+    def can_limit(self, limit: Optional[int], offset: Optional[int]) -> bool:
+        # the limit is pushed down only when all quals are pushed down as filters, see execute
+        return self._quals_pushed_down
+
+    def _columns_to_compute(self, columns: list[str]) -> list[str]:
         raise NotImplementedError()
 
+    def execute(
+        self,
+        quals: list[Qual],
+        columns: list[str],
+        sort_keys: Optional[list[Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> Iterator[dict[str, Any]]:
+        sort_keys = sort_keys or []
+        col_names = self._columns_to_compute(columns)
+        # sorting by a column which is not selected still requires the column to be computed
+        col_names += [k.attname for k in sort_keys if k.attname not in col_names]
+        items = [column_utils.table_col_as_computable(self._table_columns[col_name]) for col_name in col_names]
+        # TODO: push down more filters that are included in quals
+        filters = extract_filters_from_quals(quals, self._table_columns)
+        sort_by = [(k.attname, SortDirection.DESC if k.is_reversed else SortDirection.ASC) for k in sort_keys]
+
+        row_limit = None
+        if limit is not None:
+            if len(filters) == len(quals):
+                row_limit = limit + (offset or 0)
+            else:
+                # postgres re-checks quals which are not pushed down, truncated result could miss matching rows
+                _log_debug("limit is not pushed down, not all quals were converted to filters")
+                offset = None
+
+        table = self._sdk.tables.for_items(
+            self._workspace, items, filters, streaming=True, sort_by=sort_by, row_limit=row_limit
+        )
+        if not filters and row_limit is None:
+            self._estimator.record_rows(col_names, len(table))
+
+        return _apply_offset(self._results_reader.read_all_rows(table), offset)
+
 
 class InsightExecutor(Executor):
     _COLUMN_VALIDATORS = [col_val.LocalIdOptionValidator(), col_val.IdOptionValidator(mandatory=False)]
@@ -53,66 +183,73 @@ class InsightExecutor(Executor):
         self._insight = inputs.table_options.insight
 
         self._table_columns = inputs.columns
+        self._observed_rows: Optional[int] = None
+        self._has_quals = True
 
     @classmethod
     def can_react(cls, inputs: InitData) -> bool:
         return inputs.table_options.insight is not None
 
+    def get_rel_size(self, quals: list[Qual], columns: list[str]) -> tuple[int, int]:
+        self._has_quals = bool(quals)
+        if self._observed_rows is None:
+            return super().get_rel_size(quals, columns)
+        # quals are evaluated by postgres, so they do not reduce the number of rows returned by the insight
+        return self._observed_rows, len(columns) * 100
+
+    def can_limit(self, limit: Optional[int], offset: Optional[int]) -> bool:
+        # see execute
+        return not self._has_quals
+
     def execute(
-        self, quals: list[Qual], columns: list[str], sort_keys: Optional[list[Any]] = None
-    ) -> Generator[dict[str, Any], None, None]:
+        self,
+        quals: list[Qual],
+        columns: list[str],
+        sort_keys: Optional[list[Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> Iterator[dict[str, Any]]:
         results_reader = InsightTableResultReader(self._table_columns, columns)
         insight = self._sdk.visualizations.get_visualization(self._workspace, self._insight)
-        table = self._sdk.tables.for_visualization(self._workspace, insight)
+        # quals are not pushed down to insights, postgres filters the rows so the limit can be applied only without them
+        row_limit = limit + (offset or 0) if limit is not None and not quals else None
+        if row_limit is None:
+            offset = None
+        table = self._sdk.tables.for_visualization(self._workspace, insight, streaming=True, row_limit=row_limit)
+        if row_limit is None:
+            self._observed_rows = len(table)
 
-        return results_reader.read_all_rows(table)
+        return _apply_offset(results_reader.read_all_rows(table), offset)
 
 
-class ComputeExecutor(Executor):
+class ComputeExecutor(ComputableExecutor):
     _COLUMN_VALIDATORS: list[col_val.ColumnValidator] = [col_val.IdOptionValidator(mandatory=True)]
 
     def __init__(self, inputs: InitData) -> None:
         super().__init__(inputs, self._COLUMN_VALIDATORS)
-        self._workspace = inputs.table_options.workspace
-        self._results_reader = TableResultReader(self._table_columns)
 
     @classmethod
     def can_react(cls, inputs: InitData) -> bool:
         return inputs.table_options.compute is not None
 
-    def execute(
-        self, quals: list[Qual], columns: list[str], sort_keys: Optional[list[Any]] = None
-    ) -> Generator[dict[str, Any], None, None]:
+    def _columns_to_compute(self, columns: list[str]) -> list[str]:
         col_val.validate_columns_in_table_def(self._table_columns, columns)
-        items = [column_utils.table_col_as_computable(self._table_columns[col_name]) for col_name in columns]
-        # TODO: push down more filters that are included in quals
-        filters = extract_filters_from_quals(quals, self._table_columns)
-        table = self._sdk.tables.for_items(self._workspace, items, filters)
+        return list(columns)
 
-        return self._results_reader.read_all_rows(table)
 
-
-class CustomExecutor(Executor):
+class CustomExecutor(ComputableExecutor):
     _COLUMN_VALIDATORS: list[col_val.ColumnValidator] = [col_val.IdOptionValidator(mandatory=True)]
 
     def __init__(self, inputs: InitData) -> None:
         super().__init__(inputs, self._COLUMN_VALIDATORS)
-        self._workspace = inputs.table_options.workspace
-        self._results_reader = TableResultReader(self._table_columns)
 
     @classmethod
     def can_react(cls, inputs: InitData) -> bool:
         return True
 
-    def execute(
-        self, quals: list[Qual], columns: list[str], sort_keys: Optional[list[Any]] = None
-    ) -> Generator[dict[str, Any], None, None]:
-        items = [column_utils.table_col_as_computable(col) for col in self._table_columns.values()]
-        # TODO: pushdown more filters that are included in quals
-        filters = extract_filters_from_quals(quals, self._table_columns)
-        table = self._sdk.tables.for_items(self._workspace, items, filters)
-
-        return self._results_reader.read_all_rows(table)
+    def _columns_to_compute(self, columns: list[str]) -> list[str]:
+        # custom tables are always computed as a whole
+        return list(self._table_columns)
 
 
 class ExecutorFactory:
@@ -7,7 +7,7 @@ from typing import Any, Optional
 from gooddata_sdk import GoodDataSdk
 
 from gooddata_fdw import __version__
-from gooddata_fdw.environment import ColumnDefinition, ForeignDataWrapper, Qual, TableDefinition
+from gooddata_fdw.environment import ColumnDefinition, ForeignDataWrapper, Qual, SortKey, TableDefinition
 from gooddata_fdw.executor import ExecutorFactory, InitData
 from gooddata_fdw.import_workspace import ImporterInitData, WorkspaceImportersLocator
 from gooddata_fdw.options import ImportSchemaOptions, ServerOptions, TableOptions
@@ -34,10 +34,32 @@ class GoodDataForeignDataWrapper(ForeignDataWrapper):
         self._executor = ExecutorFactory.create(InitData(gd_sdk, self._server_options, self._table_options, columns))
         self._executor.validate_columns_def()
 
-    def execute(self, quals: list[Qual], columns: list[str], sortkeys: Optional[list[Any]] = None):  # type: ignore
-        _log_debug(f"query in fdw with {self._server_options}; {self._table_options}; columns {columns}; quals={quals}")
+    def get_rel_size(self, quals: list[Qual], columns: list[str]) -> tuple[int, int]:  # type: ignore
+        return self._executor.get_rel_size(quals, columns)
+
+    def get_path_keys(self) -> list[tuple[tuple[str, ...], int]]:  # type: ignore
+        return self._executor.get_path_keys()
+
+    def can_sort(self, sortkeys: list[SortKey]) -> list[SortKey]:  # type: ignore
+        return self._executor.can_sort(sortkeys)
+
+    def can_limit(self, limit: Optional[int], offset: Optional[int]) -> bool:  # type: ignore
+        return self._executor.can_limit(limit, offset)
+
+    def execute(  # type: ignore
+        self,
+        quals: list[Qual],
+        columns: list[str],
+        sortkeys: Optional[list[Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ):
+        _log_debug(
+            f"query in fdw with {self._server_options}; {self._table_options}; columns {columns}; quals={quals}; "
+            f"sortkeys={sortkeys}; limit={limit}; offset={offset}"
+        )
         try:
-            return self._executor.execute(quals, columns, sortkeys)
+            return self._executor.execute(quals, columns, sortkeys, limit, offset)
         except Exception as e:
             _log_error(traceback.format_exc())
             raise e
@@ -96,6 +96,10 @@ class TableOptions(BaseOptions):
     def compute(self) -> Union[str, None]:
         return self._options.get("compute")
 
+    @property
+    def push_down_label_sort(self) -> bool:
+        return self._options.get("push_down_label_sort", "false").lower() == "true"
+
 
 class ImportSchemaOptions(BaseOptions):
     METRIC_DIGITS_BEFORE_DEC_POINT_DEFAULT = "18"
@@ -1,35 +1,60 @@
 # (C) 2022 GoodData Corporation
 from __future__ import annotations
 
+import itertools
 from collections.abc import Generator
 from typing import Any
 
 from gooddata_sdk import ExecutionTable
-from gooddata_sdk.type_converter import DBTypeConverterStore
+from gooddata_sdk.type_converter import Converter, DBTypeConverterStore
 
 import gooddata_fdw.column_validation as col_valid
 from gooddata_fdw.environment import ColumnDefinition
 
+_ROW_BATCH_SIZE = 512
+"""
+Number of rows whose values are converted to postgres data types at once.
+"""
+
 
 class TableResultReader:
     def __init__(self, table_columns: dict[str, ColumnDefinition]) -> None:
         self._table_columns = table_columns
+        # converters are looked up just once per column
+        self._converters: dict[str, Converter] = {}
 
     def read_all_rows(self, table: ExecutionTable) -> Generator[dict[str, Any], None, None]:
-        for result_row in table.read_all():
-            yield self._process_row(result_row)
+        rows = iter(table.read_all())
+        while True:
+            batch = list(itertools.islice(rows, _ROW_BATCH_SIZE))
+            if not batch:
+                return
+
+            yield from self._process_batch(batch)
+
+    def _column_keys(self, row: dict[str, Any]) -> dict[str, str]:
+        """Returns mapping of column name to the key of its value in the result row"""
+        return {k: k for k in row}
+
+    def _process_batch(self, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        column_keys = self._column_keys(rows[0])
+        columns = [
+            self._sanitize_values(column_name, [row[key] for row in rows]) for column_name, key in column_keys.items()
+        ]
+        column_names = list(column_keys)
 
-    def _process_row(self, row: dict[str, Any]) -> dict[str, Any]:
-        return {k: self._sanitize_value(k, v) for k, v in row.items()}
+        return [dict(zip(column_names, values)) for values in zip(*columns)]
 
-    def _sanitize_value(self, column_name: str, value: Any) -> Any:
-        """Alter the value to comply with postgres data type"""
-        if not isinstance(value, str):
-            return value
+    def _sanitize_values(self, column_name: str, values: list[Any]) -> list[Any]:
+        """Alter the column values to comply with postgres data type"""
+        return self._converter(column_name).to_type_batch(values)
 
-        type_name = self._table_columns[column_name].base_type_name
-        converter = DBTypeConverterStore.find_converter(type_name.lower())
-        return converter.to_type(value)
+    def _converter(self, column_name: str) -> Converter:
+        converter = self._converters.get(column_name)
+        if converter is None:
+            type_name = self._table_columns[column_name].base_type_name
+            converter = self._converters[column_name] = DBTypeConverterStore.find_converter(type_name.lower())
+        return converter
 
 
 class InsightTableResultReader(TableResultReader):
@@ -40,8 +65,5 @@ class InsightTableResultReader(TableResultReader):
 
         self._col_to_local_id = {c.column_name: c.options["local_id"] for c in self._table_columns.values()}
 
-    def _process_row(self, row: dict[str, Any]) -> dict[str, Any]:
-        return {
-            column_name: self._sanitize_value(column_name, row[self._col_to_local_id[column_name]])
-            for column_name in self._query_columns
-        }
+    def _column_keys(self, row: dict[str, Any]) -> dict[str, str]:
+        return {column_name: self._col_to_local_id[column_name] for column_name in self._query_columns}
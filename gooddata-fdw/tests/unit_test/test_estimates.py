@@ -0,0 +1,73 @@
+# (C) 2024 GoodData Corporation
+from collections import OrderedDict
+from unittest import mock
+
+import pytest
+from gooddata_fdw.environment import ColumnDefinition, Qual
+from gooddata_fdw.estimates import DEFAULT_ELEMENTS_COUNT, DEFAULT_SELECTIVITY, RelSizeEstimator
+
+
+@pytest.fixture
+def table_columns():
+    columns = OrderedDict()
+    columns["region"] = ColumnDefinition(
+        column_name="region", type_name="VARCHAR(255)", options=dict(id="label/region.region")
+    )
+    columns["state"] = ColumnDefinition(column_name="state", type_name="VARCHAR(8)", options=dict(id="label/state"))
+    columns["day"] = ColumnDefinition(column_name="day", type_name="DATE", options=dict(id="label/date.day"))
+    columns["price"] = ColumnDefinition(
+        column_name="price", type_name="DECIMAL(15,5)", options=dict(id="fact/price", agg="SUM")
+    )
+    return columns
+
+
+@pytest.fixture
+def sdk():
+    sdk = mock.Mock(name="sdk")
+    counts = {"label/region.region": 4, "label/state": 50, "label/date.day": 1000}
+    sdk.catalog_workspace_content.get_label_elements_count.side_effect = lambda _, label_id: counts[label_id]
+    return sdk
+
+
+def test_estimate_rows_from_elements(sdk, table_columns):
+    estimator = RelSizeEstimator(sdk, "demo", table_columns)
+
+    assert estimator.estimate_rows(["price"]) == 1
+    assert estimator.estimate_rows(["region", "price"]) == 4
+    assert estimator.estimate_rows(["region", "state"]) == 200
+    estimator.estimate_rows(["region", "state", "day"])
+    # element counts are read just once
+    assert sdk.catalog_workspace_content.get_label_elements_count.call_count == 3
+
+
+def test_estimate_rows_observed(sdk, table_columns):
+    estimator = RelSizeEstimator(sdk, "demo", table_columns)
+    estimator.record_rows(["region", "state", "price"], 60)
+
+    assert estimator.estimate_rows(["state", "region"]) == 60
+    assert estimator.estimate_rows(["state", "region"], [Qual("region", "=", "West")]) == 15
+
+
+def test_estimate_rows_quals(sdk, table_columns):
+    estimator = RelSizeEstimator(sdk, "demo", table_columns)
+    columns = ["region", "state"]
+
+    assert estimator.estimate_rows(columns, [Qual("state", "=", "CA")]) == 4
+    assert estimator.estimate_rows(columns, [Qual("state", "<>", "CA")]) == 196
+    assert estimator.estimate_rows(columns, [Qual("state", ("=", True), ["CA", "NY"])]) == 8
+    assert estimator.estimate_rows(columns, [Qual("state", ("<>", False), ["CA", "NY"])]) == 192
+    assert estimator.estimate_rows(columns, [Qual("price", ">", 10)]) == int(200 * DEFAULT_SELECTIVITY)
+    assert estimator.estimate_rows(columns, [Qual("region", "=", "West"), Qual("state", "=", "CA")]) == 1
+
+
+def test_estimate_rows_elements_failure(sdk, table_columns):
+    sdk.catalog_workspace_content.get_label_elements_count.side_effect = ValueError("unavailable")
+    estimator = RelSizeEstimator(sdk, "demo", table_columns)
+
+    assert estimator.estimate_rows(["region"]) == DEFAULT_ELEMENTS_COUNT
+
+
+def test_estimate_width(sdk, table_columns):
+    estimator = RelSizeEstimator(sdk, "demo", table_columns)
+
+    assert estimator.estimate_width(["region", "state", "day", "price"]) == 32 + 8 + 4 + 16
@@ -1,9 +1,12 @@
 # (C) 2022 GoodData Corporation
 
+from collections import OrderedDict
 from unittest import mock
 
 import pytest
 from gooddata_fdw import executor, options
+from gooddata_fdw.environment import ColumnDefinition, Qual, SortKey
+from gooddata_sdk import SortDirection
 
 
 @pytest.mark.parametrize(
@@ -25,3 +28,86 @@ def test_executor_factory(test_config, table_options, expected_executor):
     )
 
     assert isinstance(executor.ExecutorFactory.create(inputs), expected_executor)
+
+
+@pytest.fixture
+def compute_executor(test_config):
+    columns = OrderedDict()
+    columns["region"] = ColumnDefinition(
+        column_name="region", type_name="VARCHAR(255)", options=dict(id="label/region.region")
+    )
+    columns["state"] = ColumnDefinition(column_name="state", type_name="VARCHAR(255)", options=dict(id="label/state"))
+    columns["price"] = ColumnDefinition(
+        column_name="price", type_name="DECIMAL(15,5)", options=dict(id="fact/price", agg="SUM")
+    )
+    sdk = mock.Mock(name="sdk")
+    sdk.tables.for_items.return_value.read_all.return_value = [{"region": str(i), "price": i} for i in range(10)]
+    inputs = executor.InitData(
+        sdk,
+        options.ServerOptions(dict(host=test_config["host"], token=test_config["token"])),
+        options.TableOptions(dict(workspace="123", compute="c")),
+        columns,
+    )
+    return executor.ExecutorFactory.create(inputs)
+
+
+def test_compute_executor_can_sort(compute_executor):
+    sort_keys = [
+        SortKey("price", 3, True, True, None),
+        SortKey("region", 1, False, False, None),
+        SortKey("state", 2, False, True, None),
+        SortKey("region", 1, False, False, None),
+    ]
+
+    # label columns are sorted by postgres unless enabled by the table option
+    assert compute_executor.can_sort(sort_keys) == sort_keys[:1]
+
+    compute_executor._push_down_label_sort = True
+    # sorting with NULLS FIRST in ascending order is not pushed down and neither are the following sort keys
+    assert compute_executor.can_sort(sort_keys) == sort_keys[:2]
+    assert compute_executor.can_sort([SortKey("region", 1, False, False, "C")]) == []
+
+
+def test_compute_executor_sort_and_limit(compute_executor):
+    sort_keys = [SortKey("price", 3, True, True, None), SortKey("state", 2, False, False, None)]
+
+    rows = list(compute_executor.execute([], ["region", "price"], sort_keys, limit=3, offset=2))
+
+    assert [row["region"] for row in rows] == [str(i) for i in range(2, 10)]
+    _, args, kwargs = compute_executor._sdk.tables.for_items.mock_calls[0]
+    # column used just for sorting is computed as well
+    assert [item.local_id for item in args[1]] == ["region", "price", "state"]
+    assert kwargs["sort_by"] == [("price", SortDirection.DESC), ("state", SortDirection.ASC)]
+    assert kwargs["row_limit"] == 5
+
+
+def test_compute_executor_limit_not_pushed_down(compute_executor):
+    # filtering by a metric is not pushed down, postgres must see all rows to apply the limit
+    quals = [Qual("region", "=", "1"), Qual("price", ">", 5)]
+
+    compute_executor._sdk.catalog_workspace_content.get_label_elements_count.return_value = 4
+    compute_executor.get_rel_size(quals, ["region", "price"])
+    assert not compute_executor.can_limit(3, 2)
+    compute_executor.get_rel_size(quals[:1], ["region", "price"])
+    assert compute_executor.can_limit(3, 2)
+
+    rows = list(compute_executor.execute(quals, ["region", "price"], limit=3, offset=2))
+
+    assert len(rows) == 10
+    _, _, kwargs = compute_executor._sdk.tables.for_items.mock_calls[0]
+    assert kwargs["row_limit"] is None
+
+
+def test_compute_executor_estimates(compute_executor):
+    counts = {"label/region.region": 4, "label/state": 50}
+    compute_executor._sdk.catalog_workspace_content.get_label_elements_count.side_effect = lambda _, label_id: counts[
+        label_id
+    ]
+
+    assert compute_executor.get_rel_size([Qual("region", "=", "1")], ["region", "price"]) == (1, 32 + 16)
+    assert compute_executor.get_path_keys() == [(("region",), 50), (("state",), 4)]
+
+    # size of unfiltered result is taken from the paging of the result
+    compute_executor._sdk.tables.for_items.return_value.__len__ = mock.Mock(return_value=10)
+    list(compute_executor.execute([], ["region", "price"]))
+    assert compute_executor.get_rel_size([], ["region", "price"]) == (10, 32 + 16)
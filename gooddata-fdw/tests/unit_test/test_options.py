@@ -124,9 +124,11 @@ class TestServerOptions:
 
 class TestTableOptions:
     def test_options_with_optional(self):
-        config = dict(workspace="ws", insight="123", compute="abc")
+        config = dict(workspace="ws", insight="123", compute="abc", push_down_label_sort="TRUE")
         to = options.TableOptions(config)
 
+        assert to.push_down_label_sort
+
         assert to.workspace == config["workspace"]
         assert to.insight == config["insight"]
         assert to.compute == config["compute"]
@@ -138,6 +140,7 @@ class TestTableOptions:
         assert to.workspace == config["workspace"]
         assert to.insight is None
         assert to.compute is None
+        assert not to.push_down_label_sort
 
 
 class TestImportSchemaOptions:
@@ -78,3 +78,18 @@ def test_insight_table_result_reader(table_columns):
     assert len(result) == len(expected)
     for result_row, expected_row in zip(result, expected):
         assert result_row == expected_row
+
+
+def test_table_result_reader_multiple_batches(table_columns):
+    executor_output = [
+        {"coverage_lifetime": float(i), "car_make": str(i), "datetime": f"2021-03-{1 + i % 28:02d}"}
+        for i in range(1200)
+    ]
+    exec_table_mock = mock.Mock(name="ExecTableMock", spec=["read_all"])
+    exec_table_mock.read_all.return_value = executor_output
+    tr = TableResultReader(table_columns)
+    result = list(tr.read_all_rows(exec_table_mock))
+
+    assert len(result) == len(executor_output)
+    for i, result_row in enumerate(result):
+        assert result_row == {"coverage_lifetime": float(i), "car_make": str(i), "datetime": date(2021, 3, 1 + i % 28)}
@@ -0,0 +1,198 @@
+#  (C) 2024 GoodData Corporation
+import contextvars
+import queue
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any, Optional, Union
+
+import pyarrow
+import structlog
+from gooddata_flight_server import ErrorCode, ErrorInfo
+from typing_extensions import TypeAlias
+
+_LOGGER = structlog.get_logger("gooddata_flexconnect.stream")
+
+BatchData: TypeAlias = Union[pyarrow.RecordBatch, pyarrow.Table, Mapping[str, Any]]
+"""
+Data produced by streaming functions: Arrow record batch, Arrow table or mapping of column name to column values.
+"""
+
+_POLL_INTERVAL = 0.1
+_END = object()
+
+
+class _ProducerError:
+    __slots__ = ("error",)
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+
+class BatchStream:
+    """
+    Stream of record batches which are produced incrementally by an iterable - typically a generator.
+
+    The iterable is consumed by a dedicated producer thread. The produced data are split into record batches
+    of at most `max_batch_size` rows. At most `max_buffered_batches` batches wait in the buffer for the
+    consumer; when the buffer is full, the producer is blocked until the consumer catches up. This way,
+    the consumer can start sending data before the production finishes, and the memory used by the stream
+    stays bounded no matter how large the whole result is.
+
+    The stream is consumed by iterating over it or by reading from `reader()`. The stream must be closed once
+    it is not needed anymore; closing stops the producer and closes the iterable if it is a generator.
+    """
+
+    def __init__(
+        self,
+        schema: pyarrow.Schema,
+        batches: Iterable[BatchData],
+        max_batch_size: Optional[int] = None,
+        max_buffered_batches: int = 4,
+    ) -> None:
+        """
+        :param schema: schema of the produced data
+        :param batches: iterable producing the data; mappings are converted to record batches using the schema
+        :param max_batch_size: maximum number of rows in a single record batch; None means the batches
+         are sent out as they are produced
+        :param max_buffered_batches: maximum number of record batches produced ahead of the consumer
+        """
+        if max_batch_size is not None and max_batch_size < 1:
+            raise ValueError(f"Maximum batch size must be positive, got {max_batch_size}.")
+        if max_buffered_batches < 1:
+            raise ValueError(f"Maximum number of buffered batches must be positive, got {max_buffered_batches}.")
+
+        self._schema = schema
+        self._batches = batches
+        self._max_batch_size = max_batch_size
+        self._buffer: queue.Queue = queue.Queue(maxsize=max_buffered_batches)
+        self._closed = threading.Event()
+        self._start_lock = threading.Lock()
+        self._producer: Optional[threading.Thread] = None
+
+    @property
+    def schema(self) -> pyarrow.Schema:
+        return self._schema
+
+    @property
+    def closed(self) -> bool:
+        return self._closed.is_set()
+
+    def start(self) -> None:
+        """
+        Starts the producer. The producer is started at most once; it is started automatically
+        when the stream is consumed.
+
+        :return: nothing
+        """
+        with self._start_lock:
+            if self._producer is not None:
+                return
+
+            # the producer runs with the same context vars, e.g. structlog's bound variables
+            ctx = contextvars.copy_context()
+            self._producer = threading.Thread(
+                target=ctx.run, args=(self._produce,), name="gd-flexconnect-stream", daemon=True
+            )
+            self._producer.start()
+
+    def reader(self) -> pyarrow.RecordBatchReader:
+        """
+        :return: Arrow RecordBatchReader which reads the batches from this stream
+        """
+        self.start()
+        return pyarrow.RecordBatchReader.from_batches(self._schema, self)
+
+    def close(self) -> None:
+        """
+        Closes the stream. The producer stops at the latest after it produces the current batch. Consumers
+        waiting for the next batch fail.
+
+        :return: nothing
+        """
+        self._closed.set()
+
+        # release the producer if it waits for space in the buffer
+        try:
+            while True:
+                self._buffer.get_nowait()
+        except queue.Empty:
+            pass
+
+    def __iter__(self) -> Iterator[pyarrow.RecordBatch]:
+        return self
+
+    def __next__(self) -> pyarrow.RecordBatch:
+        self.start()
+
+        while True:
+            if self._closed.is_set():
+                raise ErrorInfo.for_reason(
+                    ErrorCode.COMMAND_CANCELLED, "The stream of the result data was closed."
+                ).to_server_error()
+
+            try:
+                item = self._buffer.get(timeout=_POLL_INTERVAL)
+                break
+            except queue.Empty:
+                continue
+
+        if item is _END:
+            # let the other consumers, if any, end as well
+            self._buffer.put(_END)
+            raise StopIteration
+        if isinstance(item, _ProducerError):
+            raise item.error
+
+        return item
+
+    def _to_record_batches(self, data: BatchData) -> Iterator[pyarrow.RecordBatch]:
+        if isinstance(data, pyarrow.Table):
+            batches: Iterable[pyarrow.RecordBatch] = data.to_batches(max_chunksize=self._max_batch_size)
+        elif isinstance(data, pyarrow.RecordBatch):
+            batches = (data,)
+        else:
+            batches = (pyarrow.RecordBatch.from_pydict(dict(data), schema=self._schema),)
+
+        for batch in batches:
+            if not batch.num_rows:
+                continue
+
+            if self._max_batch_size is None or batch.num_rows <= self._max_batch_size:
+                yield batch
+                continue
+
+            for offset in range(0, batch.num_rows, self._max_batch_size):
+                yield batch.slice(offset, self._max_batch_size)
+
+    def _try_put(self, item: Any) -> bool:
+        try:
+            self._buffer.put(item, timeout=_POLL_INTERVAL)
+            return True
+        except queue.Full:
+            return False
+
+    def _put(self, item: Any) -> bool:
+        while not self._closed.is_set():
+            if self._try_put(item):
+                return True
+
+        return False
+
+    def _produce(self) -> None:
+        iterator = iter(self._batches)
+
+        try:
+            for data in iterator:
+                for batch in self._to_record_batches(data):
+                    if not self._put(batch):
+                        _LOGGER.info("stream_closed_early")
+                        return
+
+            self._put(_END)
+        except Exception as e:
+            _LOGGER.error("stream_producer_failed", exc_info=True)
+            self._put(_ProducerError(e))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
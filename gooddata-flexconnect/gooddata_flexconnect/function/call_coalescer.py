@@ -0,0 +1,338 @@
+#  (C) 2024 GoodData Corporation
+import hashlib
+import threading
+from typing import Callable, Optional, Union
+
+import orjson
+import pyarrow
+import pyarrow.flight
+import structlog
+from gooddata_flight_server import (
+    FlightDataTaskResult,
+    Task,
+    TaskError,
+    TaskExecutionResult,
+    TaskExecutor,
+    TaskResult,
+    TaskWaitTimeoutError,
+    TemporalContainer,
+)
+
+_LOGGER = structlog.get_logger("gooddata_flexconnect.coalescer")
+
+
+def invocation_key(fun_name: str, parameters: dict) -> str:
+    """
+    Creates key identifying FlexConnect function invocation. Invocations of the same function with
+    parameters that differ only in formatting or order of keys have the same key.
+
+    :param fun_name: name of the invoked function
+    :param parameters: invocation parameters
+    :return: key of the invocation
+    """
+    canonical = orjson.dumps({"functionName": fun_name, "parameters": parameters}, option=orjson.OPT_SORT_KEYS)
+
+    return hashlib.sha256(canonical).hexdigest()
+
+
+class _CachedTable:
+    __slots__ = ("key", "table", "nbytes")
+
+    def __init__(self, key: str, table: pyarrow.Table) -> None:
+        self.key = key
+        self.table = table
+        self.nbytes = table.nbytes
+
+
+class _InFlightTask:
+    __slots__ = ("task_id", "key", "refs", "claimed")
+
+    def __init__(self, task_id: str, key: str) -> None:
+        self.task_id = task_id
+        self.key = key
+        # number of invocations that share the task and did not receive its result yet
+        self.refs = 1
+        # whether some invocation already received the result
+        self.claimed = False
+
+
+class _CachedTableTask(Task):
+    """
+    Serves a cached table as result of a new task; the function is not called at all.
+    """
+
+    __slots__ = ("_table",)
+    run_in_worker = False
+
+    def __init__(self, table: pyarrow.Table, cmd: bytes) -> None:
+        super().__init__(cmd, cancellable=False)
+
+        self._table = table
+
+    def run(self) -> Union[TaskResult, TaskError]:
+        return FlightDataTaskResult.for_table(self._table)
+
+
+class CallCoalescer:
+    """
+    Coalesces identical FlexConnect function invocations, so that they share a single computation.
+
+    When an invocation arrives while an identical invocation is in flight, it does not start a new task.
+    Instead, it waits for the task of the in-flight invocation and shares its result - and its ticket.
+    Results that can be read only once (e.g. streamed results) cannot be shared; in that case the
+    coalesced invocation has to fall back to running its own task.
+
+    Optionally, the coalescer caches the tables produced by the finished invocations for `cache_ttl`
+    seconds. Identical invocations arriving within this time are served from the cache. The cache holds
+    at most `cache_max_bytes` of data; the oldest tables are evicted when this limit is exceeded.
+
+    Note that the invocations are identified by function name and parameters only. Only the functions
+    that opt in using `FlexConnectFunction.CallCoalescing` are coalesced - their results must not depend
+    on the call headers.
+
+    An invocation stops being in flight as soon as its task finishes, regardless of whether anyone polls
+    for the result. The books about the invocations sharing the finished task are kept for as long as the
+    executor retains the task's result (`keep_finished_for`).
+    """
+
+    def __init__(
+        self,
+        task_executor: TaskExecutor,
+        cache_ttl: float = 0,
+        cache_max_bytes: int = 0,
+        keep_finished_for: float = 15,
+    ) -> None:
+        """
+        :param task_executor: executor which runs the tasks
+        :param cache_ttl: number of seconds for which the results are cached; 0 disables the cache
+        :param cache_max_bytes: maximum size of the cached data; 0 disables the cache
+        :param keep_finished_for: number of seconds for which the executor retains results of finished tasks
+        """
+        self._task_executor = task_executor
+        self._lock = threading.Lock()
+        # key of invocation -> id of its task; only while the task runs
+        self._in_flight: dict[str, str] = {}
+        # id of task -> invocations sharing it; until all of them receive the result or the result expires
+        self._tasks: dict[str, _InFlightTask] = {}
+        self._finished: TemporalContainer[_InFlightTask] = TemporalContainer(
+            logger_name="gooddata_flexconnect.coalesced_tasks",
+            entry_evict_fun=self._on_finished_task_evicted,
+            grace_period=keep_finished_for,
+        )
+
+        self._cache_lock = threading.Lock()
+        self._cache_bytes = 0
+        self._cache_max_bytes = cache_max_bytes
+        self._cache: Optional[TemporalContainer[_CachedTable]] = None
+
+        if cache_ttl > 0 and cache_max_bytes > 0:
+            self._cache = TemporalContainer(
+                logger_name="gooddata_flexconnect.result_cache",
+                entry_evict_fun=self._on_cached_table_evicted,
+                grace_period=cache_ttl,
+            )
+
+    @property
+    def cache_bytes(self) -> int:
+        """
+        :return: size of the data currently held in the cache
+        """
+        return self._cache_bytes
+
+    def submit(self, key: str, create_task: Callable[[], Task]) -> tuple[str, bool]:
+        """
+        Submits the invocation identified by the key. The task is created and submitted only if there is
+        no identical invocation in flight and no cached result.
+
+        :param key: key of the invocation, see `invocation_key`
+        :param create_task: factory for the task of the invocation
+        :return: tuple of (id of the task, flag whether the task is shared with other invocations)
+        """
+        with self._lock:
+            task_id = self._in_flight.get(key)
+            if task_id is not None and self._result_gone(task_id):
+                # the task is gone from the executor; joining it would fail
+                _LOGGER.warning("in_flight_task_gone", task_id=task_id)
+                del self._in_flight[key]
+                self._tasks.pop(task_id, None)
+                task_id = None
+
+            if task_id is not None:
+                _LOGGER.info("invocation_coalesced", task_id=task_id)
+                self._tasks[task_id].refs += 1
+
+                return task_id, True
+
+            cached = self._cache.get_entry(key) if self._cache is not None else None
+            if cached is not None:
+                task = create_task()
+                cached_task = _CachedTableTask(cached.table, task.cmd)
+                self._task_executor.submit(cached_task)
+                _LOGGER.info("invocation_cached", task_id=cached_task.task_id)
+
+                return cached_task.task_id, False
+
+            task = create_task()
+            self._task_executor.submit(task)
+            in_flight = _InFlightTask(task.task_id, key)
+            self._in_flight[key] = task.task_id
+            self._tasks[task.task_id] = in_flight
+
+        threading.Thread(target=self._await_completion, args=(in_flight,), daemon=True).start()
+
+        return task.task_id, False
+
+    def wait_for_result(
+        self, task_id: str, timeout: Optional[float] = None
+    ) -> tuple[Optional[TaskExecutionResult], bool]:
+        """
+        Waits for result of a task submitted by `submit`, see `TaskExecutor.wait_for_result`.
+
+        Every invocation that shares the task receives the result. The first one to receive it gets the
+        result as not shared; the others get it as shared - results of shared tasks that can be read only
+        once must not be used by them, see `is_single_use`.
+
+        :param task_id: id of the task
+        :param timeout: time to wait for the result
+        :raise TaskWaitTimeoutError: if the wait for the result timed out
+        :return: tuple of (result of the task or None if there is no such task, flag whether the result
+         is shared)
+        """
+        result = self._task_executor.wait_for_result(task_id, timeout)
+
+        with self._lock:
+            in_flight = self._tasks.get(task_id)
+
+        if in_flight is None:
+            return result, False
+
+        # the waiter may see the result before the task's completion is processed
+        self._complete(in_flight, result)
+
+        with self._lock:
+            first = not in_flight.claimed
+            in_flight.claimed = True
+            in_flight.refs -= 1
+
+            if (in_flight.refs <= 0 or result is None) and self._tasks.get(task_id) is in_flight:
+                del self._tasks[task_id]
+
+        return result, not first
+
+    def cancel(self, task_id: str) -> bool:
+        """
+        Cancels the invocation of a task submitted by `submit`. The task itself is cancelled only if no other
+        invocation shares it, see `TaskExecutor.cancel`.
+
+        :param task_id: id of the task
+        :return: true if cancelled, false if cancel not possible
+        """
+        with self._lock:
+            in_flight = self._tasks.get(task_id)
+            if in_flight is not None and in_flight.refs > 1:
+                in_flight.refs -= 1
+                return True
+
+            if in_flight is not None:
+                del self._tasks[task_id]
+                if self._in_flight.get(in_flight.key) == task_id:
+                    del self._in_flight[in_flight.key]
+
+        return self._task_executor.cancel(task_id)
+
+    @staticmethod
+    def is_single_use(result: TaskExecutionResult) -> bool:
+        """
+        :param result: result of a task
+        :return: true if data of the result can be read only once and thus cannot be shared
+        """
+        task_result = result.result
+
+        return isinstance(task_result, FlightDataTaskResult) and task_result.single_use_data
+
+    def _result_gone(self, task_id: str) -> bool:
+        try:
+            return self._task_executor.wait_for_result(task_id, timeout=0) is None
+        except TaskWaitTimeoutError:
+            # still running
+            return False
+
+    def _await_completion(self, in_flight: _InFlightTask) -> None:
+        try:
+            result = self._task_executor.wait_for_result(in_flight.task_id)
+        except Exception:
+            _LOGGER.error("in_flight_task_wait_failed", task_id=in_flight.task_id, exc_info=True)
+            result = None
+
+        self._complete(in_flight, result)
+
+    def _complete(self, in_flight: _InFlightTask, result: Optional[TaskExecutionResult]) -> None:
+        """
+        Called once the task of the in-flight invocation finishes. Only the first call for the task (or none,
+        if the invocation was cancelled) has effect.
+        """
+        with self._lock:
+            if self._in_flight.get(in_flight.key) != in_flight.task_id:
+                return
+
+            # the result is cached before any waiter gets it, so that the waiter's next invocation hits the cache
+            if result is not None:
+                self._cache_result(in_flight.key, result)
+
+            # once finished, the task is no longer joined by new invocations
+            del self._in_flight[in_flight.key]
+
+        self._finished[in_flight.task_id] = in_flight
+
+    def _on_finished_task_evicted(self, in_flight: _InFlightTask) -> None:
+        # the executor no longer has the result; invocations which did not poll for it gave up
+        with self._lock:
+            if self._tasks.get(in_flight.task_id) is in_flight:
+                del self._tasks[in_flight.task_id]
+
+    def _cache_result(self, key: str, result: TaskExecutionResult) -> None:
+        task_result = result.result
+        if self._cache is None or not isinstance(task_result, FlightDataTaskResult) or task_result.single_use_data:
+            return
+
+        try:
+            rlock, data = task_result.acquire_data()
+        except pyarrow.flight.FlightError:
+            # result was closed in the meanwhile
+            return
+
+        try:
+            if isinstance(data, pyarrow.Table):
+                self._add_cached_table(_CachedTable(key, data))
+        finally:
+            rlock.release()
+
+    def _add_cached_table(self, entry: _CachedTable) -> None:
+        assert self._cache is not None
+
+        if entry.nbytes > self._cache_max_bytes:
+            _LOGGER.debug("result_too_large_to_cache", nbytes=entry.nbytes)
+            return
+
+        self._cache.evict_entry(entry.key)
+
+        to_evict: list[str] = []
+        with self._cache_lock:
+            self._cache_bytes += entry.nbytes
+            self._cache[entry.key] = entry
+
+            # the entries are iterated from the oldest to the newest
+            excess = self._cache_bytes - self._cache_max_bytes
+            for cached in self._cache:
+                if excess <= 0:
+                    break
+
+                to_evict.append(cached.key)
+                excess -= cached.nbytes
+
+        for evicted_key in to_evict:
+            self._cache.evict_entry(evicted_key)
+
+    def _on_cached_table_evicted(self, entry: _CachedTable) -> None:
+        with self._cache_lock:
+            self._cache_bytes -= entry.nbytes
@@ -1,11 +1,12 @@
 #  (C) 2024 GoodData Corporation
 from collections.abc import Generator
-from typing import Optional
+from typing import NoReturn, Optional
 
 import orjson
 import pyarrow.flight
 import structlog
 from gooddata_flight_server import (
+    DataStreamOptions,
     ErrorCode,
     ErrorInfo,
     FlightDataTaskResult,
@@ -16,18 +17,31 @@ from gooddata_flight_server import (
     flight_server_methods,
 )
 
+from gooddata_flexconnect.function.call_coalescer import CallCoalescer, invocation_key
 from gooddata_flexconnect.function.function import FlexConnectFunction
 from gooddata_flexconnect.function.function_registry import FlexConnectFunctionRegistry
 from gooddata_flexconnect.function.function_task import FlexConnectFunctionTask
 
 _LOGGER = structlog.get_logger("gooddata_flexconnect.rpc")
-_DEFAULT_TASK_WAIT = 60.0
+_DEFAULT_POLLING_INTERVAL_MS = 2000
 
 
 class _FlexConnectServerMethods(FlightServerMethods):
-    def __init__(self, ctx: ServerContext, registry: FlexConnectFunctionRegistry) -> None:
+    def __init__(
+        self,
+        ctx: ServerContext,
+        registry: FlexConnectFunctionRegistry,
+        coalescer: Optional[CallCoalescer] = None,
+        polling_interval: float = _DEFAULT_POLLING_INTERVAL_MS / 1000,
+        tenant_header: Optional[str] = None,
+        tenant_max_concurrency: Optional[int] = None,
+    ) -> None:
         self._ctx = ctx
         self._registry = registry
+        self._coalescer = coalescer
+        self._polling_interval = polling_interval
+        self._tenant_header = tenant_header.lower() if tenant_header is not None else None
+        self._tenant_max_concurrency = tenant_max_concurrency
 
     @staticmethod
     def _create_descriptor(fun_name: str, metadata: Optional[dict]) -> pyarrow.flight.FlightDescriptor:
@@ -52,9 +66,8 @@ class _FlexConnectServerMethods(FlightServerMethods):
             total_records=-1,
         )
 
-    def _extract_invocation_payload(
-        self, descriptor: pyarrow.flight.FlightDescriptor
-    ) -> tuple[str, dict, Optional[tuple[str, ...]]]:
+    @staticmethod
+    def _load_command(descriptor: pyarrow.flight.FlightDescriptor) -> dict:
         if descriptor.command is None or not len(descriptor.command):
             raise ErrorInfo.bad_argument(
                 "Incorrect FlexConnect function invocation. Flight descriptor must contain command "
@@ -62,12 +75,17 @@ class _FlexConnectServerMethods(FlightServerMethods):
             )
 
         try:
-            payload = orjson.loads(descriptor.command)
+            return orjson.loads(descriptor.command)
         except Exception:
             raise ErrorInfo.bad_argument(
                 "Incorrect FlexConnect function invocation. The invocation payload is " "not a valid JSON."
             )
 
+    def _extract_invocation_payload(
+        self, descriptor: pyarrow.flight.FlightDescriptor
+    ) -> tuple[str, dict, Optional[tuple[str, ...]]]:
+        payload = self._load_command(descriptor)
+
         fun = payload.get("functionName")
         if fun is None or not len(fun):
             raise ErrorInfo.bad_argument(
@@ -79,6 +97,19 @@ class _FlexConnectServerMethods(FlightServerMethods):
 
         return fun, parameters, columns
 
+    def _concurrency_limits(self, fun: FlexConnectFunction, headers: dict[str, list[str]]) -> dict[str, int]:
+        limits: dict[str, int] = {}
+
+        if fun.MaxConcurrency is not None:
+            limits[f"function:{fun.Name}"] = fun.MaxConcurrency
+
+        if self._tenant_header is not None and self._tenant_max_concurrency is not None:
+            tenant = headers.get(self._tenant_header)
+            if tenant:
+                limits[f"tenant:{tenant[0]}"] = self._tenant_max_concurrency
+
+        return limits
+
     def _prepare_task(
         self,
         context: pyarrow.flight.ServerCallContext,
@@ -94,6 +125,7 @@ class _FlexConnectServerMethods(FlightServerMethods):
             columns=columns,
             headers=headers,
             cmd=descriptor.command,
+            concurrency_limits=self._concurrency_limits(fun, headers),
         )
 
     def _prepare_flight_info(self, task_result: TaskExecutionResult) -> pyarrow.flight.FlightInfo:
@@ -122,6 +154,87 @@ class _FlexConnectServerMethods(FlightServerMethods):
             total_bytes=-1,
         )
 
+    @staticmethod
+    def _prepare_poll_error(task_id: str) -> pyarrow.flight.FlightTimedOutError:
+        retry = {"task_id": task_id}
+
+        return ErrorInfo.poll(
+            retry_descriptor=pyarrow.flight.FlightDescriptor.for_command(orjson.dumps(retry)),
+            cancel_descriptor=pyarrow.flight.FlightDescriptor.for_command(orjson.dumps({**retry, "cancel": True})),
+        )
+
+    def _submit_task(
+        self,
+        context: pyarrow.flight.ServerCallContext,
+        descriptor: pyarrow.flight.FlightDescriptor,
+    ) -> str:
+        fun_name, parameters, _ = self._extract_invocation_payload(descriptor)
+        fun = self._registry.functions.get(fun_name)
+
+        if self._coalescer is None or fun is None or not fun.CallCoalescing:
+            task = self._prepare_task(context, descriptor)
+            self._ctx.task_executor.submit(task)
+
+            return task.task_id
+
+        task_id, _ = self._coalescer.submit(
+            invocation_key(fun_name, parameters),
+            lambda: self._prepare_task(context, descriptor),
+        )
+
+        return task_id
+
+    def _cancel_task(self, task_id: str) -> NoReturn:
+        if self._coalescer is not None:
+            cancelled = self._coalescer.cancel(task_id)
+        else:
+            cancelled = self._ctx.task_executor.cancel(task_id)
+
+        if not cancelled:
+            raise ErrorInfo.for_reason(
+                ErrorCode.COMMAND_CANCEL_NOT_POSSIBLE,
+                f"FlexConnect function invocation cannot be cancelled. Invocation task was: '{task_id}'.",
+            ).to_user_error()
+
+        raise ErrorInfo.for_reason(
+            ErrorCode.COMMAND_CANCELLED,
+            f"FlexConnect function invocation was cancelled. Invocation task was: '{task_id}'.",
+        ).to_server_error()
+
+    def _poll_flight_info(
+        self,
+        context: pyarrow.flight.ServerCallContext,
+        task_id: str,
+    ) -> pyarrow.flight.FlightInfo:
+        try:
+            if self._coalescer is not None:
+                # whether the task is shared is decided by the coalescer, never by the client
+                task_result, shared = self._coalescer.wait_for_result(task_id, self._polling_interval)
+            else:
+                task_result = self._ctx.task_executor.wait_for_result(task_id, self._polling_interval)
+                shared = False
+        except TaskWaitTimeoutError:
+            # the task is still running; the client polls for its completion using the retry descriptor
+            _LOGGER.info("get_flight_info_poll", task_id=task_id)
+            raise self._prepare_poll_error(task_id)
+
+        if task_result is None:
+            raise ErrorInfo.for_reason(
+                ErrorCode.BAD_ARGUMENT,
+                f"FlexConnect function invocation task '{task_id}' does not exist. The task's result may "
+                f"have already expired.",
+            ).to_user_error()
+
+        if shared and CallCoalescer.is_single_use(task_result):
+            # the result of the shared task can be read only once - by the first invocation to receive it;
+            # this invocation has to compute the result on its own
+            task = self._prepare_task(context, pyarrow.flight.FlightDescriptor.for_command(task_result.cmd))
+            self._ctx.task_executor.submit(task)
+
+            return self._poll_flight_info(context, task.task_id)
+
+        return self._prepare_flight_info(task_result)
+
     ###################################################################
     # Implementation of Flight RPC methods
     ###################################################################
@@ -140,34 +253,23 @@ class _FlexConnectServerMethods(FlightServerMethods):
         descriptor: pyarrow.flight.FlightDescriptor,
     ) -> pyarrow.flight.FlightInfo:
         structlog.contextvars.bind_contextvars(peer=context.peer())
-        task: Optional[FlexConnectFunctionTask] = None
 
         try:
-            task = self._prepare_task(context, descriptor)
-            self._ctx.task_executor.submit(task)
-
-            try:
-                # XXX: this should be enhanced to implement polling
-                task_result = self._ctx.task_executor.wait_for_result(task.task_id, _DEFAULT_TASK_WAIT)
-            except TaskWaitTimeoutError:
-                raise ErrorInfo.for_reason(
-                    ErrorCode.TIMEOUT, f"GetFlightInfo timed out while waiting for task {task.task_id}."
-                ).to_timeout_error()
-
-            # if this bombs then there must be something really wrong because the task
-            # was clearly submitted and code was waiting for its completion. this invariant
-            # should not happen in this particular code path. The None return value may
-            # be applicable one day when polling is in use and a request comes to check whether
-            # particular task id finished
-            assert task_result is not None
-
-            return self._prepare_flight_info(task_result)
+            payload = self._load_command(descriptor)
+            task_id = payload.get("task_id")
+
+            if task_id is None:
+                task_id = self._submit_task(context, descriptor)
+            elif payload.get("cancel"):
+                self._cancel_task(task_id)
+
+            # otherwise the descriptor is a retry descriptor sent by a client polling for the result
+            return self._poll_flight_info(context, task_id)
+        except pyarrow.flight.FlightTimedOutError:
+            # the client is told to poll, this is not a failure
+            raise
         except Exception:
-            if task is not None:
-                _LOGGER.error("get_flight_info_failed", task_id=task.task_id, fun=task.fun_name, exc_info=True)
-            else:
-                _LOGGER.error("flexconnect_fun_submit_failed", exc_info=True)
-
+            _LOGGER.error("get_flight_info_failed", exc_info=True)
             raise
 
     def do_get(
@@ -187,7 +289,9 @@ class _FlexConnectServerMethods(FlightServerMethods):
             if task_id is None or not len(task_id):
                 raise ErrorInfo.bad_argument("Incorrect ticket payload. The ticket payload does not specify 'task_id'.")
 
-            return self.do_get_task_result(context, self._ctx.task_executor, task_id)
+            return self.do_get_task_result(
+                context, self._ctx.task_executor, task_id, DataStreamOptions.from_config(self._ctx.config)
+            )
         except Exception:
             _LOGGER.error("do_get_failed", exc_info=True)
             raise
@@ -195,6 +299,13 @@ class _FlexConnectServerMethods(FlightServerMethods):
 
 _FLEX_CONNECT_CONFIG_SECTION = "flexconnect"
 _FLEX_CONNECT_FUNCTION_LIST = "functions"
+_FLEX_CONNECT_CALL_COALESCING = "call_coalescing"
+_FLEX_CONNECT_RESULT_CACHE_TTL = "result_cache_ttl"
+_FLEX_CONNECT_RESULT_CACHE_MAX_BYTES = "result_cache_max_bytes"
+_FLEX_CONNECT_POLLING_INTERVAL_MS = "polling_interval_ms"
+_FLEX_CONNECT_TENANT_HEADER = "tenant_header"
+_FLEX_CONNECT_TENANT_MAX_CONCURRENCY = "tenant_max_concurrency"
+_DEFAULT_RESULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
 
 
 @flight_server_methods
@@ -205,6 +316,21 @@ def create_flexconnect_flight_methods(ctx: ServerContext) -> FlightServerMethods
     FlexConnect Server hosts one or more functions developed externally, and linked to the server
     at runtime - during startup.
 
+    Identical concurrent invocations of the functions that opt in using `FlexConnectFunction.CallCoalescing`
+    share a single computation, unless disabled by the `call_coalescing` setting. Optionally, results of the
+    invocations can be cached for `result_cache_ttl` seconds, holding at most `result_cache_max_bytes` of data.
+    See `CallCoalescer` for more details.
+
+    GetFlightInfo waits at most `polling_interval_ms` milliseconds for the invocation to finish. If the invocation
+    takes longer, the call fails with the POLL error code and the error's RetryInfo contains descriptors which
+    the client uses to poll for the result or to cancel the invocation. This way, long-running invocations do
+    not hold the server's RPC threads.
+
+    The number of invocations that run at the same time can be limited per function (see
+    `FlexConnectFunction.MaxConcurrency`) and per tenant: when `tenant_header` and `tenant_max_concurrency`
+    are set, at most `tenant_max_concurrency` invocations with the same value of the `tenant_header`
+    header run at the same time. Invocations over the limits wait in the server's task queue.
+
     :param ctx: server's context
     :return: new instance of Flight RPC server methods to integrate into the server
     """
@@ -212,4 +338,32 @@ def create_flexconnect_flight_methods(ctx: ServerContext) -> FlightServerMethods
     _LOGGER.info("flexconnect_init", modules=modules)
     registry = FlexConnectFunctionRegistry().load(ctx, modules)
 
-    return _FlexConnectServerMethods(ctx, registry)
+    coalescer: Optional[CallCoalescer] = None
+    if ctx.settings.get(f"{_FLEX_CONNECT_CONFIG_SECTION}.{_FLEX_CONNECT_CALL_COALESCING}", True):
+        cache_ttl = ctx.settings.get(f"{_FLEX_CONNECT_CONFIG_SECTION}.{_FLEX_CONNECT_RESULT_CACHE_TTL}", 0)
+        cache_max_bytes = ctx.settings.get(
+            f"{_FLEX_CONNECT_CONFIG_SECTION}.{_FLEX_CONNECT_RESULT_CACHE_MAX_BYTES}", _DEFAULT_RESULT_CACHE_MAX_BYTES
+        )
+        _LOGGER.info("flexconnect_call_coalescing", result_cache_ttl=cache_ttl, result_cache_max_bytes=cache_max_bytes)
+        coalescer = CallCoalescer(
+            ctx.task_executor,
+            cache_ttl=cache_ttl,
+            cache_max_bytes=cache_max_bytes,
+            keep_finished_for=ctx.config.task_result_ttl_sec,
+        )
+
+    polling_interval_ms = ctx.settings.get(
+        f"{_FLEX_CONNECT_CONFIG_SECTION}.{_FLEX_CONNECT_POLLING_INTERVAL_MS}", _DEFAULT_POLLING_INTERVAL_MS
+    )
+
+    tenant_header = ctx.settings.get(f"{_FLEX_CONNECT_CONFIG_SECTION}.{_FLEX_CONNECT_TENANT_HEADER}")
+    tenant_max_concurrency = ctx.settings.get(f"{_FLEX_CONNECT_CONFIG_SECTION}.{_FLEX_CONNECT_TENANT_MAX_CONCURRENCY}")
+
+    return _FlexConnectServerMethods(
+        ctx,
+        registry,
+        coalescer,
+        polling_interval=polling_interval_ms / 1000,
+        tenant_header=tenant_header,
+        tenant_max_concurrency=tenant_max_concurrency,
+    )
@@ -1,10 +1,13 @@
 #  (C) 2024 GoodData Corporation
 import abc
+from collections.abc import Iterable
 from typing import Optional
 
 import pyarrow
 from gooddata_flight_server import ArrowData, ServerContext
 
+from gooddata_flexconnect.function.batch_stream import BatchData, BatchStream
+
 
 class FlexConnectFunction(abc.ABC):
     """
@@ -33,6 +36,10 @@ class FlexConnectFunction(abc.ABC):
       the function _must_ inspect the `parameters` to actually determine what the caller
       is interested in.
 
+    The function may either return the whole result at once or stream it - see `stream`. Streamed
+    results are sent to the caller while the function is still producing them, so the function does not
+    need to hold the whole result in memory.
+
     Programming detail: a new instance of the FlexConnectFunction class will be created
     for every call using the `create` method.
     """
@@ -53,6 +60,42 @@ class FlexConnectFunction(abc.ABC):
     influence how the function is used by and called from GoodData Cloud & FlexQuery.
     """
 
+    MaxBatchSize: Optional[int] = None
+    """
+    Function MAY limit the number of rows in a single record batch of streamed results. By default,
+    the batches are sent out as they are produced.
+    """
+
+    MaxBufferedBatches: int = 4
+    """
+    Function MAY change the number of record batches of streamed results, which are produced ahead
+    of the caller reading them.
+    """
+
+    Lane: Optional[str] = None
+    """
+    Function MAY specify priority lane of the server's task queue in which its invocations wait
+    for a free thread. See the server's `task_lanes` setting.
+    """
+
+    MaxConcurrency: Optional[int] = None
+    """
+    Function MAY limit the number of its invocations that run at the same time. The invocations
+    over the limit wait in the server's task queue.
+    """
+
+    CallCoalescing: bool = False
+    """
+    Function MAY allow its identical concurrent invocations to share a single computation. The invocations
+    are identified by function name and parameters only - the function MUST NOT enable this if its result
+    depends on the `headers` (tenant, authorization etc.).
+    """
+
+    _streams: Optional[list[BatchStream]] = None
+    """
+    Streams created by `stream` during the call; instances create their own list on the first `stream`.
+    """
+
     @classmethod
     def create(cls) -> "FlexConnectFunction":
         """
@@ -94,6 +137,45 @@ class FlexConnectFunction(abc.ABC):
         """
         raise NotImplementedError
 
+    def stream(self, batches: Iterable[BatchData]) -> pyarrow.RecordBatchReader:
+        """
+        Creates a result which is streamed to the caller while it is being produced. Use this in `call` when
+        the result is too large to be materialized or when the caller should start receiving data as soon
+        as possible:
+
+        >>> def call(self, parameters, columns, headers):
+        >>>     return self.stream(self._generate_batches(parameters))
+
+        The `batches` are produced in a separate thread and they are split into record batches of at most
+        `MaxBatchSize` rows. The production is paused when `MaxBufferedBatches` batches are waiting to be
+        sent out. It stops when the call is cancelled or when the result is closed; generators are closed
+        at that point, so they can release their resources in `finally` blocks.
+
+        :param batches: iterable producing record batches, tables or mappings of column name to column values;
+         all of them must conform to the function's `Schema`
+        :return: reader of the streamed result, to be returned by `call`
+        """
+        assert self.Schema is not None
+
+        stream = BatchStream(
+            self.Schema,
+            batches,
+            max_batch_size=self.MaxBatchSize,
+            max_buffered_batches=self.MaxBufferedBatches,
+        )
+        if self._streams is None:
+            self._streams = []
+        self._streams.append(stream)
+
+        return stream.reader()
+
+    def _close_streams(self) -> None:
+        """
+        Closes all the streams created by `stream`.
+        """
+        for stream in self._streams or ():
+            stream.close()
+
     def cancel(self) -> bool:
         """
         A FlexConnection function call may be cancelled by the server. It usually happens
@@ -126,6 +208,10 @@ class FlexConnectFunction(abc.ABC):
         at startup. If the function needs some external (custom) settings, the user can code
         those into config files or env variables -> this method can act on them.
 
+        Note that when the server runs the functions in worker processes (see the server's `task_executor`
+        setting), this method is called in the server process only. The workers see the state initialized
+        by this method only if they are started using the 'fork' method.
+
         :param ctx: context of the server which hosts this function
         :return: nothing
         """
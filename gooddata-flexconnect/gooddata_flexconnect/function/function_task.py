@@ -1,4 +1,5 @@
 #  (C) 2024 GoodData Corporation
+from collections.abc import Mapping
 from typing import Optional, Union
 
 import structlog
@@ -21,8 +22,9 @@ class FlexConnectFunctionTask(Task):
         cmd: bytes,
         cancellable: bool = True,
         task_id: Optional[str] = None,
+        concurrency_limits: Optional[Mapping[str, int]] = None,
     ):
-        super().__init__(cmd, cancellable, task_id)
+        super().__init__(cmd, cancellable, task_id, lane=fun.Lane, concurrency_limits=concurrency_limits)
 
         self._fun = fun
         self._parameters = parameters
@@ -45,9 +47,11 @@ class FlexConnectFunctionTask(Task):
             headers=self._headers,
         )
 
-        return FlightDataTaskResult.for_data(result)
+        # streamed results stop being produced once they are sent out or thrown away
+        return FlightDataTaskResult.for_data(result, on_close=self._fun._close_streams)
 
     def on_task_cancel(self) -> None:
         _LOGGER.info("flexconnect_task_cancel", fun=self._fun.Name, task_id=self._task_id)
 
         self._fun.cancel()
+        self._fun._close_streams()
@@ -0,0 +1,82 @@
+#  (C) 2024 GoodData Corporation
+import threading
+
+import pyarrow
+import pyarrow.flight
+import pytest
+from gooddata_flexconnect.function.batch_stream import BatchStream
+from gooddata_flight_server import ErrorCode
+
+from tests.assert_error_info import assert_error_code
+
+_SCHEMA = pyarrow.schema(fields=[pyarrow.field("col1", pyarrow.int64())])
+
+
+def _table(start: int, stop: int) -> pyarrow.Table:
+    return pyarrow.table({"col1": list(range(start, stop))}, schema=_SCHEMA)
+
+
+def test_batch_stream_rechunks():
+    data = [_table(0, 7), pyarrow.record_batch({"col1": [7, 8, 9]}, schema=_SCHEMA), {"col1": [10]}, {"col1": []}]
+    stream = BatchStream(_SCHEMA, data, max_batch_size=4)
+
+    table = stream.reader().read_all()
+
+    assert table.column("col1").to_pylist() == list(range(11))
+    assert [batch.num_rows for batch in table.to_batches()] == [4, 3, 3, 1]
+
+
+def test_batch_stream_backpressure():
+    produced = []
+    can_finish = threading.Event()
+
+    def _generate():
+        for i in range(10):
+            produced.append(i)
+            yield {"col1": [i]}
+        can_finish.wait()
+
+    stream = BatchStream(_SCHEMA, _generate(), max_buffered_batches=2)
+    stream.start()
+
+    first = next(stream)
+    # the producer is paused while the buffer is full, it is at most one batch ahead of the buffer
+    threading.Event().wait(0.3)
+    assert first.column(0).to_pylist() == [0]
+    assert len(produced) <= 4
+
+    can_finish.set()
+    rest = [batch.column(0).to_pylist() for batch in stream]
+    assert rest == [[i] for i in range(1, 10)]
+
+
+def test_batch_stream_producer_error():
+    def _generate():
+        yield {"col1": [1]}
+        raise ValueError("failed")
+
+    stream = BatchStream(_SCHEMA, _generate())
+
+    assert next(stream).num_rows == 1
+    with pytest.raises(ValueError, match="failed"):
+        next(stream)
+
+
+def test_batch_stream_close():
+    generator_closed = threading.Event()
+
+    def _generate():
+        try:
+            while True:
+                yield {"col1": [1]}
+        finally:
+            generator_closed.set()
+
+    stream = BatchStream(_SCHEMA, _generate(), max_buffered_batches=1)
+    next(stream)
+    stream.close()
+
+    assert generator_closed.wait(5)
+    with pytest.raises(pyarrow.flight.FlightServerError) as e:
+        next(stream)
+    assert_error_code(ErrorCode.COMMAND_CANCELLED, e.value)
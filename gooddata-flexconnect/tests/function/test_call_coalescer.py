@@ -0,0 +1,193 @@
+#  (C) 2024 GoodData Corporation
+import threading
+from typing import Union
+
+import pyarrow
+import pytest
+from gooddata_flexconnect.function.call_coalescer import CallCoalescer, invocation_key
+from gooddata_flight_server import FlightDataTaskResult, Task, TaskError, TaskExecutionResult, TaskResult
+from gooddata_flight_server.tasks.thread_task_executor import ThreadTaskExecutor
+
+
+class _CountingTask(Task):
+    runs = 0
+
+    def __init__(self, release: threading.Event, rows: int = 10, reader: bool = False) -> None:
+        super().__init__(cmd=b"", cancellable=True, task_id=None)
+        self._release = release
+        self._rows = rows
+        self._reader = reader
+
+    def run(self) -> Union[TaskResult, TaskError]:
+        _CountingTask.runs += 1
+        self._release.wait()
+        table = pyarrow.table({"col1": list(range(self._rows))})
+
+        return FlightDataTaskResult.for_data(table.to_reader() if self._reader else table)
+
+
+@pytest.fixture
+def executor():
+    _CountingTask.runs = 0
+    executor = ThreadTaskExecutor(metric_prefix="test_coalescer", task_threads=4, keep_results_for=30)
+    yield executor
+    executor.stop()
+
+
+def _run(coalescer: CallCoalescer, key: str, create_task) -> tuple[TaskExecutionResult, bool]:
+    task_id, _ = coalescer.submit(key, create_task)
+
+    return coalescer.wait_for_result(task_id, timeout=10)
+
+
+def _run_concurrently(coalescer: CallCoalescer, key: str, create_task, calls: int) -> list:
+    results: list = [None] * calls
+
+    def _call(i: int) -> None:
+        results[i] = _run(coalescer, key, create_task)
+
+    threads = [threading.Thread(target=_call, args=(i,)) for i in range(calls)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return results
+
+
+def test_invocation_key_is_canonical():
+    key = invocation_key("fun", {"a": 1, "b": {"c": [1, 2], "d": None}})
+
+    assert key == invocation_key("fun", {"b": {"d": None, "c": [1, 2]}, "a": 1})
+    assert key != invocation_key("fun2", {"a": 1, "b": {"c": [1, 2], "d": None}})
+    assert key != invocation_key("fun", {"a": 1, "b": {"c": [2, 1], "d": None}})
+
+
+def test_identical_calls_share_computation(executor):
+    coalescer = CallCoalescer(executor)
+    release = threading.Event()
+    threading.Timer(0.5, release.set).start()
+
+    results = _run_concurrently(coalescer, "key", lambda: _CountingTask(release), calls=5)
+
+    assert _CountingTask.runs == 1
+    assert sorted(shared for _, shared in results) == [False, True, True, True, True]
+    assert len({result.task_id for result, _ in results}) == 1
+    assert len({id(result.result) for result, _ in results}) == 1
+
+
+def test_single_use_results(executor):
+    coalescer = CallCoalescer(executor)
+    release = threading.Event()
+    threading.Timer(0.5, release.set).start()
+
+    results = _run_concurrently(coalescer, "key", lambda: _CountingTask(release, reader=True), calls=3)
+
+    assert all(CallCoalescer.is_single_use(result) for result, _ in results)
+    assert not CallCoalescer.is_single_use(_run(coalescer, "key", lambda: _CountingTask(release))[0])
+    # the first invocation to receive the result gets to read it
+    assert sorted(shared for _, shared in results) == [False, True, True]
+
+
+def test_cancel_shared_task(executor):
+    coalescer = CallCoalescer(executor)
+    release = threading.Event()
+
+    task_id, _ = coalescer.submit("key", lambda: _CountingTask(release))
+    assert coalescer.submit("key", lambda: _CountingTask(release)) == (task_id, True)
+
+    # the other invocation still waits for the task
+    assert coalescer.cancel(task_id)
+    release.set()
+    result, shared = coalescer.wait_for_result(task_id, timeout=10)
+    assert not result.cancelled
+    assert not shared
+
+
+def test_cancelled_task_is_not_joined(executor):
+    coalescer = CallCoalescer(executor)
+    release = threading.Event()
+
+    task_id, _ = coalescer.submit("key", lambda: _CountingTask(release))
+    assert coalescer.cancel(task_id)
+
+    other_id, shared = coalescer.submit("key", lambda: _CountingTask(release))
+    assert other_id != task_id
+    assert not shared
+
+    release.set()
+    result, _ = coalescer.wait_for_result(other_id, timeout=10)
+    assert not result.cancelled
+
+
+def test_abandoned_task_is_not_joined(executor):
+    coalescer = CallCoalescer(executor)
+    release = threading.Event()
+    release.set()
+
+    # the invocation never polls for its result and the executor drops it eventually
+    task_id, _ = coalescer.submit("key", lambda: _CountingTask(release))
+    assert executor.wait_for_result(task_id, timeout=10) is not None
+    executor.close_result(task_id)
+
+    other_id, shared = coalescer.submit("key", lambda: _CountingTask(release))
+    assert other_id != task_id
+    assert not shared
+
+    result, _ = coalescer.wait_for_result(other_id, timeout=10)
+    assert result is not None
+    assert _CountingTask.runs == 2
+
+
+def test_calls_after_completion_are_not_coalesced(executor):
+    coalescer = CallCoalescer(executor)
+    release = threading.Event()
+    release.set()
+
+    first, _ = _run(coalescer, "key", lambda: _CountingTask(release))
+    second, _ = _run(coalescer, "key", lambda: _CountingTask(release))
+
+    assert _CountingTask.runs == 2
+    assert first.task_id != second.task_id
+
+
+def test_cached_result(executor):
+    coalescer = CallCoalescer(executor, cache_ttl=60, cache_max_bytes=1024 * 1024)
+    release = threading.Event()
+    release.set()
+
+    first, _ = _run(coalescer, "key", lambda: _CountingTask(release))
+    second, _ = _run(coalescer, "key", lambda: _CountingTask(release))
+
+    assert _CountingTask.runs == 1
+    assert first.task_id != second.task_id
+    assert coalescer.cache_bytes == pyarrow.table({"col1": list(range(10))}).nbytes
+
+    # the cached table outlives the original result
+    executor.close_result(first.task_id)
+    lock, data = second.result.acquire_data()
+    lock.release()
+    assert data.column("col1").to_pylist() == list(range(10))
+
+
+def test_cache_evicts_oldest_results(executor):
+    table_bytes = pyarrow.table({"col1": list(range(100))}).nbytes
+    coalescer = CallCoalescer(executor, cache_ttl=60, cache_max_bytes=2 * table_bytes)
+    release = threading.Event()
+    release.set()
+
+    for key in ("key1", "key2", "key3"):
+        _run(coalescer, key, lambda: _CountingTask(release, rows=100))
+    assert coalescer.cache_bytes == 2 * table_bytes
+
+    _run(coalescer, "key2", lambda: _CountingTask(release, rows=100))
+    _run(coalescer, "key3", lambda: _CountingTask(release, rows=100))
+    assert _CountingTask.runs == 3
+
+    _run(coalescer, "key1", lambda: _CountingTask(release, rows=100))
+    assert _CountingTask.runs == 4
+
+    # too large results are not cached at all
+    _run(coalescer, "key4", lambda: _CountingTask(release, rows=1000))
+    _run(coalescer, "key4", lambda: _CountingTask(release, rows=1000))
+    assert _CountingTask.runs == 6
@@ -0,0 +1,34 @@
+#  (C) 2024 GoodData Corporation
+from collections.abc import Generator
+
+import pyarrow
+from gooddata_flexconnect.function.batch_stream import BatchData
+from gooddata_flexconnect.function.function import FlexConnectFunction
+from gooddata_flight_server import ArrowData
+
+
+class _StreamingFun(FlexConnectFunction):
+    Name = "StreamingFun"
+    Schema = pyarrow.schema(
+        fields=[
+            pyarrow.field("col1", pyarrow.int64()),
+            pyarrow.field("col2", pyarrow.string()),
+        ]
+    )
+    MaxBatchSize = 10
+    MaxBufferedBatches = 2
+
+    def call(
+        self,
+        parameters: dict,
+        columns: tuple[str, ...],
+        headers: dict[str, list[str]],
+    ) -> ArrowData:
+        return self.stream(self._generate(parameters["rows"]))
+
+    @staticmethod
+    def _generate(rows: int) -> Generator[BatchData, None, None]:
+        # chunks of uneven size, they are re-chunked to MaxBatchSize
+        for start in range(0, rows, 25):
+            values = list(range(start, min(start + 25, rows)))
+            yield {"col1": values, "col2": [str(v) for v in values]}
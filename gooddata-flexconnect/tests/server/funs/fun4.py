@@ -0,0 +1,41 @@
+#  (C) 2024 GoodData Corporation
+import time
+
+import pyarrow
+from gooddata_flexconnect.function.function import FlexConnectFunction
+from gooddata_flight_server import ArrowData
+
+
+class _SlowFun(FlexConnectFunction):
+    Name = "SlowFun"
+    Schema = pyarrow.schema(fields=[pyarrow.field("col1", pyarrow.int64())])
+    CallCoalescing = True
+    Calls = 0
+
+    def call(
+        self,
+        parameters: dict,
+        columns: tuple[str, ...],
+        headers: dict[str, list[str]],
+    ) -> ArrowData:
+        _SlowFun.Calls += 1
+        time.sleep(0.5)
+
+        return pyarrow.table(data={"col1": list(range(parameters["rows"]))}, schema=self.Schema)
+
+
+class _SlowTenantFun(FlexConnectFunction):
+    Name = "SlowTenantFun"
+    Schema = pyarrow.schema(fields=[pyarrow.field("tenant", pyarrow.string())])
+    Calls = 0
+
+    def call(
+        self,
+        parameters: dict,
+        columns: tuple[str, ...],
+        headers: dict[str, list[str]],
+    ) -> ArrowData:
+        _SlowTenantFun.Calls += 1
+        time.sleep(0.5)
+
+        return pyarrow.table(data={"tenant": headers.get("x-tenant", [])}, schema=self.Schema)
@@ -1,8 +1,17 @@
 #  (C) 2024 GoodData Corporation
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union
+
 import orjson
 import pyarrow.flight
+import pytest
+from gooddata_flight_server import ErrorCode, ErrorInfo, RetryInfo
 
+from tests.assert_error_info import assert_error_code
 from tests.server.conftest import flexconnect_server
+from tests.server.funs.fun4 import _SlowFun, _SlowTenantFun
 
 
 def test_basic_function():
@@ -84,3 +93,190 @@ def test_basic_function_tls(tls_ca_cert):
 
         assert len(data) == 3
         assert data.column_names == ["col1", "col2", "col3"]
+
+
+def test_streaming_function():
+    with flexconnect_server(["tests.server.funs.fun3"]) as s:
+        c = pyarrow.flight.FlightClient(s.location)
+        descriptor = pyarrow.flight.FlightDescriptor.for_command(
+            orjson.dumps(
+                {
+                    "functionName": "StreamingFun",
+                    "parameters": {"rows": 100},
+                }
+            )
+        )
+
+        info = c.get_flight_info(descriptor)
+        batches = list(c.do_get(info.endpoints[0].ticket))
+
+        assert [len(batch.data) for batch in batches] == [10, 10, 5] * 4
+        data = pyarrow.Table.from_batches([batch.data for batch in batches])
+        assert data.column("col1").to_pylist() == list(range(100))
+
+
+def test_identical_calls_coalesced():
+    with flexconnect_server(["tests.server.funs.fun4"]) as s:
+        c = pyarrow.flight.FlightClient(s.location)
+        # same parameters, in different order of keys
+        descriptors = [
+            pyarrow.flight.FlightDescriptor.for_command(
+                orjson.dumps({"functionName": "SlowFun", "parameters": {"rows": 10, "other": i % 2}})
+            )
+            for i in range(4)
+        ] + [
+            pyarrow.flight.FlightDescriptor.for_command(
+                b'{"parameters": {"other": 0, "rows": 10}, "functionName": "SlowFun"}'
+            )
+        ]
+
+        with ThreadPoolExecutor(max_workers=len(descriptors)) as executor:
+            infos = list(executor.map(c.get_flight_info, descriptors))
+
+        assert _SlowFun.Calls == 2
+        assert len({info.endpoints[0].ticket.ticket for info in infos}) == 2
+        for info in infos:
+            assert c.do_get(info.endpoints[0].ticket).read_all().column("col1").to_pylist() == list(range(10))
+
+
+def test_calls_not_coalesced_without_opt_in():
+    with flexconnect_server(["tests.server.funs.fun4"]) as s:
+        c = pyarrow.flight.FlightClient(s.location)
+        descriptor = pyarrow.flight.FlightDescriptor.for_command(
+            orjson.dumps({"functionName": "SlowTenantFun", "parameters": {}})
+        )
+
+        def _call(tenant: str) -> list:
+            options = pyarrow.flight.FlightCallOptions(headers=[(b"x-tenant", tenant.encode())])
+            info = c.get_flight_info(descriptor, options)
+
+            return c.do_get(info.endpoints[0].ticket).read_all().column("tenant").to_pylist()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(_call, ["a", "b"]))
+
+        assert _SlowTenantFun.Calls == 2
+        assert results == [["a"], ["b"]]
+
+
+def _poll(c: pyarrow.flight.FlightClient, descriptor: pyarrow.flight.FlightDescriptor) -> RetryInfo:
+    with pytest.raises(pyarrow.flight.FlightTimedOutError) as e:
+        c.get_flight_info(descriptor)
+
+    assert_error_code(ErrorCode.POLL, e.value)
+
+    return RetryInfo.from_bytes(ErrorInfo.from_pyarrow_error(e.value).body)
+
+
+def _get_flight_info_or_retry(
+    c: pyarrow.flight.FlightClient, descriptor: pyarrow.flight.FlightDescriptor
+) -> Union[pyarrow.flight.FlightInfo, pyarrow.flight.FlightDescriptor]:
+    try:
+        return c.get_flight_info(descriptor)
+    except pyarrow.flight.FlightTimedOutError as e:
+        assert_error_code(ErrorCode.POLL, e)
+
+        return RetryInfo.from_bytes(ErrorInfo.from_pyarrow_error(e).body).retry_descriptor
+
+
+def _get_flight_info_polling(
+    c: pyarrow.flight.FlightClient, descriptor: pyarrow.flight.FlightDescriptor
+) -> pyarrow.flight.FlightInfo:
+    # follows the retry descriptors until the invocation finishes
+    for _ in range(300):
+        result = _get_flight_info_or_retry(c, descriptor)
+        if isinstance(result, pyarrow.flight.FlightInfo):
+            return result
+        descriptor = result
+
+    raise AssertionError("the invocation did not finish")
+
+
+def test_polling():
+    os.environ["GOODDATA_FLIGHT_FLEXCONNECT__POLLING_INTERVAL_MS"] = "100"
+
+    with flexconnect_server(["tests.server.funs.fun4"]) as s:
+        c = pyarrow.flight.FlightClient(s.location)
+        descriptor = pyarrow.flight.FlightDescriptor.for_command(
+            orjson.dumps({"functionName": "SlowFun", "parameters": {"rows": 10}})
+        )
+
+        retry_info = _poll(c, descriptor)
+        assert retry_info.cancel_descriptor is not None
+        retry_info = _poll(c, retry_info.retry_descriptor)
+
+        time.sleep(0.5)
+        info = c.get_flight_info(retry_info.retry_descriptor)
+        assert info.descriptor.command == descriptor.command
+        assert c.do_get(info.endpoints[0].ticket).read_all().column("col1").to_pylist() == list(range(10))
+
+
+def test_polling_cancel():
+    os.environ["GOODDATA_FLIGHT_FLEXCONNECT__POLLING_INTERVAL_MS"] = "100"
+
+    with flexconnect_server(["tests.server.funs.fun4"]) as s:
+        c = pyarrow.flight.FlightClient(s.location)
+        descriptor = pyarrow.flight.FlightDescriptor.for_command(
+            orjson.dumps({"functionName": "SlowFun", "parameters": {"rows": 10}})
+        )
+
+        retry_info = _poll(c, descriptor)
+        with pytest.raises(pyarrow.flight.FlightServerError) as e:
+            c.get_flight_info(retry_info.cancel_descriptor)
+
+        assert_error_code(ErrorCode.COMMAND_CANCELLED, e.value)
+
+        # let the cancelled call finish before the server stops
+        time.sleep(0.5)
+
+
+def test_tenant_concurrency_limit():
+    os.environ["GOODDATA_FLIGHT_FLEXCONNECT__TENANT_HEADER"] = "x-tenant"
+    os.environ["GOODDATA_FLIGHT_FLEXCONNECT__TENANT_MAX_CONCURRENCY"] = "1"
+
+    with flexconnect_server(["tests.server.funs.fun4"]) as s:
+        c = pyarrow.flight.FlightClient(s.location)
+
+        def _call(args: tuple[int, str]) -> pyarrow.flight.FlightInfo:
+            rows, tenant = args
+            descriptor = pyarrow.flight.FlightDescriptor.for_command(
+                orjson.dumps({"functionName": "SlowFun", "parameters": {"rows": rows}})
+            )
+            options = pyarrow.flight.FlightCallOptions(headers=[(b"x-tenant", tenant.encode())])
+
+            return c.get_flight_info(descriptor, options)
+
+        def _timed_calls(tenants: list[str]) -> float:
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=len(tenants)) as executor:
+                list(executor.map(_call, enumerate(tenants)))
+
+            return time.perf_counter() - start
+
+        # invocations of the same tenant run one after another
+        assert _timed_calls(["a", "a"]) >= 1.0
+        assert _timed_calls(["a", "b"]) < 1.0
+
+
+def test_process_task_executor():
+    os.environ["GOODDATA_FLIGHT_SERVER__TASK_EXECUTOR"] = "process"
+    os.environ["GOODDATA_FLIGHT_SERVER__TASK_PROCESSES"] = "2"
+    # starting the worker processes may take longer than the polling interval
+    os.environ["GOODDATA_FLIGHT_FLEXCONNECT__POLLING_INTERVAL_MS"] = "100"
+
+    with flexconnect_server(["tests.server.funs.fun1", "tests.server.funs.fun3"]) as s:
+        c = pyarrow.flight.FlightClient(s.location)
+
+        descriptor = pyarrow.flight.FlightDescriptor.for_command(
+            orjson.dumps({"functionName": "SimpleFun", "parameters": {"test1": 1, "test2": 2, "test3": 3}})
+        )
+        info = _get_flight_info_polling(c, descriptor)
+        assert len(c.do_get(info.endpoints[0].ticket).read_all()) == 3
+
+        # streamed results are complete once they are passed from the worker
+        descriptor = pyarrow.flight.FlightDescriptor.for_command(
+            orjson.dumps({"functionName": "StreamingFun", "parameters": {"rows": 100}})
+        )
+        info = _get_flight_info_polling(c, descriptor)
+        data = c.do_get(info.endpoints[0].ticket).read_all()
+        assert data.column("col1").to_pylist() == list(range(100))
@@ -1,12 +1,19 @@
 # (C) 2024 GoodData Corporation
 
-from gooddata_flight_server.config.config import AuthenticationMethod, OtelConfig, OtelExporterType, ServerConfig
+from gooddata_flight_server.config.config import (
+    AuthenticationMethod,
+    OtelConfig,
+    OtelExporterType,
+    ServerConfig,
+    TaskExecutorType,
+)
 from gooddata_flight_server.errors.error_code import ErrorCode
 from gooddata_flight_server.errors.error_info import ErrorInfo, RetryInfo
 from gooddata_flight_server.health.server_health_monitor import ModuleHealthStatus, ServerHealthMonitor
 from gooddata_flight_server.server.auth.auth_middleware import TokenAuthMiddleware
 from gooddata_flight_server.server.auth.token_verifier import TokenVerificationStrategy
 from gooddata_flight_server.server.base import FlightServerMethodsFactory, ServerContext
+from gooddata_flight_server.server.flight_rpc.data_stream import DataStreamOptions
 from gooddata_flight_server.server.flight_rpc.flight_middleware import CallFinalizer, CallInfo
 from gooddata_flight_server.server.flight_rpc.server_methods import FlightServerMethods
 from gooddata_flight_server.server.server_main import GoodDataFlightServer, create_server
@@ -20,4 +27,5 @@ from gooddata_flight_server.tasks.task_result import (
     TaskExecutionResult,
     TaskResult,
 )
+from gooddata_flight_server.tasks.temporal_container import TemporalContainer
 from gooddata_flight_server.utils.methods_discovery import flight_server_methods
@@ -1,6 +1,7 @@
 #  (C) 2024 GoodData Corporation
 import dataclasses
 import enum
+import multiprocessing
 import os
 import platform
 import socket
@@ -23,6 +24,15 @@ class OtelExporterType(enum.Enum):
     Console = "console"
 
 
+class TaskExecutorType(enum.Enum):
+    """
+    Task executor type specifies where the tasks run.
+    """
+
+    Thread = "thread"
+    Process = "process"
+
+
 class AuthenticationMethod(enum.Enum):
     """
     Authentication method specifies how to authenticate requests.
@@ -57,9 +67,25 @@ class ServerConfig:
     token_header_name: Optional[str]
     token_verification: Optional[str]
 
+    task_executor: TaskExecutorType
     task_threads: int
+    task_processes: int
+    task_process_start_method: str
     task_close_threads: int
+    task_queue_size: int
+    task_lanes: dict[str, int]
     task_result_ttl_sec: int
+    task_result_memory_budget: int
+    task_result_spill_threshold: int
+    task_result_spill_dir: Optional[str]
+
+    data_compression: Optional[str]
+    data_batch_rows: int
+    data_batch_bytes: int
+    data_batch_min_rows: int
+    data_batch_max_rows: int
+    data_batch_min_bytes: int
+    data_batch_max_bytes: int
 
     metrics_host: Optional[str]
     metrics_port: int
@@ -109,9 +135,24 @@ class _Settings:
     AuthenticationMethod = "authentication_method"
     TokenHeaderName = "token_header_name"
     TokenVerification = "token_verification"
+    TaskExecutor = "task_executor"
     TaskThreads = "task_threads"
+    TaskProcesses = "task_processes"
+    TaskProcessStartMethod = "task_process_start_method"
     TaskCloseThreads = "task_close_threads"
+    TaskQueueSize = "task_queue_size"
+    TaskLanes = "task_lanes"
     TaskResultTtlSec = "task_result_ttl_sec"
+    TaskResultMemoryBudget = "task_result_memory_budget"
+    TaskResultSpillThreshold = "task_result_spill_threshold"
+    TaskResultSpillDir = "task_result_spill_dir"
+    DataCompression = "data_compression"
+    DataBatchRows = "data_batch_rows"
+    DataBatchBytes = "data_batch_bytes"
+    DataBatchMinRows = "data_batch_min_rows"
+    DataBatchMaxRows = "data_batch_max_rows"
+    DataBatchMinBytes = "data_batch_min_bytes"
+    DataBatchMaxBytes = "data_batch_max_bytes"
     MetricsHost = "metrics_host"
     MetricsPort = "metrics_port"
     HealthcheckHost = "health_check_host"
@@ -131,7 +172,12 @@ _DEFAULT_ADVERTISE_HOST = socket.gethostbyaddr("127.0.0.1")[0] if platform.syste
 _DEFAULT_LISTEN_PORT = 17001
 _DEFAULT_TASK_THREADS = 32
 _DEFAULT_TASK_CLOSE_THREADS = 2
+_DEFAULT_TASK_PROCESS_START_METHOD = "spawn"
 _DEFAULT_TASK_RESULT_TTL_SEC = 60
+_DEFAULT_DATA_BATCH_MIN_ROWS = 1024
+_DEFAULT_DATA_BATCH_MAX_ROWS = 1024 * 1024
+_DEFAULT_DATA_BATCH_MIN_BYTES = 64 * 1024
+_DEFAULT_DATA_BATCH_MAX_BYTES = 64 * 1024 * 1024
 _DEFAULT_MALLOC_TRIM_INTERVAL_SEC = 30
 _DEFAULT_METRICS_PORT = 17101
 _DEFAULT_HEALTHCHECK_PORT = 8877
@@ -146,6 +192,13 @@ _SUPPORTED_EXPORTERS = [
     OtelExporterType.Console.value,
 ]
 
+_SUPPORTED_TASK_EXECUTORS = [
+    TaskExecutorType.Thread.value,
+    TaskExecutorType.Process.value,
+]
+
+_SUPPORTED_DATA_COMPRESSION = ["none", "lz4", "zstd"]
+
 _SUPPORTED_AUTH_METHOD = [
     AuthenticationMethod.NoAuth.value,
     AuthenticationMethod.Token.value,
@@ -174,10 +227,29 @@ def _validate_non_negative_number(val: Any) -> bool:
         return False
 
 
+def _validate_zero_or_positive_number(val: Any) -> bool:
+    try:
+        return int(val) >= 0
+    except ValueError:
+        return False
+
+
 def _validate_supported_otel_exporter(val: Any) -> bool:
     return val in _SUPPORTED_EXPORTERS
 
 
+def _validate_supported_task_executor(val: Any) -> bool:
+    return val in _SUPPORTED_TASK_EXECUTORS
+
+
+def _validate_supported_process_start_method(val: Any) -> bool:
+    return val in multiprocessing.get_all_start_methods()
+
+
+def _validate_supported_data_compression(val: Any) -> bool:
+    return val in _SUPPORTED_DATA_COMPRESSION
+
+
 def _validate_supported_auth(val: Any) -> bool:
     return val in _SUPPORTED_AUTH_METHOD
 
@@ -186,6 +258,10 @@ def _validate_mapping(val: Any) -> bool:
     return isinstance(val, dict)
 
 
+def _validate_lane_weights(val: Any) -> bool:
+    return isinstance(val, dict) and all(isinstance(weight, int) and weight > 0 for weight in val.values())
+
+
 def _validate_boolean(val: Any) -> bool:
     return isinstance(val, bool)
 
@@ -293,6 +369,15 @@ _VALIDATORS = [
             "condition": f"{_Settings.TokenVerification} must be a non-empty string.",
         },
     ),
+    Validator(
+        _fqsn(_Settings.TaskExecutor),
+        default=TaskExecutorType.Thread.value,
+        condition=_validate_supported_task_executor,
+        cast=str,
+        messages={
+            "condition": f"{_Settings.TaskExecutor} must be one of {', '.join(_SUPPORTED_TASK_EXECUTORS)}.",
+        },
+    ),
     Validator(
         _fqsn(_Settings.TaskThreads),
         default=_DEFAULT_TASK_THREADS,
@@ -302,6 +387,25 @@ _VALIDATORS = [
             "condition": f"{_Settings.TaskThreads} must be a positive number.",
         },
     ),
+    Validator(
+        _fqsn(_Settings.TaskProcesses),
+        default=0,
+        condition=_validate_zero_or_positive_number,
+        cast=int,
+        messages={
+            "condition": f"{_Settings.TaskProcesses} must be a non-negative number.",
+        },
+    ),
+    Validator(
+        _fqsn(_Settings.TaskProcessStartMethod),
+        default=_DEFAULT_TASK_PROCESS_START_METHOD,
+        condition=_validate_supported_process_start_method,
+        cast=str,
+        messages={
+            "condition": f"{_Settings.TaskProcessStartMethod} must be one of "
+            f"{', '.join(multiprocessing.get_all_start_methods())}.",
+        },
+    ),
     Validator(
         _fqsn(_Settings.TaskCloseThreads),
         default=_DEFAULT_TASK_CLOSE_THREADS,
@@ -311,6 +415,22 @@ _VALIDATORS = [
             "condition": f"{_Settings.TaskCloseThreads} must be a positive number.",
         },
     ),
+    Validator(
+        _fqsn(_Settings.TaskQueueSize),
+        default=0,
+        condition=_validate_zero_or_positive_number,
+        cast=int,
+        messages={
+            "condition": f"{_Settings.TaskQueueSize} must be a non-negative number (number of tasks).",
+        },
+    ),
+    Validator(
+        _fqsn(_Settings.TaskLanes),
+        condition=_validate_lane_weights,
+        messages={
+            "condition": f"{_Settings.TaskLanes} must be a mapping of lane name -> lane weight (a positive number).",
+        },
+    ),
     Validator(
         _fqsn(_Settings.TaskResultTtlSec),
         default=_DEFAULT_TASK_RESULT_TTL_SEC,
@@ -320,6 +440,95 @@ _VALIDATORS = [
             "condition": f"{_Settings.TaskResultTtlSec} must be a positive number (number of seconds).",
         },
     ),
+    Validator(
+        _fqsn(_Settings.TaskResultMemoryBudget),
+        default=0,
+        condition=_validate_zero_or_positive_number,
+        cast=int,
+        messages={
+            "condition": f"{_Settings.TaskResultMemoryBudget} must be a non-negative number (number of bytes).",
+        },
+    ),
+    Validator(
+        _fqsn(_Settings.TaskResultSpillThreshold),
+        default=0,
+        condition=_validate_zero_or_positive_number,
+        cast=int,
+        messages={
+            "condition": f"{_Settings.TaskResultSpillThreshold} must be a non-negative number (number of bytes).",
+        },
+    ),
+    Validator(
+        _fqsn(_Settings.TaskResultSpillDir),
+        condition=_validate_non_empty_string,
+        cast=str,
+        messages={
+            "condition": f"{_Settings.TaskResultSpillDir} must be a path to a directory.",
+        },
+    ),
+    Validator(
+        _fqsn(_Settings.DataCompression),
+        default="none",
+        condition=_validate_supported_data_compression,
+        cast=str,
+        messages={
+            "condition": f"{_Settings.DataCompression} must be one of {', '.join(_SUPPORTED_DATA_COMPRESSION)}.",
+        },
+    ),
+    Validator(
+        _fqsn(_Settings.DataBatchRows),
+        default=0,
+        condition=_validate_zero_or_positive_number,
+        cast=int,
+        messages={
+            "condition": f"{_Settings.DataBatchRows} must be a non-negative number (number of rows).",
+        },
+    ),
+    Validator(
+        _fqsn(_Settings.DataBatchBytes),
+        default=0,
+        condition=_validate_zero_or_positive_number,
+        cast=int,
+        messages={
+            "condition": f"{_Settings.DataBatchBytes} must be a non-negative number (number of bytes).",
+        },
+    ),
+    Validator(
+        _fqsn(_Settings.DataBatchMinRows),
+        default=_DEFAULT_DATA_BATCH_MIN_ROWS,
+        condition=_validate_non_negative_number,
+        cast=int,
+        messages={
+            "condition": f"{_Settings.DataBatchMinRows} must be a positive number (number of rows).",
+        },
+    ),
+    Validator(
+        _fqsn(_Settings.DataBatchMaxRows),
+        default=_DEFAULT_DATA_BATCH_MAX_ROWS,
+        condition=_validate_non_negative_number,
+        cast=int,
+        messages={
+            "condition": f"{_Settings.DataBatchMaxRows} must be a positive number (number of rows).",
+        },
+    ),
+    Validator(
+        _fqsn(_Settings.DataBatchMinBytes),
+        default=_DEFAULT_DATA_BATCH_MIN_BYTES,
+        condition=_validate_non_negative_number,
+        cast=int,
+        messages={
+            "condition": f"{_Settings.DataBatchMinBytes} must be a positive number (number of bytes).",
+        },
+    ),
+    Validator(
+        _fqsn(_Settings.DataBatchMaxBytes),
+        default=_DEFAULT_DATA_BATCH_MAX_BYTES,
+        condition=_validate_non_negative_number,
+        cast=int,
+        messages={
+            "condition": f"{_Settings.DataBatchMaxBytes} must be a positive number (number of bytes).",
+        },
+    ),
     Validator(
         _fqsn(_Settings.MetricsHost),
         condition=_validate_non_empty_string,
@@ -444,6 +653,8 @@ def _create_server_config(settings: Dynaconf) -> ServerConfig:
     if exporter_type == "none":
         exporter_type = None
 
+    data_compression = server_settings.get(_Settings.DataCompression)
+
     # advertise port defaults to value of listen port
     advertise_port = server_settings.get(_Settings.AdvertisePort) or server_settings.get(_Settings.ListenPort)
 
@@ -487,9 +698,24 @@ def _create_server_config(settings: Dynaconf) -> ServerConfig:
         authentication_method=_auth_method,
         token_header_name=server_settings.get(_Settings.TokenHeaderName),
         token_verification=_token_verification,
+        task_executor=TaskExecutorType(server_settings.get(_Settings.TaskExecutor)),
         task_threads=server_settings.get(_Settings.TaskThreads),
+        task_processes=server_settings.get(_Settings.TaskProcesses),
+        task_process_start_method=server_settings.get(_Settings.TaskProcessStartMethod),
         task_close_threads=server_settings.get(_Settings.TaskCloseThreads),
+        task_queue_size=server_settings.get(_Settings.TaskQueueSize),
+        task_lanes=dict(server_settings.get(_Settings.TaskLanes) or {}),
         task_result_ttl_sec=server_settings.get(_Settings.TaskResultTtlSec),
+        task_result_memory_budget=server_settings.get(_Settings.TaskResultMemoryBudget),
+        task_result_spill_threshold=server_settings.get(_Settings.TaskResultSpillThreshold),
+        task_result_spill_dir=server_settings.get(_Settings.TaskResultSpillDir),
+        data_compression=data_compression if data_compression != "none" else None,
+        data_batch_rows=server_settings.get(_Settings.DataBatchRows),
+        data_batch_bytes=server_settings.get(_Settings.DataBatchBytes),
+        data_batch_min_rows=server_settings.get(_Settings.DataBatchMinRows),
+        data_batch_max_rows=server_settings.get(_Settings.DataBatchMaxRows),
+        data_batch_min_bytes=server_settings.get(_Settings.DataBatchMinBytes),
+        data_batch_max_bytes=server_settings.get(_Settings.DataBatchMaxBytes),
         metrics_host=server_settings.get(_Settings.MetricsHost),
         metrics_port=server_settings.get(_Settings.MetricsPort),
         health_check_host=server_settings.get(_Settings.HealthcheckHost),
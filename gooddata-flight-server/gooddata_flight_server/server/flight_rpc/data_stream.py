@@ -0,0 +1,239 @@
+#  (C) 2024 GoodData Corporation
+import dataclasses
+from collections.abc import Generator, Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any, Optional, Union
+
+import pyarrow.flight
+import pyarrow.ipc
+
+from gooddata_flight_server.config.config import ServerConfig
+from gooddata_flight_server.errors.error_info import ErrorInfo
+from gooddata_flight_server.tasks.base import ArrowData
+
+SUPPORTED_COMPRESSION = ("lz4", "zstd")
+"""
+Codecs which can be used to compress the data sent out by DoGet.
+"""
+
+DATA_COMPRESSION_HEADER = "x-gdfs-data-compression"
+"""
+Header using which the caller selects compression of the data: one of `SUPPORTED_COMPRESSION` or 'none'.
+"""
+
+DATA_BATCH_ROWS_HEADER = "x-gdfs-data-batch-rows"
+"""
+Header using which the caller selects target number of rows in a record batch; '0' keeps the batches as they are.
+Other values are clamped to the server's bounds, see `DataStreamOptions.min_batch_rows`.
+"""
+
+DATA_BATCH_BYTES_HEADER = "x-gdfs-data-batch-bytes"
+"""
+Header using which the caller selects target size of a record batch; '0' keeps the batches as they are.
+Other values are clamped to the server's bounds, see `DataStreamOptions.min_batch_bytes`.
+"""
+
+
+@dataclass(frozen=True)
+class DataStreamOptions:
+    """
+    Options of the data streams sent out by DoGet.
+    """
+
+    compression: Optional[str] = None
+    """
+    compression codec of record batch buffers; one of `SUPPORTED_COMPRESSION` or None for no compression
+    """
+
+    batch_rows: int = 0
+    """
+    target number of rows in a record batch; 0 means no limit
+    """
+
+    batch_bytes: int = 0
+    """
+    target size of a record batch in bytes; 0 means no limit
+    """
+
+    min_batch_rows: int = 1024
+    """
+    smallest target number of rows in a record batch which the caller may select
+    """
+
+    max_batch_rows: int = 1024 * 1024
+    """
+    largest target number of rows in a record batch which the caller may select
+    """
+
+    min_batch_bytes: int = 64 * 1024
+    """
+    smallest target size of a record batch which the caller may select
+    """
+
+    max_batch_bytes: int = 64 * 1024 * 1024
+    """
+    largest target size of a record batch which the caller may select
+    """
+
+    @staticmethod
+    def from_config(config: ServerConfig) -> "DataStreamOptions":
+        """
+        :param config: server configuration
+        :return: options configured for the server
+        """
+        return DataStreamOptions(
+            compression=config.data_compression,
+            batch_rows=config.data_batch_rows,
+            batch_bytes=config.data_batch_bytes,
+            min_batch_rows=config.data_batch_min_rows,
+            max_batch_rows=config.data_batch_max_rows,
+            min_batch_bytes=config.data_batch_min_bytes,
+            max_batch_bytes=config.data_batch_max_bytes,
+        )
+
+    @property
+    def rechunk(self) -> bool:
+        return self.batch_rows > 0 or self.batch_bytes > 0
+
+    def with_headers(self, headers: Mapping[str, list[str]]) -> "DataStreamOptions":
+        """
+        Overrides the options using the call headers, see `DATA_COMPRESSION_HEADER`, `DATA_BATCH_ROWS_HEADER`
+        and `DATA_BATCH_BYTES_HEADER`. The batch sizes selected by the caller are clamped to the bounds
+        of the options.
+
+        :param headers: headers of the call
+        :return: new instance of options
+        """
+        overrides: dict[str, Any] = {}
+
+        compression = headers.get(DATA_COMPRESSION_HEADER)
+        if compression:
+            codec = compression[0].lower()
+            if codec != "none" and codec not in SUPPORTED_COMPRESSION:
+                raise ErrorInfo.bad_argument(
+                    f"Unsupported data compression '{compression[0]}'. "
+                    f"Supported values are: none, {', '.join(SUPPORTED_COMPRESSION)}."
+                )
+
+            overrides["compression"] = None if codec == "none" else codec
+
+        for header, field, lower, upper in (
+            (DATA_BATCH_ROWS_HEADER, "batch_rows", self.min_batch_rows, self.max_batch_rows),
+            (DATA_BATCH_BYTES_HEADER, "batch_bytes", self.min_batch_bytes, self.max_batch_bytes),
+        ):
+            value = headers.get(header)
+            if not value:
+                continue
+
+            try:
+                number = int(value[0]) if value[0].isascii() and value[0].isdecimal() else -1
+            except ValueError:
+                number = -1
+
+            if number < 0:
+                raise ErrorInfo.bad_argument(f"Value of the '{header}' header must be a non-negative number.")
+
+            overrides[field] = min(max(number, lower), upper) if number > 0 else 0
+
+        return dataclasses.replace(self, **overrides) if overrides else self
+
+    def ipc_options(self) -> Optional[pyarrow.ipc.IpcWriteOptions]:
+        """
+        :return: IPC write options to use for the data stream; None if the defaults should be used
+        """
+        if self.compression is None:
+            return None
+
+        return pyarrow.ipc.IpcWriteOptions(compression=self.compression)
+
+
+def _to_batches(data: Union[Iterable[ArrowData], ArrowData]) -> Generator[pyarrow.RecordBatch, None, None]:
+    if isinstance(data, pyarrow.RecordBatch):
+        yield data
+    elif isinstance(data, pyarrow.Table):
+        yield from data.to_batches()
+    elif isinstance(data, pyarrow.RecordBatchReader):
+        yield from data
+    else:
+        for item in data:
+            yield from _to_batches(item)
+
+
+def _combine(schema: pyarrow.Schema, batches: list[pyarrow.RecordBatch]) -> pyarrow.RecordBatch:
+    if len(batches) == 1:
+        return batches[0]
+
+    return pyarrow.Table.from_batches(batches, schema=schema).combine_chunks().to_batches()[0]
+
+
+def rechunk(
+    schema: pyarrow.Schema,
+    data: Union[Iterable[ArrowData], ArrowData],
+    batch_rows: int = 0,
+    batch_bytes: int = 0,
+) -> Generator[pyarrow.RecordBatch, None, None]:
+    """
+    Re-chunks the data into record batches of the target size. Larger batches are split, smaller
+    batches are combined. The batches are at most `batch_rows` rows and roughly `batch_bytes` large;
+    the last batch may be smaller.
+
+    :param schema: schema of the data
+    :param data: data to re-chunk
+    :param batch_rows: target number of rows in a batch; 0 means no limit
+    :param batch_bytes: target size of a batch in bytes; 0 means no limit
+    :return: generator of the re-chunked batches
+    """
+    pending: list[pyarrow.RecordBatch] = []
+    pending_rows = 0
+    pending_bytes = 0
+
+    for batch in _to_batches(data):
+        offset = 0
+        row_bytes = batch.nbytes / batch.num_rows if batch.num_rows else 0
+
+        while offset < batch.num_rows:
+            rows = batch.num_rows - offset
+            if batch_rows:
+                rows = min(rows, batch_rows - pending_rows)
+            if batch_bytes and row_bytes:
+                rows = min(rows, max(1, int((batch_bytes - pending_bytes) / row_bytes)))
+
+            pending.append(batch.slice(offset, rows))
+            pending_rows += rows
+            pending_bytes += int(rows * row_bytes)
+            offset += rows
+
+            if (batch_rows and pending_rows >= batch_rows) or (batch_bytes and pending_bytes >= batch_bytes):
+                yield _combine(schema, pending)
+                pending, pending_rows, pending_bytes = [], 0, 0
+
+    if pending:
+        yield _combine(schema, pending)
+
+
+def create_data_stream(
+    schema: pyarrow.Schema,
+    data: Union[Iterable[ArrowData], ArrowData],
+    options: DataStreamOptions,
+) -> pyarrow.flight.FlightDataStream:
+    """
+    Creates a stream which sends out the data according to the options.
+
+    :param schema: schema of the data
+    :param data: data to send out
+    :param options: options of the stream
+    :return: FlightDataStream, can be returned as-is as result of do_get
+    """
+    ipc_options = options.ipc_options()
+
+    if options.rechunk:
+        reader = pyarrow.RecordBatchReader.from_batches(
+            schema, rechunk(schema, data, batch_rows=options.batch_rows, batch_bytes=options.batch_bytes)
+        )
+
+        return pyarrow.flight.RecordBatchStream(reader, options=ipc_options)
+
+    if isinstance(data, (pyarrow.Table, pyarrow.RecordBatchReader)):
+        return pyarrow.flight.RecordBatchStream(data, options=ipc_options)
+
+    return pyarrow.flight.GeneratorStream(schema, data, options=ipc_options)
@@ -6,6 +6,7 @@ import pyarrow.flight
 import structlog
 
 from gooddata_flight_server.errors.error_info import ErrorCode, ErrorInfo
+from gooddata_flight_server.server.flight_rpc.data_stream import DataStreamOptions, create_data_stream
 from gooddata_flight_server.server.flight_rpc.flight_middleware import (
     CallFinalizer,
     CallInfo,
@@ -62,7 +63,10 @@ class FlightServerMethods:
 
     @staticmethod
     def do_get_task_result(
-        context: pyarrow.flight.ServerCallContext, task_executor: TaskExecutor, task_id: str
+        context: pyarrow.flight.ServerCallContext,
+        task_executor: TaskExecutor,
+        task_id: str,
+        options: Optional[DataStreamOptions] = None,
     ) -> pyarrow.flight.FlightDataStream:
         """
         Utility method that creates a FlightDataStream from a result of a task that was
@@ -72,12 +76,19 @@ class FlightServerMethods:
         acquired to protect the data are freed. Single-use results will be closed once they
         are sent out. The method uses current's call finalizer middleware to accomplish this.
 
+        The data are compressed and re-chunked according to the `options`. The caller may override
+        the options using headers, see `DataStreamOptions.with_headers`.
+
         :param context: server call context
         :param task_executor: task executor where the task run
         :param task_id: task identifier
+        :param options: options of the data stream; if not specified, the data are sent out as they are
         :return: FlightDataStream, can be returned as-is as result of do_get
         """
         try:
+            stream_options = (options or DataStreamOptions()).with_headers(
+                FlightServerMethods.call_info_middleware(context).headers
+            )
             task_result = task_executor.wait_for_result(task_id)
             if task_result is None:
                 raise ErrorInfo.for_reason(
@@ -127,15 +138,12 @@ class FlightServerMethods:
 
             if isinstance(data, pyarrow.Table):
                 _LOGGER.info("do_get_table", task_id=task_id, num_rows=data.num_rows)
-
-                return pyarrow.flight.RecordBatchStream(data)
             elif isinstance(data, pyarrow.RecordBatchReader):
                 _LOGGER.info("do_get_reader", task_id=task_id)
+            else:
+                _LOGGER.info("do_get_generator", task_id=task_id)
 
-                return pyarrow.flight.RecordBatchStream(data)
-
-            _LOGGER.info("do_get_generator", task_id=task_id)
-            return pyarrow.flight.GeneratorStream(data)
+            return create_data_stream(result.get_schema(), data, stream_options)
         except Exception:
             _LOGGER.error("do_get_failed", exc_info=True)
             raise
@@ -1,21 +1,45 @@
 #  (C) 2024 GoodData Corporation
-from typing import Union
+from typing import Any, Union
 
 import pyarrow.flight
 from dynaconf import Dynaconf
 
-from gooddata_flight_server.config.config import ServerConfig, read_config
+from gooddata_flight_server.config.config import ServerConfig, TaskExecutorType, read_config
 from gooddata_flight_server.exceptions import FlightMethodsModuleError
 from gooddata_flight_server.server.base import FlightServerMethodsFactory, ServerContext
 from gooddata_flight_server.server.flight_rpc.flight_service import FlightRpcService
 from gooddata_flight_server.server.flight_rpc.server_methods import FlightServerMethods
 from gooddata_flight_server.server.server_base import DEFAULT_LOGGING_INI, ServerBase
+from gooddata_flight_server.tasks.process_task_executor import ProcessTaskExecutor
 from gooddata_flight_server.tasks.task_executor import TaskExecutor
 from gooddata_flight_server.tasks.thread_task_executor import ThreadTaskExecutor
 from gooddata_flight_server.utils.logging import init_logging
 from gooddata_flight_server.utils.otel_tracing import initialize_otel_tracing
 
 
+def _create_task_executor(config: ServerConfig) -> ThreadTaskExecutor:
+    executor_settings: dict[str, Any] = dict(
+        result_close_threads=config.task_close_threads,
+        max_queue_size=config.task_queue_size,
+        lane_weights=config.task_lanes,
+        keep_results_for=config.task_result_ttl_sec,
+        result_memory_budget=config.task_result_memory_budget,
+        result_spill_threshold=config.task_result_spill_threshold,
+        result_spill_dir=config.task_result_spill_dir,
+    )
+
+    # TODO: make metric prefix configurable
+    if config.task_executor == TaskExecutorType.Process:
+        return ProcessTaskExecutor(
+            metric_prefix="gdfs",
+            task_processes=config.task_processes or None,
+            start_method=config.task_process_start_method,
+            **executor_settings,
+        )
+
+    return ThreadTaskExecutor(metric_prefix="gdfs", task_threads=config.task_threads, **executor_settings)
+
+
 class GoodDataFlightServer(ServerBase):
     def __init__(
         self,
@@ -32,13 +56,7 @@ class GoodDataFlightServer(ServerBase):
         self._flight_service = FlightRpcService(config=config)
         self._location = pyarrow.flight.Location(self._flight_service.client_url)
 
-        # TODO: make metric prefix configurable
-        self._task_executor = ThreadTaskExecutor(
-            metric_prefix="gdfs",
-            task_threads=config.task_threads,
-            result_close_threads=config.task_close_threads,
-            keep_results_for=config.task_result_ttl_sec,
-        )
+        self._task_executor = _create_task_executor(config)
 
     @property
     def location(self) -> pyarrow.flight.Location:
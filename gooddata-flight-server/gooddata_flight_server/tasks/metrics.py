@@ -33,6 +33,12 @@ class TaskExecutorMetrics:
     _TaskErrors: dict[str, Counter] = {}
     _TaskCancelled: dict[str, Counter] = {}
     _TaskCompleted: dict[str, Counter] = {}
+    _TaskRejected: dict[str, Counter] = {}
+    _LaneQueueSize: dict[str, Gauge] = {}
+    _ResultResidentBytes: dict[str, Gauge] = {}
+    _ResultSpilledBytes: dict[str, Gauge] = {}
+    _ResultSpilled: dict[str, Counter] = {}
+    _ResultEvicted: dict[str, Counter] = {}
     _MapLock = threading.Lock()
 
     @staticmethod
@@ -113,3 +119,53 @@ class TaskExecutorMetrics:
                 "of how their execution completed (success, failure, cancel).",
             ),
         )
+
+        self.task_rejected = self._get_or_create(
+            TaskExecutorMetrics._TaskRejected,
+            prefix,
+            lambda: Counter(f"{prefix}_task_rejected", "Number of tasks rejected because the queue was full."),
+        )
+
+        self.lane_queue_size = self._get_or_create(
+            TaskExecutorMetrics._LaneQueueSize,
+            prefix,
+            lambda: Gauge(
+                f"{prefix}_lane_queue",
+                "Number of tasks waiting in the queue for a free thread, per priority lane.",
+                labelnames=("lane",),
+            ),
+        )
+
+        self.result_resident_bytes = self._get_or_create(
+            TaskExecutorMetrics._ResultResidentBytes,
+            prefix,
+            lambda: Gauge(
+                f"{prefix}_result_resident_bytes",
+                "Size of data of the retained task results which is held in memory.",
+            ),
+        )
+
+        self.result_spilled_bytes = self._get_or_create(
+            TaskExecutorMetrics._ResultSpilledBytes,
+            prefix,
+            lambda: Gauge(
+                f"{prefix}_result_spilled_bytes",
+                "Size of data of the retained task results which is spilled to local files.",
+            ),
+        )
+
+        self.result_spilled = self._get_or_create(
+            TaskExecutorMetrics._ResultSpilled,
+            prefix,
+            lambda: Counter(f"{prefix}_result_spilled", "Number of task results spilled to local files."),
+        )
+
+        self.result_evicted = self._get_or_create(
+            TaskExecutorMetrics._ResultEvicted,
+            prefix,
+            lambda: Counter(
+                f"{prefix}_result_evicted",
+                "Number of task results evicted before their time-to-live because the results exceeded "
+                "the memory budget.",
+            ),
+        )
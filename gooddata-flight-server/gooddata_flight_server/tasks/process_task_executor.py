@@ -0,0 +1,222 @@
+#  (C) 2024 GoodData Corporation
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Optional, Union
+
+import pyarrow
+import pyarrow.ipc
+
+from gooddata_flight_server.tasks.task import Task
+from gooddata_flight_server.tasks.task_error import TaskError
+from gooddata_flight_server.tasks.task_result import FlightDataTaskResult, TaskResult, _SpilledTableTaskResult
+from gooddata_flight_server.tasks.thread_task_executor import ThreadTaskExecutor, _create_task_error
+
+_SHM_DIR = "/dev/shm"
+_CANCEL_POLL_INTERVAL = 0.1
+
+
+class _WorkerOutcome:
+    """
+    Outcome of a task run in a worker process. Data of the results are never pickled - they are
+    passed back to the server process in Arrow IPC files.
+    """
+
+    __slots__ = ("result", "error", "path", "cancelled")
+
+    def __init__(
+        self,
+        result: Optional[TaskResult] = None,
+        error: Optional[TaskError] = None,
+        path: Optional[str] = None,
+        cancelled: bool = False,
+    ) -> None:
+        self.result = result
+        self.error = error
+        self.path = path
+        self.cancelled = cancelled
+
+    def __getstate__(self) -> tuple:
+        return self.result, self.error, self.path, self.cancelled
+
+    def __setstate__(self, state: tuple) -> None:
+        self.result, self.error, self.path, self.cancelled = state
+
+
+def _write_result_data(task_result: FlightDataTaskResult, result_dir: Optional[str]) -> str:
+    fd, path = tempfile.mkstemp(prefix="gdfs-result-", suffix=".arrow", dir=result_dir)
+
+    try:
+        rlock, data = task_result.acquire_data()
+        try:
+            with (
+                pyarrow.OSFile(path, "wb") as sink,
+                pyarrow.ipc.new_file(sink, task_result.get_schema()) as writer,
+            ):
+                for item in (data,) if isinstance(data, pyarrow.Table) else data:
+                    if isinstance(item, pyarrow.Table):
+                        writer.write_table(item)
+                    else:
+                        writer.write_batch(item)
+        finally:
+            rlock.release()
+    except Exception:
+        os.unlink(path)
+        raise
+    finally:
+        os.close(fd)
+
+    return path
+
+
+def _watch_cancel(task: Task, cancel_event: Any, done: threading.Event) -> None:
+    while not done.is_set():
+        if cancel_event.wait(_CANCEL_POLL_INTERVAL):
+            task.cancel()
+            return
+
+
+def _run_in_worker(task: Task, cancel_event: Any, result_dir: Optional[str]) -> _WorkerOutcome:
+    """
+    Runs the task in a worker process.
+    """
+    done = threading.Event()
+    watcher = threading.Thread(target=_watch_cancel, args=(task, cancel_event, done), daemon=True)
+    watcher.start()
+
+    try:
+        result = task.run()
+
+        if isinstance(result, TaskError):
+            return _WorkerOutcome(error=result)
+        if not isinstance(result, FlightDataTaskResult):
+            return _WorkerOutcome(result=result)
+
+        try:
+            return _WorkerOutcome(path=_write_result_data(result, result_dir))
+        finally:
+            result.close()
+    except CancelledError:
+        return _WorkerOutcome(cancelled=True)
+    except Exception as e:
+        return _WorkerOutcome(error=_create_task_error(e))
+    finally:
+        done.set()
+
+
+class ProcessTaskExecutor(ThreadTaskExecutor):
+    """
+    Implementation of TaskExecutor interface that runs the tasks in worker processes. Unlike the
+    ThreadTaskExecutor, CPU-bound tasks running in this executor are not serialized by the GIL.
+
+    The tasks are pickled and sent to the worker processes, so they must be picklable; the task
+    runs on a copy of the task which is submitted to the executor. The executor's threads only
+    wait for the workers - all other mechanics such as queueing and retention of results are
+    the same as in the ThreadTaskExecutor.
+
+    The data of the results are not pickled. The worker writes them into an Arrow IPC file
+    in `result_dir` - by default in shared memory, if available - and the server process maps
+    the file into its memory. Streamed results are written by the worker as they are produced
+    and the server starts sending them out only after they are complete.
+
+    When a running task is cancelled, the cancellation is forwarded to the task's copy in the
+    worker process - triggering its `on_task_cancel`.
+
+    The tasks that opt out using `Task.run_in_worker` run in the executor's threads, same as in
+    the ThreadTaskExecutor.
+    """
+
+    def __init__(
+        self,
+        metric_prefix: str,
+        task_processes: Optional[int] = None,
+        start_method: str = "spawn",
+        result_dir: Optional[str] = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        :param metric_prefix: prefix of the executor's prometheus metrics
+        :param task_processes: number of worker processes which run the tasks; defaults to number of CPUs
+        :param start_method: multiprocessing start method used to start the worker processes; note that only
+         the workers started using 'fork' inherit the state of the server process
+        :param result_dir: directory for the Arrow IPC files with the result data; defaults to `/dev/shm`
+         if available, system's temporary directory otherwise
+        :param kwargs: other parameters, see `ThreadTaskExecutor`
+        """
+        processes = task_processes or os.cpu_count() or 1
+        # each executor's thread waits for one worker process
+        super().__init__(metric_prefix=metric_prefix, task_threads=processes, **kwargs)
+
+        self._mp_context = multiprocessing.get_context(start_method)
+        self._task_processes = processes
+        self._result_dir = result_dir or (_SHM_DIR if os.path.isdir(_SHM_DIR) else None)
+        self._manager = self._mp_context.Manager()
+        self._pool_lock = threading.Lock()
+        self._pool = self._create_pool()
+        self._cancel_events: dict[str, Any] = {}
+
+    def _create_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self._task_processes, mp_context=self._mp_context)
+
+    def _replace_broken_pool(self, pool: ProcessPoolExecutor) -> None:
+        with self._pool_lock:
+            if self._pool is pool:
+                self._logger.warning("task_process_pool_broken")
+                self._pool = self._create_pool()
+
+    def _invoke_task(self, task: Task) -> Union[TaskResult, TaskError]:
+        if not task.run_in_worker:
+            return super()._invoke_task(task)
+
+        cancel_event = self._manager.Event()
+        with self._pool_lock:
+            pool = self._pool
+            self._cancel_events[task.task_id] = cancel_event
+
+        try:
+            outcome: _WorkerOutcome = pool.submit(_run_in_worker, task, cancel_event, self._result_dir).result()
+        except BrokenProcessPool:
+            # a worker process died abruptly; the pool cannot be used anymore
+            self._replace_broken_pool(pool)
+            raise
+        finally:
+            with self._pool_lock:
+                self._cancel_events.pop(task.task_id, None)
+
+        if outcome.cancelled:
+            raise CancelledError()
+        if outcome.error is not None:
+            return outcome.error
+        if outcome.path is not None:
+            return _SpilledTableTaskResult(outcome.path)
+
+        assert outcome.result is not None
+        return outcome.result
+
+    def cancel(self, task_id: str) -> bool:
+        cancelled = super().cancel(task_id)
+
+        if cancelled:
+            with self._pool_lock:
+                cancel_event = self._cancel_events.get(task_id)
+
+            if cancel_event is not None:
+                cancel_event.set()
+
+        return cancelled
+
+    def stop(self, cancel_running: bool = True, timeout: Optional[float] = None) -> None:
+        if cancel_running:
+            with self._pool_lock:
+                cancel_events = list(self._cancel_events.values())
+
+            for cancel_event in cancel_events:
+                cancel_event.set()
+
+        super().stop(cancel_running=cancel_running, timeout=timeout)
+
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._manager.shutdown()
@@ -2,6 +2,7 @@
 import abc
 import threading
 import uuid
+from collections.abc import Mapping
 from concurrent.futures import CancelledError
 from typing import Optional, Union, final
 
@@ -31,6 +32,22 @@ class Task(abc.ABC):
     no longer feasible), then it must first switch the task to be non-cancellable
     using the `switch_non_cancellable` - this may raise CancelledError if the `run`
     was raced and someone cancelled the task.
+
+    The task may influence when the executor runs it:
+
+    - the task is queued in a priority `lane`; the executor takes tasks from its lanes
+      in proportion to the lanes' weights
+    - the task may be part of one or more concurrency groups, each with a limit on
+      the number of tasks from the group that may run at the same time (e.g. a limit
+      for a tenant)
+    - the task may opt out of running in a worker process, see `run_in_worker`
+    """
+
+    run_in_worker: bool = True
+    """
+    Whether executors that run the tasks in worker processes may send the task to a worker. Tasks
+    that already hold their data (e.g. cached results) should opt out - the data would be pickled
+    into the worker only to be written back to the server process.
     """
 
     __slots__ = (
@@ -40,6 +57,8 @@ class Task(abc.ABC):
         "_cancelled",
         "_cancellable",
         "_triggers",
+        "_lane",
+        "_concurrency_limits",
     )
 
     def __init__(
@@ -47,12 +66,40 @@ class Task(abc.ABC):
         cmd: bytes,
         cancellable: bool = True,
         task_id: Optional[str] = None,
+        lane: Optional[str] = None,
+        concurrency_limits: Optional[Mapping[str, int]] = None,
     ):
+        """
+        :param cmd: command from Flight descriptor which resulted in the creation of the task
+        :param cancellable: whether the task can be cancelled
+        :param task_id: task identifier; generated if not specified
+        :param lane: priority lane to queue the task in; if not specified or if the executor does
+         not have such lane, the task is queued in the default lane
+        :param concurrency_limits: mapping of concurrency group to maximum number of tasks from that
+         group that may run at the same time
+        """
         self._task_id = task_id or uuid.uuid4().hex
         self._cmd = cmd
         self._cancel_lock = threading.Lock()
         self._cancelled = False
         self._cancellable = cancellable
+        self._lane = lane
+        self._concurrency_limits: Mapping[str, int] = concurrency_limits or {}
+
+    def __getstate__(self) -> dict:
+        # tasks are pickled when they are sent to worker processes; the lock cannot be pickled
+        state = dict(getattr(self, "__dict__", {}))
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if name not in ("_cancel_lock", "__dict__", "__weakref__") and hasattr(self, name):
+                    state[name] = getattr(self, name)
+
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self._cancel_lock = threading.Lock()
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
 
     @final
     @property
@@ -64,6 +111,16 @@ class Task(abc.ABC):
     def cmd(self) -> bytes:
         return self._cmd
 
+    @final
+    @property
+    def lane(self) -> Optional[str]:
+        return self._lane
+
+    @final
+    @property
+    def concurrency_limits(self) -> Mapping[str, int]:
+        return self._concurrency_limits
+
     @final
     @property
     def cancelled(self) -> bool:
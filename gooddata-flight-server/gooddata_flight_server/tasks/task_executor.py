@@ -50,7 +50,9 @@ class TaskExecutor(abc.ABC):
         Submit a new task that will perform all work as described in the provided command.
 
         :param task: task to run
-        :return: nothing, task is always submitted
+        :raise FlightUnavailableError: with the BACKPRESSURE error code, if the executor cannot accept
+         more tasks at the moment; the caller should retry later
+        :return: nothing
         """
         raise NotImplementedError
 
@@ -0,0 +1,151 @@
+#  (C) 2024 GoodData Corporation
+from collections import deque
+from collections.abc import Iterator, Mapping
+from typing import Generic, Optional, TypeVar
+
+from gooddata_flight_server.tasks.task import Task
+
+DEFAULT_LANE = "default"
+"""
+Name of the lane where tasks go unless they specify other lane.
+"""
+
+T = TypeVar("T")
+
+
+class _Lane(Generic[T]):
+    __slots__ = ("name", "weight", "current", "entries")
+
+    def __init__(self, name: str, weight: int) -> None:
+        self.name = name
+        self.weight = weight
+        # current weight used by the smooth weighted round-robin
+        self.current = 0
+        self.entries: deque[tuple[Task, T]] = deque()
+
+
+class TaskQueue(Generic[T]):
+    """
+    Queue of tasks waiting to run. The queue is not thread-safe; the callers must synchronize
+    the access.
+
+    The tasks are queued in lanes. Each lane has a weight; when multiple lanes have tasks ready
+    to run, the tasks are taken in proportion to the weights of the lanes (using smooth weighted
+    round-robin). Within a lane, the tasks are taken in FIFO order.
+
+    A task is ready to run only if all its concurrency groups are below their limits. Tasks that
+    are not ready stay in the queue and do not block the ready tasks queued after them.
+    """
+
+    def __init__(self, lane_weights: Optional[Mapping[str, int]] = None) -> None:
+        """
+        :param lane_weights: mapping of lane name to its weight; the default lane is always present,
+         with weight 1 unless specified otherwise
+        """
+        weights = {DEFAULT_LANE: 1, **(lane_weights or {})}
+        for name, weight in weights.items():
+            if weight < 1:
+                raise ValueError(f"Weight of lane '{name}' must be a positive number, got {weight}.")
+
+        self._lanes: dict[str, _Lane[T]] = {name: _Lane(name, weight) for name, weight in weights.items()}
+        self._running: dict[str, int] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def lane_sizes(self) -> Iterator[tuple[str, int]]:
+        """
+        :return: iterator of (lane name, number of queued tasks)
+        """
+        return ((lane.name, len(lane.entries)) for lane in self._lanes.values())
+
+    def lane_of(self, task: Task) -> str:
+        """
+        :param task: task
+        :return: name of the lane where the task is queued
+        """
+        return task.lane if task.lane in self._lanes else DEFAULT_LANE
+
+    def put(self, task: Task, value: T) -> None:
+        """
+        Queues the task.
+
+        :param task: task to queue
+        :param value: value to return together with the task once it is taken from the queue
+        :return: nothing
+        """
+        self._lanes[self.lane_of(task)].entries.append((task, value))
+        self._size += 1
+
+    def remove(self, task: Task) -> bool:
+        """
+        Removes the task from the queue.
+
+        :param task: task to remove
+        :return: true if removed, false if the task was not queued
+        """
+        entries = self._lanes[self.lane_of(task)].entries
+        for entry in entries:
+            if entry[0] is task:
+                entries.remove(entry)
+                self._size -= 1
+
+                return True
+
+        return False
+
+    def _is_ready(self, task: Task) -> bool:
+        return all(self._running.get(group, 0) < limit for group, limit in task.concurrency_limits.items())
+
+    def _first_ready(self, lane: _Lane[T]) -> Optional[tuple[Task, T]]:
+        for entry in lane.entries:
+            if self._is_ready(entry[0]):
+                return entry
+
+        return None
+
+    def take(self) -> Optional[tuple[Task, T]]:
+        """
+        Takes the next task that is ready to run from the queue. The task is counted as running
+        in all its concurrency groups until `release` is called for it.
+
+        :return: tuple of (task, value) or None if there is no task ready to run
+        """
+        candidates = []
+        for lane in self._lanes.values():
+            entry = self._first_ready(lane)
+            if entry is not None:
+                candidates.append((lane, entry))
+
+        if not candidates:
+            return None
+
+        total_weight = 0
+        for lane, _ in candidates:
+            lane.current += lane.weight
+            total_weight += lane.weight
+
+        lane, entry = max(candidates, key=lambda candidate: candidate[0].current)
+        lane.current -= total_weight
+        lane.entries.remove(entry)
+        self._size -= 1
+
+        for group in entry[0].concurrency_limits:
+            self._running[group] = self._running.get(group, 0) + 1
+
+        return entry
+
+    def release(self, task: Task) -> None:
+        """
+        Releases the task that was taken from the queue and is not running anymore.
+
+        :param task: task that was taken using `take`
+        :return: nothing
+        """
+        for group in task.concurrency_limits:
+            running = self._running.get(group, 0) - 1
+            if running > 0:
+                self._running[group] = running
+            else:
+                self._running.pop(group, None)
@@ -1,11 +1,14 @@
 #  (C) 2024 GoodData Corporation
 import abc
+import os
+import tempfile
 import threading
 from collections.abc import Generator, Iterable
 from dataclasses import dataclass
 from typing import Callable, Optional, Union, final
 
 import pyarrow.flight
+import pyarrow.ipc
 import structlog
 from readerwriterlock import rwlock
 from typing_extensions import TypeAlias
@@ -94,6 +97,18 @@ class FlightDataTaskResult(abc.ABC):
         """
         return self._single_use_data
 
+    def get_resident_bytes(self) -> int:
+        """
+        Gets size of the result's data which is held in memory. The task executor uses this to keep
+        the results within the configured memory budget.
+
+        Subclasses that hold their data in memory should override this method. By default, the size is
+        unknown and the result is not accounted.
+
+        :return: number of bytes; 0 if unknown or if the data is not held in memory (e.g. it is streamed)
+        """
+        return 0
+
     @abc.abstractmethod
     def get_schema(self) -> pyarrow.Schema:
         """
@@ -317,11 +332,41 @@ class _TableTaskResult(FlightDataTaskResult):
         super().__init__(single_use_data=False)
 
         self._table: pyarrow.Table = table
+        self._nbytes = table.nbytes
         self._on_close = on_close
 
+    def get_resident_bytes(self) -> int:
+        return self._nbytes
+
     def get_schema(self) -> pyarrow.Schema:
         return self._table.schema
 
+    def spill(self, spill_dir: Optional[str] = None) -> "_SpilledTableTaskResult":
+        """
+        Writes the table into an Arrow IPC file and creates a new result which memory-maps the data
+        from that file.
+
+        Once the spilled result is created, this result should be closed; the `on_close` callback is
+        transferred to the spilled result.
+
+        :param spill_dir: directory where to create the file; defaults to system's temporary directory
+        :return: spilled result
+        """
+        fd, path = tempfile.mkstemp(prefix="gdfs-result-", suffix=".arrow", dir=spill_dir)
+        os.close(fd)
+
+        try:
+            with pyarrow.OSFile(path, "wb") as sink, pyarrow.ipc.new_file(sink, self._table.schema) as writer:
+                writer.write_table(self._table)
+
+            spilled = _SpilledTableTaskResult(path, on_close=self._on_close)
+        except Exception:
+            os.unlink(path)
+            raise
+
+        self._on_close = None
+        return spilled
+
     def _get_data(self) -> Union[Iterable[ArrowData], ArrowData]:
         return self._table
 
@@ -361,3 +406,43 @@ class _ReaderTaskResult(FlightDataTaskResult):
                 self._on_close()
         except Exception:
             _LOGGER.warning("reader_on_close_failed", exc_info=True)
+
+
+class _SpilledTableTaskResult(FlightDataTaskResult):
+    """
+    Result whose table is stored in a local Arrow IPC file. The data are memory-mapped from the file,
+    so they do not count towards the process memory. The file is removed when the result is closed.
+    """
+
+    def __init__(self, path: str, on_close: Optional[OnCloseCallback] = None) -> None:
+        super().__init__(single_use_data=False)
+
+        self._path = path
+        self._mmap = pyarrow.memory_map(path, "r")
+        self._table: pyarrow.Table = pyarrow.ipc.open_file(self._mmap).read_all()
+        self._on_close = on_close
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def get_schema(self) -> pyarrow.Schema:
+        return self._table.schema
+
+    def _get_data(self) -> Union[Iterable[ArrowData], ArrowData]:
+        return self._table
+
+    def _close(self) -> None:
+        del self._table
+
+        try:
+            self._mmap.close()
+            os.unlink(self._path)
+        except Exception:
+            _LOGGER.warning("spilled_result_cleanup_failed", path=self._path, exc_info=True)
+
+        try:
+            if self._on_close is not None:
+                self._on_close()
+        except Exception:
+            _LOGGER.warning("reader_on_close_failed", exc_info=True)
@@ -1,8 +1,10 @@
 #  (C) 2024 GoodData Corporation
 import abc
+import os
 import threading
 import time
-from collections.abc import Generator
+from collections import OrderedDict
+from collections.abc import Generator, Mapping
 from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass
@@ -23,10 +25,13 @@ from gooddata_flight_server.tasks.task_executor import (
     TaskAttributes,
     TaskExecutor,
 )
+from gooddata_flight_server.tasks.task_queue import TaskQueue
 from gooddata_flight_server.tasks.task_result import (
     FlightDataTaskResult,
     TaskExecutionResult,
     TaskResult,
+    _SpilledTableTaskResult,
+    _TableTaskResult,
 )
 from gooddata_flight_server.tasks.temporal_container import TemporalContainer
 from gooddata_flight_server.utils.otel_tracing import SERVER_TRACER
@@ -158,6 +163,7 @@ class _TaskExecution:
         "_result_future",
         "_lock",
         "_completed",
+        "_done",
         "_stats",
     )
 
@@ -189,6 +195,7 @@ class _TaskExecution:
         # all these are protected using the lock
         self._result_future: Optional[Future[Union[TaskResult, TaskError]]] = None
         self._completed: threading.Condition = threading.Condition(self._lock)
+        self._done = False
 
     @property
     def task(self) -> Task:
@@ -234,6 +241,7 @@ class _TaskExecution:
 
         with self._lock:
             execution_result = self._cb.process_task_result(self, self._result_future)
+            self._done = True
             self._completed.notify_all()
 
         self._complete_execution_span(execution_result)
@@ -288,9 +296,21 @@ class _TaskExecution:
             # may not be possible
             return self._task.cancel()
 
+    def cancel_pending(self) -> bool:
+        """
+        Cancels the execution only if its task did not start running yet.
+
+        :return: True if cancel was successful, false if the task is already running
+        """
+        assert self._result_future is not None
+
+        with self._lock:
+            return self._result_future.cancel()
+
     def wait_for_completion(self, timeout: Optional[float] = None) -> None:
         with self._lock:
-            completed = self._completed.wait(timeout=timeout)
+            # the execution may complete between the caller looking it up and starting to wait
+            completed = self._completed.wait_for(lambda: self._done, timeout=timeout)
 
         if not completed:
             raise TaskWaitTimeoutError(task_id=self._task.task_id, cmd=self._task.cmd)
@@ -332,6 +352,19 @@ class ThreadTaskExecutor(TaskExecutor, _TaskExecutionCallbacks):
     """
     Implementation of TaskExecutor interface that uses a pluggable TaskFactory
     to create tasks to run and then submits those into a ThreadPoolExecutor.
+
+    The tasks wait for a free thread in a queue. The queue holds at most `max_queue_size`
+    tasks; tasks submitted to a full queue are rejected with the BACKPRESSURE error. The queue
+    is split into priority lanes with weights given by `lane_weights` and it also honors
+    the tasks' concurrency limits, see `Task`.
+
+    Results of the finished tasks are retained for `keep_results_for` seconds. Additionally,
+    the executor keeps track of how much memory the retained results hold:
+
+    - results whose tables are larger than `result_spill_threshold` bytes are spilled to Arrow IPC
+      files in `result_spill_dir`; the data are then memory-mapped back from the files
+    - when the results held in memory exceed `result_memory_budget` bytes, the least recently
+      used results are evicted before their time runs out
     """
 
     def __init__(
@@ -340,7 +373,23 @@ class ThreadTaskExecutor(TaskExecutor, _TaskExecutionCallbacks):
         task_threads: int = 4,
         result_close_threads: int = 2,
         keep_results_for: int = 15,
+        max_queue_size: int = 0,
+        lane_weights: Optional[Mapping[str, int]] = None,
+        result_memory_budget: int = 0,
+        result_spill_threshold: int = 0,
+        result_spill_dir: Optional[str] = None,
     ) -> None:
+        """
+        :param metric_prefix: prefix of the executor's prometheus metrics
+        :param task_threads: number of threads which run the tasks
+        :param result_close_threads: number of threads which close the evicted results
+        :param keep_results_for: number of seconds for which the results are retained
+        :param max_queue_size: maximum number of tasks waiting for a free thread; 0 means no limit
+        :param lane_weights: mapping of priority lane name to its weight
+        :param result_memory_budget: maximum size of results held in memory; 0 means no limit
+        :param result_spill_threshold: minimum size of result that is spilled to a file; 0 means no spilling
+        :param result_spill_dir: directory for the spilled results; defaults to system's temporary directory
+        """
         self._logger = structlog.get_logger("gooddata_flight_server.task_executor")
         self._metric_prefix = metric_prefix
 
@@ -358,6 +407,23 @@ class ThreadTaskExecutor(TaskExecutor, _TaskExecutionCallbacks):
         self._queue_size: int = 0
         self._executions: dict[str, _TaskExecution] = {}
 
+        self._task_threads = task_threads
+        self._max_queue_size = max_queue_size
+        # tasks waiting for a free thread, along with the futures of their results; protected by the task lock
+        self._pending: TaskQueue[tuple[_TaskExecution, Future]] = TaskQueue(lane_weights)
+        self._running_tasks = 0
+        self._stopped = False
+
+        self._result_memory_budget = result_memory_budget
+        self._result_spill_threshold = result_spill_threshold
+        self._result_spill_dir = result_spill_dir
+        self._result_bytes_lock = threading.Lock()
+        # results held in memory, from the least to the most recently used
+        self._resident_results: OrderedDict[str, int] = OrderedDict()
+        self._resident_bytes = 0
+        self._spilled_results: dict[str, int] = {}
+        self._spilled_bytes = 0
+
         self._results: TemporalContainer[TaskExecutionResult] = TemporalContainer(
             logger_name="gooddata_flight_server.result_container",
             grace_period=keep_results_for,
@@ -388,6 +454,94 @@ class ThreadTaskExecutor(TaskExecutor, _TaskExecutionCallbacks):
             self._close_executor.submit(self._async_close_result, result.task_id, task_result)
 
         self._executions.pop(result.task_id, None)
+        self._release_result_bytes(result.task_id)
+
+    def _spill_result(self, result: TaskExecutionResult) -> TaskExecutionResult:
+        """
+        Spills the result's table to a file, if it is over the spill threshold.
+        """
+        task_result = result.result
+        if (
+            not self._result_spill_threshold
+            or not isinstance(task_result, _TableTaskResult)
+            or task_result.get_resident_bytes() < self._result_spill_threshold
+        ):
+            return result
+
+        try:
+            spilled = task_result.spill(self._result_spill_dir)
+        except Exception:
+            self._logger.warning("result_spill_failed", task_id=result.task_id, exc_info=True)
+            return result
+
+        task_result.close()
+        self._metrics.result_spilled.inc()
+        self._logger.info("result_spilled", task_id=result.task_id, path=spilled.path)
+
+        return TaskExecutionResult(
+            task_id=result.task_id,
+            cmd=result.cmd,
+            result=spilled,
+            error=None,
+            cancelled=False,
+        )
+
+    def _account_result_bytes(self, result: TaskExecutionResult) -> None:
+        """
+        Accounts size of the retained result. If the results held in memory exceed the memory
+        budget, then the least recently used results are evicted. The result being accounted
+        is never evicted.
+        """
+        task_result = result.result
+        if isinstance(task_result, _SpilledTableTaskResult):
+            spilled_bytes = os.path.getsize(task_result.path)
+
+            with self._result_bytes_lock:
+                self._spilled_results[result.task_id] = spilled_bytes
+                self._spilled_bytes += spilled_bytes
+                self._metrics.result_spilled_bytes.set(self._spilled_bytes)
+
+            return
+
+        if not isinstance(task_result, FlightDataTaskResult) or not task_result.get_resident_bytes():
+            return
+
+        to_evict: list[str] = []
+        with self._result_bytes_lock:
+            self._resident_results[result.task_id] = task_result.get_resident_bytes()
+            self._resident_bytes += task_result.get_resident_bytes()
+            self._metrics.result_resident_bytes.set(self._resident_bytes)
+
+            excess = self._resident_bytes - self._result_memory_budget if self._result_memory_budget else 0
+            for task_id, nbytes in self._resident_results.items():
+                if excess <= 0 or task_id == result.task_id:
+                    break
+
+                to_evict.append(task_id)
+                excess -= nbytes
+
+        # evictions call back to _release_result_bytes, they must happen outside the critical section
+        for task_id in to_evict:
+            if self._results.evict_entry(task_id):
+                self._logger.info("result_evicted_over_budget", task_id=task_id)
+                self._metrics.result_evicted.inc()
+
+    def _release_result_bytes(self, task_id: str) -> None:
+        with self._result_bytes_lock:
+            resident_bytes = self._resident_results.pop(task_id, None)
+            if resident_bytes is not None:
+                self._resident_bytes -= resident_bytes
+                self._metrics.result_resident_bytes.set(self._resident_bytes)
+
+            spilled_bytes = self._spilled_results.pop(task_id, None)
+            if spilled_bytes is not None:
+                self._spilled_bytes -= spilled_bytes
+                self._metrics.result_spilled_bytes.set(self._spilled_bytes)
+
+    def _touch_result(self, task_id: str) -> None:
+        with self._result_bytes_lock:
+            if task_id in self._resident_results:
+                self._resident_results.move_to_end(task_id)
 
     def _create_task_exec_result(
         self,
@@ -491,6 +645,12 @@ class ThreadTaskExecutor(TaskExecutor, _TaskExecutionCallbacks):
                 error=task_error,
             )
 
+    def _invoke_task(self, task: Task) -> Union[TaskResult, TaskError]:
+        """
+        Runs the task. This is called from one of the executor's threads.
+        """
+        return task.run()
+
     def _task_run_wrapper(self, task_execution: _TaskExecution) -> Any:
         task = task_execution.task
         logging_ctx = task_execution.logging_ctx
@@ -512,7 +672,7 @@ class ThreadTaskExecutor(TaskExecutor, _TaskExecutionCallbacks):
             self._metrics.wait_time.observe(stats.run_waited_duration)
 
             try:
-                return task.run()
+                return self._invoke_task(task)
             finally:
                 stats.run_completed = time.perf_counter()
                 stats.completed = stats.run_completed
@@ -532,22 +692,80 @@ class ThreadTaskExecutor(TaskExecutor, _TaskExecutionCallbacks):
 
         self._metrics.queue_size.set(self._queue_size)
 
+    def _update_lane_metrics(self) -> None:
+        for lane, size in self._pending.lane_sizes():
+            self._metrics.lane_queue_size.labels(lane=lane).set(size)
+
+    def _run_dispatched(self, task_execution: _TaskExecution, future: Future) -> None:
+        try:
+            # the future is not running if the task was cancelled while waiting in the queue
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = self._task_run_wrapper(task_execution)
+                except BaseException as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+        finally:
+            with self._task_lock:
+                self._running_tasks -= 1
+                self._pending.release(task_execution.task)
+
+            self._dispatch()
+
+    def _dispatch(self) -> None:
+        """
+        Hands the queued tasks that are ready to run over to the thread pool - for as long as there are free threads.
+        """
+        while True:
+            with self._task_lock:
+                if self._stopped or self._running_tasks >= self._task_threads:
+                    return
+
+                entry = self._pending.take()
+                if entry is None:
+                    return
+
+                self._running_tasks += 1
+                self._update_lane_metrics()
+
+            task_execution, future = entry[1]
+            self._executor.submit(self._run_dispatched, task_execution, future)
+
     def run_task(
         self,
         task_execution: _TaskExecution,
     ) -> Future:
         with task_execution.use_execution_span(), SERVER_TRACER.start_as_current_span("task_run_submit"):
             task_execution.stats.run_submitted = time.perf_counter()
+            future: Future = Future()
+
+            with self._task_lock:
+                stopped = self._stopped
+                if not stopped:
+                    self._pending.put(task_execution.task, (task_execution, future))
+                    self._update_lane_metrics()
 
-            return self._executor.submit(self._task_run_wrapper, task_execution)
+            if stopped:
+                future.cancel()
+            else:
+                self._dispatch()
+
+            return future
 
     def process_task_result(
         self,
         task_execution: "_TaskExecution",
         future: Future,
     ) -> TaskExecutionResult:
-        result = self._create_task_exec_result(task_execution, future)
+        if future.cancelled():
+            with self._task_lock:
+                if self._pending.remove(task_execution.task):
+                    self._update_lane_metrics()
+
+        result = self._spill_result(self._create_task_exec_result(task_execution, future))
         self._finish_task_with_result(task_execution, result)
+        self._account_result_bytes(result)
 
         return result
 
@@ -555,12 +773,26 @@ class ThreadTaskExecutor(TaskExecutor, _TaskExecutionCallbacks):
         self,
         task: Task,
     ) -> None:
-        # note: task execution constructor will snapshot current logging and tracing context
-        execution = _TaskExecution(task=task, cb=self)
-
         with self._task_lock:
-            self._queue_size += 1
-            self._executions[task.task_id] = execution
+            # the check and the admission must be atomic, otherwise concurrent submits could overrun the queue;
+            # the tasks that are submitted but not yet running also include those not yet put into the queue
+            queued = max(self._queue_size - self._running_tasks, 0)
+            rejected = bool(self._max_queue_size) and queued >= self._max_queue_size
+
+            if not rejected:
+                # note: task execution constructor will snapshot current logging and tracing context
+                execution = _TaskExecution(task=task, cb=self)
+                self._queue_size += 1
+                self._executions[task.task_id] = execution
+
+        if rejected:
+            self._metrics.task_rejected.inc()
+            self._logger.warning("task_rejected", task_id=task.task_id, queued=queued)
+
+            raise ErrorInfo.for_reason(
+                ErrorCode.BACKPRESSURE,
+                f"The server is busy, there are already {queued} tasks waiting to run. Try again later.",
+            ).to_unavailable_error()
 
         execution.start()
         self._metrics.queue_size.set(self._queue_size)
@@ -571,6 +803,8 @@ class ThreadTaskExecutor(TaskExecutor, _TaskExecutionCallbacks):
             result = self._results.get_entry(task_id)
 
         if result is not None:
+            self._touch_result(task_id)
+
             return result
         elif execution is not None:
             execution.wait_for_completion(timeout=timeout)
@@ -622,12 +856,19 @@ class ThreadTaskExecutor(TaskExecutor, _TaskExecutionCallbacks):
         :return: nothing
         """
         self._logger.info("task_exec_stopping", pending_tasks=len(self._executions))
+
+        with self._task_lock:
+            self._stopped = True
+            executions = list(self._executions.values())
+
         self._executor.shutdown(wait=False, cancel_futures=True)
 
-        if cancel_running:
-            with self._task_lock:
-                for task in self._executions.values():
-                    task.cancel()
+        # cancellation runs the callbacks which need the task lock; it must happen outside the critical section
+        for execution in executions:
+            if cancel_running:
+                execution.cancel()
+            else:
+                execution.cancel_pending()
 
         def _shutdown_executor() -> None:
             self._executor.shutdown(wait=True, cancel_futures=True)
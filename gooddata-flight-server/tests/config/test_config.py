@@ -56,6 +56,12 @@ def test_read_empty():
     assert server_config.token_header_name is None
     assert server_config.token_verification is None
 
+    assert server_config.data_compression is None
+    assert server_config.data_batch_rows == 0
+    assert server_config.data_batch_bytes == 0
+    assert server_config.data_batch_min_rows == 1024
+    assert server_config.data_batch_max_bytes == 64 * 1024 * 1024
+
 
 def test_read_tls():
     keyfile = os.path.join(_CURRENT_DIR, "private_key.pem")
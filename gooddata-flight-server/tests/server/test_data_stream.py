@@ -0,0 +1,123 @@
+#  (C) 2024 GoodData Corporation
+import os
+from typing import Union
+
+import pyarrow.flight
+import pytest
+from gooddata_flight_server import (
+    DataStreamOptions,
+    FlightDataTaskResult,
+    FlightServerMethods,
+    ServerContext,
+    Task,
+    TaskError,
+    TaskResult,
+)
+from gooddata_flight_server.server.flight_rpc.data_stream import (
+    DATA_BATCH_BYTES_HEADER,
+    DATA_BATCH_ROWS_HEADER,
+    DATA_COMPRESSION_HEADER,
+    rechunk,
+)
+
+from tests.server.conftest import server
+
+_DATA = pyarrow.table(
+    data={"col1": list(range(100)), "col2": [f"val{x}" for x in range(100)]},
+)
+
+
+def _batch_sizes(batches) -> list[int]:
+    return [batch.num_rows for batch in batches]
+
+
+def test_rechunk_rows():
+    # batches of 10, 20, 30 and 40 rows
+    data = pyarrow.concat_tables([_DATA.slice(0, 10), _DATA.slice(10, 20), _DATA.slice(30, 30), _DATA.slice(60)])
+
+    batches = list(rechunk(_DATA.schema, data, batch_rows=25))
+
+    assert _batch_sizes(batches) == [25, 25, 25, 25]
+    assert pyarrow.Table.from_batches(batches).equals(_DATA)
+
+
+def test_rechunk_bytes():
+    row_bytes = _DATA.nbytes / _DATA.num_rows
+    reader = _DATA.to_reader(max_chunksize=7)
+
+    batches = list(rechunk(_DATA.schema, reader, batch_bytes=int(50 * row_bytes)))
+
+    assert sum(_batch_sizes(batches)) == 100
+    assert all(45 <= batch.num_rows <= 55 for batch in batches[:-1])
+    assert pyarrow.Table.from_batches(batches).equals(_DATA)
+
+
+def test_options_with_headers():
+    options = DataStreamOptions(compression="lz4", batch_rows=1000)
+
+    assert options.with_headers({}) is options
+    assert options.with_headers({DATA_COMPRESSION_HEADER: ["ZSTD"]}).compression == "zstd"
+    assert options.with_headers({DATA_COMPRESSION_HEADER: ["none"]}).compression is None
+    assert options.with_headers({DATA_BATCH_ROWS_HEADER: ["2000"]}).batch_rows == 2000
+    assert options.with_headers({DATA_BATCH_ROWS_HEADER: ["0"]}).batch_rows == 0
+
+    # the caller cannot select batch sizes outside of the server's bounds
+    assert options.with_headers({DATA_BATCH_ROWS_HEADER: ["1"]}).batch_rows == options.min_batch_rows
+    assert options.with_headers({DATA_BATCH_BYTES_HEADER: ["10" * 10]}).batch_bytes == options.max_batch_bytes
+
+    with pytest.raises(pyarrow.flight.FlightServerError):
+        options.with_headers({DATA_COMPRESSION_HEADER: ["gzip"]})
+
+    for value in ("-1", "\u0663", "\u00b2"):
+        with pytest.raises(pyarrow.flight.FlightServerError):
+            options.with_headers({DATA_BATCH_ROWS_HEADER: [value]})
+
+
+class _DataTask(Task):
+    def __init__(self) -> None:
+        super().__init__(cmd=b"")
+
+    def run(self) -> Union[TaskResult, TaskError]:
+        return FlightDataTaskResult.for_data(_DATA)
+
+
+class _DataMethods(FlightServerMethods):
+    def __init__(self, ctx: ServerContext) -> None:
+        self._ctx = ctx
+
+    def do_get(
+        self,
+        context: pyarrow.flight.ServerCallContext,
+        ticket: pyarrow.flight.Ticket,
+    ) -> pyarrow.flight.FlightDataStream:
+        task = _DataTask()
+        self._ctx.task_executor.submit(task)
+
+        return self.do_get_task_result(
+            context, self._ctx.task_executor, task.task_id, DataStreamOptions.from_config(self._ctx.config)
+        )
+
+
+def test_do_get_options():
+    os.environ["GOODDATA_FLIGHT_SERVER__DATA_COMPRESSION"] = "lz4"
+    os.environ["GOODDATA_FLIGHT_SERVER__DATA_BATCH_ROWS"] = "30"
+
+    with server(_DataMethods) as s:
+        c = pyarrow.flight.FlightClient(s.location)
+        ticket = pyarrow.flight.Ticket(b"data")
+
+        batches = [chunk.data for chunk in c.do_get(ticket)]
+        assert _batch_sizes(batches) == [30, 30, 30, 10]
+        assert pyarrow.Table.from_batches(batches).equals(_DATA)
+
+        # the caller overrides the server's settings
+        options = pyarrow.flight.FlightCallOptions(
+            headers=[(DATA_COMPRESSION_HEADER.encode(), b"zstd"), (DATA_BATCH_ROWS_HEADER.encode(), b"0")]
+        )
+        batches = [chunk.data for chunk in c.do_get(ticket, options)]
+        assert _batch_sizes(batches) == [100]
+        assert pyarrow.Table.from_batches(batches).equals(_DATA)
+
+        options = pyarrow.flight.FlightCallOptions(headers=[(DATA_COMPRESSION_HEADER.encode(), b"gzip")])
+        with pytest.raises(pyarrow.flight.FlightServerError):
+            c.do_get(ticket, options).read_all()
@@ -0,0 +1,107 @@
+#  (C) 2024 GoodData Corporation
+import os
+import time
+from typing import Union
+
+import pyarrow
+import pytest
+from gooddata_flight_server import ErrorCode, FlightDataTaskResult, Task, TaskError, TaskResult
+from gooddata_flight_server.tasks.process_task_executor import ProcessTaskExecutor
+
+_TEST_TABLE = pyarrow.table({"col1": list(range(100))})
+
+
+class _PidTask(Task):
+    def __init__(self, streamed: bool = False) -> None:
+        super().__init__(cmd=b"")
+        self.streamed = streamed
+
+    def run(self) -> Union[TaskResult, TaskError]:
+        table = _TEST_TABLE.append_column("pid", pyarrow.array([os.getpid()] * _TEST_TABLE.num_rows))
+
+        return FlightDataTaskResult.for_data(table.to_reader(max_chunksize=10) if self.streamed else table)
+
+
+class _InProcessTask(_PidTask):
+    run_in_worker = False
+
+
+class _FailingTask(Task):
+    def __init__(self) -> None:
+        super().__init__(cmd=b"")
+
+    def run(self) -> Union[TaskResult, TaskError]:
+        raise ValueError("bad argument")
+
+
+class _CancellableTask(Task):
+    def __init__(self) -> None:
+        super().__init__(cmd=b"")
+
+    def run(self) -> Union[TaskResult, TaskError]:
+        for _ in range(100):
+            self.check_cancelled()
+            time.sleep(0.1)
+
+        return FlightDataTaskResult.for_data(_TEST_TABLE)
+
+
+@pytest.fixture(scope="module")
+def executor(tmp_path_factory):
+    executor = ProcessTaskExecutor(
+        metric_prefix="test_process",
+        task_processes=2,
+        keep_results_for=30,
+        result_dir=str(tmp_path_factory.mktemp("results")),
+    )
+    yield executor
+    executor.stop()
+
+
+@pytest.mark.parametrize("streamed", [False, True])
+def test_task_runs_in_worker(executor, streamed):
+    task = _PidTask(streamed)
+    executor.submit(task)
+    exec_result = executor.wait_for_result(task.task_id, timeout=30)
+
+    assert exec_result.error is None
+    rlock, data = exec_result.result.acquire_data()
+    rlock.release()
+
+    assert data.column("col1").equals(_TEST_TABLE.column("col1"))
+    assert data.column("pid")[0].as_py() != os.getpid()
+    assert os.path.dirname(exec_result.result.path) == executor._result_dir
+
+    assert executor.close_result(task.task_id)
+
+
+def test_task_runs_in_process(executor):
+    task = _InProcessTask()
+    executor.submit(task)
+    exec_result = executor.wait_for_result(task.task_id, timeout=30)
+
+    assert exec_result.error is None
+    rlock, data = exec_result.result.acquire_data()
+    rlock.release()
+
+    assert data.column("pid")[0].as_py() == os.getpid()
+
+
+def test_task_error(executor):
+    task = _FailingTask()
+    executor.submit(task)
+    exec_result = executor.wait_for_result(task.task_id, timeout=30)
+
+    assert exec_result.error.error_info.code == ErrorCode.BAD_ARGUMENT
+    assert exec_result.error.error_info.msg == "bad argument"
+
+
+def test_cancel_running_task(executor):
+    task = _CancellableTask()
+    executor.submit(task)
+    time.sleep(0.5)
+
+    assert executor.cancel(task.task_id)
+    exec_result = executor.wait_for_result(task.task_id, timeout=5)
+
+    assert exec_result.cancelled
@@ -4,7 +4,15 @@ from typing import Union
 
 import pyarrow.flight
 import pytest
-from gooddata_flight_server import ErrorCode, ErrorInfo, FlightDataTaskResult, Task, TaskError, TaskResult
+from gooddata_flight_server import (
+    ErrorCode,
+    ErrorInfo,
+    FlightDataTaskResult,
+    Task,
+    TaskError,
+    TaskExecutionResult,
+    TaskResult,
+)
 from gooddata_flight_server.tasks.base import TaskWaitTimeoutError
 from gooddata_flight_server.tasks.thread_task_executor import ThreadTaskExecutor
 
@@ -229,3 +237,180 @@ def test_task_error_handling4(te_error_fixture):
 
     assert exec_result.error is not None
     assert exec_result.error.error_info.code == ErrorCode.COMMAND_FAILED
+
+
+class _TableTask(Task):
+    def __init__(self, table: pyarrow.Table = _TEST_TABLE) -> None:
+        super().__init__(cmd=b"", cancellable=True, task_id=None)
+        self.table = table
+
+    def run(self) -> Union[TaskResult, TaskError]:
+        return FlightDataTaskResult.for_data(self.table)
+
+
+def _run_task(executor: ThreadTaskExecutor, task: Task) -> TaskExecutionResult:
+    executor.submit(task)
+
+    return executor.wait_for_result(task.task_id)
+
+
+def test_results_over_memory_budget_evicted():
+    executor = ThreadTaskExecutor(
+        task_threads=1,
+        metric_prefix="test",
+        keep_results_for=30,
+        result_memory_budget=2 * _TEST_TABLE.nbytes,
+    )
+    tasks = [_TableTask() for _ in range(3)]
+
+    _run_task(executor, tasks[0])
+    _run_task(executor, tasks[1])
+    # the first result is used again, the second one is the least recently used
+    executor.wait_for_result(tasks[0].task_id)
+    _run_task(executor, tasks[2])
+
+    assert executor.wait_for_result(tasks[0].task_id) is not None
+    assert executor.wait_for_result(tasks[1].task_id) is None
+    assert executor.wait_for_result(tasks[2].task_id) is not None
+
+    # results of any size are retained, at least until next result comes
+    large_task = _TableTask(pyarrow.table({"col1": list(range(1000))}))
+    assert _run_task(executor, large_task).result is not None
+    assert executor.wait_for_result(tasks[0].task_id) is None
+    assert executor.wait_for_result(tasks[2].task_id) is None
+
+    executor.stop()
+
+
+def test_large_results_spilled(tmp_path):
+    executor = ThreadTaskExecutor(
+        task_threads=1,
+        metric_prefix="test",
+        keep_results_for=30,
+        result_memory_budget=_TEST_TABLE.nbytes,
+        result_spill_threshold=_TEST_TABLE.nbytes + 1,
+        result_spill_dir=str(tmp_path),
+    )
+    large_table = pyarrow.table({"col1": list(range(1000))})
+    small_task, large_task = _TableTask(), _TableTask(large_table)
+
+    _run_task(executor, small_task)
+    exec_result = _run_task(executor, large_task)
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # spilled results do not count towards the memory budget
+    assert executor.wait_for_result(small_task.task_id) is not None
+    assert exec_result.result.get_resident_bytes() == 0
+    rlock, data = exec_result.result.acquire_data()
+    assert data.equals(large_table)
+    rlock.release()
+
+    assert executor.close_result(large_task.task_id)
+    executor.stop()
+
+    assert not list(tmp_path.iterdir())
+
+
+class _RecordingTask(Task):
+    def __init__(self, started: list, release: threading.Event, **kwargs) -> None:
+        super().__init__(cmd=b"", cancellable=True, task_id=None, **kwargs)
+        self.started = started
+        self.release = release
+
+    def run(self) -> Union[TaskResult, TaskError]:
+        self.started.append(self.task_id)
+        self.release.wait()
+
+        return FlightDataTaskResult.for_data(_TEST_TABLE)
+
+
+def test_full_queue_rejects_tasks():
+    executor = ThreadTaskExecutor(task_threads=1, metric_prefix="test", keep_results_for=30, max_queue_size=1)
+    started: list = []
+    release = threading.Event()
+
+    running, queued = _RecordingTask(started, release), _RecordingTask(started, release)
+    executor.submit(running)
+    executor.submit(queued)
+
+    with pytest.raises(pyarrow.flight.FlightUnavailableError) as e:
+        executor.submit(_RecordingTask(started, release))
+
+    assert ErrorInfo.from_pyarrow_error(e.value).code == ErrorCode.BACKPRESSURE
+
+    release.set()
+    assert executor.wait_for_result(queued.task_id).result is not None
+    executor.stop()
+
+
+def test_concurrent_submits_respect_queue_size():
+    executor = ThreadTaskExecutor(task_threads=1, metric_prefix="test", keep_results_for=30, max_queue_size=2)
+    started: list = []
+    release = threading.Event()
+    executor.submit(_RecordingTask(started, release))
+
+    accepted: list = []
+
+    def _submit() -> None:
+        task = _RecordingTask(started, release)
+        try:
+            executor.submit(task)
+            accepted.append(task)
+        except pyarrow.flight.FlightUnavailableError:
+            pass
+
+    threads = [threading.Thread(target=_submit) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(accepted) == 2
+
+    release.set()
+    for task in accepted:
+        assert executor.wait_for_result(task.task_id).result is not None
+    executor.stop()
+
+
+def test_lanes_and_concurrency_limits():
+    executor = ThreadTaskExecutor(
+        task_threads=1,
+        metric_prefix="test",
+        keep_results_for=30,
+        lane_weights={"interactive": 2},
+    )
+    started: list = []
+    release = threading.Event()
+
+    blocking = _RecordingTask(started, release)
+    executor.submit(blocking)
+
+    default_tasks = [_RecordingTask(started, release) for _ in range(2)]
+    interactive_tasks = [_RecordingTask(started, release, lane="interactive") for _ in range(4)]
+    for task in default_tasks + interactive_tasks:
+        executor.submit(task)
+
+    release.set()
+    for task in default_tasks + interactive_tasks:
+        executor.wait_for_result(task.task_id)
+
+    lanes = ["i" if task_id in {t.task_id for t in interactive_tasks} else "d" for task_id in started[1:]]
+    assert lanes == ["i", "d", "i", "i", "d", "i"]
+
+    # tasks of a group over its limit wait even if there are free threads
+    executor = ThreadTaskExecutor(task_threads=4, metric_prefix="test", keep_results_for=30)
+    started.clear()
+    release.clear()
+    limited = [_RecordingTask(started, release, concurrency_limits={"tenant:a": 2}) for _ in range(3)]
+    other = _RecordingTask(started, release, concurrency_limits={"tenant:b": 2})
+    for task in limited + [other]:
+        executor.submit(task)
+
+    with pytest.raises(TaskWaitTimeoutError):
+        executor.wait_for_result(other.task_id, timeout=0.2)
+    assert sorted(started) == sorted([limited[0].task_id, limited[1].task_id, other.task_id])
+
+    release.set()
+    assert executor.wait_for_result(limited[2].task_id).result is not None
+    executor.stop()
@@ -0,0 +1,71 @@
+#  (C) 2024 GoodData Corporation
+from typing import Optional, Union
+
+import pytest
+from gooddata_flight_server import Task, TaskError, TaskResult
+from gooddata_flight_server.tasks.task_queue import DEFAULT_LANE, TaskQueue
+
+
+class _Task(Task):
+    def __init__(self, lane: Optional[str] = None, concurrency_limits=None) -> None:
+        super().__init__(cmd=b"", lane=lane, concurrency_limits=concurrency_limits)
+
+    def run(self) -> Union[TaskResult, TaskError]:
+        raise NotImplementedError
+
+
+def _take_all(queue: TaskQueue) -> list:
+    taken = []
+    while (entry := queue.take()) is not None:
+        taken.append(entry[1])
+
+    return taken
+
+
+def test_lanes_weighted():
+    queue: TaskQueue[str] = TaskQueue({"high": 3, "low": 1})
+    for i in range(4):
+        queue.put(_Task("high"), f"h{i}")
+        queue.put(_Task("low"), f"l{i}")
+        queue.put(_Task(), f"d{i}")
+
+    assert dict(queue.lane_sizes()) == {DEFAULT_LANE: 4, "high": 4, "low": 4}
+    assert _take_all(queue)[:5] == ["h0", "d0", "h1", "l0", "h2"]
+    assert len(queue) == 0
+
+
+def test_unknown_lane_is_default():
+    queue: TaskQueue[str] = TaskQueue()
+    queue.put(_Task("unknown"), "a")
+
+    assert dict(queue.lane_sizes()) == {DEFAULT_LANE: 1}
+
+
+def test_concurrency_limits():
+    queue: TaskQueue[str] = TaskQueue()
+    first = _Task(concurrency_limits={"tenant:a": 1})
+    queue.put(first, "a1")
+    queue.put(_Task(concurrency_limits={"tenant:a": 1}), "a2")
+    queue.put(_Task(concurrency_limits={"tenant:b": 1}), "b1")
+
+    # the task over the limit does not block other tasks
+    assert _take_all(queue) == ["a1", "b1"]
+    assert len(queue) == 1
+
+    queue.release(first)
+    assert _take_all(queue) == ["a2"]
+
+
+def test_remove():
+    queue: TaskQueue[str] = TaskQueue()
+    task = _Task()
+    queue.put(task, "a")
+
+    assert queue.remove(task)
+    assert not queue.remove(task)
+    assert queue.take() is None
+
+
+def test_invalid_weight():
+    with pytest.raises(ValueError):
+        TaskQueue({"lane": 0})
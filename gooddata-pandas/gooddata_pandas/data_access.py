@@ -16,16 +16,17 @@ from gooddata_sdk import (
     ObjId,
     TableDimension,
 )
-from gooddata_sdk.utils import IdObjType
+from gooddata_sdk.type_converter import Converter
+from gooddata_sdk.utils import IdObjType, id_obj_to_key
 
 from gooddata_pandas.utils import (
     ColumnsDef,
     IndexDef,
     LabelItemDef,
+    _attribute_converter,
     _str_to_obj_id,
     _to_attribute,
     _to_item,
-    _typed_attribute_value,
 )
 
 
@@ -318,29 +319,42 @@ def _extract_for_metrics_only(response: ExecutionResponse, cols: list, col_to_me
     return {col: [result.data[col_to_metric_idx[col]]] for col in cols}
 
 
-def _find_attribute(attributes: list[CatalogAttribute], id_obj: IdObjType) -> Union[CatalogAttribute, None]:
+def _label_attribute_index(attributes: list[CatalogAttribute]) -> dict[str, CatalogAttribute]:
+    """
+    Internal function that indexes attributes of the catalog by keys of their labels.
+
+    Args:
+        attributes (list[CatalogAttribute]): The catalog of attributes.
+
+    Returns:
+        dict[str, CatalogAttribute]: Mapping of label key to the attribute which the label belongs to.
+    """
+    label_idx: dict[str, CatalogAttribute] = {}
     for attribute in attributes:
-        if attribute.find_label(id_obj) is not None:
-            return attribute
-    return None
+        for label in attribute.labels:
+            label_idx.setdefault(str(label.obj_id), attribute)
+    return label_idx
+
+
+def _find_attribute(label_idx: dict[str, CatalogAttribute], id_obj: IdObjType) -> Union[CatalogAttribute, None]:
+    return label_idx.get(id_obj_to_key(id_obj))
 
 
-def _typed_result(attributes: list[CatalogAttribute], attribute: Attribute, result_values: list[Any]) -> list[Any]:
+def _attribute_converter_for(label_idx: dict[str, CatalogAttribute], attribute: Attribute) -> Converter:
     """
-    Internal function to convert result_values to proper data types.
+    Internal function to find converter of values of the attribute to proper data types.
 
     Args:
-        attributes (list[CatalogAttribute]): The catalog of attributes.
-        attribute (Attribute): The attribute for which the typed result will be computed.
-        result_values (list[Any]): A list of raw values.
+        label_idx (dict[str, CatalogAttribute]): The catalog of attributes indexed by label keys.
+        attribute (Attribute): The attribute whose values will be converted.
 
     Returns:
-        list[Any]: A list of converted values with proper data types.
+        Converter: Converter for values of the attribute.
     """
-    catalog_attribute = _find_attribute(attributes, attribute.label)
+    catalog_attribute = _find_attribute(label_idx, attribute.label)
     if catalog_attribute is None:
         raise ValueError(f"Unable to find attribute {attribute.label} in catalog")
-    return [_typed_attribute_value(catalog_attribute, value) for value in result_values]
+    return _attribute_converter(catalog_attribute)
 
 
 def _extract_from_attributes_and_maybe_metrics(
@@ -373,34 +387,32 @@ def _extract_from_attributes_and_maybe_metrics(
     offset = [0 for _ in exec_def.dimensions]
     limit = [len(exec_def.metrics), _RESULT_PAGE_LEN] if exec_def.has_metrics() else [_RESULT_PAGE_LEN]
     attribute_dim = 1 if exec_def.has_metrics() else 0
-    result = response.read_result(limit=limit, offset=offset)
     safe_index_to_attr_idx = index_to_attr_idx if index_to_attr_idx is not None else dict()
 
-    # mappings from column name to Attribute
-    index_to_attribute = {index_name: exec_def.attributes[i] for index_name, i in safe_index_to_attr_idx.items()}
-    col_to_attribute = {col: exec_def.attributes[i] for col, i in col_to_attr_idx.items()}
+    # mappings from column name to converter of the Attribute values; looked up just once per column
+    label_idx = _label_attribute_index(attributes)
+    index_to_converter = {
+        index_name: _attribute_converter_for(label_idx, exec_def.attributes[i])
+        for index_name, i in safe_index_to_attr_idx.items()
+    }
+    col_to_converter = {
+        col: _attribute_converter_for(label_idx, exec_def.attributes[i]) for col, i in col_to_attr_idx.items()
+    }
 
     # datastructures to return
     index: dict[str, list[Any]] = {idx_name: [] for idx_name in safe_index_to_attr_idx}
     data: dict[str, list[Any]] = {col: [] for col in cols}
 
-    while True:
+    for result in response.read_result_pages(limit=limit, offset=offset):
         for idx_name in index:
             rs = result.get_all_header_values(attribute_dim, safe_index_to_attr_idx[idx_name])
-            attribute = index_to_attribute[idx_name]
-            index[idx_name] += _typed_result(attributes, attribute, rs)
+            index[idx_name].extend(index_to_converter[idx_name].to_external_type_batch(rs))
         for col in cols:
             if col in col_to_attr_idx:
                 rs = result.get_all_header_values(attribute_dim, col_to_attr_idx[col])
-                attribute = col_to_attribute[col]
-                data[col] += _typed_result(attributes, attribute, rs)
+                data[col].extend(col_to_converter[col].to_external_type_batch(rs))
             elif col_to_metric_idx[col] < len(result.data):
                 data[col] += result.data[col_to_metric_idx[col]]
-        if result.is_complete(attribute_dim):
-            break
-
-        offset[attribute_dim] = result.next_page_start(attribute_dim)
-        result = response.read_result(limit=limit, offset=offset)
 
     return data, index
 
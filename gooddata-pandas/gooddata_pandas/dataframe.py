@@ -1,19 +1,25 @@
 # (C) 2021 GoodData Corporation
 from __future__ import annotations
 
+import copy
+import functools
+from collections.abc import Iterator
 from typing import Optional, Union
 
 import pandas
+from attrs import evolve
 from gooddata_api_client import models
 from gooddata_sdk import (
     Attribute,
     BareExecutionResponse,
+    BatchItem,
     ExecutionDefinition,
     Filter,
     GoodDataSdk,
     ResultCacheMetadata,
     ResultSizeDimensions,
 )
+from gooddata_sdk.compute.batch import DEFAULT_BATCH_CONCURRENCY, run_batch
 
 from gooddata_pandas.data_access import compute_and_extract
 from gooddata_pandas.result_convertor import (
@@ -32,6 +38,19 @@ from gooddata_pandas.utils import (
 )
 
 
+def _copy_data_frame_result(
+    result: tuple[pandas.DataFrame, DataFrameMetadata],
+) -> tuple[pandas.DataFrame, DataFrameMetadata]:
+    # the execution response is shared, it is not modified by the callers
+    df, metadata = result
+    return df.copy(), evolve(
+        metadata,
+        row_totals_indexes=copy.deepcopy(metadata.row_totals_indexes),
+        primary_labels_from_index=copy.deepcopy(metadata.primary_labels_from_index),
+        primary_labels_from_columns=copy.deepcopy(metadata.primary_labels_from_columns),
+    )
+
+
 class DataFrameFactory:
     """
     Factory to create pandas.DataFrame instances.
@@ -49,12 +68,16 @@ class DataFrameFactory:
             -> ResultCacheMetadata:
         - for_exec_def(self, exec_def: ExecutionDefinition, label_overrides: Optional[LabelOverrides] = None,
             result_size_dimensions_limits: ResultSizeDimensions = (), result_size_bytes_limit: Optional[int] = None,
-            page_size: int = _DEFAULT_PAGE_SIZE,) -> Tuple[pandas.DataFrame, DataFrameMetadata]:
+            page_size: int = _DEFAULT_PAGE_SIZE, columnar: bool = False,) -> Tuple[pandas.DataFrame, DataFrameMetadata]:
+        - for_exec_defs(self, exec_defs: list[ExecutionDefinition], label_overrides: Optional[LabelOverrides] = None,
+            result_size_dimensions_limits: ResultSizeDimensions = (), result_size_bytes_limit: Optional[int] = None,
+            page_size: int = _DEFAULT_PAGE_SIZE, columnar: bool = False, max_concurrency: int = 4,
+            ordered: bool = True,) -> Iterator[BatchItem[Tuple[pandas.DataFrame, DataFrameMetadata]]]:
         - for_exec_result_id(self, result_id: str, label_overrides: Optional[LabelOverrides] = None,
             result_cache_metadata: Optional[ResultCacheMetadata] = None,
             result_size_dimensions_limits: ResultSizeDimensions = (),
             result_size_bytes_limit: Optional[int] = None,
-            use_local_ids_in_headers: bool = False, page_size: int = _DEFAULT_PAGE_SIZE,)
+            use_local_ids_in_headers: bool = False, page_size: int = _DEFAULT_PAGE_SIZE, columnar: bool = False,)
             -> Tuple[pandas.DataFrame, DataFrameMetadata]:
     """
 
@@ -202,6 +225,7 @@ class DataFrameFactory:
         result_size_dimensions_limits: ResultSizeDimensions = (),
         result_size_bytes_limit: Optional[int] = None,
         page_size: int = _DEFAULT_PAGE_SIZE,
+        columnar: bool = False,
     ) -> tuple[pandas.DataFrame, DataFrameMetadata]:
         """
         Creates a data frame using an execution definition.
@@ -232,6 +256,8 @@ class DataFrameFactory:
             result_size_dimensions_limits (ResultSizeDimensions): A tuple containing maximum size of result dimensions.
             result_size_bytes_limit (Optional[int]): Maximum size of result in bytes.
             page_size (int): Number of records per page.
+            columnar (bool): Read the result straight into float64 NumPy array instead of Python lists.
+                All data columns will be float64. Recommended for large results.
 
         Returns:
             Tuple[pandas.DataFrame, DataFrameMetadata]: Tuple holding DataFrame and DataFrame metadata.
@@ -249,6 +275,56 @@ class DataFrameFactory:
             result_size_dimensions_limits=result_size_dimensions_limits,
             result_size_bytes_limit=result_size_bytes_limit,
             page_size=page_size,
+            columnar=columnar,
+        )
+
+    def for_exec_defs(
+        self,
+        exec_defs: list[ExecutionDefinition],
+        label_overrides: Optional[LabelOverrides] = None,
+        result_size_dimensions_limits: ResultSizeDimensions = (),
+        result_size_bytes_limit: Optional[int] = None,
+        page_size: int = _DEFAULT_PAGE_SIZE,
+        columnar: bool = False,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        ordered: bool = True,
+    ) -> Iterator[BatchItem[tuple[pandas.DataFrame, DataFrameMetadata]]]:
+        """
+        Creates data frames for multiple execution definitions. The executions are computed and their results
+        are read in parallel, sharing the connection pool of the SDK.
+
+        A failure of one execution does not stop the other ones - the error is reported by the corresponding item.
+        Equal execution definitions are processed just once; each of their items gets its own copy of the data frame.
+
+        Args:
+            exec_defs (list[ExecutionDefinition]): Execution definitions.
+            label_overrides (Optional[LabelOverrides]): Label overrides for metrics and attributes,
+                shared by all the execution definitions.
+            result_size_dimensions_limits (ResultSizeDimensions): A tuple containing maximum size of result dimensions.
+            result_size_bytes_limit (Optional[int]): Maximum size of result in bytes.
+            page_size (int): Number of records per page.
+            columnar (bool): Read the result straight into float64 NumPy array instead of Python lists.
+            max_concurrency (int): Maximum number of execution definitions processed in parallel.
+            ordered (bool): Yield the items in order of the execution definitions; otherwise the items are yielded
+                as soon as their data frames are created.
+
+        Returns:
+            Iterator[BatchItem[tuple[pandas.DataFrame, DataFrameMetadata]]]: Item holding DataFrame and DataFrame
+                metadata or the error for each of the execution definitions.
+        """
+        return run_batch(
+            exec_defs,
+            functools.partial(
+                self.for_exec_def,
+                label_overrides=label_overrides,
+                result_size_dimensions_limits=result_size_dimensions_limits,
+                result_size_bytes_limit=result_size_bytes_limit,
+                page_size=page_size,
+                columnar=columnar,
+            ),
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+            copy_result=_copy_data_frame_result,
         )
 
     def for_exec_result_id(
@@ -261,6 +337,7 @@ class DataFrameFactory:
         use_local_ids_in_headers: bool = False,
         use_primary_labels_in_attributes: bool = False,
         page_size: int = _DEFAULT_PAGE_SIZE,
+        columnar: bool = False,
     ) -> tuple[pandas.DataFrame, DataFrameMetadata]:
         """
             Retrieves a DataFrame and DataFrame metadata for a given execution result identifier.
@@ -291,6 +368,8 @@ class DataFrameFactory:
             use_local_ids_in_headers (bool): Use local identifier in headers.
             use_primary_labels_in_attributes (bool): Use primary labels in attributes.
             page_size (int): Number of records per page.
+            columnar (bool): Read the result straight into float64 NumPy array instead of Python lists.
+                All data columns will be float64. Recommended for large results.
 
         Returns:
             Tuple[pandas.DataFrame, DataFrameMetadata]: Tuple holding DataFrame and DataFrame metadata.
@@ -316,4 +395,5 @@ class DataFrameFactory:
             use_local_ids_in_headers=use_local_ids_in_headers,
             use_primary_labels_in_attributes=use_primary_labels_in_attributes,
             page_size=page_size,
+            columnar=columnar,
         )
@@ -4,7 +4,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional
 
-from gooddata_sdk import GoodDataSdk
+from gooddata_sdk import CatalogCache, ExecutionResultCache, GoodDataSdk, HttpConfig
 from gooddata_sdk.utils import PROFILES_FILE_PATH, good_pandas_profile_content
 
 from gooddata_pandas import __version__
@@ -25,6 +25,9 @@ class GoodPandas:
         host: str,
         token: str,
         headers_host: Optional[str] = None,
+        catalog_cache: Optional[CatalogCache] = None,
+        result_cache: Optional[ExecutionResultCache] = None,
+        http_config: Optional[HttpConfig] = None,
         **custom_headers_: Optional[str],
     ) -> None:
         """
@@ -34,12 +37,25 @@ class GoodPandas:
             host (str): Host for GoodDataSdk.
             token (str): Token for GoodDataSdk.
             headers_host (Optional[str]): Host header, if needed.
+            catalog_cache (Optional[CatalogCache]): Cache of workspace catalogs. When set, repeated Series and
+                DataFrame builds against the same workspace do not reload the catalog from the server.
+            result_cache (Optional[ExecutionResultCache]): Cache of execution results. When set, repeated
+                computations of the same Series and DataFrames reuse the already computed results.
+            http_config (Optional[HttpConfig]): Configuration of HTTP connection pooling, timeouts and retries.
             **custom_headers_ (Optional[str]): Additional headers for GoodDataSdk.
 
         """
         if headers_host is not None:
             custom_headers_["Host"] = headers_host
-        self._sdk = GoodDataSdk.create(host, token, USER_AGENT, **custom_headers_)
+        self._sdk = GoodDataSdk.create(
+            host,
+            token,
+            USER_AGENT,
+            catalog_cache_=catalog_cache,
+            result_cache_=result_cache,
+            http_config_=http_config,
+            **custom_headers_,
+        )
         self._series_per_ws: dict[str, SeriesFactory] = dict()
         self._frames_per_ws: dict[str, DataFrameFactory] = dict()
 
@@ -1,10 +1,15 @@
 # (C) 2022 GoodData Corporation
-from typing import Any, Callable, Optional, Union, cast
+from collections.abc import Hashable
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union, cast
 
+import numpy
 import pandas
 from attrs import define, field, frozen
 from gooddata_sdk import BareExecutionResponse, ExecutionResult, ResultCacheMetadata, ResultSizeDimensions
 
+if TYPE_CHECKING:
+    import pyarrow
+
 _DEFAULT_PAGE_SIZE = 100
 _DataHeaders = list[list[Any]]
 _DataArray = list[Union[int, None]]
@@ -16,8 +21,9 @@ class _DataWithHeaders:
     """Extracted data; either array of values for one-dimensional result or array of arrays of values.
 
     Attributes:
-        data (List[_DataArray]):
-            Extracted data; either array of values for one-dimensional result or array of arrays of values.
+        data (Union[List[_DataArray], numpy.ndarray]):
+            Extracted data; either array of values for one-dimensional result or array of arrays of values. When
+            the result was read in columnar mode, this is a float64 NumPy array of the same dimensionality.
         data_headers (Tuple[_DataHeaders, Optional[_DataHeaders]]):
             Per-dimension headers for the data.
         grand_totals (Tuple[Optional[List[_DataArray]], Optional[List[_DataArray]]]):
@@ -26,7 +32,7 @@ class _DataWithHeaders:
             Per-dimension grand total headers.
     """
 
-    data: list[_DataArray]
+    data: Union[list[_DataArray], numpy.ndarray]
     data_headers: tuple[_DataHeaders, Optional[_DataHeaders]]
     grand_totals: tuple[Optional[list[_DataArray]], Optional[list[_DataArray]]]
     grand_total_headers: tuple[Optional[list[dict[str, _DataHeaders]]], Optional[list[dict[str, _DataHeaders]]]]
@@ -176,6 +182,54 @@ class _AccumulatedData:
         )
 
 
+@define
+class _ColumnarAccumulatedData(_AccumulatedData):
+    """
+    Variant of _AccumulatedData which writes the data of each page straight into a preallocated float64 NumPy array
+    instead of growing nested Python lists. The array is sized from the paging totals of the first page; missing
+    values are represented by NaN.
+
+    Headers and grand totals are accumulated the same way as in _AccumulatedData - their size is proportional to the
+    number of rows and columns, not to the number of cells.
+    """
+
+    data: numpy.ndarray = field(init=False, factory=lambda: numpy.empty(0, dtype=numpy.float64))  # type: ignore[assignment]
+    _allocated: bool = field(init=False, default=False)
+
+    def _write_page(self, from_result: ExecutionResult) -> None:
+        if not self._allocated:
+            self.data = numpy.full(from_result.paging_total, numpy.nan, dtype=numpy.float64)
+            self._allocated = True
+
+        count = from_result.paging_count
+        if not all(count):
+            return
+
+        # None values get converted to NaN
+        page = numpy.asarray(from_result.data, dtype=numpy.float64).reshape(count)
+        window = tuple(slice(offset, offset + cnt) for offset, cnt in zip(from_result.paging_offset, count))
+        self.data[window] = page
+
+    def accumulate_data(self, from_result: ExecutionResult) -> None:
+        """
+        Write data of the ExecutionResult page into the preallocated array.
+
+        Args:
+            from_result (ExecutionResult): The result page whose data will be written into the array.
+        """
+        self._write_page(from_result)
+
+    def extend_existing_row_data(self, from_result: ExecutionResult) -> None:
+        """
+        Write data of the ExecutionResult page into the preallocated array. Position of the page in the array is
+        given by the page offset, so there is no difference from accumulate_data.
+
+        Args:
+            from_result (ExecutionResult): The result page whose data will be written into the array.
+        """
+        self._write_page(from_result)
+
+
 @define
 class DataFrameMetadata:
     """
@@ -234,6 +288,7 @@ def _read_complete_execution_result(
     result_size_dimensions_limits: ResultSizeDimensions,
     result_size_bytes_limit: Optional[int] = None,
     page_size: int = _DEFAULT_PAGE_SIZE,
+    columnar: bool = False,
 ) -> _DataWithHeaders:
     """
     Extracts all data and headers for an execution result. This does page around the execution result to extract
@@ -245,6 +300,8 @@ def _read_complete_execution_result(
         result_size_dimensions_limits (ResultSizeDimensions): Limits for result size dimensions.
         result_size_bytes_limit (Optional[int], optional): Limit for result size in bytes. Defaults to None.
         page_size (int, optional): Page size to use when reading data. Defaults to _DEFAULT_PAGE_SIZE.
+        columnar (bool, optional): Accumulate data into preallocated float64 NumPy array instead of Python lists.
+            Defaults to False.
 
     Returns:
         _DataWithHeaders: All the data and headers from the execution result.
@@ -252,57 +309,40 @@ def _read_complete_execution_result(
     num_dims = len(execution_response.dimensions)
     offset = [0] * num_dims
     limit = [page_size] * num_dims
-    acc = _AccumulatedData()
+    acc = _ColumnarAccumulatedData() if columnar else _AccumulatedData()
 
     result_size_limits_checked = False
-
-    while True:
-        # top-level loop pages through the first dimension;
-        #
-        # if one-dimensional result, it pages over an array of data
-        # if two-dimensional result, it pages over table rows
-        result = execution_response.read_result(offset=offset, limit=limit)
-
+    load_headers_and_totals = False
+
+    # pages come in order: the top-level iteration pages through the first dimension;
+    #
+    # if one-dimensional result, it pages over an array of data
+    # if two-dimensional result, it pages over table rows and for each of them it pages 'to the right' to get
+    # data from all the columns
+    for result in execution_response.read_result_pages(offset=offset, limit=limit):
         if not result_size_limits_checked:
             result.check_dimensions_size_limits(result_size_dimensions_limits)
             result_cache_metadata.check_bytes_size_limit(result_size_bytes_limit)
             result_size_limits_checked = True
 
-        acc.accumulate_data(from_result=result)
-        acc.accumulate_headers(from_result=result, from_dim=0)
-        acc.accumulate_grand_totals(from_result=result, paging_dim=0, response=execution_response)
+        if num_dims == 1 or result.paging_offset[1] == 0:
+            acc.accumulate_data(from_result=result)
+            acc.accumulate_headers(from_result=result, from_dim=0)
+            acc.accumulate_grand_totals(from_result=result, paging_dim=0, response=execution_response)
 
-        if num_dims > 1:
             # when result is two-dimensional make sure to read the column headers and column totals
             # just once - when scrolling 'to the right' for the first time;
-            load_headers_and_totals = False
-            if acc.data_headers[1] is None:
+            load_headers_and_totals = num_dims > 1 and acc.data_headers[1] is None
+            if load_headers_and_totals:
                 acc.accumulate_headers(from_result=result, from_dim=1)
-                load_headers_and_totals = True
-
-            if not result.is_complete(dim=1):
-                # have two-dimensional result (typical table) and the page does not contain
-                # all the columns.
-                #
-                # page 'to the right' to get data from all columns, extend existing rows with that data
-                offset = [offset[0], result.next_page_start(dim=1)]
-                while True:
-                    result = execution_response.read_result(offset=offset, limit=limit)
-                    acc.extend_existing_row_data(from_result=result)
-
-                    if load_headers_and_totals:
-                        acc.accumulate_headers(from_result=result, from_dim=1)
-                        acc.accumulate_grand_totals(from_result=result, paging_dim=1, response=execution_response)
-
-                    if result.is_complete(dim=1):
-                        break
-
-                    offset = [offset[0], result.next_page_start(dim=1)]
-
-        if result.is_complete(dim=0):
-            break
+        else:
+            # have two-dimensional result (typical table) and the page contains next columns of the rows
+            # that were already accumulated; extend existing rows with that data
+            acc.extend_existing_row_data(from_result=result)
 
-        offset = [result.next_page_start(dim=0), 0] if num_dims > 1 else [result.next_page_start(dim=0)]
+            if load_headers_and_totals:
+                acc.accumulate_headers(from_result=result, from_dim=1)
+                acc.accumulate_grand_totals(from_result=result, paging_dim=1, response=execution_response)
 
     return acc.result()
 
@@ -388,6 +428,110 @@ def _create_header_mapper(
     return _mapper
 
 
+def _header_key(header: Any) -> Hashable:
+    """
+    Creates hashable key for a header. Headers with the same key are always mapped to the same label by the
+    header mapper.
+    """
+    if header is None:
+        return None
+    if "attributeHeader" in header:
+        attribute_header = header["attributeHeader"]
+        return "a", attribute_header.get("labelValue"), attribute_header.get("primaryLabelValue")
+    if "measureHeader" in header:
+        return "m", header["measureHeader"]["measureIndex"]
+    if "totalHeader" in header:
+        return "t", header["totalHeader"]["function"]
+    return "?", str(header)
+
+
+def _encode_header_group(
+    mapper: Callable[[Any, Optional[int]], Optional[str]], header_group: list[Any], header_idx: int
+) -> tuple[numpy.ndarray, list[str]]:
+    """
+    Dictionary-encodes single level of headers. The mapper is called just once for each distinct header.
+
+    Args:
+        mapper (Callable[[Any, Optional[int]], Optional[str]]): Header mapper created by _create_header_mapper.
+        header_group (List[Any]): Headers of one level.
+        header_idx (int): Index of the level.
+
+    Returns:
+        Tuple[numpy.ndarray, List[str]]: Codes pointing to the list of unique labels; code -1 is used for
+        headers without label.
+    """
+    codes = numpy.empty(len(header_group), dtype=numpy.int32)
+    key_to_code: dict[Hashable, int] = {}
+    label_to_code: dict[str, int] = {}
+    labels: list[str] = []
+
+    for pos, header in enumerate(header_group):
+        key = _header_key(header)
+        code = key_to_code.get(key)
+        if code is None:
+            label = mapper(header, header_idx)
+            if label is None:
+                code = -1
+            else:
+                code = label_to_code.get(label, len(labels))
+                if code == len(labels):
+                    label_to_code[label] = code
+                    labels.append(label)
+            key_to_code[key] = code
+        codes[pos] = code
+
+    return codes, labels
+
+
+def _encode_headers(
+    dim_idx: int,
+    headers: tuple[_DataHeaders, Optional[_DataHeaders]],
+    response: BareExecutionResponse,
+    label_overrides: LabelOverrides,
+    use_local_ids_in_headers: bool = False,
+    use_primary_labels_in_attributes: bool = False,
+) -> tuple[list[tuple[numpy.ndarray, list[str]]], list[Optional[str]], dict[int, dict[str, str]]]:
+    """
+    Dictionary-encodes headers of a dimension.
+
+    Args:
+        dim_idx (int): Index of the current dimension.
+        headers (Tuple[_DataHeaders, Optional[_DataHeaders]]):
+            Tuple of data headers and optional secondary data headers.
+        response (BareExecutionResponse): The execution response object with all data.
+        label_overrides (LabelOverrides): A dictionary containing label overrides for the headers.
+        use_local_ids_in_headers (bool, optional): If True, uses local Ids in headers, otherwise not. Defaults to False.
+        use_primary_labels_in_attributes (bool, optional): If True, uses primary labels in attributes, otherwise not.
+            Defaults to False.
+
+    Returns:
+        Tuple[List[Tuple[numpy.ndarray, List[str]]], List[Optional[str]], Dict[int, Dict[str, str]]]: Codes and unique
+        labels for each header level, names of the levels and primary attribute labels mapping. Lists are empty if
+        the dimension has no headers.
+    """
+    primary_attribute_labels_mapping: dict[int, dict[str, str]] = {}
+
+    if len(response.dimensions) <= dim_idx or not len(response.dimensions[dim_idx]["headers"]):
+        return [], [], primary_attribute_labels_mapping
+
+    mapper = _create_header_mapper(
+        response=response,
+        dim=dim_idx,
+        label_overrides=label_overrides,
+        use_local_ids_in_headers=use_local_ids_in_headers,
+        use_primary_labels_in_attributes=use_primary_labels_in_attributes,
+        primary_attribute_labels_mapping=primary_attribute_labels_mapping,
+    )
+
+    encoded = [
+        _encode_header_group(mapper, header_group, header_idx)
+        for header_idx, header_group in enumerate(cast(_DataHeaders, headers[dim_idx]))
+    ]
+    names = [mapper(dim_header, None) for dim_header in (response.dimensions[dim_idx]["headers"])]
+
+    return encoded, names, primary_attribute_labels_mapping
+
+
 def _headers_to_index(
     dim_idx: int,
     headers: tuple[_DataHeaders, Optional[_DataHeaders]],
@@ -395,6 +539,7 @@ def _headers_to_index(
     label_overrides: LabelOverrides,
     use_local_ids_in_headers: bool = False,
     use_primary_labels_in_attributes: bool = False,
+    encode_headers: bool = False,
 ) -> tuple[Optional[pandas.Index], dict[int, dict[str, str]]]:
     """Converts headers to a pandas MultiIndex.
 
@@ -409,13 +554,34 @@ def _headers_to_index(
         use_local_ids_in_headers (bool, optional): If True, uses local Ids in headers, otherwise not. Defaults to False.
         use_primary_labels_in_attributes (bool, optional): If True, uses primary labels in attributes, otherwise not.
             Defaults to False.
+        encode_headers (bool, optional): If True, headers are dictionary-encoded first and the MultiIndex is created
+            directly from levels and codes. Defaults to False.
 
     Returns:
         Tuple[Optional[pandas.Index], Dict[int, Dict[str, str]]: A pandas MultiIndex object created from the headers
         with primary attribute labels mapping as Dict, or None with empty Dict if the headers are empty.
     """
+    if encode_headers:
+        encoded, names, primary_attribute_labels_mapping = _encode_headers(
+            dim_idx=dim_idx,
+            headers=headers,
+            response=response,
+            label_overrides=label_overrides,
+            use_local_ids_in_headers=use_local_ids_in_headers,
+            use_primary_labels_in_attributes=use_primary_labels_in_attributes,
+        )
+        if not encoded:
+            return None, primary_attribute_labels_mapping
+
+        return pandas.MultiIndex(
+            levels=[labels for _, labels in encoded],
+            codes=[codes for codes, _ in encoded],
+            names=names,
+            verify_integrity=False,
+        ), primary_attribute_labels_mapping
+
     # dict of primary labels and it's custom labels for attributes per level as key
-    primary_attribute_labels_mapping: dict[int, dict[str, str]] = {}
+    primary_attribute_labels_mapping = {}
 
     if len(response.dimensions) <= dim_idx or not len(response.dimensions[dim_idx]["headers"]):
         return None, primary_attribute_labels_mapping
@@ -449,7 +615,7 @@ def _merge_grand_totals_into_data(extract: _DataWithHeaders) -> Union[_DataArray
     Returns:
         Union[_DataArray, List[_DataArray]]: Mutated data with rows and columns extended with grand totals.
     """
-    data: list[_DataArray] = extract.data
+    data = cast(list[_DataArray], extract.data)
 
     if extract.grand_totals[0] is not None:
         # column totals are computed into extra rows, one row per column total
@@ -465,6 +631,40 @@ def _merge_grand_totals_into_data(extract: _DataWithHeaders) -> Union[_DataArray
     return data
 
 
+def _merge_grand_totals_into_array(extract: _DataWithHeaders) -> numpy.ndarray:
+    """
+    Merges grand totals into the data extracted in columnar mode. Column totals become extra rows at the bottom,
+    row totals become extra columns on the right; cells not covered by data or totals are NaN.
+
+    Args:
+        extract (_DataWithHeaders): Extracted data with headers and grand totals; data is a NumPy array.
+
+    Returns:
+        numpy.ndarray: New array with rows and columns extended with grand totals, or the original array if there
+        are no grand totals.
+    """
+    data = cast(numpy.ndarray, extract.data)
+    column_totals, row_totals = extract.grand_totals
+
+    if column_totals is None and row_totals is None:
+        return data
+
+    assert data.ndim == 2, "Grand totals are supported only for 2-dimensional results"
+    rows, cols = data.shape
+    extra_cols = max((len(totals) for totals in row_totals), default=0) if row_totals is not None else 0
+    width = max([cols + extra_cols] + [len(totals) for totals in column_totals or []])
+    merged = numpy.full((rows + len(column_totals or []), width), numpy.nan, dtype=numpy.float64)
+    merged[:rows, :cols] = data
+
+    for total_idx, totals in enumerate(column_totals or []):
+        merged[rows + total_idx, : len(totals)] = numpy.asarray(totals, dtype=numpy.float64)
+
+    for row_idx, totals in enumerate(row_totals or []):
+        merged[row_idx, cols : cols + len(totals)] = numpy.asarray(totals, dtype=numpy.float64)
+
+    return merged
+
+
 def _merge_grand_total_headers_into_headers(extract: _DataWithHeaders) -> tuple[_DataHeaders, Optional[_DataHeaders]]:
     """Merges grand total headers into data headers. This function will mutate the extracted data.
 
@@ -496,6 +696,7 @@ def convert_execution_response_to_dataframe(
     use_local_ids_in_headers: bool = False,
     use_primary_labels_in_attributes: bool = False,
     page_size: int = _DEFAULT_PAGE_SIZE,
+    columnar: bool = False,
 ) -> tuple[pandas.DataFrame, DataFrameMetadata]:
     """
     Converts execution result to a pandas dataframe, maintaining the dimensionality of the result.
@@ -511,6 +712,9 @@ def convert_execution_response_to_dataframe(
         use_primary_labels_in_attributes (bool, default=False): Use primary labels in attributes if True, else use
             default settings.
         page_size (int, default=_DEFAULT_PAGE_SIZE): Size of the page.
+        columnar (bool, default=False): Read the result pages straight into preallocated float64 NumPy array and
+            dictionary-encode the headers. All data columns of the dataframe are float64 with NaN for missing values.
+            This avoids creating Python objects for every cell and is recommended for large results.
 
     Returns:
         Tuple[pandas.DataFrame, DataFrameMetadata]: A tuple containing the created dataframe and its metadata.
@@ -521,8 +725,9 @@ def convert_execution_response_to_dataframe(
         result_size_dimensions_limits=result_size_dimensions_limits,
         result_size_bytes_limit=result_size_bytes_limit,
         page_size=page_size,
+        columnar=columnar,
     )
-    full_data = _merge_grand_totals_into_data(extract)
+    full_data = _merge_grand_totals_into_array(extract) if columnar else _merge_grand_totals_into_data(extract)
     full_headers = _merge_grand_total_headers_into_headers(extract)
 
     index, primary_labels_from_index = _headers_to_index(
@@ -532,6 +737,7 @@ def convert_execution_response_to_dataframe(
         label_overrides=label_overrides,
         use_local_ids_in_headers=use_local_ids_in_headers,
         use_primary_labels_in_attributes=use_primary_labels_in_attributes,
+        encode_headers=columnar,
     )
 
     columns, primary_labels_from_columns = _headers_to_index(
@@ -541,6 +747,7 @@ def convert_execution_response_to_dataframe(
         label_overrides=label_overrides,
         use_local_ids_in_headers=use_local_ids_in_headers,
         use_primary_labels_in_attributes=use_primary_labels_in_attributes,
+        encode_headers=columnar,
     )
 
     df = pandas.DataFrame(
@@ -555,3 +762,104 @@ def convert_execution_response_to_dataframe(
         primary_labels_from_index=primary_labels_from_index,
         primary_labels_from_columns=primary_labels_from_columns,
     )
+
+
+def convert_execution_response_to_arrow(
+    execution_response: BareExecutionResponse,
+    result_cache_metadata: ResultCacheMetadata,
+    label_overrides: LabelOverrides,
+    result_size_dimensions_limits: ResultSizeDimensions,
+    result_size_bytes_limit: Optional[int] = None,
+    use_local_ids_in_headers: bool = False,
+    use_primary_labels_in_attributes: bool = False,
+    page_size: int = _DEFAULT_PAGE_SIZE,
+    column_name_separator: str = "|",
+) -> "pyarrow.Table":
+    """
+    Converts execution result to a pyarrow Table. The result is read in columnar mode, no dataframe is created.
+
+    Headers of the first dimension become leading dictionary-encoded string columns. Each column of data becomes
+    float64 column; missing values are nulls. Names of the data columns are created by joining labels of all
+    header levels of the second dimension using `column_name_separator`.
+
+    Requires pyarrow to be installed.
+
+    Args:
+        execution_response (BareExecutionResponse): Execution response through which the result can be read
+            and converted to a table.
+        result_cache_metadata (ResultCacheMetadata): Metadata about the result cache.
+        label_overrides (LabelOverrides): Label overrides for the table.
+        result_size_dimensions_limits (ResultSizeDimensions): Dimension limits for the table.
+        result_size_bytes_limit (Optional[int], default=None): Size limit in bytes for the table.
+        use_local_ids_in_headers (bool, default=False): Use local ids in headers if True, else use default settings.
+        use_primary_labels_in_attributes (bool, default=False): Use primary labels in attributes if True, else use
+            default settings.
+        page_size (int, default=_DEFAULT_PAGE_SIZE): Size of the page.
+        column_name_separator (str, default="|"): Separator used to join labels of the column header levels.
+
+    Returns:
+        pyarrow.Table: Table with the complete execution result.
+    """
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required to convert execution result to Arrow. Install it using 'gooddata-pandas[arrow]'."
+        ) from e
+
+    extract = _read_complete_execution_result(
+        execution_response=execution_response,
+        result_cache_metadata=result_cache_metadata,
+        result_size_dimensions_limits=result_size_dimensions_limits,
+        result_size_bytes_limit=result_size_bytes_limit,
+        page_size=page_size,
+        columnar=True,
+    )
+    full_data = _merge_grand_totals_into_array(extract)
+    full_headers = _merge_grand_total_headers_into_headers(extract)
+
+    if full_data.ndim == 1:
+        full_data = full_data.reshape(-1, 1)
+    # make the columns contiguous in memory
+    full_data = numpy.asfortranarray(full_data)
+
+    row_levels, row_names, _ = _encode_headers(
+        dim_idx=0,
+        headers=full_headers,
+        response=execution_response,
+        label_overrides=label_overrides,
+        use_local_ids_in_headers=use_local_ids_in_headers,
+        use_primary_labels_in_attributes=use_primary_labels_in_attributes,
+    )
+    column_levels, _, _ = _encode_headers(
+        dim_idx=1,
+        headers=full_headers,
+        response=execution_response,
+        label_overrides=label_overrides,
+        use_local_ids_in_headers=use_local_ids_in_headers,
+        use_primary_labels_in_attributes=use_primary_labels_in_attributes,
+    )
+
+    arrays: list[pyarrow.Array] = []
+    names: list[str] = []
+
+    for level_idx, ((codes, labels), name) in enumerate(zip(row_levels, row_names)):
+        arrays.append(
+            pyarrow.DictionaryArray.from_arrays(
+                pyarrow.array(codes, mask=codes < 0), pyarrow.array(labels, type=pyarrow.string())
+            )
+        )
+        names.append(name if name is not None else f"__index_level_{level_idx}__")
+
+    for col_idx in range(full_data.shape[1]):
+        arrays.append(pyarrow.array(full_data[:, col_idx], type=pyarrow.float64(), from_pandas=True))
+        if column_levels:
+            names.append(
+                column_name_separator.join(
+                    labels[codes[col_idx]] for codes, labels in column_levels if codes[col_idx] >= 0
+                )
+            )
+        else:
+            names.append(str(col_idx))
+
+    return pyarrow.Table.from_arrays(arrays, names=names)
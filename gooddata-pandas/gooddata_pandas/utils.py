@@ -15,7 +15,13 @@ from gooddata_sdk import (
     VisualizationAttribute,
     VisualizationMetric,
 )
-from gooddata_sdk.type_converter import AttributeConverterStore, DateConverter, DatetimeConverter, IntegerConverter
+from gooddata_sdk.type_converter import (
+    AttributeConverterStore,
+    Converter,
+    DateConverter,
+    DatetimeConverter,
+    IntegerConverter,
+)
 from pandas import Index, MultiIndex
 
 LabelItemDef = Union[Attribute, ObjId, str]
@@ -23,10 +29,13 @@ DataItemDef = Union[Attribute, Metric, ObjId, str]
 IndexDef = Union[LabelItemDef, dict[str, LabelItemDef]]
 ColumnsDef = dict[str, DataItemDef]
 
-# register external pandas types to converters
+# register external pandas types to converters; batch functions convert whole columns at once
 IntegerConverter.set_external_fnc(lambda self, value: pandas.to_numeric(value))
+IntegerConverter.set_external_batch_fnc(lambda self, values: pandas.to_numeric(values))
 DateConverter.set_external_fnc(lambda self, value: pandas.to_datetime(value))
+DateConverter.set_external_batch_fnc(lambda self, values: pandas.to_datetime(values))
 DatetimeConverter.set_external_fnc(lambda self, value: pandas.to_datetime(value))
+DatetimeConverter.set_external_batch_fnc(lambda self, values: pandas.to_datetime(values))
 
 
 def _unique_local_id() -> str:
@@ -144,8 +153,20 @@ def _typed_attribute_value(ct_attr: CatalogAttribute, value: Any) -> Any:
     Returns:
         Any: The converted value.
     """
-    converter = AttributeConverterStore.find_converter(ct_attr.dataset.dataset_type, ct_attr.granularity)
-    return converter.to_external_type(value)
+    return _attribute_converter(ct_attr).to_external_type(value)
+
+
+def _attribute_converter(ct_attr: CatalogAttribute) -> Converter:
+    """
+    Find converter of values of the CatalogAttribute.
+
+    Args:
+        ct_attr (CatalogAttribute): The catalog attribute.
+
+    Returns:
+        Converter: Converter for the attribute values.
+    """
+    return AttributeConverterStore.find_converter(ct_attr.dataset.dataset_type, ct_attr.granularity)
 
 
 def make_pandas_index(index: dict) -> Optional[Union[Index, MultiIndex]]:
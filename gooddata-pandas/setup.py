@@ -23,6 +23,7 @@ setup(
     license_file="LICENSE.txt",
     license_files=("LICENSE.txt",),
     install_requires=REQUIRES,
+    extras_require={"arrow": ["pyarrow>=16.1.0"]},
     packages=find_packages(exclude=["tests*"]),
     python_requires=">=3.9.0",
     project_urls={
@@ -1,11 +1,13 @@
 # (C) 2022 GoodData Corporation
 from pathlib import Path
 from typing import Optional
+from unittest import mock
 
-from gooddata_pandas import DataFrameFactory
+from gooddata_pandas import DataFrameFactory, GoodPandas
 from gooddata_sdk import (
     Attribute,
     ExecutionDefinition,
+    ExecutionResultCache,
     ObjId,
     ResultSizeBytesLimitExceeded,
     ResultSizeDimensionsLimitsExceeded,
@@ -83,6 +85,57 @@ def test_dataframe_for_exec_def_two_dim1(test_config, gdf: DataFrameFactory):
     assert result.to_string().find(overrides["metrics"]["price"]["title"]) == 162
 
 
+@gd_vcr.use_cassette(str(_fixtures_dir / "dataframe_for_exec_def_two_dim2.yaml"))
+def test_dataframe_for_exec_def_cached(test_config):
+    gdpd = GoodPandas(
+        host=test_config["host"], token=test_config["token"], result_cache=ExecutionResultCache(cache_pages=True)
+    )
+    gdf = gdpd.data_frames(test_config["workspace"])
+    exec_def = ExecutionDefinition(
+        attributes=[
+            Attribute(local_id="region", label="region"),
+            Attribute(local_id="state", label="state"),
+            Attribute(local_id="product_category", label="products.category"),
+        ],
+        metrics=[
+            SimpleMetric(local_id="price", item=ObjId(id="price", type="fact")),
+            SimpleMetric(local_id="order_amount", item=ObjId(id="order_amount", type="metric")),
+        ],
+        filters=[],
+        dimensions=[
+            TableDimension(item_ids=["region", "state", "product_category"]),
+            TableDimension(item_ids=["measureGroup"]),
+        ],
+    )
+    result, _ = gdf.for_exec_def(exec_def=exec_def)
+
+    # the second call is served from the cache - neither computation nor paging goes to the backend
+    actions_api = gdpd.sdk.compute._actions_api
+    with mock.patch.multiple(
+        actions_api,
+        compute_report=mock.Mock(side_effect=AssertionError),
+        retrieve_execution_metadata=mock.Mock(side_effect=AssertionError),
+        retrieve_result=mock.Mock(side_effect=AssertionError),
+    ):
+        cached_result, _ = gdf.for_exec_def(exec_def=exec_def)
+    assert cached_result.to_string() == result.to_string()
+
+    # batch with a cached execution definition and the other one failing to compute
+    other_exec_def = ExecutionDefinition(
+        attributes=[Attribute(local_id="region", label="region")],
+        metrics=[SimpleMetric(local_id="price", item=ObjId(id="price", type="fact"))],
+        filters=[],
+        dimensions=[TableDimension(item_ids=["region"]), TableDimension(item_ids=["measureGroup"])],
+    )
+    with mock.patch.multiple(actions_api, compute_report=mock.Mock(side_effect=ValueError("failed"))):
+        items = list(gdf.for_exec_defs([other_exec_def, exec_def, exec_def], max_concurrency=2))
+    assert [item.index for item in items] == [0, 1, 2]
+    assert isinstance(items[0].error, ValueError)
+    assert items[1].unwrap()[0].to_string() == items[2].unwrap()[0].to_string() == result.to_string()
+    # equal execution definitions get their own data frames
+    assert items[1].unwrap()[0] is not items[2].unwrap()[0]
+
+
 @gd_vcr.use_cassette(str(_fixtures_dir / "dataframe_for_exec_def_dimensions_limits_failure.yaml"))
 def test_dataframe_for_exec_def_dimensions_limits_failure(test_config, gdf: DataFrameFactory):
     exec_def = ExecutionDefinition(
@@ -0,0 +1,148 @@
+# (C) 2024 GoodData Corporation
+from typing import Any, Optional
+
+import numpy
+import pandas
+import pytest
+from gooddata_pandas.result_convertor import (
+    convert_execution_response_to_arrow,
+    convert_execution_response_to_dataframe,
+)
+from gooddata_sdk import BareExecutionResponse, ExecutionResult
+
+_REGIONS = ["East", "East", "West", "West", "West"]
+_STATES = ["NY", "NJ", "CA", None, "OR"]
+_METRICS = ["price", "amount", "count"]
+_DATA = [
+    [1, 2.5, None],
+    [4, 5, 6],
+    [None, None, None],
+    [10, 11, 12.25],
+    [13, 14, 15],
+]
+_COLUMN_TOTALS = [[28, 32.5, 33.25]]
+
+
+def _attribute_header(value: Optional[str]) -> dict[str, Any]:
+    return {"attributeHeader": {"labelValue": value, "primaryLabelValue": value}}
+
+
+class _FakeResultCacheMetadata:
+    result_size = 1
+
+    def check_bytes_size_limit(self, result_size_bytes_limit: Optional[int] = None) -> None:
+        pass
+
+
+class _FakeExecutionResponse:
+    """
+    Serves pages of a static 2-dimensional result the same way as the backend does.
+    """
+
+    def __init__(self, with_totals: bool) -> None:
+        self._with_totals = with_totals
+        self.dimensions = [
+            {
+                "localIdentifier": "dim_0",
+                "headers": [
+                    {"attributeHeader": {"localIdentifier": "region", "labelName": "Region"}},
+                    {"attributeHeader": {"localIdentifier": "state", "labelName": "State"}},
+                ],
+            },
+            {
+                "localIdentifier": "dim_1",
+                "headers": [{"measureGroupHeaders": [{"localIdentifier": m, "name": m.title()} for m in _METRICS]}],
+            },
+        ]
+
+    read_result_pages = BareExecutionResponse.read_result_pages
+    read_next_result_pages = BareExecutionResponse.read_next_result_pages
+
+    def read_result(self, limit: list[int], offset: list[int]) -> ExecutionResult:
+        rows = slice(offset[0], min(offset[0] + limit[0], len(_DATA)))
+        cols = slice(offset[1], min(offset[1] + limit[1], len(_METRICS)))
+        grand_totals = []
+        if self._with_totals:
+            grand_totals.append(
+                {
+                    "data": [totals[cols] for totals in _COLUMN_TOTALS],
+                    "dimensionHeaders": [
+                        {
+                            "headerGroups": [
+                                {"headers": [{"totalHeader": {"function": "sum"}}]},
+                                {"headers": [{"totalHeader": {"function": "sum"}}]},
+                            ]
+                        }
+                    ],
+                    "totalDimensions": ["dim_1"],
+                }
+            )
+
+        return ExecutionResult(
+            {
+                "data": [row[cols] for row in _DATA[rows]],
+                "dimension_headers": [
+                    {
+                        "headerGroups": [
+                            {"headers": [_attribute_header(v) for v in _REGIONS[rows]]},
+                            {"headers": [_attribute_header(v) for v in _STATES[rows]]},
+                        ]
+                    },
+                    {
+                        "headerGroups": [
+                            {"headers": [{"measureHeader": {"measureIndex": i}} for i in range(len(_METRICS))][cols]}
+                        ]
+                    },
+                ],
+                "grand_totals": grand_totals,
+                "paging": {
+                    "count": [rows.stop - rows.start, cols.stop - cols.start],
+                    "offset": offset,
+                    "total": [len(_DATA), len(_METRICS)],
+                },
+            }
+        )
+
+
+def _convert(with_totals: bool, columnar: bool) -> tuple[pandas.DataFrame, Any]:
+    return convert_execution_response_to_dataframe(
+        execution_response=_FakeExecutionResponse(with_totals),
+        result_cache_metadata=_FakeResultCacheMetadata(),
+        label_overrides={},
+        result_size_dimensions_limits=(),
+        page_size=2,
+        columnar=columnar,
+    )
+
+
+@pytest.mark.parametrize("with_totals", [False, True])
+def test_columnar_dataframe_matches_default(with_totals: bool):
+    expected, expected_metadata = _convert(with_totals, columnar=False)
+    result, result_metadata = _convert(with_totals, columnar=True)
+
+    assert all(dtype == numpy.float64 for dtype in result.dtypes)
+    pandas.testing.assert_frame_equal(result, expected, check_dtype=False, check_index_type=False)
+    assert result.index.to_list() == expected.index.to_list()
+    assert result.columns.to_list() == expected.columns.to_list()
+    assert result_metadata.row_totals_indexes == expected_metadata.row_totals_indexes
+    assert result_metadata.primary_labels_from_index == expected_metadata.primary_labels_from_index
+
+
+def test_arrow_table():
+    pyarrow = pytest.importorskip("pyarrow")
+
+    table = convert_execution_response_to_arrow(
+        execution_response=_FakeExecutionResponse(with_totals=True),
+        result_cache_metadata=_FakeResultCacheMetadata(),
+        label_overrides={},
+        result_size_dimensions_limits=(),
+        page_size=2,
+    )
+
+    assert table.column_names == ["Region", "State", "Price", "Amount", "Count"]
+    assert table.num_rows == len(_DATA) + 1
+    assert pyarrow.types.is_dictionary(table.schema.field("Region").type)
+    assert table.column("Region").to_pylist() == _REGIONS + ["sum"]
+    assert table.column("State").to_pylist() == ["NY", "NJ", "CA", " ", "OR", "sum"]
+    assert table.column("Price").to_pylist() == [1.0, 4.0, None, 10.0, 13.0, 28.0]
+    assert table.column("Count").null_count == 2
@@ -7,6 +7,11 @@ At the moment the SDK provides services to inspect and interact with the Semanti
 import logging
 
 from gooddata_sdk._version import __version__
+from gooddata_sdk.aio.catalog import AsyncCatalogWorkspaceContentService
+from gooddata_sdk.aio.client import AsyncGoodDataApiClient
+from gooddata_sdk.aio.compute import AsyncComputeService, AsyncExecution
+from gooddata_sdk.aio.export import AsyncExportService
+from gooddata_sdk.aio.sdk import AsyncGoodDataSdk
 from gooddata_sdk.catalog.data_source.action_model.requests.ldm_request import (
     CatalogGenerateLdmRequest,
     CatalogPdmLdmRequest,
@@ -139,6 +144,7 @@ from gooddata_sdk.catalog.user.management_model.management import (
     CatalogWorkspacePermissionAssignment,
 )
 from gooddata_sdk.catalog.validate_by_item import CatalogValidateByItem
+from gooddata_sdk.catalog.workspace.catalog_cache import CatalogCache
 from gooddata_sdk.catalog.workspace.content_service import CatalogWorkspaceContent, CatalogWorkspaceContentService
 from gooddata_sdk.catalog.workspace.declarative_model.workspace.analytics_model.analytics_model import (
     CatalogDeclarativeAnalytics,
@@ -208,7 +214,8 @@ from gooddata_sdk.catalog.workspace.entity_model.user_data_filter import (
     CatalogUserDataFilterRelationships,
 )
 from gooddata_sdk.catalog.workspace.entity_model.workspace import CatalogWorkspace
-from gooddata_sdk.client import GoodDataApiClient
+from gooddata_sdk.client import GoodDataApiClient, HttpConfig
+from gooddata_sdk.compute.batch import BatchItem
 from gooddata_sdk.compute.compute_to_sdk_converter import ComputeToSdkConverter
 from gooddata_sdk.compute.model.attribute import Attribute
 from gooddata_sdk.compute.model.base import ExecModelEntity, ObjId
@@ -246,11 +253,13 @@ from gooddata_sdk.compute.model.metric import (
     PopDatesetMetric,
     SimpleMetric,
 )
+from gooddata_sdk.compute.result_cache import ExecutionResultCache
 from gooddata_sdk.compute.service import ComputeService
 from gooddata_sdk.sdk import GoodDataSdk
 from gooddata_sdk.table import ExecutionTable, TableService
 from gooddata_sdk.utils import SideLoads
 from gooddata_sdk.visualization import (
+    SortDirection,
     Visualization,
     VisualizationAttribute,
     VisualizationBucket,
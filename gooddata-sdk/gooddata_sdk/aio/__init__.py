@@ -0,0 +1 @@
+# (C) 2024 GoodData Corporation
@@ -0,0 +1,166 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Optional
+
+from gooddata_api_client.api_client import Endpoint
+
+from gooddata_sdk.aio.client import AsyncGoodDataApiClient
+from gooddata_sdk.catalog.workspace.entity_model.content_objects.dataset import (
+    CatalogAttribute,
+    CatalogFact,
+    CatalogLabel,
+)
+from gooddata_sdk.catalog.workspace.entity_model.content_objects.metric import CatalogMetric
+from gooddata_sdk.catalog.workspace.model_container import CatalogWorkspaceContent
+from gooddata_sdk.utils import AllPagedEntities, _merge_entity_pages, _total_pages
+
+_AVAILABLE_ATTRIBUTE_INCLUDES = {"datasets", "labels", "attributeHierarchies", "dataset", "defaultView", "ALL"}
+
+
+class AsyncCatalogWorkspaceContentService:
+    """
+    Counterpart of CatalogWorkspaceContentService which lists the workspace content without blocking the event loop.
+    """
+
+    def __init__(self, client: AsyncGoodDataApiClient) -> None:
+        self._client = client
+        self._entities_api = client.client.entities_api
+
+    async def _load_all_entities(
+        self, endpoint: Endpoint, max_concurrency: int = 1, page_size: int = 500, **params: Any
+    ) -> AllPagedEntities:
+        """
+        Loads all pages of the paged entities, see `load_all_entities`. When max_concurrency is greater than 1,
+        the first page carries the number of pages and up to max_concurrency of the other pages are requested
+        at the same time.
+        """
+        if max_concurrency > 1:
+            first_page = await self._client.call_json(endpoint, page=0, size=page_size, meta_include=["page"], **params)
+            total_pages = _total_pages(first_page)
+            if total_pages is not None:
+                semaphore = asyncio.Semaphore(max_concurrency)
+
+                async def _load_page(page: int) -> Any:
+                    async with semaphore:
+                        return await self._client.call_json(endpoint, page=page, size=page_size, **params)
+
+                other_pages = await asyncio.gather(*(_load_page(page) for page in range(1, total_pages)))
+                return _merge_entity_pages([first_page, *other_pages])
+            pages = [first_page]
+        else:
+            pages = [await self._client.call_json(endpoint, page=0, size=page_size, **params)]
+
+        while len(pages[-1]["data"]) >= page_size:
+            pages.append(await self._client.call_json(endpoint, page=len(pages), size=page_size, **params))
+        return _merge_entity_pages(pages)
+
+    async def get_full_catalog(self, workspace_id: str, max_concurrency: int = 1) -> CatalogWorkspaceContent:
+        """Retrieves catalog for a workspace. Catalog contains all data sets and metrics defined in that workspace.
+
+        Attributes, datasets and metrics are loaded at the same time. The returned catalog has no valid objects
+        function; use CatalogWorkspaceContentService.compute_valid_objects instead.
+
+        Args:
+            workspace_id (str):
+                Workspace identification string e.g. "demo"
+            max_concurrency (int):
+                When greater than 1, up to max_concurrency pages of each of the collections are requested
+                at the same time. Defaults to 1 - pages are requested one by one.
+
+        Returns:
+            CatalogWorkspaceContent: Object containing all data sets and metrics.
+        """
+        attributes, datasets, metrics = await asyncio.gather(
+            self._load_all_entities(
+                self._entities_api.get_all_entities_attributes_endpoint,
+                max_concurrency,
+                workspace_id=workspace_id,
+                include=["labels", "datasets"],
+            ),
+            self._load_all_entities(
+                self._entities_api.get_all_entities_datasets_endpoint,
+                max_concurrency,
+                workspace_id=workspace_id,
+                include=["attributes", "facts"],
+            ),
+            self._load_all_entities(
+                self._entities_api.get_all_entities_metrics_endpoint, max_concurrency, workspace_id=workspace_id
+            ),
+        )
+        return CatalogWorkspaceContent.create_workspace_content_catalog(None, datasets, attributes, metrics)
+
+    async def get_attributes_catalog(
+        self, workspace_id: str, include: Optional[list[str]] = None
+    ) -> list[CatalogAttribute]:
+        """Retrieve all attributes in a given workspace.
+
+        Args:
+            workspace_id (str):
+                Workspace identification string e.g. "demo"
+            include (list[str]):
+                Entities to include.
+                Available: datasets, labels, attributeHierarchies, dataset, defaultView, ALL
+
+        Returns:
+            list[CatalogAttribute]:
+                List of all attributes in a given workspace.
+        """
+        include = include if include is not None else ["labels"]
+        if not set(include).issubset(_AVAILABLE_ATTRIBUTE_INCLUDES):
+            raise ValueError(
+                f"Invalid include parameter. Available values: {_AVAILABLE_ATTRIBUTE_INCLUDES}, got: {include}"
+            )
+        attributes = await self._load_all_entities(
+            self._entities_api.get_all_entities_attributes_endpoint, workspace_id=workspace_id, include=include
+        )
+        return [CatalogAttribute.from_api(a, side_loads=attributes.included) for a in attributes.data]
+
+    async def get_labels_catalog(self, workspace_id: str) -> list[CatalogLabel]:
+        """Retrieve all labels in a given workspace.
+
+        Args:
+            workspace_id (str):
+                Workspace identification string e.g. "demo"
+
+        Returns:
+            list[CatalogLabel]:
+                List of all labels in a given workspace.
+        """
+        labels = await self._load_all_entities(
+            self._entities_api.get_all_entities_labels_endpoint, workspace_id=workspace_id
+        )
+        return [CatalogLabel.from_api(label) for label in labels.data]
+
+    async def get_metrics_catalog(self, workspace_id: str) -> list[CatalogMetric]:
+        """Retrieve all metrics in a given workspace.
+
+        Args:
+            workspace_id (str):
+                Workspace identification string e.g. "demo"
+
+        Returns:
+            list[CatalogMetric]:
+                List of all metrics in a given workspace.
+        """
+        metrics = await self._load_all_entities(
+            self._entities_api.get_all_entities_metrics_endpoint, workspace_id=workspace_id
+        )
+        return [CatalogMetric.from_api(metric) for metric in metrics.data]
+
+    async def get_facts_catalog(self, workspace_id: str) -> list[CatalogFact]:
+        """Retrieve all facts in a given workspace.
+
+        Args:
+            workspace_id (str):
+                Workspace identification string e.g. "demo"
+
+        Returns:
+            list[CatalogFact]:
+                List of all facts in a given workspace.
+        """
+        facts = await self._load_all_entities(
+            self._entities_api.get_all_entities_facts_endpoint, workspace_id=workspace_id
+        )
+        return [CatalogFact.from_api(fact) for fact in facts.data]
@@ -0,0 +1,272 @@
+# (C) 2024 GoodData Corporation
+"""Module containing a non-blocking counterpart of GoodDataApiClient."""
+
+from __future__ import annotations
+
+import json
+import ssl
+from typing import TYPE_CHECKING, Any, Optional, Union
+from urllib.parse import quote, urlencode
+
+from attrs import frozen
+from gooddata_api_client import exceptions
+from gooddata_api_client.api_client import Endpoint
+from gooddata_api_client.configuration import Configuration
+from gooddata_api_client.rest import should_bypass_proxies
+
+from gooddata_sdk.client import GoodDataApiClient, loads_json
+
+if TYPE_CHECKING:
+    import aiohttp
+
+DEFAULT_MAX_CONNECTIONS = 100
+"""
+Default maximum number of connections the async client keeps open at the same time.
+"""
+
+
+def _import_aiohttp() -> Any:
+    try:
+        import aiohttp
+    except ImportError as e:
+        raise ImportError("aiohttp is required to use AsyncGoodDataSdk. Install it using 'gooddata-sdk[async]'.") from e
+
+    return aiohttp
+
+
+def _ssl_context(configuration: Configuration) -> Union[bool, ssl.SSLContext]:
+    # the same SSL settings as used by the generated client, see gooddata_api_client.rest.RESTClientObject
+    if not configuration.verify_ssl:
+        return False
+    context = ssl.create_default_context(cafile=configuration.ssl_ca_cert)
+    if configuration.assert_hostname is False:
+        context.check_hostname = False
+    if configuration.cert_file:
+        context.load_cert_chain(configuration.cert_file, configuration.key_file)
+    return context
+
+
+@frozen
+class AsyncResponse:
+    """
+    Fully read HTTP response. It mimics the response of the generated client, so that it can be deserialized
+    by the generated client and used to create its exceptions.
+    """
+
+    status: int
+    reason: Optional[str]
+    data: bytes
+    headers: dict[str, str]
+
+    def getheaders(self) -> dict[str, str]:
+        return self.headers
+
+    def getheader(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        return self.headers.get(name, default)
+
+
+def _raise_for_status(response: AsyncResponse) -> None:
+    if 200 <= response.status <= 299:
+        return
+    if response.status == 401:
+        raise exceptions.UnauthorizedException(http_resp=response)
+    if response.status == 403:
+        raise exceptions.ForbiddenException(http_resp=response)
+    if response.status == 404:
+        raise exceptions.NotFoundException(http_resp=response)
+    if 500 <= response.status <= 599:
+        raise exceptions.ServiceException(http_resp=response)
+    raise exceptions.ApiException(http_resp=response)
+
+
+class AsyncGoodDataApiClient:
+    """
+    Calls endpoints of the generated API client without blocking the event loop.
+
+    The requests are described by the endpoints of the generated client - their paths, parameters and response
+    types - and they carry the same headers as the requests of the wrapped GoodDataApiClient. The requests are sent
+    by aiohttp; all of them share a single connection pool, so a single thread can keep many requests in flight.
+
+    The SSL and proxy settings are taken from the configuration of the generated client, the same way as done
+    by the generated client itself. Proxies set by the environment variables are used as well.
+
+    The client must be closed once it is not needed anymore, see `close`.
+    """
+
+    def __init__(
+        self,
+        client: GoodDataApiClient,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Args:
+            client (GoodDataApiClient):
+                Client providing the generated API client, its configuration and headers.
+            max_connections (int):
+                Maximum number of connections open at the same time. Defaults to 100.
+            timeout (Optional[float]):
+                Total timeout of a single request in seconds. Defaults to None - no timeout.
+        """
+        _import_aiohttp()
+        self._client = client
+        self._max_connections = max_connections
+        self._timeout = timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def client(self) -> GoodDataApiClient:
+        return self._client
+
+    @property
+    def custom_headers(self) -> dict[str, str]:
+        return self._client.custom_headers
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # the session binds to the running event loop, it can be created only from a coroutine
+        if self._session is not None and not self._session.closed:
+            return self._session
+        session = self._create_session()
+        self._session = session
+        return session
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        aiohttp = _import_aiohttp()
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self._max_connections, ssl=_ssl_context(self._configuration)),
+            timeout=aiohttp.ClientTimeout(total=self._timeout),
+            trust_env=True,
+        )
+
+    @property
+    def _configuration(self) -> Configuration:
+        return self._client.actions_api.api_client.configuration
+
+    def _proxy(self) -> tuple[Optional[str], Optional[dict[str, str]]]:
+        configuration = self._configuration
+        if not configuration.proxy or should_bypass_proxies(configuration.host, no_proxy=configuration.no_proxy or ""):
+            return None, None
+        return configuration.proxy, configuration.proxy_headers
+
+    async def close(self) -> None:
+        """
+        Closes all the connections of the client.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def call(self, endpoint: Endpoint, **params: Any) -> Any:
+        """
+        Calls the endpoint and deserializes the response the same way as the generated client
+        called with `_check_return_type=False`.
+
+        Args:
+            endpoint: endpoint of the generated API client, e.g. `client.actions_api.compute_report_endpoint`
+            params: parameters of the endpoint, named as in the generated API client
+
+        Returns:
+            Any: deserialized response; None if the endpoint has no response type
+        """
+        response = await self.call_raw(endpoint, **params)
+        response_type = endpoint.settings["response_type"]
+        if response_type is None:
+            return None
+        return endpoint.api_client.deserialize(response, response_type, False)
+
+    async def call_json(self, endpoint: Endpoint, **params: Any) -> Any:
+        """
+        Calls the endpoint and returns its response as a dictionary, see GoodDataApiClient.call_json.
+
+        Args:
+            endpoint: endpoint of the generated API client, e.g. `client.actions_api.retrieve_result_endpoint`
+            params: parameters of the endpoint, named as in the generated API client
+
+        Returns:
+            Any: dictionary of the response body, keys are camelCase as in JSON
+        """
+        if not self._client.raw_responses:
+            return (await self.call(endpoint, **params)).to_dict(camel_case=True)
+        response = await self.call_raw(endpoint, **params)
+        return loads_json(response.data)
+
+    async def call_raw(self, endpoint: Endpoint, **params: Any) -> AsyncResponse:
+        """
+        Calls the endpoint and returns the response as it is. Responses with an error status are raised
+        as exceptions of the generated client.
+
+        Args:
+            endpoint: endpoint of the generated API client, e.g. `client.actions_api.compute_report_endpoint`
+            params: parameters of the endpoint, named as in the generated API client
+
+        Returns:
+            AsyncResponse: read response
+        """
+        import yarl
+
+        method, url, headers, body = self._prepare_request(endpoint, params)
+        # the url is already quoted the same way as by the generated client, it must not be normalized
+        request_url = yarl.URL(url, encoded=True)
+        proxy, proxy_headers = self._proxy()
+        async with self._get_session().request(
+            method, request_url, headers=headers, data=body, proxy=proxy, proxy_headers=proxy_headers
+        ) as response:
+            data = await response.read()
+            result = AsyncResponse(
+                status=response.status,
+                reason=response.reason,
+                data=data,
+                headers=dict(response.headers),
+            )
+        _raise_for_status(result)
+        return result
+
+    @staticmethod
+    def _prepare_request(
+        endpoint: Endpoint, params: dict[str, Any]
+    ) -> tuple[str, str, dict[str, str], Optional[bytes]]:
+        api_client = endpoint.api_client
+        settings = endpoint.settings
+        missing = [name for name in endpoint.params_map["required"] if name not in params]
+        if missing:
+            raise ValueError(f"Missing the required parameters {missing} when calling {settings['operation_id']}.")
+
+        path = settings["endpoint_path"]
+        query: list[tuple[str, Any]] = []
+        headers: dict[str, Any] = dict(api_client.default_headers)
+        body = None
+        collection_formats = {endpoint.attribute_map[n]: f for n, f in endpoint.collection_format_map.items()}
+        for name, value in params.items():
+            location = endpoint.location_map.get(name)
+            if location is None:
+                raise TypeError(f"Got an unexpected parameter '{name}' when calling {settings['operation_id']}.")
+            if location == "body":
+                body = api_client.sanitize_for_serialization(value)
+                continue
+
+            param = {endpoint.attribute_map[name]: api_client.sanitize_for_serialization(value)}
+            if location == "path":
+                for key, path_value in api_client.parameters_to_tuples(param, collection_formats):
+                    safe_chars = api_client.configuration.safe_chars_for_path_param
+                    path = path.replace(f"{{{key}}}", quote(str(path_value), safe=safe_chars))
+            elif location == "query":
+                query.extend(api_client.parameters_to_tuples(param, collection_formats))
+            elif location == "header":
+                headers.update((k, str(v)) for k, v in api_client.parameters_to_tuples(param, collection_formats))
+            else:
+                raise NotImplementedError(f"Parameters in {location} are not supported, got '{name}'.")
+
+        if endpoint.headers_map["accept"]:
+            headers["Accept"] = api_client.select_header_accept(endpoint.headers_map["accept"])
+        data = None
+        if body is not None:
+            headers["Content-Type"] = api_client.select_header_content_type(
+                endpoint.headers_map["content_type"], settings["http_method"], body
+            )
+            # serialized the same way as by the generated client
+            data = json.dumps(body).encode("utf-8")
+
+        url = f"{api_client.configuration.host}{path}"
+        if query:
+            url = f"{url}?{urlencode(query)}"
+        return settings["http_method"], url, headers, data
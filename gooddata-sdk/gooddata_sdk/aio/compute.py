@@ -0,0 +1,161 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncGenerator
+from typing import Any, Union
+
+from gooddata_api_client import models
+
+from gooddata_sdk.aio.client import AsyncGoodDataApiClient
+from gooddata_sdk.compute.model.execution import (
+    DEFAULT_PAGE_READ_CONCURRENCY,
+    ExecutionDefinition,
+    ExecutionResult,
+    ResultCacheMetadata,
+    _next_page_windows,
+)
+
+
+class AsyncExecution:
+    """
+    Execution started by AsyncComputeService. It holds the execution definition and the execution response
+    and allows reading the execution result without blocking the event loop.
+    """
+
+    def __init__(
+        self,
+        client: AsyncGoodDataApiClient,
+        workspace_id: str,
+        exec_def: ExecutionDefinition,
+        response: models.AfmExecutionResponse,
+    ) -> None:
+        self._client = client
+        self._actions_api = client.client.actions_api
+        self._workspace_id = workspace_id
+        self._exec_def = exec_def
+        self._afm_exec_response = response
+        self._exec_response: models.ExecutionResponse = response["execution_response"]
+
+    @property
+    def workspace_id(self) -> str:
+        return self._workspace_id
+
+    @property
+    def exec_def(self) -> ExecutionDefinition:
+        return self._exec_def
+
+    @property
+    def result_id(self) -> str:
+        return self._exec_response["links"]["executionResult"]
+
+    @property
+    def dimensions(self) -> Any:
+        return self._exec_response["dimensions"]
+
+    async def read_result(
+        self, limit: Union[int, list[int]], offset: Union[None, int, list[int]] = None
+    ) -> ExecutionResult:
+        """
+        Reads from the execution result.
+        """
+        _offset = offset if isinstance(offset, list) else [offset] if offset is not None else None
+        _limit = limit if isinstance(limit, list) else [limit]
+        # the server ignores paging when only limit is specified, see BareExecutionResponse.read_result
+        _offset = [0 for _ in _limit] if _offset is None else _offset
+
+        execution_result = await self._client.call_json(
+            self._actions_api.retrieve_result_endpoint,
+            workspace_id=self._workspace_id,
+            result_id=self.result_id,
+            offset=_offset,
+            limit=_limit,
+        )
+        return ExecutionResult.from_json(execution_result)
+
+    async def read_result_pages(
+        self,
+        limit: Union[int, list[int]],
+        offset: Union[None, int, list[int]] = None,
+        max_concurrency: int = DEFAULT_PAGE_READ_CONCURRENCY,
+        first_dim_only: bool = False,
+    ) -> AsyncGenerator[ExecutionResult, None]:
+        """
+        Reads all pages of the execution result starting at the given offset.
+
+        Once the first page is read, windows of all the remaining pages are known. Up to `max_concurrency` pages
+        are requested at the same time, ahead of the consumer. The pages are always yielded in order - row of pages
+        by row of pages and within a row from left to right.
+
+        Args:
+            limit: size of the pages
+            offset: offset of the first page; defaults to the start of the result
+            max_concurrency: maximum number of pages requested at the same time; 1 means the pages are read one by one
+            first_dim_only: page only through the first dimension; other dimensions stay as in the first page
+        """
+        _limit = limit if isinstance(limit, list) else [limit]
+        first_page = await self.read_result(limit=_limit, offset=offset)
+        yield first_page
+
+        pending: deque[asyncio.Task[ExecutionResult]] = deque()
+        try:
+            for window in _next_page_windows(first_page, first_dim_only):
+                pending.append(asyncio.ensure_future(self.read_result(limit=_limit, offset=window)))
+                if len(pending) >= max_concurrency:
+                    yield await pending.popleft()
+
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __repr__(self) -> str:
+        return f"AsyncExecution(workspace_id={self.workspace_id}, result_id={self.result_id})"
+
+
+class AsyncComputeService:
+    """
+    Counterpart of ComputeService which does not block the event loop.
+    """
+
+    def __init__(self, client: AsyncGoodDataApiClient) -> None:
+        self._client = client
+        self._actions_api = client.client.actions_api
+
+    async def for_exec_def(self, workspace_id: str, exec_def: ExecutionDefinition) -> AsyncExecution:
+        """
+        Starts computation in GoodData.CN workspace, using the provided execution definition.
+
+        Args:
+            workspace_id: workspace identifier
+            exec_def: execution definition - this prescribes what to calculate, how to place labels and metric values
+         into dimensions
+        """
+        response = await self._client.call(
+            self._actions_api.compute_report_endpoint,
+            workspace_id=workspace_id,
+            afm_execution=exec_def.as_api_model(),
+        )
+        return AsyncExecution(self._client, workspace_id, exec_def, response)
+
+    async def retrieve_result_cache_metadata(self, workspace_id: str, result_id: str) -> ResultCacheMetadata:
+        """
+        Gets execution result's metadata from GoodData.CN workspace for given execution result ID.
+
+        Args:
+            workspace_id: workspace identifier
+            result_id: execution result ID
+        Returns:
+            ResultCacheMetadata: execution result's metadata
+        """
+        result_cache_metadata = await self._client.call(
+            self._actions_api.retrieve_execution_metadata_endpoint,
+            workspace_id=workspace_id,
+            result_id=result_id,
+        )
+        return ResultCacheMetadata(result_cache_metadata=result_cache_metadata)
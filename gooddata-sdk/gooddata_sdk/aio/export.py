@@ -0,0 +1,169 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from gooddata_api_client.api_client import Endpoint
+from gooddata_api_client.exceptions import NotFoundException
+from gooddata_api_client.model.visual_export_request import VisualExportRequest
+
+from gooddata_sdk.aio.client import AsyncGoodDataApiClient
+from gooddata_sdk.catalog.export.request import ExportRequest
+
+
+class AsyncExportService:
+    """
+    Counterpart of ExportService which waits for the exports without blocking the event loop.
+    """
+
+    def __init__(self, client: AsyncGoodDataApiClient) -> None:
+        self._client = client
+        self._entities_api = client.client.entities_api
+        self._actions_api = client.client.actions_api
+
+    async def _get_exported_content(
+        self,
+        workspace_id: str,
+        export_id: str,
+        get_endpoint: Endpoint,
+        timeout: float = 60.0,
+        retry: float = 0.2,
+        max_retry: float = 5.0,
+    ) -> bytes:
+        """
+        Polls the export until it is finished, see ExportService._get_exported_content.
+        """
+        assert (
+            timeout > 0 and retry > 0 and max_retry > 0
+        ), f"Timeout value '{timeout}' or retry value '{retry}' or max retry value '{max_retry}' is negative."
+        assert timeout > retry, f"Retry value {retry} cannot be higher than timeout value {timeout}"
+        assert retry <= max_retry, f"Retry value {retry} must be smaller or the same as max retry value {max_retry}"
+        response = await self._client.call_raw(get_endpoint, workspace_id=workspace_id, export_id=export_id)
+        counter = 0
+        while response.status == 202 and counter * retry <= timeout:
+            await asyncio.sleep(retry)
+            retry = min(retry * 2, max_retry)
+            counter += 1
+            response = await self._client.call_raw(get_endpoint, workspace_id=workspace_id, export_id=export_id)
+        if response.status != 200:
+            raise ValueError(
+                f"Server was not able to return response. The last response status is '{response.status}'."
+            )
+        return response.data
+
+    async def _store_export(
+        self,
+        workspace_id: str,
+        export_id: str,
+        file_path: Path,
+        get_endpoint: Endpoint,
+        timeout: float = 60.0,
+        retry: float = 0.2,
+        max_retry: float = 5.0,
+    ) -> None:
+        content = await self._get_exported_content(workspace_id, export_id, get_endpoint, timeout, retry, max_retry)
+        with open(file_path, "wb") as f:
+            f.write(content)
+
+    async def export_pdf(
+        self,
+        workspace_id: str,
+        dashboard_id: str,
+        file_name: str,
+        store_path: Union[str, Path] = Path.cwd(),
+        timeout: float = 60.0,
+        retry: float = 0.2,
+        max_retry: float = 5.0,
+        metadata: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """
+        Export a PDF of the specified GoodData Dashboard and save it to the specified file path.
+        Args:
+            workspace_id (str):
+                The ID of the GoodData Workspace.
+            dashboard_id (str):
+                The ID of the GoodData Dashboard.
+            file_name (str):
+                The name of the PDF file (excluding the file extension).
+            store_path (Union[str, Path], optional):
+                The path to save the exported PDF.
+                Defaults to the current directory.
+            timeout (float, optional):
+                The maximum amount of time (in seconds) to wait for the server to process the export.
+                Defaults to 60.0.
+            retry (float, optional):
+                Initial wait time (in seconds) before retrying to get the exported content.
+                Defaults to 0.2.
+            max_retry (float, optional):
+                The maximum retry wait time (in seconds).
+                Defaults to 5.0.
+            metadata (Dict[str, Any]):
+                Specify the metadata for the export.
+                Specific metadata can override filtering.
+        """
+        try:
+            # exporters do not check existence of the dashboard
+            await self._client.call_raw(
+                self._entities_api.get_entity_analytical_dashboards_endpoint,
+                workspace_id=workspace_id,
+                object_id=dashboard_id,
+            )
+        except NotFoundException:
+            raise ValueError(f"Dashboard id '{dashboard_id}' does not exist for workspace '{workspace_id}'.")
+        store_path = store_path if isinstance(store_path, Path) else Path(store_path)
+        request = VisualExportRequest(dashboard_id=dashboard_id, file_name=file_name, metadata=metadata)
+        response = await self._client.call(
+            self._actions_api.create_pdf_export_endpoint, workspace_id=workspace_id, visual_export_request=request
+        )
+        await self._store_export(
+            workspace_id,
+            response["export_result"],
+            store_path / f"{file_name}.pdf",
+            self._actions_api.get_exported_file_endpoint,
+            timeout,
+            retry,
+            max_retry,
+        )
+
+    async def export_tabular(
+        self,
+        workspace_id: str,
+        export_request: ExportRequest,
+        store_path: Union[str, Path] = Path.cwd(),
+        timeout: float = 60.0,
+        retry: float = 0.2,
+        max_retry: float = 5.0,
+    ) -> None:
+        """
+        Export Tabular (CSV, XLSX) data from the specified GoodData Dashboard report, saved to the specified file path.
+        Args:
+            workspace_id (str):
+                The ID of the GoodData Workspace.
+            export_request (ExportRequest):
+                An instance of ExportRequest containing the required information for the tabular export.
+            store_path (Union[str, Path], optional):
+                The path to save the exported tabular data. Defaults to the current directory.
+            timeout (float, optional):
+                The maximum amount of time (in seconds) to wait for the server to process the export. Defaults to 60.0.
+            retry (float, optional):
+                Initial wait time (in seconds) before retrying to get the exported content. Defaults to 0.2.
+            max_retry (float, optional):
+                The maximum retry wait time (in seconds). Defaults to 5.0.
+        """
+        store_path = store_path if isinstance(store_path, Path) else Path(store_path)
+        response = await self._client.call(
+            self._actions_api.create_tabular_export_endpoint,
+            workspace_id=workspace_id,
+            tabular_export_request=export_request.to_api(),
+        )
+        await self._store_export(
+            workspace_id,
+            response["export_result"],
+            store_path / export_request.file,
+            self._actions_api.get_tabular_export_endpoint,
+            timeout,
+            retry,
+            max_retry,
+        )
@@ -0,0 +1,107 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+from pathlib import Path
+from types import TracebackType
+from typing import Optional
+
+from gooddata_sdk.aio.catalog import AsyncCatalogWorkspaceContentService
+from gooddata_sdk.aio.client import DEFAULT_MAX_CONNECTIONS, AsyncGoodDataApiClient
+from gooddata_sdk.aio.compute import AsyncComputeService
+from gooddata_sdk.aio.export import AsyncExportService
+from gooddata_sdk.client import GoodDataApiClient
+from gooddata_sdk.utils import PROFILES_FILE_PATH, profile_content
+
+
+class AsyncGoodDataSdk:
+    """Asyncio counterpart of GoodDataSdk covering computations, catalog listing and exports.
+
+    All the requests share a single non-blocking connection pool, so one event loop can keep many computations
+    in flight. Close the SDK once it is not needed anymore, preferably by using it as an async context manager:
+
+    >>> async with AsyncGoodDataSdk.create(host_, token_) as sdk:
+    >>>     execution = await sdk.compute.for_exec_def("demo", exec_def)
+
+    Requires aiohttp to be installed.
+    """
+
+    @classmethod
+    def create_from_profile(
+        cls, profile: str = "default", profiles_path: Path = PROFILES_FILE_PATH
+    ) -> AsyncGoodDataSdk:
+        """Convenient method to initialize the SDK from config file.
+
+        Args:
+            profile (str, optional):
+                Profile Name. Defaults to "default".
+            profiles_path (Path, optional):
+                File path for the profiles. Defaults to PROFILES_FILE_PATH.
+
+        Returns:
+            AsyncGoodDataSdk:
+                Initialized SDK.
+        """
+        content = profile_content(profile, profiles_path)
+        client = GoodDataApiClient(**content)
+        return cls(AsyncGoodDataApiClient(client))
+
+    @classmethod
+    def create(
+        cls,
+        host_: str,
+        token_: str,
+        extra_user_agent_: Optional[str] = None,
+        max_connections_: int = DEFAULT_MAX_CONNECTIONS,
+        timeout_: Optional[float] = None,
+        **custom_headers_: Optional[str],
+    ) -> AsyncGoodDataSdk:
+        """
+        Create AsyncGoodDataApiClient and return new AsyncGoodDataSdk instance, see GoodDataSdk.create.
+
+        The async client opens at most `max_connections_` connections at the same time; `timeout_` is total
+        timeout of a single request in seconds.
+        """
+        filtered_headers = {key: value for key, value in custom_headers_.items() if value is not None}
+        client = GoodDataApiClient(host_, token_, custom_headers=filtered_headers, extra_user_agent=extra_user_agent_)
+        return cls(AsyncGoodDataApiClient(client, max_connections=max_connections_, timeout=timeout_))
+
+    def __init__(self, client: AsyncGoodDataApiClient) -> None:
+        """Take instance of AsyncGoodDataApiClient and return new AsyncGoodDataSdk instance.
+
+        Usually users should use `AsyncGoodDataSdk.create` classmethod.
+        """
+        self._client = client
+
+        self._compute = AsyncComputeService(self._client)
+        self._catalog_workspace_content = AsyncCatalogWorkspaceContentService(self._client)
+        self._export = AsyncExportService(self._client)
+
+    async def __aenter__(self) -> AsyncGoodDataSdk:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        await self._client.close()
+
+    @property
+    def compute(self) -> AsyncComputeService:
+        return self._compute
+
+    @property
+    def catalog_workspace_content(self) -> AsyncCatalogWorkspaceContentService:
+        return self._catalog_workspace_content
+
+    @property
+    def export(self) -> AsyncExportService:
+        return self._export
+
+    @property
+    def client(self) -> AsyncGoodDataApiClient:
+        return self._client
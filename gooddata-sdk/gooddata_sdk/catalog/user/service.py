@@ -72,11 +72,12 @@ class CatalogUserService(CatalogServiceBase):
         """
         self._entities_api.delete_entity_users(id=user_id)
 
-    def list_users(self) -> list[CatalogUser]:
+    def list_users(self, max_concurrency: int = 1) -> list[CatalogUser]:
         """Get a list of all existing users.
 
         Args:
-            None
+            max_concurrency (int):
+                Max number of pages fetched at the same time. Defaults to 1.
 
         Returns:
             list[CatalogUser]:
@@ -87,7 +88,7 @@ class CatalogUserService(CatalogServiceBase):
             include=["userGroups"],
             _check_return_type=False,
         )
-        users = load_all_entities_dict(get_users, camel_case=False)
+        users = load_all_entities_dict(get_users, camel_case=False, max_concurrency=max_concurrency)
         return [CatalogUser.from_dict(v, camel_case=False) for v in users["data"]]
 
     # Entity methods for user groups
@@ -0,0 +1,241 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar
+
+from cattrs import structure, unstructure
+
+from gooddata_sdk.catalog.workspace.entity_model.content_objects.dataset import (
+    CatalogAttribute,
+    CatalogDataset,
+    CatalogFact,
+    CatalogLabel,
+)
+from gooddata_sdk.catalog.workspace.entity_model.content_objects.metric import CatalogMetric
+
+T = TypeVar("T")
+
+CatalogCacheKey = tuple[str, str, tuple[str, ...]]
+
+_CACHE_FILE_SUFFIX = ".json"
+
+# catalog objects which can be persisted; entries are restored only into these classes
+_PERSISTED_TYPES: dict[str, type] = {
+    cls.__name__: cls for cls in (CatalogAttribute, CatalogDataset, CatalogFact, CatalogLabel, CatalogMetric)
+}
+
+
+def _digest(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()[:32]
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, (list, tuple)):
+        return [_to_json(item) for item in value]
+    type_name = type(value).__name__
+    if _PERSISTED_TYPES.get(type_name) is type(value):
+        return {"catalogType": type_name, "data": unstructure(value)}
+    return value
+
+
+def _from_json(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_from_json(item) for item in value]
+    if isinstance(value, dict) and "catalogType" in value:
+        return structure(value["data"], _PERSISTED_TYPES[value["catalogType"]])
+    return value
+
+
+class CatalogCache:
+    """
+    In-memory cache of workspace catalog objects (attributes, labels, metrics, facts and datasets) with optional
+    on-disk persistence.
+
+    Entries are keyed by workspace id, catalog kind and the parameters that influence the content of the catalog
+    (e.g. side-loaded includes). Entries expire after `ttl` seconds and the least recently used entries are evicted
+    once there are more than `max_entries` of them in memory.
+
+    When `persist_dir` is set, every entry is also stored as JSON into that directory so that it survives process
+    restarts. Only lists and tuples of catalog objects and JSON-compatible values are persisted; tuples are restored
+    as lists. Entries loaded from disk are subject to the same TTL - the store time is kept together with the entry.
+
+    The cache does not observe changes done on the server. Use `invalidate` after changing the semantic model of
+    a workspace by other means than CatalogWorkspaceContentService and CatalogWorkspaceService.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = 300.0,
+        max_entries: int = 128,
+        persist_dir: Optional[Path] = None,
+    ) -> None:
+        """
+        Args:
+            ttl (Optional[float]):
+                Number of seconds after which cached entries expire. None means that entries never expire.
+                Defaults to 300 seconds.
+            max_entries (int):
+                Maximum number of entries kept in memory. Defaults to 128.
+            persist_dir (Optional[Path]):
+                Directory where the cached entries are persisted. Defaults to None - no persistence.
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl must be a positive number or None, got: {ttl}")
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be a positive number, got: {max_entries}")
+
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._persist_dir = persist_dir
+        self._entries: OrderedDict[CatalogCacheKey, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        if self._persist_dir is not None:
+            self._persist_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def ttl(self) -> Optional[float]:
+        return self._ttl
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries
+
+    @property
+    def persist_dir(self) -> Optional[Path]:
+        return self._persist_dir
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get_or_load(self, workspace_id: str, kind: str, loader: Callable[[], T], params: tuple[str, ...] = ()) -> T:
+        """
+        Returns cached catalog entry. If there is no valid entry, calls the loader and caches its result.
+
+        Args:
+            workspace_id (str):
+                Workspace identification string e.g. "demo"
+            kind (str):
+                Kind of the catalog e.g. "attributes"
+            loader (Callable[[], T]):
+                Function that loads the catalog from the server.
+            params (tuple[str, ...]):
+                Additional parameters that influence content of the catalog.
+
+        Returns:
+            T: Cached or freshly loaded catalog.
+        """
+        key = (workspace_id, kind, params)
+        found, value = self._get(key)
+        if found:
+            return value
+
+        value = loader()
+        self._put(key, value)
+        return value
+
+    def invalidate(self, workspace_id: Optional[str] = None) -> None:
+        """
+        Drops cached entries, both from memory and from the disk.
+
+        Args:
+            workspace_id (Optional[str]):
+                Workspace identification string e.g. "demo". When not specified, all entries are dropped.
+        """
+        with self._lock:
+            if workspace_id is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == workspace_id]:
+                    del self._entries[key]
+
+        if self._persist_dir is not None:
+            prefix = "" if workspace_id is None else f"{_digest(workspace_id)}-"
+            for path in self._persist_dir.glob(f"{prefix}*{_CACHE_FILE_SUFFIX}"):
+                path.unlink(missing_ok=True)
+
+    def _is_expired(self, stored_at: float) -> bool:
+        return self._ttl is not None and time.time() - stored_at > self._ttl
+
+    def _get(self, key: CatalogCacheKey) -> tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if not self._is_expired(entry[0]):
+                    self._entries.move_to_end(key)
+                    return True, entry[1]
+                del self._entries[key]
+
+        entry = self._read_entry(key)
+        if entry is None:
+            return False, None
+
+        with self._lock:
+            self._store_in_memory(key, entry)
+        return True, entry[1]
+
+    def _put(self, key: CatalogCacheKey, value: Any) -> None:
+        entry = (time.time(), value)
+        with self._lock:
+            self._store_in_memory(key, entry)
+        self._write_entry(key, entry)
+
+    def _store_in_memory(self, key: CatalogCacheKey, entry: tuple[float, Any]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _entry_path(self, key: CatalogCacheKey) -> Path:
+        assert self._persist_dir is not None
+        workspace_id, kind, params = key
+        return self._persist_dir / f"{_digest(workspace_id)}-{_digest(repr((kind, params)))}{_CACHE_FILE_SUFFIX}"
+
+    def _read_entry(self, key: CatalogCacheKey) -> Optional[tuple[float, Any]]:
+        if self._persist_dir is None:
+            return None
+
+        path = self._entry_path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                stored = json.load(f)
+            stored_workspace_id, stored_kind, stored_params = stored["key"]
+            stored_key = (stored_workspace_id, stored_kind, tuple(stored_params))
+            stored_at = float(stored["storedAt"])
+            if stored_key != key:
+                return None
+            if self._is_expired(stored_at):
+                path.unlink(missing_ok=True)
+                return None
+            value = _from_json(stored["value"])
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # corrupted or incompatible entry, e.g. written by a different version of the SDK
+            path.unlink(missing_ok=True)
+            return None
+
+        return stored_at, value
+
+    def _write_entry(self, key: CatalogCacheKey, entry: tuple[float, Any]) -> None:
+        if self._persist_dir is None:
+            return
+
+        try:
+            content = json.dumps({"key": list(key), "storedAt": entry[0], "value": _to_json(entry[1])})
+        except (TypeError, ValueError):
+            # the value is not JSON-compatible, it is cached in memory only
+            return
+
+        path = self._entry_path(key)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        tmp_path.replace(path)
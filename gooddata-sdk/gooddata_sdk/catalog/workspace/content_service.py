@@ -3,8 +3,9 @@ from __future__ import annotations
 
 import copy
 import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Literal, Optional, Union
+from typing import Callable, Literal, Optional, TypeVar, Union
 
 import gooddata_api_client.models as afm_models
 from gooddata_api_client.model.elements_request import ElementsRequest
@@ -15,6 +16,7 @@ from gooddata_sdk.catalog.depends_on import CatalogDependsOn, CatalogDependsOnDa
 from gooddata_sdk.catalog.filter_by import CatalogFilterBy
 from gooddata_sdk.catalog.types import ValidObjects
 from gooddata_sdk.catalog.validate_by_item import CatalogValidateByItem
+from gooddata_sdk.catalog.workspace.catalog_cache import CatalogCache
 from gooddata_sdk.catalog.workspace.declarative_model.workspace.analytics_model.analytics_model import (
     CatalogDeclarativeAnalytics,
 )
@@ -22,6 +24,7 @@ from gooddata_sdk.catalog.workspace.declarative_model.workspace.logical_model.ld
 from gooddata_sdk.catalog.workspace.declarative_model.workspace.workspace import LAYOUT_WORKSPACES_DIR
 from gooddata_sdk.catalog.workspace.entity_model.content_objects.dataset import (
     CatalogAttribute,
+    CatalogDataset,
     CatalogFact,
     CatalogLabel,
 )
@@ -48,6 +51,8 @@ LabelElementsInputType = Union[str, ObjId]
 
 DependsOnItem = Union[CatalogDependsOn, CatalogDependsOnDateFilter]
 
+T = TypeVar("T")
+
 
 class CatalogWorkspaceContentService(CatalogServiceBase):
     # Note on the disabled checking:
@@ -56,12 +61,49 @@ class CatalogWorkspaceContentService(CatalogServiceBase):
     # note: the parsing is done lazily so it does not necessarily bomb on the next line but when trying to
     #  access returned object's properties
 
-    def __init__(self, api_client: GoodDataApiClient) -> None:
+    def __init__(self, api_client: GoodDataApiClient, catalog_cache: Optional[CatalogCache] = None) -> None:
         super().__init__(api_client)
+        self._catalog_cache = catalog_cache
+
+    @property
+    def catalog_cache(self) -> Optional[CatalogCache]:
+        return self._catalog_cache
+
+    def set_catalog_cache(self, catalog_cache: Optional[CatalogCache]) -> None:
+        """Sets cache used by get_*_catalog methods. Pass None to disable caching.
+
+        Args:
+            catalog_cache (Optional[CatalogCache]):
+                Cache of workspace catalogs.
+
+        Returns:
+            None
+        """
+        self._catalog_cache = catalog_cache
+
+    def invalidate_catalog_cache(self, workspace_id: Optional[str] = None) -> None:
+        """Drops cached catalogs of a given workspace. Does nothing if the catalog cache is not set.
+
+        Args:
+            workspace_id (Optional[str]):
+                Workspace identification string e.g. "demo". When not specified, catalogs of all workspaces are dropped.
+
+        Returns:
+            None
+        """
+        if self._catalog_cache is not None:
+            self._catalog_cache.invalidate(workspace_id)
+
+    def _cached(self, workspace_id: str, kind: str, loader: Callable[[], T], params: tuple[str, ...] = ()) -> T:
+        if self._catalog_cache is None:
+            return loader()
+        return self._catalog_cache.get_or_load(workspace_id, kind, loader, params)
 
     # Entities methods
 
-    def get_full_catalog(self, workspace_id: str, inject_valid_objects_func: bool = True) -> CatalogWorkspaceContent:
+    def get_full_catalog(
+        self, workspace_id: str, inject_valid_objects_func: bool = True, max_concurrency: int = 1
+    ) -> CatalogWorkspaceContent:
         """Retrieves catalog for a workspace. Catalog contains all data sets and metrics defined in that workspace.
 
         Args:
@@ -71,37 +113,57 @@ class CatalogWorkspaceContentService(CatalogServiceBase):
                 Should valid_objects func be injected into the result container?
                 When turned off, it enables pickling of the result, which is useful e.g. in Streamlit caching
                 In such a case, developers must call compute_valid_objects in this service.
+            max_concurrency (int):
+                When greater than 1, attributes, datasets and metrics are loaded at the same time and up to
+                max_concurrency pages of each of them are fetched in parallel. Defaults to 1 - sequential loading.
 
         Returns:
             CatalogWorkspaceContent: Object containing all data sets and metrics.
         """
+        datasets, metrics = self._cached(
+            workspace_id, "full", functools.partial(self._load_full_catalog, workspace_id, max_concurrency)
+        )
+
+        valid_obj_fun = None
+        if inject_valid_objects_func:
+            valid_obj_fun = functools.partial(self.compute_valid_objects, workspace_id)
+
+        return CatalogWorkspaceContent(valid_obj_fun, datasets=list(datasets), metrics=list(metrics))
+
+    def _load_full_catalog(
+        self, workspace_id: str, max_concurrency: int
+    ) -> tuple[list[CatalogDataset], list[CatalogMetric]]:
         get_datasets = functools.partial(
+            self._client.call_json,
             self._entities_api.get_all_entities_datasets,
             workspace_id,
             include=["attributes", "facts"],
-            _check_return_type=False,
         )
 
         get_attributes = functools.partial(
+            self._client.call_json,
             self._entities_api.get_all_entities_attributes,
             workspace_id,
             include=["labels", "datasets"],
-            _check_return_type=False,
         )
 
         get_metrics = functools.partial(
-            self._entities_api.get_all_entities_metrics, workspace_id, _check_return_type=False
+            self._client.call_json, self._entities_api.get_all_entities_metrics, workspace_id
         )
 
-        attributes = load_all_entities(get_attributes)
-        datasets = load_all_entities(get_datasets)
-        metrics = load_all_entities(get_metrics)
-
-        valid_obj_fun = None
-        if inject_valid_objects_func:
-            valid_obj_fun = functools.partial(self.compute_valid_objects, workspace_id)
+        loaders = [
+            functools.partial(load_all_entities, get_page_func, max_concurrency=max_concurrency)
+            for get_page_func in (get_attributes, get_datasets, get_metrics)
+        ]
+        if max_concurrency <= 1:
+            attributes, datasets, metrics = (loader() for loader in loaders)
+        else:
+            # the collections are independent, load them at the same time
+            with ThreadPoolExecutor(max_workers=len(loaders), thread_name_prefix="gd-catalog") as executor:
+                attributes, datasets, metrics = executor.map(lambda loader: loader(), loaders)
 
-        return CatalogWorkspaceContent.create_workspace_content_catalog(valid_obj_fun, datasets, attributes, metrics)
+        catalog = CatalogWorkspaceContent.create_workspace_content_catalog(None, datasets, attributes, metrics)
+        return catalog.datasets, catalog.metrics
 
     def get_attributes_catalog(self, workspace_id: str, include: Optional[list[str]] = None) -> list[CatalogAttribute]:
         """Retrieve all attributes in a given workspace.
@@ -121,11 +183,21 @@ class CatalogWorkspaceContentService(CatalogServiceBase):
         include = include if include is not None else ["labels"]
         if not set(include).issubset(available_includes):
             raise ValueError(f"Invalid include parameter. Available values: {available_includes}, got: {include}")
+        return list(
+            self._cached(
+                workspace_id,
+                "attributes",
+                functools.partial(self._load_attributes_catalog, workspace_id, include),
+                params=tuple(sorted(set(include))),
+            )
+        )
+
+    def _load_attributes_catalog(self, workspace_id: str, include: list[str]) -> list[CatalogAttribute]:
         get_attributes = functools.partial(
+            self._client.call_json,
             self._entities_api.get_all_entities_attributes,
             workspace_id,
             include=include,
-            _check_return_type=False,
         )
         attributes = load_all_entities(get_attributes)
         catalog_attributes = [CatalogAttribute.from_api(a, side_loads=attributes.included) for a in attributes.data]
@@ -142,10 +214,13 @@ class CatalogWorkspaceContentService(CatalogServiceBase):
             list[CatalogLabel]:
                 List of all labels in a given workspace.
         """
+        return list(self._cached(workspace_id, "labels", functools.partial(self._load_labels_catalog, workspace_id)))
+
+    def _load_labels_catalog(self, workspace_id: str) -> list[CatalogLabel]:
         get_labels = functools.partial(
+            self._client.call_json,
             self._entities_api.get_all_entities_labels,
             workspace_id,
-            _check_return_type=False,
         )
         labels = load_all_entities(get_labels)
         catalog_labels = [CatalogLabel.from_api(label) for label in labels.data]
@@ -162,8 +237,11 @@ class CatalogWorkspaceContentService(CatalogServiceBase):
             list[CatalogMetric]:
                 List of all metrics in a given workspace.
         """
+        return list(self._cached(workspace_id, "metrics", functools.partial(self._load_metrics_catalog, workspace_id)))
+
+    def _load_metrics_catalog(self, workspace_id: str) -> list[CatalogMetric]:
         get_metrics = functools.partial(
-            self._entities_api.get_all_entities_metrics, workspace_id, _check_return_type=False
+            self._client.call_json, self._entities_api.get_all_entities_metrics, workspace_id
         )
         metrics = load_all_entities(get_metrics)
         catalog_metrics = [CatalogMetric.from_api(metric) for metric in metrics.data]
@@ -180,7 +258,10 @@ class CatalogWorkspaceContentService(CatalogServiceBase):
             list[CatalogFact]:
                 List of all facts in a given workspace.
         """
-        get_facts = functools.partial(self._entities_api.get_all_entities_facts, workspace_id, _check_return_type=False)
+        return list(self._cached(workspace_id, "facts", functools.partial(self._load_facts_catalog, workspace_id)))
+
+    def _load_facts_catalog(self, workspace_id: str) -> list[CatalogFact]:
+        get_facts = functools.partial(self._client.call_json, self._entities_api.get_all_entities_facts, workspace_id)
         facts = load_all_entities(get_facts)
         catalog_facts = [CatalogFact.from_api(fact) for fact in facts.data]
         return catalog_facts
@@ -239,7 +320,10 @@ class CatalogWorkspaceContentService(CatalogServiceBase):
             CatalogDeclarativeModel:
                 Object Containing declarative Logical Data Model.
         """
-        return CatalogDeclarativeModel.from_api(self._layout_api.get_logical_model(workspace_id))
+        return CatalogDeclarativeModel.from_dict(
+            self._client.call_json(self._layout_api.get_logical_model, workspace_id, camel_case=False),
+            camel_case=False,
+        )
 
     def put_declarative_ldm(
         self,
@@ -271,6 +355,7 @@ class CatalogWorkspaceContentService(CatalogServiceBase):
             ldm = copy.deepcopy(ldm)
             ldm.remove_wdf_refs()
         self._layout_api.set_logical_model(workspace_id, ldm.to_api())
+        self.invalidate_catalog_cache(workspace_id)
 
     def store_declarative_ldm(self, workspace_id: str, layout_root_path: Path = Path.cwd()) -> None:
         """Store declarative logical data model for a given workspace in directory hierarchy.
@@ -383,7 +468,9 @@ class CatalogWorkspaceContentService(CatalogServiceBase):
         if exclude is None:
             exclude = []
         return CatalogDeclarativeAnalytics.from_dict(
-            self._layout_api.get_analytics_model(workspace_id=workspace_id, exclude=exclude).to_dict(camel_case=False),
+            self._client.call_json(
+                self._layout_api.get_analytics_model, workspace_id=workspace_id, exclude=exclude, camel_case=False
+            ),
             camel_case=False,
         )
 
@@ -400,6 +487,7 @@ class CatalogWorkspaceContentService(CatalogServiceBase):
             None
         """
         self._layout_api.set_analytics_model(workspace_id, analytics_model.to_api())
+        self.invalidate_catalog_cache(workspace_id)
 
     def store_declarative_analytics_model(self, workspace_id: str, layout_root_path: Path = Path.cwd()) -> None:
         """Store declarative analytics model for a given workspace in directory hierarchy.
@@ -655,3 +743,25 @@ class CatalogWorkspaceContentService(CatalogServiceBase):
             workspace_id, request, _check_return_type=False, **paging_params
         )
         return [v["title"] for v in values["elements"]]
+
+    def get_label_elements_count(self, workspace_id: str, label_id: LabelElementsInputType) -> int:
+        """
+        Get number of existing values of a label. Only the first value is transferred, the count is taken from
+        the paging of the response.
+
+        Args:
+            workspace_id (str):
+                Workspace identification string e.g. "demo".
+            label_id (str):
+                Label ID. We support string or ObjId types.
+                String may not contain "label/" prefix, we append it if necessary.
+        Returns:
+            int: number of label values
+        """
+        # API expects ID without type prefix
+        parts = str(label_id).split("/")
+        if len(parts) == 2:
+            label_id = parts[1]
+        request = ElementsRequest(label=label_id)
+        values = self._actions_api.compute_label_elements_post(workspace_id, request, _check_return_type=False, limit=1)
+        return values["paging"]["total"]
@@ -29,7 +29,7 @@ from gooddata_sdk.catalog.workspace.declarative_model.workspace.analytics_model.
 from gooddata_sdk.catalog.workspace.declarative_model.workspace.analytics_model.export_definition import (
     CatalogDeclarativeExportDefinition,
 )
-from gooddata_sdk.utils import create_directory, get_sorted_yaml_files
+from gooddata_sdk.utils import create_directory, load_layout_objects, store_layout_objects
 
 AnalyticsObjects = Union[
     DeclarativeAnalyticalDashboard,
@@ -58,13 +58,13 @@ class CatalogDeclarativeAnalytics(Base):
     def client_class() -> type[DeclarativeAnalytics]:
         return DeclarativeAnalytics
 
-    def store_to_disk(self, workspace_folder: Path) -> None:
+    def store_to_disk(self, workspace_folder: Path, incremental: bool = False) -> None:
         if self.analytics is not None:
-            self.analytics.store_to_disk(workspace_folder)
+            self.analytics.store_to_disk(workspace_folder, incremental)
 
     @classmethod
-    def load_from_disk(cls, workspace_folder: Path) -> CatalogDeclarativeAnalytics:
-        analytics = CatalogDeclarativeAnalyticsLayer.load_from_disk(workspace_folder)
+    def load_from_disk(cls, workspace_folder: Path, incremental: bool = False) -> CatalogDeclarativeAnalytics:
+        analytics = CatalogDeclarativeAnalyticsLayer.load_from_disk(workspace_folder, incremental)
         return cls(analytics=analytics)
 
 
@@ -137,7 +137,16 @@ class CatalogDeclarativeAnalyticsLayer(Base):
         create_directory(folder)
         return folder
 
-    def store_to_disk(self, workspace_folder: Path) -> None:
+    def store_to_disk(self, workspace_folder: Path, incremental: bool = False) -> None:
+        """Stores the analytics layer to the workspace folder, one file per object.
+
+        Args:
+            workspace_folder (Path):
+                Folder of the workspace.
+            incremental (bool, optional):
+                If true, only the files of changed objects are rewritten and files of objects which are
+                no longer part of the layout are deleted. See IncrementalLayoutFolder. Defaults to False.
+        """
         analytics_model_folder = self.get_analytics_model_folder(workspace_folder)
 
         analytical_dashboards_folder = self.get_analytical_dashboards_folder(analytics_model_folder)
@@ -149,32 +158,30 @@ class CatalogDeclarativeAnalyticsLayer(Base):
         attribute_hierarchy_folder = self.get_attribute_hierarchy_folder(analytics_model_folder)
         export_definition_folder = self.get_export_definition_dif(analytical_dashboards_folder)
 
-        for analytical_dashboard in self.analytical_dashboards:
-            analytical_dashboard.store_to_disk(analytical_dashboards_folder)
-
-        for analytical_dashboard_extension in self.analytical_dashboard_extensions:
-            analytical_dashboard_extension.store_to_disk(analytical_dashboard_extensions_folder)
-
-        for dashboard_plugin in self.dashboard_plugins:
-            dashboard_plugin.store_to_disk(dashboard_plugins_folder)
-
-        for filter_context in self.filter_contexts:
-            filter_context.store_to_disk(filter_contexts_folder)
-
-        for metric in self.metrics:
-            metric.store_to_disk(metrics_folder)
-
-        for visualization_object in self.visualization_objects:
-            visualization_object.store_to_disk(visualization_objects_folder)
-
-        for attribute_hierarchy in self.attribute_hierarchies:
-            attribute_hierarchy.store_to_disk(attribute_hierarchy_folder)
-
-        for export_definition in self.export_definitions:
-            export_definition.store_to_disk(export_definition_folder)
+        store_layout_objects(analytical_dashboards_folder, self.analytical_dashboards, incremental)
+        store_layout_objects(analytical_dashboard_extensions_folder, self.analytical_dashboard_extensions, incremental)
+        store_layout_objects(dashboard_plugins_folder, self.dashboard_plugins, incremental)
+        store_layout_objects(filter_contexts_folder, self.filter_contexts, incremental)
+        store_layout_objects(metrics_folder, self.metrics, incremental)
+        store_layout_objects(visualization_objects_folder, self.visualization_objects, incremental)
+        store_layout_objects(attribute_hierarchy_folder, self.attribute_hierarchies, incremental)
+        store_layout_objects(export_definition_folder, self.export_definitions, incremental)
 
     @classmethod
-    def load_from_disk(cls, workspace_folder: Path) -> CatalogDeclarativeAnalyticsLayer:
+    def load_from_disk(cls, workspace_folder: Path, incremental: bool = False) -> CatalogDeclarativeAnalyticsLayer:
+        """Loads the analytics layer stored using `store_to_disk`.
+
+        Args:
+            workspace_folder (Path):
+                Folder of the workspace.
+            incremental (bool, optional):
+                If true, only the files which changed since the last incremental load are parsed.
+                See IncrementalLayoutFolder. Defaults to False.
+
+        Returns:
+            CatalogDeclarativeAnalyticsLayer:
+                Declarative analytics layer.
+        """
         analytics_model_folder = cls.get_analytics_model_folder(workspace_folder)
         analytical_dashboards_folder = cls.get_analytical_dashboards_folder(analytics_model_folder)
         analytical_dashboard_extensions_folder = cls.get_analytical_dashboard_extensions_folder(analytics_model_folder)
@@ -185,53 +192,27 @@ class CatalogDeclarativeAnalyticsLayer(Base):
         attribute_hierarchy_folder = cls.get_attribute_hierarchy_folder(analytics_model_folder)
         export_definition_folder = cls.get_export_definition_dif(analytical_dashboards_folder)
 
-        analytical_dashboard_files = get_sorted_yaml_files(analytical_dashboards_folder)
-        analytical_dashboard_extension_files = get_sorted_yaml_files(analytical_dashboard_extensions_folder)
-        dashboard_plugin_files = get_sorted_yaml_files(dashboard_plugins_folder)
-        filter_context_files = get_sorted_yaml_files(filter_contexts_folder)
-        metric_files = get_sorted_yaml_files(metrics_folder)
-        visualization_object_files = get_sorted_yaml_files(visualization_objects_folder)
-        attribute_hierarchy_files = get_sorted_yaml_files(attribute_hierarchy_folder)
-        export_definition_files = get_sorted_yaml_files(export_definition_folder)
-
-        analytical_dashboards = [
-            CatalogDeclarativeAnalyticalDashboard.load_from_disk(analytical_dashboard_file)
-            for analytical_dashboard_file in analytical_dashboard_files
-        ]
-        analytical_dashboard_extensions = [
-            CatalogDeclarativeAnalyticalDashboardExtension.load_from_disk(analytical_dashboard_extension_file)
-            for analytical_dashboard_extension_file in analytical_dashboard_extension_files
-        ]
-        dashboard_plugins = [
-            CatalogDeclarativeDashboardPlugin.load_from_disk(dashboard_plugin_file)
-            for dashboard_plugin_file in dashboard_plugin_files
-        ]
-        filter_contexts = [
-            CatalogDeclarativeFilterContext.load_from_disk(filter_context_file)
-            for filter_context_file in filter_context_files
-        ]
-        metrics = [CatalogDeclarativeMetric.load_from_disk(metric_file) for metric_file in metric_files]
-        visualization_objects = [
-            CatalogDeclarativeVisualizationObject.load_from_disk(visualization_object_file)
-            for visualization_object_file in visualization_object_files
-        ]
-        attribute_hierarchy_objects = [
-            CatalogDeclarativeAttributeHierarchy.load_from_disk(attribute_hierarchy_file)
-            for attribute_hierarchy_file in attribute_hierarchy_files
-        ]
-        export_definitions = [
-            CatalogDeclarativeExportDefinition.load_from_disk(export_definition_file)
-            for export_definition_file in export_definition_files
-        ]
         return cls(
-            analytical_dashboards=analytical_dashboards,
-            analytical_dashboard_extensions=analytical_dashboard_extensions,
-            attribute_hierarchies=attribute_hierarchy_objects,
-            dashboard_plugins=dashboard_plugins,
-            filter_contexts=filter_contexts,
-            metrics=metrics,
-            visualization_objects=visualization_objects,
-            export_definitions=export_definitions,
+            analytical_dashboards=load_layout_objects(
+                analytical_dashboards_folder, CatalogDeclarativeAnalyticalDashboard, incremental
+            ),
+            analytical_dashboard_extensions=load_layout_objects(
+                analytical_dashboard_extensions_folder, CatalogDeclarativeAnalyticalDashboardExtension, incremental
+            ),
+            attribute_hierarchies=load_layout_objects(
+                attribute_hierarchy_folder, CatalogDeclarativeAttributeHierarchy, incremental
+            ),
+            dashboard_plugins=load_layout_objects(
+                dashboard_plugins_folder, CatalogDeclarativeDashboardPlugin, incremental
+            ),
+            filter_contexts=load_layout_objects(filter_contexts_folder, CatalogDeclarativeFilterContext, incremental),
+            metrics=load_layout_objects(metrics_folder, CatalogDeclarativeMetric, incremental),
+            visualization_objects=load_layout_objects(
+                visualization_objects_folder, CatalogDeclarativeVisualizationObject, incremental
+            ),
+            export_definitions=load_layout_objects(
+                export_definition_folder, CatalogDeclarativeExportDefinition, incremental
+            ),
         )
 
 
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from shutil import rmtree
 from typing import Optional
 
 import attr
@@ -21,7 +22,7 @@ from gooddata_sdk.catalog.workspace.declarative_model.workspace.logical_model.da
     LAYOUT_DATE_INSTANCES_DIR,
     CatalogDeclarativeDateDataset,
 )
-from gooddata_sdk.utils import create_directory, get_sorted_yaml_files
+from gooddata_sdk.utils import create_directory, load_layout_objects, store_layout_objects
 
 LAYOUT_LDM_DIR = "ldm"
 
@@ -34,13 +35,13 @@ class CatalogDeclarativeModel(Base):
     def client_class() -> type[DeclarativeModel]:
         return DeclarativeModel
 
-    def store_to_disk(self, workspace_folder: Path) -> None:
+    def store_to_disk(self, workspace_folder: Path, incremental: bool = False) -> None:
         if self.ldm is not None:
-            self.ldm.store_to_disk(workspace_folder)
+            self.ldm.store_to_disk(workspace_folder, incremental)
 
     @classmethod
-    def load_from_disk(cls, workspace_folder: Path) -> CatalogDeclarativeModel:
-        ldm = CatalogDeclarativeLdm.load_from_disk(workspace_folder)
+    def load_from_disk(cls, workspace_folder: Path, incremental: bool = False) -> CatalogDeclarativeModel:
+        ldm = CatalogDeclarativeLdm.load_from_disk(workspace_folder, incremental)
         return cls(ldm=ldm)
 
     def remove_wdf_refs(self) -> None:
@@ -106,42 +107,55 @@ class CatalogDeclarativeLdm(Base):
         create_directory(folder)
         return folder
 
-    def store_to_disk(self, workspace_folder: Path) -> None:
+    def store_to_disk(self, workspace_folder: Path, incremental: bool = False) -> None:
+        """Stores the logical data model to the workspace folder, one file per object.
+
+        Args:
+            workspace_folder (Path):
+                Folder of the workspace.
+            incremental (bool, optional):
+                If true, only the files of changed objects are rewritten and files of objects which are
+                no longer part of the model are deleted. See IncrementalLayoutFolder. Defaults to False.
+        """
         ldm_folder = self.create_ldm_folder(workspace_folder)
         datasets_folder = self.create_datasets_folder(ldm_folder)
         date_instances_folder = self.create_date_instances_folder(ldm_folder)
 
-        for dataset in self.datasets:
-            dataset.store_to_disk(datasets_folder)
-        for date_instance in self.date_instances:
-            date_instance.store_to_disk(date_instances_folder)
+        store_layout_objects(datasets_folder, self.datasets, incremental)
+        store_layout_objects(date_instances_folder, self.date_instances, incremental)
         # Note: should be defaulted to an empty list in the future
         if self.dataset_extensions:
             dataset_extensions_folder = self.create_dataset_extensions_folder(ldm_folder)
-            for dataset_extension in self.dataset_extensions:
-                dataset_extension.store_to_disk(dataset_extensions_folder)
+            store_layout_objects(dataset_extensions_folder, self.dataset_extensions, incremental)
+        elif incremental:
+            dataset_extensions_folder = self.get_dataset_extensions_folder(ldm_folder)
+            if dataset_extensions_folder.exists():
+                rmtree(dataset_extensions_folder)
 
     @classmethod
-    def load_from_disk(cls, workspace_folder: Path) -> CatalogDeclarativeLdm:
+    def load_from_disk(cls, workspace_folder: Path, incremental: bool = False) -> CatalogDeclarativeLdm:
+        """Loads the logical data model stored using `store_to_disk`.
+
+        Args:
+            workspace_folder (Path):
+                Folder of the workspace.
+            incremental (bool, optional):
+                If true, only the files which changed since the last incremental load are parsed.
+                See IncrementalLayoutFolder. Defaults to False.
+
+        Returns:
+            CatalogDeclarativeLdm:
+                Declarative logical data model.
+        """
         ldm_folder = cls.get_ldm_folder(workspace_folder)
         datasets_folder = cls.get_datasets_folder(ldm_folder)
         date_instances_folder = cls.get_date_instances_folder(ldm_folder)
         dataset_extensions_folder = cls.get_dataset_extensions_folder(ldm_folder)
 
-        dataset_files = get_sorted_yaml_files(datasets_folder)
-        date_instance_files = get_sorted_yaml_files(date_instances_folder)
-        dataset_extensions_files = get_sorted_yaml_files(dataset_extensions_folder)
-
-        datasets = [CatalogDeclarativeDataset.load_from_disk(dataset_file) for dataset_file in dataset_files]
-        date_instances = [
-            CatalogDeclarativeDateDataset.load_from_disk(date_instance_file)
-            for date_instance_file in date_instance_files
-        ]
+        datasets = load_layout_objects(datasets_folder, CatalogDeclarativeDataset, incremental)
+        date_instances = load_layout_objects(date_instances_folder, CatalogDeclarativeDateDataset, incremental)
         dataset_extensions = (
-            [
-                CatalogDeclarativeDatasetExtension.load_from_disk(dataset_extensions_file)
-                for dataset_extensions_file in dataset_extensions_files
-            ]
+            load_layout_objects(dataset_extensions_folder, CatalogDeclarativeDatasetExtension, incremental)
             if dataset_extensions_folder.exists()
             else None
         )
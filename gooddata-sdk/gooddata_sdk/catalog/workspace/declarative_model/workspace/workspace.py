@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import copy
 from pathlib import Path
+from shutil import rmtree
 from typing import Any, Optional
 
 import attr
@@ -33,7 +34,15 @@ from gooddata_sdk.catalog.workspace.declarative_model.workspace.analytics_model.
 )
 from gooddata_sdk.catalog.workspace.declarative_model.workspace.automation import CatalogDeclarativeAutomation
 from gooddata_sdk.catalog.workspace.declarative_model.workspace.logical_model.ldm import CatalogDeclarativeLdm
-from gooddata_sdk.utils import create_directory, get_sorted_yaml_files, read_layout_from_file, write_layout_to_file
+from gooddata_sdk.utils import (
+    IncrementalLayoutFolder,
+    create_directory,
+    get_sorted_yaml_files,
+    load_layout_objects,
+    read_layout_from_file,
+    store_layout_objects,
+    write_layout_to_file,
+)
 
 LAYOUT_WORKSPACES_DIR = "workspaces"
 LAYOUT_WORKSPACES_DATA_FILTERS_DIR = "workspaces_data_filters"
@@ -54,16 +63,16 @@ class CatalogDeclarativeWorkspaceModel(Base):
     def client_class() -> type[DeclarativeWorkspaceModel]:
         return DeclarativeWorkspaceModel
 
-    def store_to_disk(self, workspace_folder: Path) -> None:
+    def store_to_disk(self, workspace_folder: Path, incremental: bool = False) -> None:
         if self.ldm is not None:
-            self.ldm.store_to_disk(workspace_folder)
+            self.ldm.store_to_disk(workspace_folder, incremental)
         if self.analytics is not None:
-            self.analytics.store_to_disk(workspace_folder)
+            self.analytics.store_to_disk(workspace_folder, incremental)
 
     @classmethod
-    def load_from_disk(cls, workspace_folder: Path) -> CatalogDeclarativeWorkspaceModel:
-        ldm = CatalogDeclarativeLdm.load_from_disk(workspace_folder)
-        analytics = CatalogDeclarativeAnalyticsLayer.load_from_disk(workspace_folder)
+    def load_from_disk(cls, workspace_folder: Path, incremental: bool = False) -> CatalogDeclarativeWorkspaceModel:
+        ldm = CatalogDeclarativeLdm.load_from_disk(workspace_folder, incremental)
+        analytics = CatalogDeclarativeAnalyticsLayer.load_from_disk(workspace_folder, incremental)
         return cls(ldm=ldm, analytics=analytics)
 
     def remove_wdf_refs(self) -> None:
@@ -101,23 +110,33 @@ class CatalogDeclarativeWorkspace(Base):
             del dictionary["model"]
         return client_class.from_dict(dictionary, camel_case=False)
 
-    def store_to_disk(self, workspaces_folder: Path) -> None:
+    def store_to_disk(self, workspaces_folder: Path, incremental: bool = False) -> None:
         workspace_folder = workspaces_folder / self.id
         file_path = workspace_folder / f"{self.id}.yaml"
         create_directory(workspace_folder)
 
         workspace_dict = self.to_api(include_nested_structures=False).to_dict(camel_case=True)
-        write_layout_to_file(file_path, workspace_dict)
+        if incremental:
+            IncrementalLayoutFolder(workspace_folder).store({self.id: workspace_dict})
+        else:
+            write_layout_to_file(file_path, workspace_dict)
 
         if self.model is not None:
-            self.model.store_to_disk(workspace_folder)
+            self.model.store_to_disk(workspace_folder, incremental)
 
     @classmethod
-    def load_from_disk(cls, workspaces_folder: Path, workspace_id: str) -> CatalogDeclarativeWorkspace:
+    def load_from_disk(
+        cls, workspaces_folder: Path, workspace_id: str, incremental: bool = False
+    ) -> CatalogDeclarativeWorkspace:
         workspace_folder = workspaces_folder / workspace_id
         workspace_file_path = workspace_folder / f"{workspace_id}.yaml"
-        model = CatalogDeclarativeWorkspaceModel.load_from_disk(workspace_folder)
-        workspace_layout_data = read_layout_from_file(workspace_file_path)
+        model = CatalogDeclarativeWorkspaceModel.load_from_disk(workspace_folder, incremental)
+        if incremental:
+            workspace_layout_data = IncrementalLayoutFolder(workspace_folder).load().get(workspace_id)
+            if workspace_layout_data is None:
+                raise ValueError(f"There is no file in the given path {workspace_file_path}")
+        else:
+            workspace_layout_data = read_layout_from_file(workspace_file_path)
         workspace_layout = CatalogDeclarativeWorkspace.from_dict(workspace_layout_data, camel_case=True)
         workspace_layout.model = model
         return workspace_layout
@@ -358,29 +377,55 @@ class CatalogDeclarativeWorkspaces(Base):
     def filter_views_folder(layout_organization_folder: Path) -> Path:
         return layout_organization_folder / LAYOUT_FILTER_VIEWS_DIR
 
-    def store_to_disk(self, layout_organization_folder: Path) -> None:
+    def store_to_disk(self, layout_organization_folder: Path, incremental: bool = False) -> None:
+        """Stores the workspaces and workspace data filters to the organization folder, one file per object.
+
+        Args:
+            layout_organization_folder (Path):
+                Folder of the organization.
+            incremental (bool, optional):
+                If true, only the files of changed objects are rewritten and files and folders of objects
+                which are no longer part of the layout are deleted. See IncrementalLayoutFolder.
+                Defaults to False.
+        """
         workspaces_folder = self.workspaces_folder(layout_organization_folder)
         workspaces_data_filters_folder = self.workspace_data_filters_folder(layout_organization_folder)
         create_directory(workspaces_folder)
         create_directory(workspaces_data_filters_folder)
         for workspace in self.workspaces:
-            workspace.store_to_disk(workspaces_folder)
-        for workspace_data_filter in self.workspace_data_filters:
-            workspace_data_filter.store_to_disk(workspaces_data_filters_folder)
+            workspace.store_to_disk(workspaces_folder, incremental)
+        if incremental:
+            workspace_ids = {workspace.id for workspace in self.workspaces}
+            for stale_folder in [p for p in workspaces_folder.iterdir() if p.is_dir() and p.name not in workspace_ids]:
+                rmtree(stale_folder)
+        store_layout_objects(workspaces_data_filters_folder, self.workspace_data_filters, incremental)
 
     @classmethod
-    def load_from_disk(cls, layout_organization_folder: Path) -> CatalogDeclarativeWorkspaces:
+    def load_from_disk(
+        cls, layout_organization_folder: Path, incremental: bool = False
+    ) -> CatalogDeclarativeWorkspaces:
+        """Loads the workspaces and workspace data filters stored using `store_to_disk`.
+
+        Args:
+            layout_organization_folder (Path):
+                Folder of the organization.
+            incremental (bool, optional):
+                If true, only the files which changed since the last incremental load are parsed.
+                See IncrementalLayoutFolder. Defaults to False.
+
+        Returns:
+            CatalogDeclarativeWorkspaces:
+                Declarative workspaces.
+        """
         workspaces_folder = cls.workspaces_folder(layout_organization_folder)
         workspace_data_filters_folder = cls.workspace_data_filters_folder(layout_organization_folder)
         workspace_ids = sorted([p.stem for p in workspaces_folder.iterdir() if p.is_dir()])
-        workspace_data_filters_files = get_sorted_yaml_files(workspace_data_filters_folder)
 
         workspaces = [
-            CatalogDeclarativeWorkspace.load_from_disk(workspaces_folder, workspace_id)
+            CatalogDeclarativeWorkspace.load_from_disk(workspaces_folder, workspace_id, incremental)
             for workspace_id in workspace_ids
         ]
-        workspace_data_filters = [
-            CatalogDeclarativeWorkspaceDataFilter.load_from_disk(workspace_data_filters_file)
-            for workspace_data_filters_file in workspace_data_filters_files
-        ]
+        workspace_data_filters = load_layout_objects(
+            workspace_data_filters_folder, CatalogDeclarativeWorkspaceDataFilter, incremental
+        )
         return cls(workspaces=workspaces, workspace_data_filters=workspace_data_filters)
@@ -1,6 +1,7 @@
 # (C) 2022 GoodData Corporation
 from __future__ import annotations
 
+import functools
 from typing import Any, Optional, Union, cast
 
 import attr
@@ -68,12 +69,15 @@ class CatalogAttribute(AttrCatalogEntity):
         # use cast as mypy is not applying next, it claims, type is filter[CatalogLabel]
         return cast(Union[CatalogLabel, None], next(filter(lambda x: x.primary, self.labels), None))
 
+    @functools.cached_property
+    def _labels_idx(self) -> dict[str, CatalogLabel]:
+        labels_idx: dict[str, CatalogLabel] = {}
+        for label in self.labels:
+            labels_idx.setdefault(str(label.obj_id), label)
+        return labels_idx
+
     def find_label(self, id_obj: IdObjType) -> Union[CatalogLabel, None]:
-        obj_key = id_obj_to_key(id_obj)
-        # use cast as mypy is not applying next, it claims, type is filter[CatalogLabel]
-        return cast(
-            Union[CatalogLabel, None], next(filter(lambda x: id_obj_to_key(x.obj_id) == obj_key, self.labels), None)
-        )
+        return self._labels_idx.get(id_obj_to_key(id_obj))
 
     # TODO add missing properties
 
@@ -163,12 +167,16 @@ class CatalogDataset(AttrCatalogEntity):
     def client_class() -> Any:
         return JsonApiDatasetOut
 
-    def find_label_attribute(self, id_obj: IdObjType) -> Union[CatalogAttribute, None]:
+    @functools.cached_property
+    def _label_attribute_idx(self) -> dict[str, CatalogAttribute]:
+        label_attribute_idx: dict[str, CatalogAttribute] = {}
         for attribute in self.attributes:
-            if attribute.find_label(id_obj) is not None:
-                return attribute
+            for label_key in attribute._labels_idx:
+                label_attribute_idx.setdefault(label_key, attribute)
+        return label_attribute_idx
 
-        return None
+    def find_label_attribute(self, id_obj: IdObjType) -> Union[CatalogAttribute, None]:
+        return self._label_attribute_idx.get(id_obj_to_key(id_obj))
 
     def filter_dataset(self, valid_objects: ValidObjects) -> Optional[CatalogDataset]:
         """
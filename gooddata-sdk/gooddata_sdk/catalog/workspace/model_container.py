@@ -17,7 +17,7 @@ from gooddata_sdk.compute.model.base import ObjId
 from gooddata_sdk.compute.model.execution import ExecutionDefinition
 from gooddata_sdk.compute.model.filter import Filter
 from gooddata_sdk.compute.model.metric import Metric
-from gooddata_sdk.utils import AllPagedEntities, IdObjType
+from gooddata_sdk.utils import AllPagedEntities, IdObjType, id_obj_to_key
 
 ValidObjectTypes = Union[Attribute, Metric, Filter, CatalogLabel, CatalogFact, CatalogMetric]
 
@@ -37,6 +37,16 @@ class CatalogWorkspaceContent:
         self._metrics = metrics
         self._metric_idx = dict([(str(m.obj_id), m) for m in metrics])
         self._datasets_idx = dict([(str(d.obj_id), d) for d in datasets])
+        self._label_attribute_idx: dict[str, CatalogAttribute] = {}
+        self._attribute_dataset_idx: dict[str, CatalogDataset] = {}
+        self._fact_idx: dict[str, CatalogFact] = {}
+        for dataset in datasets:
+            for label_key, attribute in dataset._label_attribute_idx.items():
+                self._label_attribute_idx.setdefault(label_key, attribute)
+            for attribute in dataset.attributes:
+                self._attribute_dataset_idx.setdefault(str(attribute.obj_id), dataset)
+            for fact in dataset.facts:
+                self._fact_idx.setdefault(str(fact.obj_id), fact)
 
     @property
     def datasets(self) -> list[CatalogDataset]:
@@ -108,15 +118,51 @@ class CatalogWorkspaceContent:
 
         return self._datasets_idx.get(obj_id_str)
 
-    def find_label_attribute(self, id_obj: IdObjType) -> Union[CatalogAttribute, None]:
-        """Get attribute by label id."""
-        for dataset in self._datasets:
-            res = dataset.find_label_attribute(id_obj)
+    def get_fact(self, fact_id: Union[str, ObjId]) -> Union[CatalogFact, None]:
+        """
+        Gets fact by id. The id can be either an instance of ObjId or string containing serialized ObjId
+        ('fact/some.fact.id') or contain just the id part ('some.fact.id').
+
+        Args:
+            fact_id: fully qualified fact entity id (type/id) or just the identifier of fact entity
+
+        Returns:
+            CatalogFact: instance of CatalogFact or None if no such fact in catalog
+
+        """
+        if isinstance(fact_id, ObjId):
+            obj_id_str = str(fact_id)
+        elif not fact_id.startswith("fact/"):
+            obj_id_str = f"fact/{fact_id}"
+        else:
+            obj_id_str = fact_id
+
+        return self._fact_idx.get(obj_id_str)
 
-            if res is not None:
-                return res
+    def get_attribute_dataset(self, attribute_id: Union[str, ObjId]) -> Union[CatalogDataset, None]:
+        """
+        Gets dataset which contains the attribute. The id can be either an instance of ObjId or string containing
+        serialized ObjId ('attribute/some.attribute.id') or contain just the id part ('some.attribute.id').
+
+        Args:
+            attribute_id: fully qualified attribute entity id (type/id) or just the identifier of attribute entity
 
-        return None
+        Returns:
+            CatalogDataset: instance of CatalogDataset or None if no such attribute in catalog
+
+        """
+        if isinstance(attribute_id, ObjId):
+            obj_id_str = str(attribute_id)
+        elif not attribute_id.startswith("attribute/"):
+            obj_id_str = f"attribute/{attribute_id}"
+        else:
+            obj_id_str = attribute_id
+
+        return self._attribute_dataset_idx.get(obj_id_str)
+
+    def find_label_attribute(self, id_obj: IdObjType) -> Union[CatalogAttribute, None]:
+        """Get attribute by label id."""
+        return self._label_attribute_idx.get(id_obj_to_key(id_obj))
 
     def _valid_objects(self, ctx: ValidObjectsInputType) -> ValidObjects:
         if self._valid_obj_fun:
@@ -13,13 +13,14 @@ from typing import Any, Callable, Optional
 from xml.etree import ElementTree as ET
 
 import attrs
-from gooddata_api_client.api.translations_api import LocaleRequest
 from gooddata_api_client.exceptions import NotFoundException
+from gooddata_api_client.model.locale_request import LocaleRequest
 from gooddata_api_client.model.resolve_settings_request import ResolveSettingsRequest
 
 from gooddata_sdk import CatalogDeclarativeAutomation
 from gooddata_sdk.catalog.catalog_service_base import CatalogServiceBase
 from gooddata_sdk.catalog.permission.service import CatalogPermissionService
+from gooddata_sdk.catalog.workspace.content_service import CatalogWorkspaceContentService
 from gooddata_sdk.catalog.workspace.declarative_model.workspace.workspace import (
     CatalogDeclarativeFilterView,
     CatalogDeclarativeUserDataFilters,
@@ -53,9 +54,17 @@ logger = logging.getLogger(__name__)
 
 
 class CatalogWorkspaceService(CatalogServiceBase):
-    def __init__(self, api_client: GoodDataApiClient) -> None:
+    def __init__(
+        self, api_client: GoodDataApiClient, content_service: Optional[CatalogWorkspaceContentService] = None
+    ) -> None:
         super().__init__(api_client)
         self._permissions_service = CatalogPermissionService(api_client)
+        # its catalog cache is invalidated whenever the content of workspaces is replaced or deleted
+        self._content_service = content_service
+
+    def _invalidate_catalog_cache(self, workspace_id: Optional[str] = None) -> None:
+        if self._content_service is not None:
+            self._content_service.invalidate_catalog_cache(workspace_id)
 
     # Entities methods
 
@@ -129,10 +138,15 @@ class CatalogWorkspaceService(CatalogServiceBase):
                 f"This workspace is parent of the following workspaces: {', '.join(children)}. "
             )
         self._entities_api.delete_entity_workspaces(workspace_id)
+        self._invalidate_catalog_cache(workspace_id)
 
-    def list_workspaces(self) -> list[CatalogWorkspace]:
+    def list_workspaces(self, max_concurrency: int = 1) -> list[CatalogWorkspace]:
         """Returns a list of all workspaces in current organization
 
+        Args:
+            max_concurrency (int):
+                Max number of pages fetched at the same time. Defaults to 1.
+
         Returns:
             list[CatalogWorkspace]: List of workspaces in the current organization.
 
@@ -142,7 +156,7 @@ class CatalogWorkspaceService(CatalogServiceBase):
             include=["workspaces"],
             _check_return_type=False,
         )
-        workspaces = load_all_entities(get_workspaces)
+        workspaces = load_all_entities(get_workspaces, max_concurrency=max_concurrency)
         return [CatalogWorkspace.from_api(w) for w in workspaces.data]
 
     def create_or_update_workspace_setting(self, workspace_id: str, workspace_setting: CatalogWorkspaceSetting) -> None:
@@ -246,7 +260,8 @@ class CatalogWorkspaceService(CatalogServiceBase):
         if exclude is None:
             exclude = []
         return CatalogDeclarativeWorkspaces.from_dict(
-            self._layout_api.get_workspaces_layout(exclude=exclude).to_dict(camel_case=False), camel_case=False
+            self._client.call_json(self._layout_api.get_workspaces_layout, exclude=exclude, camel_case=False),
+            camel_case=False,
         )
 
     def put_declarative_workspaces(self, workspace: CatalogDeclarativeWorkspaces) -> None:
@@ -261,30 +276,41 @@ class CatalogWorkspaceService(CatalogServiceBase):
             None
         """
         self._layout_api.set_workspaces_layout(workspace.to_api())
+        self._invalidate_catalog_cache()
 
-    def store_declarative_workspaces(self, layout_root_path: Path = Path.cwd()) -> None:
+    def store_declarative_workspaces(self, layout_root_path: Path = Path.cwd(), incremental: bool = False) -> None:
         """Stores declarative workspaces in a given path, as folder hierarchy.
 
         Args:
             layout_root_path (Path, optional):
                 Path to the root of the layout directory. Defaults to Path.cwd().
+            incremental (bool, optional):
+                If true, only the files of changed objects are rewritten and files of objects which are
+                no longer part of the layout are deleted. Defaults to False.
 
         Returns:
             None
         """
-        self.get_declarative_workspaces().store_to_disk(self.layout_organization_folder(layout_root_path))
+        self.get_declarative_workspaces().store_to_disk(self.layout_organization_folder(layout_root_path), incremental)
 
-    def load_declarative_workspaces(self, layout_root_path: Path = Path.cwd()) -> CatalogDeclarativeWorkspaces:
+    def load_declarative_workspaces(
+        self, layout_root_path: Path = Path.cwd(), incremental: bool = False
+    ) -> CatalogDeclarativeWorkspaces:
         """Load declarative workspaces layout, which was stored using `store_declarative_workspaces`
 
         Args:
             layout_root_path (Path, optional):
                 Path to the root of the layout directory. Defaults to Path.cwd().
+            incremental (bool, optional):
+                If true, parsed layout files are cached and only the files which changed since
+                the last incremental load are parsed. Defaults to False.
         Returns:
             CatalogDeclarativeWorkspaces:
                 Declarative Workspaces Object
         """
-        return CatalogDeclarativeWorkspaces.load_from_disk(self.layout_organization_folder(layout_root_path))
+        return CatalogDeclarativeWorkspaces.load_from_disk(
+            self.layout_organization_folder(layout_root_path), incremental
+        )
 
     def load_and_put_declarative_workspaces(self, layout_root_path: Path = Path.cwd()) -> None:
         """Loads and sets the layouts stored using `store_declarative_workspaces`.
@@ -322,7 +348,9 @@ class CatalogWorkspaceService(CatalogServiceBase):
         if exclude is None:
             exclude = []
         return CatalogDeclarativeWorkspaceModel.from_dict(
-            self._layout_api.get_workspace_layout(workspace_id=workspace_id, exclude=exclude).to_dict(camel_case=False),
+            self._client.call_json(
+                self._layout_api.get_workspace_layout, workspace_id=workspace_id, exclude=exclude, camel_case=False
+            ),
             camel_case=False,
         )
 
@@ -346,6 +374,7 @@ class CatalogWorkspaceService(CatalogServiceBase):
             workspace = copy.deepcopy(workspace)
             workspace.remove_wdf_refs()
         self._layout_api.put_workspace_layout(workspace_id, workspace.to_api())
+        self._invalidate_catalog_cache(workspace_id)
 
     def store_declarative_workspace(
         self, workspace_id: str, layout_root_path: Path = Path.cwd(), exclude: Optional[list[str]] = None
@@ -3,17 +3,190 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import functools
+import json
+import socket
+from typing import Any, Callable, Optional, Union
 
 import gooddata_api_client as api_client
 import requests
-from gooddata_api_client import apis
+from attrs import define, field
+from gooddata_api_client import apis, rest
+from gooddata_api_client.model_utils import ModelComposed, ModelNormal
+from requests.adapters import DEFAULT_RETRIES, HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 
 from gooddata_sdk import __version__
 from gooddata_sdk.utils import HttpMethod
 
 USER_AGENT = f"gooddata-python-sdk/{__version__}"
 
+RequestTimeout = Union[None, float, tuple[Optional[float], Optional[float]]]
+# timeout understood by both the generated client and requests
+HttpTimeout = Union[None, tuple[float, float], tuple[float, None]]
+
+
+@functools.cache
+def _import_orjson() -> Any:
+    try:
+        import orjson
+    except ImportError:
+        return None
+
+    return orjson
+
+
+def loads_json(data: Union[bytes, str]) -> Any:
+    """
+    Parses JSON document. orjson is used when it is installed, see 'gooddata-sdk[fast-json]'.
+    """
+    orjson = _import_orjson()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.cache
+def _model_properties(model_class: Any) -> dict[str, tuple[str, tuple[Any, ...]]]:
+    """
+    Maps JSON keys of the model properties to their python names and OpenAPI types.
+    """
+    composed_schemas = model_class._composed_schemas if issubclass(model_class, ModelComposed) else {}
+    model_classes = [model_class, *(c for schemas in composed_schemas.values() for c in schemas)]
+    properties: dict[str, tuple[str, tuple[Any, ...]]] = {}
+    for cls in model_classes:
+        for name, json_key in cls.attribute_map.items():
+            properties.setdefault(json_key, (name, cls.openapi_types[name]))
+    return properties
+
+
+def _json_to_python_names(data: Any, types: tuple[Any, ...]) -> Any:
+    """
+    Renames the keys of raw JSON to python names of the properties of the given OpenAPI types. The result is
+    the same as `model.to_dict(camel_case=False)` of the deserialized model, the models are not constructed though.
+    Free-form objects are kept as they are.
+    """
+    if isinstance(data, dict):
+        for t in types:
+            if isinstance(t, type) and issubclass(t, (ModelNormal, ModelComposed)):
+                properties = _model_properties(t)
+                result = {}
+                for key, value in data.items():
+                    if key in properties:
+                        name, value_types = properties[key]
+                        result[name] = _json_to_python_names(value, value_types)
+                    else:
+                        result[key] = value
+                return result
+            if isinstance(t, dict):
+                (value_types,) = t.values()
+                return {key: _json_to_python_names(value, value_types) for key, value in data.items()}
+    elif isinstance(data, list):
+        for t in types:
+            if isinstance(t, list):
+                return [_json_to_python_names(item, tuple(t)) for item in data]
+    return data
+
+
+@define(frozen=True)
+class HttpConfig:
+    """
+    Configuration of HTTP connections made by GoodDataApiClient.
+
+    Connections are pooled and reused, both by the generated API client and by the raw requests made
+    by `do_request`. Retrying is opt-in: when `retries` is set, failed requests of idempotent methods
+    (GET, HEAD, PUT, DELETE, OPTIONS, TRACE) are retried with exponential backoff - on connection errors and
+    on the `retry_statuses`; requests of other methods, e.g. POST, are never retried.
+
+    Attributes:
+        pool_size (int): Number of per-host connection pools kept around. Defaults to 4.
+        max_connections_per_host (Optional[int]): Maximum number of connections kept open to a single host.
+            Defaults to None - five connections per CPU.
+        keep_alive (bool): Enable TCP keep-alive probes, so that idle pooled connections are not dropped silently
+            by firewalls and load balancers. Defaults to True.
+        connect_timeout (Optional[float]): Timeout of establishing a connection in seconds. Defaults to None -
+            the same as read_timeout.
+        read_timeout (Optional[float]): Timeout of waiting for response data in seconds. Defaults to None -
+            no timeout.
+        retries (Optional[int]): Maximum number of retries of a single request. Defaults to None - the defaults
+            of the underlying libraries apply: the generated API client retries connection errors, the raw
+            requests are not retried.
+        backoff_factor (float): Backoff factor of the retries; n-th retry waits `backoff_factor * 2 ** (n - 1)`
+            seconds, unless the server sends Retry-After header. Defaults to 0.5.
+        retry_statuses (tuple[int, ...]): Response statuses the requests are retried on.
+            Defaults to 429, 502, 503 and 504.
+    """
+
+    pool_size: int = 4
+    max_connections_per_host: Optional[int] = None
+    keep_alive: bool = True
+    connect_timeout: Optional[float] = None
+    read_timeout: Optional[float] = None
+    retries: Optional[int] = None
+    backoff_factor: float = 0.5
+    retry_statuses: tuple[int, ...] = field(default=(429, 502, 503, 504), converter=tuple)
+
+    @property
+    def timeout(self) -> HttpTimeout:
+        if self.connect_timeout is None:
+            return None if self.read_timeout is None else (self.read_timeout, self.read_timeout)
+        if self.read_timeout is None:
+            return self.connect_timeout, None
+        return self.connect_timeout, self.read_timeout
+
+    def retry_policy(self) -> Optional[Retry]:
+        if self.retries is None:
+            return None
+        return Retry(
+            total=self.retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=self.retry_statuses,
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            # the last response is returned and raised as an error of the client
+            raise_on_status=False,
+        )
+
+    def socket_options(self) -> list[tuple[int, int, int]]:
+        options = list(HTTPConnection.default_socket_options)
+        if self.keep_alive:
+            options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        return options
+
+
+class _PooledRESTClientObject(rest.RESTClientObject):
+    """
+    REST client of the generated API client, which applies the default timeout to requests without explicit one.
+    """
+
+    def __init__(self, configuration: api_client.Configuration, http_config: HttpConfig) -> None:
+        super().__init__(configuration, pools_size=http_config.pool_size)
+        self._default_timeout = http_config.timeout
+
+    def request(self, *args: Any, _request_timeout: RequestTimeout = None, **kwargs: Any) -> Any:
+        if _request_timeout is None:
+            _request_timeout = self._default_timeout
+        return super().request(*args, _request_timeout=_request_timeout, **kwargs)
+
+
+class _PooledHTTPAdapter(HTTPAdapter):
+    """
+    Adapter of the requests session, which pools the connections the same way as the generated API client.
+    """
+
+    def __init__(self, http_config: HttpConfig, max_connections_per_host: int) -> None:
+        self._socket_options = http_config.socket_options()
+        retry_policy = http_config.retry_policy()
+        super().__init__(
+            pool_connections=http_config.pool_size,
+            pool_maxsize=max_connections_per_host,
+            max_retries=retry_policy if retry_policy is not None else DEFAULT_RETRIES,
+        )
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs["socket_options"] = self._socket_options
+        super().init_poolmanager(*args, **kwargs)
+
 
 class GoodDataApiClient:
     """Provide access to metadata and afm services."""
@@ -24,6 +197,8 @@ class GoodDataApiClient:
         token: str,
         custom_headers: Optional[dict[str, str]] = None,
         extra_user_agent: Optional[str] = None,
+        http_config: Optional[HttpConfig] = None,
+        raw_responses: bool = True,
     ) -> None:
         """Take url, token for connecting to GoodData.CN.
 
@@ -32,20 +207,39 @@ class GoodDataApiClient:
 
         `extra_user_agent` is optional string to be added to default http User-Agent
         header. This takes precedence over custom_headers setting.
+
+        `http_config` configures pooling, timeouts and retries of the HTTP connections,
+        see HttpConfig for the defaults.
+
+        `raw_responses` enables fast path of the hot endpoints - execution results,
+        entity listings and layouts. Their responses are parsed directly from JSON,
+        see `call_json`. When disabled, the responses are validated by the models
+        of the generated API client first.
         """
         self._hostname = host
         self._token = token
         self._custom_headers = custom_headers or {}
         self._default_headers = {"Accept-Encoding": "br, gzip, deflate"}
+        self._http_config = http_config or HttpConfig()
+        self._raw_responses = raw_responses
 
         user_agent = f"{USER_AGENT} {extra_user_agent}" if extra_user_agent is not None else USER_AGENT
 
         self._api_config = api_client.Configuration(host=host)
+        if self._http_config.max_connections_per_host is not None:
+            self._api_config.connection_pool_maxsize = self._http_config.max_connections_per_host
+        self._api_config.retries = self._http_config.retry_policy()
+        self._api_config.socket_options = self._http_config.socket_options()
         self._api_client = api_client.ApiClient(
             configuration=self._api_config,
             header_name="Authorization",
             header_value=f"Bearer {token}",
         )
+        self._api_client.rest_client = _PooledRESTClientObject(self._api_config, self._http_config)
+        self._session = requests.Session()
+        adapter = _PooledHTTPAdapter(self._http_config, self._api_config.connection_pool_maxsize)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
         self._set_default_headers(self._api_client.default_headers)
         for header_name, header_value in self._default_headers.items():
             self._api_client.default_headers[header_name] = header_value
@@ -77,13 +271,14 @@ class GoodDataApiClient:
         if not self._hostname.endswith("/"):
             endpoint = f"/{endpoint}"
 
-        response = requests.post(
+        response = self._session.post(
             url=f"{self._hostname}{endpoint}",
             headers={
                 "Content-Type": content_type,
                 "Authorization": f"Bearer {self._token}",
             },
             data=data,
+            timeout=self._http_config.timeout,
         )
 
         return response
@@ -114,11 +309,70 @@ class GoodDataApiClient:
         else:
             raise NotImplementedError("Currently only supports the POST method.")
 
+    def call_json(
+        self,
+        api_method: Callable[..., Any],
+        *args: Any,
+        camel_case: bool = True,
+        _return_http_data_only: bool = True,
+        **kwargs: Any,
+    ) -> Any:
+        """Call method of the generated API client and return its response as a dictionary.
+
+        In the raw response mode, the response body is parsed directly from JSON, the models of the generated
+        API client are neither constructed nor validated. Otherwise, the response is deserialized by the generated
+        API client and converted to a dictionary.
+
+        Args:
+            api_method (Callable[..., Any]): Method of the generated API client,
+                e.g. `client.actions_api.retrieve_result`.
+            args (Any): Positional arguments of the method.
+            camel_case (bool): Keep the keys as they are in JSON, camelCase. When False, the keys of the response
+                model properties are snake_case, as returned by `model.to_dict(camel_case=False)`. Defaults to True.
+            _return_http_data_only (bool): When False, return tuple of the dictionary, HTTP status and HTTP headers,
+                the same way as the generated API client. Defaults to True.
+            kwargs (Any): Keyword arguments of the method.
+
+        Returns:
+            Any: Dictionary of the response body, or tuple with HTTP status and headers.
+        """
+        if self._raw_responses:
+            response = api_method(*args, _preload_content=False, **kwargs)
+            data = loads_json(response.data)
+            if not camel_case:
+                endpoint = getattr(api_method.__self__, f"{api_method.__name__}_endpoint")  # type: ignore[attr-defined]
+                data = _json_to_python_names(data, endpoint.settings["response_type"])
+            status, headers = response.status, response.headers
+        else:
+            # without type checks, the nested objects are kept as they are in JSON
+            data, status, headers = api_method(
+                *args, _check_return_type=not camel_case, _return_http_data_only=False, **kwargs
+            )
+            data = data.to_dict(camel_case=camel_case)
+        if _return_http_data_only:
+            return data
+        return data, status, headers
+
     @staticmethod
     def _set_default_headers(headers: dict) -> None:
         headers["X-Requested-With"] = "XMLHttpRequest"
         headers["X-GDC-VALIDATE-RELATIONS"] = "true"
 
+    def close(self) -> None:
+        """
+        Closes all the pooled connections.
+        """
+        self._session.close()
+        self._api_client.rest_client.pool_manager.clear()
+
+    @property
+    def http_config(self) -> HttpConfig:
+        return self._http_config
+
+    @property
+    def raw_responses(self) -> bool:
+        return self._raw_responses
+
     @property
     def custom_headers(self) -> dict[str, str]:
         return self._custom_headers
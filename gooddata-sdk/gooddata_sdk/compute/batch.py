@@ -0,0 +1,118 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Generic, Optional, TypeVar
+
+from attrs import frozen
+
+from gooddata_sdk.compute.model.execution import ExecutionDefinition
+
+T = TypeVar("T")
+
+DEFAULT_BATCH_CONCURRENCY = 4
+"""
+Default number of execution definitions of a batch that are processed in parallel.
+"""
+
+
+@frozen
+class BatchItem(Generic[T]):
+    """
+    Outcome of processing a single execution definition of a batch. Failure of one item does not affect the others.
+
+    Attributes:
+        index (int): Position of the execution definition in the batch.
+        exec_def (ExecutionDefinition): The processed execution definition.
+        result (Optional[T]): Result of the processing; None if the processing failed.
+        error (Optional[Exception]): Error raised during the processing; None if the processing succeeded.
+    """
+
+    index: int
+    exec_def: ExecutionDefinition
+    result: Optional[T] = None
+    error: Optional[Exception] = None
+
+    @property
+    def is_success(self) -> bool:
+        return self.error is None
+
+    def unwrap(self) -> T:
+        """
+        Returns the result of the processing or raises the error the processing failed with.
+        """
+        if self.error is not None:
+            raise self.error
+        return self.result  # type: ignore[return-value]
+
+
+def run_batch(
+    exec_defs: list[ExecutionDefinition],
+    process: Callable[[ExecutionDefinition], T],
+    max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ordered: bool = True,
+    copy_result: Optional[Callable[[T], T]] = None,
+) -> Iterator[BatchItem[T]]:
+    """
+    Processes the execution definitions in parallel. Equal execution definitions are processed just once. The first
+    of them gets the result; the others get its copies made by `copy_result` or, if not provided, the very same
+    result object.
+
+    Args:
+        exec_defs: execution definitions to process
+        process: function processing single execution definition
+        max_concurrency: maximum number of execution definitions processed in parallel; 1 means sequentially
+        ordered: yield the items in order of the execution definitions; otherwise the items are yielded
+         as soon as they are processed
+        copy_result: function copying the result for the repeated execution definitions; None means they share
+         the result object
+
+    Returns:
+        Iterator[BatchItem[T]]: outcome of processing of each of the execution definitions
+    """
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be a positive number, got: {max_concurrency}")
+
+    indexes_by_def: dict[ExecutionDefinition, list[int]] = {}
+    for idx, exec_def in enumerate(exec_defs):
+        indexes_by_def.setdefault(exec_def, []).append(idx)
+
+    def _items(exec_def: ExecutionDefinition, future: Future[T]) -> list[BatchItem[T]]:
+        error = future.exception()
+        if error is not None:
+            if not isinstance(error, Exception):
+                raise error
+            return [BatchItem(index=idx, exec_def=exec_defs[idx], error=error) for idx in indexes_by_def[exec_def]]
+        result = future.result()
+        first_idx, *other_idxs = indexes_by_def[exec_def]
+        return [
+            BatchItem(index=first_idx, exec_def=exec_defs[first_idx], result=result),
+            *(
+                BatchItem(index=idx, exec_def=exec_defs[idx], result=copy_result(result) if copy_result else result)
+                for idx in other_idxs
+            ),
+        ]
+
+    with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="gd-batch") as executor:
+        futures = {executor.submit(process, exec_def): exec_def for exec_def in indexes_by_def}
+        try:
+            if ordered:
+                done: dict[int, BatchItem[T]] = {}
+                next_idx = 0
+                for future, exec_def in futures.items():
+                    # futures are in order of the first occurrence of each execution definition
+                    for item in _items(exec_def, future):
+                        done[item.index] = item
+                    while next_idx in done:
+                        yield done.pop(next_idx)
+                        next_idx += 1
+            else:
+                pending = set(futures)
+                while pending:
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        yield from _items(futures[future], future)
+        finally:
+            for future in futures:
+                future.cancel()
@@ -1,7 +1,9 @@
 # (C) 2022 GoodData Corporation
 from __future__ import annotations
 
-from typing import Optional, Union
+import hashlib
+import json
+from typing import Any, Optional, Union
 
 import gooddata_api_client.models as afm_models
 from gooddata_api_client.model_utils import OpenApiModel
@@ -62,6 +64,14 @@ class ObjId:
         return f"{self.type}/{self.id}"
 
 
+def canonical_fingerprint(canonical_model: Any) -> str:
+    """
+    Returns hash of a JSON-serializable structure; keys of the mappings are sorted, so their order does not matter.
+    """
+    canonical_json = json.dumps(canonical_model, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()
+
+
 class ExecModelEntity:
     def __init__(self) -> None:
         pass
@@ -69,6 +79,19 @@ class ExecModelEntity:
     def as_api_model(self) -> OpenApiModel:
         raise NotImplementedError()
 
+    def canonical_model(self) -> Any:
+        """
+        JSON-serializable representation of the entity used to compute its fingerprint. Parts of the entity
+        whose ordering has no meaning for the computation are put in a canonical order.
+        """
+        return self.as_api_model().to_dict()
+
+    def fingerprint(self) -> str:
+        """
+        Canonical hash of the entity. Entities that lead to the same computation have the same fingerprint.
+        """
+        return canonical_fingerprint(self.canonical_model())
+
 
 class Filter(ExecModelEntity):
     def __init__(self) -> None:
@@ -86,6 +109,12 @@ class Filter(ExecModelEntity):
     def as_api_model(self) -> OpenApiModel:
         raise NotImplementedError()
 
+    def canonical_model(self) -> Any:
+        if self.is_noop():
+            # noop filters cannot be converted to API model, all of them have the same effect
+            return {"noop": type(self).__name__}
+        return super().canonical_model()
+
     def description(self, labels: dict[str, str], format_locale: Optional[str] = None) -> str:
         """
         Description of the filter as it's visible for customer in UI.
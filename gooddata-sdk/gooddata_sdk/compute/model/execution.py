@@ -1,22 +1,37 @@
 # (C) 2022 GoodData Corporation
 from __future__ import annotations
 
+import itertools
 import logging
-from typing import Any, Optional, Union
+import threading
+from collections import deque
+from collections.abc import Generator, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 
 from attr.setters import frozen as frozen_attr
 from attrs import define, field
 from gooddata_api_client import models
+from gooddata_api_client.exceptions import ApiException
 from gooddata_api_client.model.afm import AFM
 from gooddata_api_client.model.result_spec import ResultSpec
 
 from gooddata_sdk.client import GoodDataApiClient
 from gooddata_sdk.compute.model.attribute import Attribute
+from gooddata_sdk.compute.model.base import canonical_fingerprint
 from gooddata_sdk.compute.model.filter import Filter
 from gooddata_sdk.compute.model.metric import Metric
 
+if TYPE_CHECKING:
+    from gooddata_sdk.compute.result_cache import ExecutionResultCache
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_PAGE_READ_CONCURRENCY = 4
+"""
+Default number of result pages that are fetched from the backend in parallel when reading all pages of a result.
+"""
+
 
 @define
 class TotalDimension:
@@ -53,6 +68,13 @@ class TableDimension:
 
 
 class ExecutionDefinition:
+    """
+    Prescription of what to compute - attributes, metrics, filters - and how to lay out the result into dimensions.
+
+    Execution definitions are compared and hashed by their fingerprint, so that equal computations can be detected.
+    The API model and the fingerprint are computed just once; do not modify the definition once it was used.
+    """
+
     def __init__(
         self,
         attributes: Optional[list[Attribute]],
@@ -66,6 +88,8 @@ class ExecutionDefinition:
         self._filters = filters or []
         self._dimensions = [dim for dim in dimensions if dim.item_ids is not None]
         self._totals = totals
+        self._api_model: Optional[models.AfmExecution] = None
+        self._fingerprint: Optional[str] = None
 
     @property
     def attributes(self) -> list[Attribute]:
@@ -192,10 +216,38 @@ class ExecutionDefinition:
         return models.ResultSpec(dimensions=dimensions, totals=totals)
 
     def as_api_model(self) -> models.AfmExecution:
-        execution = compute_model_to_api_model(attributes=self.attributes, metrics=self.metrics, filters=self.filters)
-        result_spec = self._create_result_spec()
+        if self._api_model is None:
+            execution = compute_model_to_api_model(
+                attributes=self.attributes, metrics=self.metrics, filters=self.filters
+            )
+            result_spec = self._create_result_spec()
+            self._api_model = models.AfmExecution(execution=execution, result_spec=result_spec)
+
+        return self._api_model
 
-        return models.AfmExecution(execution=execution, result_spec=result_spec)
+    def fingerprint(self) -> str:
+        """
+        Canonical hash of the execution definition. Definitions which differ just in order of attributes or filters
+        or in order of values of attribute filters lead to the same computation and have the same fingerprint.
+        """
+        if self._fingerprint is None:
+            canonical_model = {
+                "attributes": sorted((a.canonical_model() for a in self.attributes), key=canonical_fingerprint),
+                "measures": [m.canonical_model() for m in self.metrics],
+                "filters": sorted(
+                    (f.canonical_model() for f in self.filters if not f.is_noop()), key=canonical_fingerprint
+                ),
+                "result_spec": self._create_result_spec().to_dict(),
+            }
+            self._fingerprint = canonical_fingerprint(canonical_model)
+
+        return self._fingerprint
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ExecutionDefinition) and self.fingerprint() == other.fingerprint()
+
+    def __hash__(self) -> int:
+        return hash(self.fingerprint())
 
 
 ResultSizeDimensions = tuple[Optional[int], ...]
@@ -220,6 +272,20 @@ class ExecutionResult:
         self._grand_totals: list[models.ExecutionResultGrandTotal] = result["grand_totals"]
         self._paging: models.ExecutionResultPaging = result["paging"]
 
+    @classmethod
+    def from_json(cls, result: dict[str, Any]) -> ExecutionResult:
+        """
+        Creates execution result from raw JSON of the response, which is not deserialized to the API model.
+        """
+        return cls(
+            {
+                "data": result["data"],
+                "dimension_headers": result["dimensionHeaders"],
+                "grand_totals": result["grandTotals"],
+                "paging": result["paging"],
+            }
+        )
+
     @property
     def data(self) -> list[Any]:
         return self._data
@@ -286,6 +352,27 @@ class ExecutionResult:
         return f"ExecutionResult(paging={self.paging})"
 
 
+def _next_page_windows(
+    after: ExecutionResult, first_dim_only: bool = False, stop: Optional[list[int]] = None
+) -> Iterator[list[int]]:
+    """
+    Computes offsets of all pages that follow the provided page. The page count is used as the page size,
+    so the windows stay aligned even if the backend capped the requested limit. Pages starting at or beyond
+    `stop` are not included; dimensions without stop offset are read whole.
+    """
+    dim_starts = []
+    stops = stop or []
+    totals = [min(total, stops[dim]) if dim < len(stops) else total for dim, total in enumerate(after.paging_total)]
+    for dim, (offset, count, total) in enumerate(zip(after.paging_offset, after.paging_count, totals)):
+        if first_dim_only and dim > 0:
+            dim_starts.append([offset])
+        else:
+            dim_starts.append(list(range(offset, max(total, offset + 1), max(count, 1))))
+
+    # product varies the last dimension fastest; the first window is the provided page itself
+    return (list(window) for window in itertools.islice(itertools.product(*dim_starts), 1, None))
+
+
 class BareExecutionResponse:
     """
     Holds ExecutionResponse from triggered report computation and allows reading report's results.
@@ -296,10 +383,24 @@ class BareExecutionResponse:
         api_client: GoodDataApiClient,
         workspace_id: str,
         execution_response: models.AfmExecutionResponse,
+        result_cache: Optional[ExecutionResultCache] = None,
+        recompute: Optional[Callable[[], models.AfmExecutionResponse]] = None,
     ):
+        """
+        Args:
+            api_client: client to use when reading the result
+            workspace_id: workspace identifier
+            execution_response: response of the report computation
+            result_cache: cache of the result pages; defaults to None - the pages are always read from the backend
+            recompute: function computing the report again; it is called when the backend no longer holds
+             the result, e.g. because the execution response was taken from a cache
+        """
         self._api_client = api_client
         self._actions_api = self._api_client.actions_api
         self._workspace_id = workspace_id
+        self._result_cache = result_cache
+        self._recompute = recompute
+        self._recompute_lock = threading.Lock()
 
         self._exec_response: models.ExecutionResponse = execution_response["execution_response"]
         self._afm_exec_response = execution_response
@@ -328,12 +429,55 @@ class BareExecutionResponse:
         # this makes sure that offset gets defaulted to start of result
         _offset = [0 for _ in _limit] if _limit is not None and _offset is None else _offset
 
-        execution_result, _, http_headers = self._actions_api.retrieve_result(
+        result_id = self.result_id
+        if self._result_cache is not None:
+            cached_page = self._result_cache.get_page(self._workspace_id, result_id, _offset, _limit)
+            if cached_page is not None:
+                return cached_page
+
+        try:
+            page = self._retrieve_result(result_id, _offset, _limit)
+        except ApiException as e:
+            recomputed_result_id = self._recompute_result(result_id) if e.status in (404, 410) else None
+            if recomputed_result_id is None:
+                raise
+            result_id = recomputed_result_id
+            page = self._retrieve_result(result_id, _offset, _limit)
+
+        if self._result_cache is not None:
+            self._result_cache.put_page(self._workspace_id, result_id, _offset, _limit, page)
+        return page
+
+    def _recompute_result(self, expired_result_id: str) -> Optional[str]:
+        """
+        Computes the report again, once - pages may be read concurrently and all of them find the result expired.
+
+        Returns id of the recomputed result or None if the report cannot be recomputed.
+        """
+        with self._recompute_lock:
+            if self.result_id != expired_result_id:
+                # another reader already recomputed the report
+                return self.result_id
+
+            recompute = self._recompute
+            if recompute is None:
+                return None
+
+            logger.info(f"Execution result {expired_result_id} is not available anymore, recomputing the report.")
+            self._recompute = None
+            afm_exec_response = recompute()
+            self._exec_response = afm_exec_response["execution_response"]
+            self._afm_exec_response = afm_exec_response
+
+            return self.result_id
+
+    def _retrieve_result(self, result_id: str, offset: list[int], limit: list[int]) -> ExecutionResult:
+        execution_result, _, http_headers = self._api_client.call_json(
+            self._actions_api.retrieve_result,
             workspace_id=self._workspace_id,
-            result_id=self.result_id,
-            offset=_offset,
-            limit=_limit,
-            _check_return_type=False,
+            result_id=result_id,
+            offset=offset,
+            limit=limit,
             _return_http_data_only=False,
         )
         custom_headers = self._api_client.custom_headers
@@ -345,7 +489,73 @@ class BareExecutionResponse:
                     responseTraceId=http_headers["X-GDC-TRACE-ID"],
                 ),
             )
-        return ExecutionResult(execution_result)
+        return ExecutionResult.from_json(execution_result)
+
+    def read_result_pages(
+        self,
+        limit: Union[int, list[int]],
+        offset: Union[None, int, list[int]] = None,
+        max_concurrency: int = DEFAULT_PAGE_READ_CONCURRENCY,
+        first_dim_only: bool = False,
+    ) -> Generator[ExecutionResult, None, None]:
+        """
+        Reads all pages of the execution result starting at the given offset.
+
+        The first page is read right away; see `read_next_result_pages` for how the rest of the pages is read.
+        """
+        _limit = limit if isinstance(limit, list) else [limit]
+        first_page = self.read_result(limit=_limit, offset=offset)
+        yield first_page
+        yield from self.read_next_result_pages(
+            after=first_page, limit=_limit, max_concurrency=max_concurrency, first_dim_only=first_dim_only
+        )
+
+    def read_next_result_pages(
+        self,
+        after: ExecutionResult,
+        limit: Optional[list[int]] = None,
+        max_concurrency: int = DEFAULT_PAGE_READ_CONCURRENCY,
+        first_dim_only: bool = False,
+        stop: Optional[list[int]] = None,
+    ) -> Generator[ExecutionResult, None, None]:
+        """
+        Reads all pages of the execution result that follow the provided page.
+
+        The provided page carries total size of the result, so windows of all the remaining pages are known upfront.
+        Up to `max_concurrency` pages are fetched in parallel. The pages are always yielded in order - row of pages
+        by row of pages and within a row from left to right - so consumers can process them as if they were read
+        one by one.
+
+        Args:
+            after: page to continue after; its offset and count determine windows of the remaining pages
+            limit: limit to use when reading the pages; defaults to count of the provided page
+            max_concurrency: maximum number of pages fetched in parallel; 1 means the pages are read sequentially
+            first_dim_only: page only through the first dimension; other dimensions stay as in the provided page
+            stop: offsets in each dimension where the reading stops; pages starting at or beyond them are not read
+        """
+        windows = _next_page_windows(after, first_dim_only, stop)
+        _limit = limit if limit is not None else list(after.paging_count)
+
+        if max_concurrency <= 1:
+            for window in windows:
+                yield self.read_result(limit=_limit, offset=window)
+            return
+
+        # pages are requested at most max_concurrency ahead of the consumer; that bounds both the number of
+        # requests in flight and the number of pages held in memory
+        with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="gd-result-page") as executor:
+            pending: deque[Future[ExecutionResult]] = deque()
+            try:
+                for window in windows:
+                    pending.append(executor.submit(self.read_result, limit=_limit, offset=window))
+                    if len(pending) >= max_concurrency:
+                        yield pending.popleft().result()
+
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
 
     def __str__(self) -> str:
         return self.__repr__()
@@ -367,12 +577,16 @@ class Execution:
         workspace_id: str,
         exec_def: ExecutionDefinition,
         response: models.AfmExecutionResponse,
+        result_cache: Optional[ExecutionResultCache] = None,
+        recompute: Optional[Callable[[], models.AfmExecutionResponse]] = None,
     ):
         self._exec_def = exec_def
         self._bare_exec_response = BareExecutionResponse(
             api_client=api_client,
             workspace_id=workspace_id,
             execution_response=response,
+            result_cache=result_cache,
+            recompute=recompute,
         )
 
     @property
@@ -421,6 +635,25 @@ class Execution:
     def read_result(self, limit: Union[int, list[int]], offset: Union[None, int, list[int]] = None) -> ExecutionResult:
         return self.bare_exec_response.read_result(limit, offset)
 
+    def read_result_pages(
+        self,
+        limit: Union[int, list[int]],
+        offset: Union[None, int, list[int]] = None,
+        max_concurrency: int = DEFAULT_PAGE_READ_CONCURRENCY,
+        first_dim_only: bool = False,
+    ) -> Generator[ExecutionResult, None, None]:
+        return self.bare_exec_response.read_result_pages(limit, offset, max_concurrency, first_dim_only)
+
+    def read_next_result_pages(
+        self,
+        after: ExecutionResult,
+        limit: Optional[list[int]] = None,
+        max_concurrency: int = DEFAULT_PAGE_READ_CONCURRENCY,
+        first_dim_only: bool = False,
+        stop: Optional[list[int]] = None,
+    ) -> Generator[ExecutionResult, None, None]:
+        return self.bare_exec_response.read_next_result_pages(after, limit, max_concurrency, first_dim_only, stop)
+
     def __str__(self) -> str:
         return self.__repr__()
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from importlib.util import find_spec
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 if find_spec("icu") is not None:
     from icu import Locale, SimpleDateFormat  # type: ignore[import-not-found]
@@ -99,6 +99,15 @@ class AttributeFilter(Filter):
     def as_api_model(self) -> OpenApiModel:
         raise NotImplementedError()
 
+    def canonical_model(self) -> Any:
+        # the filter matches set of values, their order does not matter
+        canonical_model = super().canonical_model()
+        for body in canonical_model.values():
+            for elements in body.values():
+                if isinstance(elements, dict) and isinstance(elements.get("values"), list):
+                    elements["values"] = sorted(elements["values"], key=lambda v: (v is None, v))
+        return canonical_model
+
     def __eq__(self, other: object) -> bool:
         return isinstance(other, AttributeFilter) and self._label == other._label and self._values == other._values
 
@@ -0,0 +1,259 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from gooddata_api_client import models
+
+from gooddata_sdk.compute.model.execution import ExecutionDefinition, ExecutionResult, ResultCacheMetadata
+
+logger = logging.getLogger(__name__)
+
+_SPILL_FILE_SUFFIX = ".json"
+
+
+def _digest(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+class _LruStore:
+    """
+    Size-bounded mapping which evicts the least recently used entries and drops entries older than `ttl` seconds.
+    """
+
+    def __init__(self, max_entries: int, ttl: Optional[float]) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._entries: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def is_expired(self, stored_at: float) -> bool:
+        return self._ttl is not None and time.time() - stored_at > self._ttl
+
+    def get(self, key: tuple) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self.is_expired(entry[0]):
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: tuple, value: Any, stored_at: Optional[float] = None) -> list[tuple[tuple, Any]]:
+        """
+        Stores the value and returns the evicted (key, (stored_at, value)) pairs.
+        """
+        self._entries[key] = (time.time() if stored_at is None else stored_at, value)
+        self._entries.move_to_end(key)
+        evicted = []
+        while len(self._entries) > self._max_entries:
+            evicted.append(self._entries.popitem(last=False))
+        return evicted
+
+    def discard(self, predicate: Callable[[Any], bool]) -> None:
+        for key in [k for k in self._entries if predicate(k)]:
+            del self._entries[key]
+
+
+class ExecutionResultCache:
+    """
+    Cache of execution results computed by ComputeService.
+
+    Execution responses (holding the result id) are keyed by a canonical hash of the AFM and the result spec together
+    with the workspace id, so a repeated computation of the same execution definition does not call the backend.
+    Result cache metadata is cached as well.
+
+    When `cache_pages` is set, the result pages that were read are materialized in memory too. At most `max_pages`
+    pages are kept in memory; once there are more of them, the least recently used pages are either dropped or,
+    when `spill_dir` is set, stored as JSON into that directory.
+
+    All entries expire after `ttl` seconds. Keep the TTL shorter than the lifetime of results in the backend cache -
+    an expired result is recomputed transparently, but only when its pages are read.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl: Optional[float] = 300.0,
+        cache_pages: bool = False,
+        max_pages: int = 1024,
+        spill_dir: Optional[Path] = None,
+    ) -> None:
+        """
+        Args:
+            max_entries (int):
+                Maximum number of cached execution responses. Defaults to 256.
+            ttl (Optional[float]):
+                Number of seconds after which cached entries expire. None means that entries never expire.
+                Defaults to 300 seconds.
+            cache_pages (bool):
+                Whether the result pages should be cached as well. Defaults to False.
+            max_pages (int):
+                Maximum number of result pages kept in memory. Defaults to 1024.
+            spill_dir (Optional[Path]):
+                Directory where the pages evicted from memory are stored. Defaults to None - the evicted pages
+                are dropped.
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl must be a positive number or None, got: {ttl}")
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be a positive number, got: {max_entries}")
+        if max_pages < 1:
+            raise ValueError(f"max_pages must be a positive number, got: {max_pages}")
+
+        self._ttl = ttl
+        self._cache_pages = cache_pages
+        self._spill_dir = spill_dir
+        self._responses = _LruStore(max_entries, ttl)
+        self._metadata = _LruStore(max_entries, ttl)
+        self._pages = _LruStore(max_pages, ttl)
+        self._lock = threading.Lock()
+
+        if self._spill_dir is not None:
+            self._spill_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def ttl(self) -> Optional[float]:
+        return self._ttl
+
+    @property
+    def cache_pages(self) -> bool:
+        return self._cache_pages
+
+    @property
+    def spill_dir(self) -> Optional[Path]:
+        return self._spill_dir
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._responses)
+
+    def get_response(self, workspace_id: str, exec_def: ExecutionDefinition) -> Optional[models.AfmExecutionResponse]:
+        key = (workspace_id, exec_def.fingerprint())
+        with self._lock:
+            return self._responses.get(key)
+
+    def put_response(
+        self, workspace_id: str, exec_def: ExecutionDefinition, response: models.AfmExecutionResponse
+    ) -> None:
+        key = (workspace_id, exec_def.fingerprint())
+        with self._lock:
+            self._responses.put(key, response)
+
+    def discard_response(self, workspace_id: str, exec_def: ExecutionDefinition) -> None:
+        key = (workspace_id, exec_def.fingerprint())
+        with self._lock:
+            self._responses.discard(lambda k: k == key)
+
+    def get_metadata(self, workspace_id: str, result_id: str) -> Optional[ResultCacheMetadata]:
+        with self._lock:
+            return self._metadata.get((workspace_id, result_id))
+
+    def put_metadata(self, workspace_id: str, result_id: str, metadata: ResultCacheMetadata) -> None:
+        with self._lock:
+            self._metadata.put((workspace_id, result_id), metadata)
+
+    def get_page(
+        self, workspace_id: str, result_id: str, offset: list[int], limit: list[int]
+    ) -> Optional[ExecutionResult]:
+        if not self._cache_pages:
+            return None
+
+        key = (workspace_id, result_id, tuple(offset), tuple(limit))
+        with self._lock:
+            page = self._pages.get(key)
+        if page is None:
+            page = self._read_spilled_page(key)
+        return page
+
+    def put_page(
+        self, workspace_id: str, result_id: str, offset: list[int], limit: list[int], page: ExecutionResult
+    ) -> None:
+        if not self._cache_pages:
+            return
+
+        key = (workspace_id, result_id, tuple(offset), tuple(limit))
+        with self._lock:
+            evicted = self._pages.put(key, page)
+        for evicted_key, (stored_at, evicted_page) in evicted:
+            self._spill_page(evicted_key, stored_at, evicted_page)
+
+    def invalidate(self, workspace_id: Optional[str] = None) -> None:
+        """
+        Drops cached entries, both from memory and from the spill directory.
+
+        Args:
+            workspace_id (Optional[str]):
+                Workspace identification string e.g. "demo". When not specified, all entries are dropped.
+        """
+        with self._lock:
+            for store in (self._responses, self._metadata, self._pages):
+                store.discard(lambda k: workspace_id is None or k[0] == workspace_id)
+
+        if self._spill_dir is not None:
+            prefix = "" if workspace_id is None else f"{_digest(workspace_id)[:32]}-"
+            for path in self._spill_dir.glob(f"{prefix}*{_SPILL_FILE_SUFFIX}"):
+                path.unlink(missing_ok=True)
+
+    def _spill_path(self, key: tuple) -> Path:
+        assert self._spill_dir is not None
+        workspace_id = key[0]
+        return self._spill_dir / f"{_digest(workspace_id)[:32]}-{_digest(repr(key))[:32]}{_SPILL_FILE_SUFFIX}"
+
+    def _spill_page(self, key: tuple, stored_at: float, page: ExecutionResult) -> None:
+        if self._spill_dir is None:
+            return
+
+        path = self._spill_path(key)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        try:
+            content = json.dumps(
+                {
+                    "key": [key[0], key[1], list(key[2]), list(key[3])],
+                    "storedAt": stored_at,
+                    "result": {
+                        "data": page.data,
+                        "dimensionHeaders": page.headers,
+                        "grandTotals": page.grand_totals,
+                        "paging": page.paging,
+                    },
+                }
+            )
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(content)
+            tmp_path.replace(path)
+        except Exception as e:
+            logger.debug(f"Unable to spill result page to {path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def _read_spilled_page(self, key: tuple) -> Optional[ExecutionResult]:
+        if self._spill_dir is None:
+            return None
+
+        path = self._spill_path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                stored = json.load(f)
+            workspace_id, result_id, offset, limit = stored["key"]
+            if (workspace_id, result_id, tuple(offset), tuple(limit)) != key:
+                return None
+            stored_at = float(stored["storedAt"])
+            if self._pages.is_expired(stored_at):
+                path.unlink(missing_ok=True)
+                return None
+            return ExecutionResult.from_json(stored["result"])
+        except FileNotFoundError:
+            return None
+        except Exception:
+            path.unlink(missing_ok=True)
+            return None
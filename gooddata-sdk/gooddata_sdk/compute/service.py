@@ -1,15 +1,21 @@
 # (C) 2022 GoodData Corporation
 from __future__ import annotations
 
+import functools
 import logging
+from collections.abc import Iterator
+from typing import Optional
 
+from gooddata_api_client import models
 from gooddata_api_client.model.chat_history_request import ChatHistoryRequest
 from gooddata_api_client.model.chat_history_result import ChatHistoryResult
 from gooddata_api_client.model.chat_request import ChatRequest
 from gooddata_api_client.model.chat_result import ChatResult
 
 from gooddata_sdk.client import GoodDataApiClient
+from gooddata_sdk.compute.batch import DEFAULT_BATCH_CONCURRENCY, BatchItem, run_batch
 from gooddata_sdk.compute.model.execution import Execution, ExecutionDefinition, ResultCacheMetadata
+from gooddata_sdk.compute.result_cache import ExecutionResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -21,28 +27,83 @@ class ComputeService:
     dimensions that influence how to organize the data in the result.
     """
 
-    def __init__(self, api_client: GoodDataApiClient):
+    def __init__(self, api_client: GoodDataApiClient, result_cache: Optional[ExecutionResultCache] = None):
         self._api_client = api_client
         self._actions_api = self._api_client.actions_api
+        self._result_cache = result_cache
+
+    @property
+    def result_cache(self) -> Optional[ExecutionResultCache]:
+        return self._result_cache
 
     def for_exec_def(self, workspace_id: str, exec_def: ExecutionDefinition) -> Execution:
         """
         Starts computation in GoodData.CN workspace, using the provided execution definition.
 
+        When the service has a result cache, a repeated computation of the same execution definition reuses
+        the cached execution response and does not call the backend.
+
         Args:
             workspace_id: workspace identifier
             exec_def: execution definition - this prescribes what to calculate, how to place labels and metric values
          into dimensions
         """
-        response = self._actions_api.compute_report(workspace_id, exec_def.as_api_model(), _check_return_type=False)
+        response = None
+        recompute = None
+        if self._result_cache is not None:
+            response = self._result_cache.get_response(workspace_id, exec_def)
+            if response is not None:
+                recompute = functools.partial(self._compute_report, workspace_id, exec_def)
+
+        if response is None:
+            response = self._compute_report(workspace_id, exec_def)
 
         return Execution(
             api_client=self._api_client,
             workspace_id=workspace_id,
             exec_def=exec_def,
             response=response,
+            result_cache=self._result_cache,
+            recompute=recompute,
+        )
+
+    def for_exec_defs(
+        self,
+        workspace_id: str,
+        exec_defs: list[ExecutionDefinition],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        ordered: bool = True,
+    ) -> Iterator[BatchItem[Execution]]:
+        """
+        Starts computations of multiple execution definitions in GoodData.CN workspace in parallel.
+
+        A failed computation does not stop the other ones - the error is reported by the corresponding item.
+        Equal execution definitions are computed just once; their items share the same Execution. All the computations
+        share the connection pool of the API client.
+
+        Args:
+            workspace_id: workspace identifier
+            exec_defs: execution definitions to compute
+            max_concurrency: maximum number of computations running in parallel
+            ordered: yield the items in order of the execution definitions; otherwise the items are yielded
+             as soon as the computations finish
+
+        Returns:
+            Iterator[BatchItem[Execution]]: item for each of the execution definitions
+        """
+        return run_batch(
+            exec_defs,
+            functools.partial(self.for_exec_def, workspace_id),
+            max_concurrency=max_concurrency,
+            ordered=ordered,
         )
 
+    def _compute_report(self, workspace_id: str, exec_def: ExecutionDefinition) -> models.AfmExecutionResponse:
+        response = self._actions_api.compute_report(workspace_id, exec_def.as_api_model(), _check_return_type=False)
+        if self._result_cache is not None:
+            self._result_cache.put_response(workspace_id, exec_def, response)
+        return response
+
     def retrieve_result_cache_metadata(self, workspace_id: str, result_id: str) -> ResultCacheMetadata:
         """
         Gets execution result's metadata from GoodData.CN workspace for given execution result ID.
@@ -53,6 +114,11 @@ class ComputeService:
         Returns:
             ResultCacheMetadata: execution result's metadata
         """
+        if self._result_cache is not None:
+            cached_metadata = self._result_cache.get_metadata(workspace_id, result_id)
+            if cached_metadata is not None:
+                return cached_metadata
+
         result_cache_metadata, _, http_headers = self._actions_api.retrieve_execution_metadata(
             workspace_id,
             result_id,
@@ -68,7 +134,10 @@ class ComputeService:
                     responseTraceId=http_headers["X-GDC-TRACE-ID"],
                 ),
             )
-        return ResultCacheMetadata(result_cache_metadata=result_cache_metadata)
+        metadata = ResultCacheMetadata(result_cache_metadata=result_cache_metadata)
+        if self._result_cache is not None:
+            self._result_cache.put_metadata(workspace_id, result_id, metadata)
+        return metadata
 
     def ai_chat(self, workspace_id: str, question: str) -> ChatResult:
         """
@@ -9,9 +9,11 @@ from gooddata_sdk.catalog.export.service import ExportService
 from gooddata_sdk.catalog.organization.service import CatalogOrganizationService
 from gooddata_sdk.catalog.permission.service import CatalogPermissionService
 from gooddata_sdk.catalog.user.service import CatalogUserService
+from gooddata_sdk.catalog.workspace.catalog_cache import CatalogCache
 from gooddata_sdk.catalog.workspace.content_service import CatalogWorkspaceContentService
 from gooddata_sdk.catalog.workspace.service import CatalogWorkspaceService
-from gooddata_sdk.client import GoodDataApiClient
+from gooddata_sdk.client import GoodDataApiClient, HttpConfig
+from gooddata_sdk.compute.result_cache import ExecutionResultCache
 from gooddata_sdk.compute.service import ComputeService
 from gooddata_sdk.support import SupportService
 from gooddata_sdk.table import TableService
@@ -46,6 +48,9 @@ class GoodDataSdk:
         host_: str,
         token_: str,
         extra_user_agent_: Optional[str] = None,
+        catalog_cache_: Optional[CatalogCache] = None,
+        result_cache_: Optional[ExecutionResultCache] = None,
+        http_config_: Optional[HttpConfig] = None,
         **custom_headers_: Optional[str],
     ) -> GoodDataSdk:
         """
@@ -53,13 +58,28 @@ class GoodDataSdk:
         Custom headers are filtered. Headers with None value are removed. It simplifies usage because headers
         can be created directly from optional values.
 
+        When catalog cache is provided, workspace catalogs are cached by the catalog_workspace_content service.
+        When result cache is provided, execution results are cached by the compute and tables services.
+        HTTP connection pooling, timeouts and retries are configured by http_config, see HttpConfig.
+
         This is preferred way of creating GoodDataSdk, when no tweaks are needed.
         """
         filtered_headers = {key: value for key, value in custom_headers_.items() if value is not None}
-        client = GoodDataApiClient(host_, token_, custom_headers=filtered_headers, extra_user_agent=extra_user_agent_)
-        return cls(client)
-
-    def __init__(self, client: GoodDataApiClient) -> None:
+        client = GoodDataApiClient(
+            host_,
+            token_,
+            custom_headers=filtered_headers,
+            extra_user_agent=extra_user_agent_,
+            http_config=http_config_,
+        )
+        return cls(client, catalog_cache=catalog_cache_, result_cache=result_cache_)
+
+    def __init__(
+        self,
+        client: GoodDataApiClient,
+        catalog_cache: Optional[CatalogCache] = None,
+        result_cache: Optional[ExecutionResultCache] = None,
+    ) -> None:
         """Take instance of GoodDataApiClient and return new GoodDataSdk instance.
 
         Useful when customized GoodDataApiClient is needed. Usually users should use
@@ -67,14 +87,14 @@ class GoodDataSdk:
         """
         self._client = client
 
-        self._catalog_workspace = CatalogWorkspaceService(self._client)
-        self._catalog_workspace_content = CatalogWorkspaceContentService(self._client)
+        self._catalog_workspace_content = CatalogWorkspaceContentService(self._client, catalog_cache=catalog_cache)
+        self._catalog_workspace = CatalogWorkspaceService(self._client, content_service=self._catalog_workspace_content)
         self._catalog_data_source = CatalogDataSourceService(self._client)
         self._catalog_organization = CatalogOrganizationService(self._client)
         self._catalog_user = CatalogUserService(self._client)
-        self._compute = ComputeService(self._client)
+        self._compute = ComputeService(self._client, result_cache=result_cache)
         self._visualizations = VisualizationService(self._client)
-        self._tables = TableService(self._client)
+        self._tables = TableService(self._client, result_cache=result_cache)
         self._support = SupportService(self._client)
         self._catalog_permission = CatalogPermissionService(self._client)
         self._export = ExportService(self._client)
@@ -2,9 +2,9 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
 from operator import attrgetter
-from typing import Any, Callable, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 
 from attrs import define, field, frozen
 from attrs.setters import frozen as frozen_attr
@@ -21,6 +21,7 @@ from gooddata_sdk.compute.model.execution import (
 from gooddata_sdk.compute.model.execution import TableDimension as ExecTableDimension
 from gooddata_sdk.compute.model.filter import Filter
 from gooddata_sdk.compute.model.metric import Metric
+from gooddata_sdk.compute.result_cache import ExecutionResultCache
 from gooddata_sdk.compute.service import ComputeService
 from gooddata_sdk.visualization import (
     AttributeSortType,
@@ -36,6 +37,9 @@ from gooddata_sdk.visualization import (
     VisualizationTotal,
 )
 
+if TYPE_CHECKING:
+    import pyarrow
+
 logger = logging.getLogger(__name__)
 
 _MEASURE_GROUP_IDENTIFIER = "measureGroup"
@@ -43,7 +47,7 @@ _TOTAL_ORDER = ["SUM", "MAX", "MIN", "AVG", "MED", "NAT"]
 
 _TABLE_ROW_BATCH_SIZE = 512
 """
-Number of rows that the code reads from backed at once.
+Default number of rows that the code reads from backed at once.
 """
 
 _MAX_METRICS = 256
@@ -101,13 +105,29 @@ class ExecutionTable:
        first dimension (paging.total[0])
     -  just metrics = single row, all metrics values returned in one row
 
+    By default, the table keeps all the pages it has read so that it can be read repeatedly. When created in
+    streaming mode, the table drops each page as soon as its rows are consumed, so the memory stays constant
+    regardless of the size of the result. Streaming table can be read just once.
+
+    When row limit is set, the table contains just the first `row_limit` rows of the result. Pages beyond the limit
+    are not read from the backend.
     """
 
-    def __init__(self, response: ExecutionResponse, first_page: ExecutionResult) -> None:
+    def __init__(
+        self,
+        response: ExecutionResponse,
+        first_page: ExecutionResult,
+        streaming: bool = False,
+        row_limit: Optional[int] = None,
+    ) -> None:
         self._exec_def = response.exec_def
         self._response = response
         self._first_page = first_page
         self._pages = [first_page]
+        self._next_pages: Optional[Iterator[ExecutionResult]] = None
+        self._streaming = streaming
+        self._streamed = False
+        self._row_limit = row_limit
 
     @property
     def result_id(self) -> str:
@@ -136,65 +156,96 @@ class ExecutionTable:
         """
         return {**{a.local_id: a for a in self.attributes}, **{m.local_id: m for m in self.metrics}}
 
-    def _read_next_page(self) -> bool:
+    @property
+    def streaming(self) -> bool:
+        return self._streaming
+
+    def _fetch_next_page(self) -> Optional[ExecutionResult]:
         if not self._exec_def.has_attributes():
             # result without attributes has just one row with all the metrics, there is no next page to load
-            return False
-
-        last_loaded = self._pages[-1]
-        offset = last_loaded.paging_offset
-        count = last_loaded.paging_count
-        total = last_loaded.paging_total
+            return None
+
+        if self._next_pages is None:
+            # all the remaining pages are known once the first page is loaded; they are prefetched in parallel
+            # and handed over in order
+            self._next_pages = self._response.read_next_result_pages(
+                after=self._first_page,
+                first_dim_only=True,
+                stop=None if self._row_limit is None else [self._row_limit],
+            )
 
-        # no more data on the backend, bail out
-        if offset[0] + count[0] >= total[0]:
-            return False
+        # None means there is no more data on the backend
+        return next(self._next_pages, None)
 
-        next_offset = [offset[0] + count[0]] + offset[1:]
-        # backend is smart enough to cap if the limit is greater than number of remaining rows
-        next_limit = [_TABLE_ROW_BATCH_SIZE] + count[1:]
+    def _read_next_page(self) -> bool:
+        next_page = self._fetch_next_page()
 
-        next_page = self._response.read_result(offset=next_offset, limit=next_limit)
+        if next_page is None:
+            return False
 
         self._pages.append(next_page)
 
         return True
 
-    def _read_all_metrics_in_one_row(self) -> Generator[dict[str, Any], None, None]:
-        data = self._first_page.data
-        cols = self.column_ids
+    def _iter_pages(self) -> Generator[ExecutionResult, None, None]:
+        if self._streaming:
+            if self._streamed:
+                raise ValueError("Streaming ExecutionTable can be read just once.")
+            self._streamed = True
 
-        yield dict(zip(cols, data))
+            # pages are not kept by the table; each page is released once the consumer moves to the next one
+            page: Optional[ExecutionResult] = self._first_page
+            while page is not None:
+                yield page
+                page = self._fetch_next_page()
+            return
 
-    def _read_all_paged(self) -> Generator[dict[str, Any], None, None]:
         page_idx = 0
-        cols = self.column_ids
-
-        while page_idx < len(self._pages):
-            page = self._pages[page_idx]
-            attribute_headers = page.headers[0]
-            data = page.data
-            paging = page.paging
-            page_row_idx = 0
-
-            # yield all data from current page
-            while page_row_idx < paging["count"][0]:
-                headers = [
-                    header["headers"][page_row_idx]["attributeHeader"]["labelValue"]
-                    for header in attribute_headers["headerGroups"]
-                ]
-                metric_data = data[page_row_idx] if self._exec_def.has_metrics() else []
-
-                yield dict(zip(cols, headers + metric_data))
-                page_row_idx += 1
-
-            # try to read next page of data. False means the end was reached so just bail out
-            if not self._read_next_page():
-                break
-
-            # otherwise the self._pages was updated so go on with next page
+        while page_idx < len(self._pages) or self._read_next_page():
+            yield self._pages[page_idx]
             page_idx += 1
 
+    def _page_row_count(self, page: ExecutionResult) -> int:
+        count = page.paging_count[0]
+        if self._row_limit is None:
+            return count
+
+        return max(0, min(count, self._row_limit - page.paging_offset[0]))
+
+    def _read_all_metrics_in_one_row(self) -> Generator[tuple[Any, ...], None, None]:
+        yield tuple(self._first_page.data)
+
+    def _read_all_paged(self) -> Generator[tuple[Any, ...], None, None]:
+        has_metrics = self._exec_def.has_metrics()
+
+        for page in self._iter_pages():
+            count = self._page_row_count(page)
+            # values of each attribute are collected for the whole page at once, rows are then just zipped together
+            header_columns = [
+                [header["attributeHeader"]["labelValue"] for header in header_group["headers"][:count]]
+                for header_group in page.headers[0]["headerGroups"]
+            ]
+
+            if has_metrics:
+                for header_values, metric_values in zip(zip(*header_columns), page.data[:count]):
+                    yield header_values + tuple(metric_values)
+            else:
+                yield from zip(*header_columns)
+
+    def read_all_tuples(self) -> Generator[tuple[Any, ...], None, None]:
+        """
+        Returns a generator that will be yielding execution result as rows. Each row is a tuple with values
+        of the columns in the order of column_ids.
+
+        This is cheaper than read_all - no dict() is created for the rows.
+
+        :return: generator yielding tuple() representing rows of the table
+        """
+        if not self._exec_def.has_attributes():
+            return self._read_all_metrics_in_one_row()
+
+        return self._read_all_paged()
+
     def read_all(self) -> Generator[dict[str, Any], None, None]:
         """
         Returns a generator that will be yielding execution result as rows. Each row is a dict() mapping column
@@ -202,16 +253,91 @@ class ExecutionTable:
 
         :return: generator yielding dict() representing rows of the table
         """
+        cols = self.column_ids
+
+        return (dict(zip(cols, row)) for row in self.read_all_tuples())
+
+    def arrow_schema(self) -> pyarrow.Schema:
+        """
+        Returns Arrow schema of the table. Attribute columns are dictionary-encoded strings, metric columns are float64.
+
+        Requires pyarrow to be installed.
+        """
+        pa = _import_pyarrow()
+
+        return pa.schema(
+            [pa.field(a.local_id, pa.dictionary(pa.int32(), pa.string())) for a in self.attributes]
+            + [pa.field(m.local_id, pa.float64()) for m in self.metrics]
+        )
+
+    def _metrics_record_batch(self, schema: pyarrow.Schema) -> pyarrow.RecordBatch:
+        pa = _import_pyarrow()
+        data = self._first_page.data
+        if len(data) == 0:
+            # nothing was computed, the table has no rows
+            return pa.RecordBatch.from_pylist([], schema=schema)
+
+        return pa.RecordBatch.from_arrays([pa.array([value], type=pa.float64()) for value in data], schema=schema)
+
+    def _page_record_batch(self, page: ExecutionResult, schema: pyarrow.Schema) -> pyarrow.RecordBatch:
+        pa = _import_pyarrow()
+        count = self._page_row_count(page)
+
+        columns = [
+            pa.array(
+                [header["attributeHeader"]["labelValue"] for header in header_group["headers"][:count]],
+                type=pa.string(),
+            ).dictionary_encode()
+            for header_group in page.headers[0]["headerGroups"]
+        ]
+        if self._exec_def.has_metrics():
+            rows = page.data[:count]
+            # nulls in the data make up the validity mask of the metric columns
+            columns.extend(
+                pa.array([row[metric_idx] for row in rows], type=pa.float64())
+                for metric_idx in range(len(self.metrics))
+            )
+
+        return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+    def _read_all_record_batches(self, schema: pyarrow.Schema) -> Generator[pyarrow.RecordBatch, None, None]:
         if not self._exec_def.has_attributes():
-            return self._read_all_metrics_in_one_row()
+            yield self._metrics_record_batch(schema)
+            return
 
-        return self._read_all_paged()
+        for page in self._iter_pages():
+            yield self._page_record_batch(page, schema)
+
+    def to_record_batch_reader(self) -> pyarrow.RecordBatchReader:
+        """
+        Returns reader of the table. Each page of the result is converted to one Arrow RecordBatch with schema
+        described by arrow_schema. The pages are read as the batches are consumed.
+
+        Requires pyarrow to be installed.
+
+        :return: reader yielding one RecordBatch for each page of the result
+        """
+        pa = _import_pyarrow()
+        schema = self.arrow_schema()
+
+        return pa.RecordBatchReader.from_batches(schema, self._read_all_record_batches(schema))
+
+    def read_all_arrow(self) -> pyarrow.Table:
+        """
+        Reads the whole table into Arrow Table. See to_record_batch_reader for details.
+
+        Requires pyarrow to be installed.
+
+        :return: Arrow Table with all rows of the table
+        """
+        return self.to_record_batch_reader().read_all()
 
     def __len__(self) -> int:
         if self._exec_def.has_attributes():
             # if there are attributes in the result, then the sheet will be sliced with one row per
             # attribute => whatever the paging says is total for the first dimension is the number of rows
-            return self._first_page.paging_total[0]
+            total = self._first_page.paging_total[0]
+            return total if self._row_limit is None else min(total, self._row_limit)
         else:
             # if there are no attributes in the result, then the sheet contains at most one row with all
             # metric values in it; now due such result being single dim, code looks at number of computed metric
@@ -225,12 +351,60 @@ class ExecutionTable:
         return f"ExecutionTable(response={self._response}, columns={self.column_ids}, rows={len(self)})"
 
 
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required to read ExecutionTable as Arrow. Install it using 'gooddata-sdk[arrow]'."
+        ) from e
+
+    return pyarrow
+
+
+def _create_row_sorting(
+    attributes: list[Attribute], metrics: list[Metric], sort_by: list[tuple[str, SortDirection]]
+) -> list[dict]:
+    attribute_ids = {a.local_id for a in attributes}
+    metric_ids = {m.local_id for m in metrics}
+    sort_keys: list[SortKey] = []
+
+    for local_id, direction in sort_by:
+        if local_id in attribute_ids:
+            sort_keys.append(
+                SortKeyAttribute(
+                    sort_type=SortType.ATTRIBUTE,
+                    direction=direction,
+                    attribute_identifier=local_id,
+                    attribute_sort_type=AttributeSortType.DEFAULT,
+                )
+            )
+        elif local_id in metric_ids:
+            # rows are sorted by values of the metric, which lives in the measure group of the second dimension
+            sort_keys.append(
+                SortKeyValue(
+                    sort_type=SortType.MEASURE,
+                    direction=direction,
+                    measure_dim_identifier="dim_1",
+                    data_column_locators=[MeasureLocator(measure_identifier=local_id)],
+                )
+            )
+        else:
+            raise ValueError(f"Invalid sort item: {local_id}. Expecting local id of one of the table items")
+
+    return [sort_key.to_dict() for sort_key in sort_keys]
+
+
 def _prepare_tabular_definition(
-    attributes: list[Attribute], filters: list[Filter], metrics: list[Metric]
+    attributes: list[Attribute],
+    filters: list[Filter],
+    metrics: list[Metric],
+    sort_by: Optional[list[tuple[str, SortDirection]]] = None,
 ) -> ExecutionDefinition:
     dims = [
         ExecTableDimension(
             item_ids=[a.local_id for a in attributes] if attributes else None,
+            sorting=_create_row_sorting(attributes, metrics, sort_by) if attributes and sort_by else [],
         ),
         ExecTableDimension(
             item_ids=[_MEASURE_GROUP_IDENTIFIER] if metrics else None,
@@ -240,9 +414,20 @@ def _prepare_tabular_definition(
     return ExecutionDefinition(attributes=attributes, metrics=metrics, filters=filters, dimensions=dims)
 
 
-def _as_table(response: ExecutionResponse) -> ExecutionTable:
+def _as_table(
+    response: ExecutionResponse,
+    batch_size: int = _TABLE_ROW_BATCH_SIZE,
+    streaming: bool = False,
+    row_limit: Optional[int] = None,
+) -> ExecutionTable:
+    if batch_size < 1:
+        raise ValueError(f"Batch size must be a positive number, got: {batch_size}")
+    if row_limit is not None and row_limit < 0:
+        raise ValueError(f"Row limit must not be negative, got: {row_limit}")
+
     first_page_offset = [0, 0]
-    first_page_limit = [_TABLE_ROW_BATCH_SIZE, _MAX_METRICS]
+    # there is no point in reading more rows than the limit; backend does not accept empty pages though
+    first_page_limit = [batch_size if row_limit is None else max(1, min(batch_size, row_limit)), _MAX_METRICS]
 
     if not response.exec_def.has_attributes():
         # there are no attributes, there shall be at most one row with the metrics, so get that as first page
@@ -255,7 +440,7 @@ def _as_table(response: ExecutionResponse) -> ExecutionTable:
 
     first_page = response.read_result(offset=first_page_offset, limit=first_page_limit)
 
-    return ExecutionTable(response=response, first_page=first_page)
+    return ExecutionTable(response=response, first_page=first_page, streaming=streaming, row_limit=row_limit)
 
 
 @frozen
@@ -768,10 +953,36 @@ class TableService:
     The ExecutionTable returned by the TableService allows you to iterate over the rows of the calculated data.
     """
 
-    def __init__(self, api_client: GoodDataApiClient) -> None:
-        self._compute = ComputeService(api_client)
+    def __init__(self, api_client: GoodDataApiClient, result_cache: Optional[ExecutionResultCache] = None) -> None:
+        self._compute = ComputeService(api_client, result_cache=result_cache)
 
-    def for_visualization(self, workspace_id: str, visualization: Visualization) -> ExecutionTable:
+    def for_visualization(
+        self,
+        workspace_id: str,
+        visualization: Visualization,
+        batch_size: int = _TABLE_ROW_BATCH_SIZE,
+        streaming: bool = False,
+        row_limit: Optional[int] = None,
+    ) -> ExecutionTable:
+        """
+        Computes the visualization and returns its result as a table.
+
+        Args:
+            workspace_id (str):
+                Workspace identification string e.g. "demo"
+            visualization (Visualization):
+                Visualization to compute.
+            batch_size (int):
+                Number of rows read from the backend at once. Defaults to 512.
+            streaming (bool):
+                Whether the table should release the pages once their rows are consumed. Streaming table can be
+                read just once. Defaults to False.
+            row_limit (Optional[int]):
+                Maximum number of rows of the table. Defaults to None - all rows.
+
+        Returns:
+            ExecutionTable: Table with the computed result.
+        """
         # Assume the received visualization is a pivot table if:
         # - we can parse out "table" suffix from the attributes.contents.visualizationUrl
         # or
@@ -782,11 +993,42 @@ class TableService:
             else get_exec_for_non_pivot(visualization)
         )
         response = self._compute.for_exec_def(workspace_id=workspace_id, exec_def=exec_def)
-        return _as_table(response)
+        return _as_table(response, batch_size=batch_size, streaming=streaming, row_limit=row_limit)
 
     def for_items(
-        self, workspace_id: str, items: list[Union[Attribute, Metric]], filters: Optional[list[Filter]] = None
+        self,
+        workspace_id: str,
+        items: list[Union[Attribute, Metric]],
+        filters: Optional[list[Filter]] = None,
+        batch_size: int = _TABLE_ROW_BATCH_SIZE,
+        streaming: bool = False,
+        sort_by: Optional[list[tuple[str, SortDirection]]] = None,
+        row_limit: Optional[int] = None,
     ) -> ExecutionTable:
+        """
+        Computes the attributes and metrics and returns the result as a table.
+
+        Args:
+            workspace_id (str):
+                Workspace identification string e.g. "demo"
+            items (list[Union[Attribute, Metric]]):
+                Attributes and metrics to compute. Each of them will be a column of the table.
+            filters (Optional[list[Filter]]):
+                Filters to apply on the computation. Defaults to None.
+            batch_size (int):
+                Number of rows read from the backend at once. Defaults to 512.
+            streaming (bool):
+                Whether the table should release the pages once their rows are consumed. Streaming table can be
+                read just once. Defaults to False.
+            sort_by (Optional[list[tuple[str, SortDirection]]]):
+                Rows ordering given as pairs of local id of an attribute or metric from the items and direction.
+                Ignored when there are no attributes in the items. Defaults to None - ordering is up to the backend.
+            row_limit (Optional[int]):
+                Maximum number of rows of the table. Defaults to None - all rows.
+
+        Returns:
+            ExecutionTable: Table with the computed result.
+        """
         if filters is None:
             filters = []
 
@@ -801,7 +1043,7 @@ class TableService:
             else:
                 raise ValueError(f"Invalid input item: {item}. Expecting instance of Attribute or Metric")
 
-        exec_def = _prepare_tabular_definition(attributes=attributes, metrics=metrics, filters=filters)
+        exec_def = _prepare_tabular_definition(attributes=attributes, metrics=metrics, filters=filters, sort_by=sort_by)
         response = self._compute.for_exec_def(workspace_id=workspace_id, exec_def=exec_def)
 
-        return _as_table(response)
+        return _as_table(response, batch_size=batch_size, streaming=streaming, row_limit=row_limit)
@@ -1,6 +1,7 @@
 # (C) 2021 GoodData Corporation
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import date, datetime
 from typing import Any, Callable, Optional
 
@@ -16,14 +17,34 @@ class Converter:
     DEFAULT_DB_DATA_TYPE = "VARCHAR(255)"
 
     _EXTERNAL_CONVERSION_FNC: Optional[Callable[[object, Any], Any]] = None
+    _EXTERNAL_BATCH_CONVERSION_FNC: Optional[Callable[[object, list[Any]], Any]] = None
 
     @classmethod
     def set_external_fnc(cls, fnc: Callable[[object, Any], Any]) -> None:
+        """
+        Set external conversion function applied on a single typed value. Batch external conversion function
+        previously set for the class is dropped, so that both conversions stay consistent.
+        """
         cls._EXTERNAL_CONVERSION_FNC = fnc
+        cls._EXTERNAL_BATCH_CONVERSION_FNC = None
+
+    @classmethod
+    def set_external_batch_fnc(cls, fnc: Callable[[object, list[Any]], Any]) -> None:
+        """
+        Set external conversion function applied on a whole list of typed values at once. When not set,
+        the external conversion function is applied on the values one by one.
+        """
+        cls._EXTERNAL_BATCH_CONVERSION_FNC = fnc
 
     def to_type(self, value: str) -> Any:
         raise NotImplementedError
 
+    def to_type_batch(self, values: Sequence[Any]) -> list[Any]:
+        """
+        Convert whole column of values. Values which are not strings (e.g. None) are passed through untouched.
+        """
+        return [self.to_type(value) if isinstance(value, str) else value for value in values]
+
     def to_external_type(self, value: str) -> Any:
         typed_value = self.to_type(value)
         if self._EXTERNAL_CONVERSION_FNC:
@@ -31,6 +52,20 @@ class Converter:
         else:
             return typed_value
 
+    def to_external_type_batch(self, values: Sequence[Any]) -> Any:
+        """
+        Convert whole column of values to external type. Returns list or any list-like result of the batch external
+        conversion function.
+        """
+        typed_values = self.to_type_batch(values)
+        if self._EXTERNAL_BATCH_CONVERSION_FNC:
+            return self._EXTERNAL_BATCH_CONVERSION_FNC(typed_values)  # type: ignore
+        elif self._EXTERNAL_CONVERSION_FNC:
+            external_fnc = self._EXTERNAL_CONVERSION_FNC
+            return [None if value is None else external_fnc(value) for value in typed_values]  # type: ignore
+        else:
+            return typed_values
+
     def db_data_type(self) -> str:
         raise NotImplementedError
 
@@ -40,6 +75,9 @@ class StringConverter(Converter):
     def to_type(self, value: str) -> str:
         return value
 
+    def to_type_batch(self, values: Sequence[Any]) -> list[Any]:
+        return list(values)
+
     def db_data_type(self) -> str:
         return self.DEFAULT_DB_DATA_TYPE
 
@@ -57,6 +95,16 @@ class DateConverter(Converter):
     def to_type(self, value: str) -> date:
         return self.to_date(value)
 
+    def to_type_batch(self, values: Sequence[Any]) -> list[Any]:
+        to_date = self.to_date
+        # fast path for complete ISO dates
+        return [
+            (date.fromisoformat(value) if len(value) == 10 and value[4] == value[7] == "-" else to_date(value))
+            if isinstance(value, str)
+            else value
+            for value in values
+        ]
+
     def db_data_type(self) -> str:
         return "DATE"
 
@@ -87,6 +135,20 @@ class DatetimeConverter(Converter):
     def to_type(self, value: str) -> datetime:
         return self.to_datetime(value)
 
+    def to_type_batch(self, values: Sequence[Any]) -> list[Any]:
+        return [self._iso_to_datetime(value) if isinstance(value, str) else value for value in values]
+
+    @classmethod
+    def _iso_to_datetime(cls, value: str) -> datetime:
+        """Fast path for 'YYYY-MM-DD HH:MM' timestamps; anything else is parsed the same way as in to_datetime."""
+        sanitized = cls._sanitize_timestamp(value)
+        if len(sanitized) == 16 and sanitized[10] == " ":
+            try:
+                return datetime.fromisoformat(sanitized)
+            except ValueError:
+                pass
+        return parse(sanitized)
+
     def db_data_type(self) -> str:
         return "TIMESTAMP"
 
@@ -261,6 +323,17 @@ class ConverterRegistryStore:
 
         return registry.converter(sub_type)
 
+    @classmethod
+    def convert_column(cls, values: Sequence[Any], type_name: str, sub_type: Optional[str] = None) -> Any:
+        """
+        Convert whole column of values to external type. Converter is looked up just once for the column.
+
+        :param values: values of the column
+        :param type_name: type name
+        :param sub_type: sub type name
+        """
+        return cls.find_converter(type_name, sub_type).to_external_type_batch(values)
+
     @classmethod
     def reset(cls) -> None:
         """
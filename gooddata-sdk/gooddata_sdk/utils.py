@@ -2,14 +2,17 @@
 from __future__ import annotations
 
 import functools
+import hashlib
+import itertools
 import json
 import os
 import re
-from collections.abc import KeysView
+from collections.abc import Iterable, Iterator, KeysView
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, auto
 from pathlib import Path
 from shutil import rmtree
-from typing import Any, Callable, NamedTuple, Union, cast, no_type_check
+from typing import Any, Callable, NamedTuple, Optional, Union, cast, no_type_check
 from warnings import warn
 from xml.etree import ElementTree as ET
 
@@ -86,13 +89,41 @@ class AllPagedEntities(NamedTuple):
     included: list[Any]
 
 
+def _merge_entity_pages(results: Iterable[Any]) -> AllPagedEntities:
+    all_paged_entities = AllPagedEntities(data=[], included=[])
+    for result in results:
+        all_paged_entities.data.extend(result["data"])
+
+        try:
+            all_paged_entities.included.extend(result["included"])
+        except (ApiAttributeError, KeyError):
+            pass
+
+    return all_paged_entities
+
+
+def _total_pages(result: Any) -> Optional[int]:
+    # the page metadata is either raw JSON or the model deserialized by the generated client
+    try:
+        page = result["meta"]["page"]
+        return int(page["totalPages"] if "totalPages" in page else page["total_pages"])
+    except (ApiAttributeError, KeyError, TypeError, ValueError):
+        return None
+
+
 # Use functools.partial instead of Protocol because Protocol is available starting by py3.8
-def load_all_entities(get_page_func: functools.partial[Any], page_size: int = 500) -> AllPagedEntities:
+def load_all_entities(
+    get_page_func: functools.partial[Any], page_size: int = 500, max_concurrency: int = 1
+) -> AllPagedEntities:
     """
     Loads all entities from a paged resource. The primary input to this function is a partial function that is setup
     with all the fixed parameters. Given this the function will get entities page-by-page and merge them into a single
     'pseudo-response' containing data and included attributes.
 
+    When max_concurrency is greater than 1, the first page is requested together with the page metadata
+    (metaInclude=page). The remaining pages are then fetched by up to max_concurrency threads. The pages are
+    merged in their natural order, so the result is the same as if the pages were fetched one by one.
+
     An example usage:
 
     >>> import functools
@@ -103,34 +134,54 @@ def load_all_entities(get_page_func: functools.partial[Any], page_size: int = 50
     >>>                              include=["ALL"], _check_return_type=False)
     >>> vis_objects = load_all_entities(get_func)
 
+    The pages may also be loaded as raw JSON, which skips construction of the models:
+
+    >>> get_func = functools.partial(sdk.client.call_json, sdk.client.entities_api.get_all_entities_metrics, 'demo')
+
     :param get_page_func: an API controller from the metadata client
     :param page_size: optionally specify page length, default is 500
+    :param max_concurrency: optionally specify max number of pages fetched at the same time, default is 1
     """
-    all_paged_entities = AllPagedEntities(data=[], included=[])
-    current_page = 0
+    if max_concurrency <= 1:
+        return _merge_entity_pages(_iterate_entity_pages(get_page_func, page_size))
+
+    first_page = get_page_func(page=0, size=page_size, meta_include=["page"])
+    total_pages = _total_pages(first_page)
+    if total_pages is None:
+        # the resource does not report page metadata; continue sequentially
+        return _merge_entity_pages(
+            itertools.chain([first_page], _iterate_entity_pages(get_page_func, page_size, first_page=first_page))
+        )
+    if total_pages <= 1:
+        return _merge_entity_pages([first_page])
 
-    while True:
-        result = get_page_func(page=current_page, size=page_size)
+    with ThreadPoolExecutor(
+        max_workers=min(max_concurrency, total_pages - 1), thread_name_prefix="gd-entity-page"
+    ) as executor:
+        next_pages = executor.map(lambda page: get_page_func(page=page, size=page_size), range(1, total_pages))
+        return _merge_entity_pages(itertools.chain([first_page], next_pages))
 
-        all_paged_entities.data.extend(result.data)
 
-        try:
-            all_paged_entities.included.extend(result.included)
-        except ApiAttributeError:
-            pass
+def _iterate_entity_pages(
+    get_page_func: functools.partial[Any], page_size: int, first_page: Optional[Any] = None
+) -> Iterator[Any]:
+    current_page = 0
+    result = first_page
 
-        if len(result.data) < page_size:
-            break
+    if result is None:
+        result = get_page_func(page=current_page, size=page_size)
+        yield result
 
+    while len(result["data"]) >= page_size:
         current_page += 1
-
-    return all_paged_entities
+        result = get_page_func(page=current_page, size=page_size)
+        yield result
 
 
 def load_all_entities_dict(
-    get_page_func: functools.partial[Any], page_size: int = 500, camel_case: bool = False
+    get_page_func: functools.partial[Any], page_size: int = 500, camel_case: bool = False, max_concurrency: int = 1
 ) -> dict[str, Any]:
-    all_entities = load_all_entities(get_page_func, page_size)
+    all_entities = load_all_entities(get_page_func, page_size, max_concurrency)
     all_entities_dict = {"data": all_entities.data, "included": all_entities.included}
     return all_entities_dict if camel_case else change_case(all_entities_dict, camel_to_snake)
 
@@ -189,13 +240,172 @@ def write_layout_to_file(path: Path, content: Union[dict[str, Any], list[dict]])
 def read_layout_from_file(path: Path) -> Any:
     if not os.path.isfile(path):
         raise ValueError(f"There is no file in the given path {path}")
+    with open(path, encoding="utf-8") as f:
+        return _parse_layout(path, f)
+
+
+def _parse_layout(path: Path, content: Any) -> Any:
     try:
-        with open(path, encoding="utf-8") as f:
-            return yaml.safe_load(f)
+        return yaml.safe_load(content)
     except yaml.YAMLError as exc:
         raise ValueError(f"File [{path}] has wrong yaml format. Following exception was raised during loading: {exc}")
 
 
+LAYOUT_MANIFEST_FILE = ".layout_manifest.json"
+LAYOUT_CACHE_FILE = ".layout_cache.json"
+
+
+def _read_json_file(path: Path) -> dict[str, Any]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_json_file(path: Path, data: dict[str, Any]) -> None:
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def _file_stat(path: Path) -> Optional[list[int]]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _layout_hash(content: Any) -> str:
+    canonical = json.dumps(content, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _is_json_serializable(content: Any) -> bool:
+    try:
+        json.dumps(content)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+class IncrementalLayoutFolder:
+    """
+    Folder with layout files - one `<id>.yaml` file per object - which is stored and loaded incrementally.
+
+    The folder contains a manifest (see LAYOUT_MANIFEST_FILE) with the content hash of each stored object.
+    Storing rewrites only the files of objects whose content changed (or whose files were modified
+    since) and deletes files of objects which are no longer part of the layout.
+
+    Loading keeps the parsed content of the files in a cache (see LAYOUT_CACHE_FILE), keyed by the file
+    modification time and content hash, so only the files which changed since the last load are parsed.
+    """
+
+    def __init__(self, folder: Path) -> None:
+        self.folder = folder
+
+    def store(self, layouts: dict[str, Any]) -> None:
+        """Stores the layouts to the folder.
+
+        Args:
+            layouts (dict[str, Any]):
+                Layouts of all objects in the folder, keyed by object id.
+        """
+        create_directory(self.folder)
+        manifest_path = self.folder / LAYOUT_MANIFEST_FILE
+        manifest = _read_json_file(manifest_path)
+        new_manifest: dict[str, Any] = {}
+
+        for object_id, content in layouts.items():
+            path = self.folder / f"{object_id}.yaml"
+            content_hash = _layout_hash(content)
+            entry = manifest.get(object_id)
+            if not entry or entry.get("hash") != content_hash or entry.get("stat") != _file_stat(path):
+                write_layout_to_file(path, content)
+                entry = {"hash": content_hash, "stat": _file_stat(path)}
+            new_manifest[object_id] = entry
+
+        for path in self.folder.glob("*.yaml"):
+            if path.stem not in layouts:
+                path.unlink()
+
+        if new_manifest != manifest:
+            _write_json_file(manifest_path, new_manifest)
+
+    def load(self) -> dict[str, Any]:
+        """Loads the layouts from the folder.
+
+        Returns:
+            dict[str, Any]:
+                Layouts of all objects in the folder, keyed by object id and sorted by it.
+        """
+        cache_path = self.folder / LAYOUT_CACHE_FILE
+        cache = _read_json_file(cache_path)
+        new_cache: dict[str, Any] = {}
+        layouts: dict[str, Any] = {}
+
+        for path in get_sorted_yaml_files(self.folder):
+            stat = _file_stat(path)
+            entry = cache.get(path.stem)
+            if not entry or entry.get("stat") != stat:
+                data = path.read_bytes()
+                file_hash = hashlib.sha256(data).hexdigest()
+                if entry and entry.get("hash") == file_hash:
+                    entry = {**entry, "stat": stat}
+                else:
+                    entry = {"hash": file_hash, "stat": stat, "layout": _parse_layout(path, data)}
+
+            layouts[path.stem] = entry["layout"]
+            if _is_json_serializable(entry["layout"]):
+                new_cache[path.stem] = entry
+
+        if new_cache != cache and self.folder.is_dir():
+            _write_json_file(cache_path, new_cache)
+
+        return layouts
+
+
+def store_layout_objects(folder: Path, objects: Iterable[Any], incremental: bool = False) -> None:
+    """Stores declarative objects to a folder, one `<id>.yaml` file per object.
+
+    Args:
+        folder (Path):
+            Folder to store the objects to.
+        objects (Iterable[Any]):
+            Declarative objects with `id`, `to_api` and `store_to_disk`.
+        incremental (bool, optional):
+            If true, the folder is stored using IncrementalLayoutFolder. Defaults to False.
+    """
+    if incremental:
+        IncrementalLayoutFolder(folder).store({obj.id: obj.to_api().to_dict(camel_case=True) for obj in objects})
+    else:
+        for obj in objects:
+            obj.store_to_disk(folder)
+
+
+def load_layout_objects(folder: Path, cls: Any, incremental: bool = False) -> list[Any]:
+    """Loads declarative objects stored using `store_layout_objects`.
+
+    Args:
+        folder (Path):
+            Folder to load the objects from.
+        cls (Any):
+            Class of the declarative objects with `from_dict` and `load_from_disk`.
+        incremental (bool, optional):
+            If true, the folder is loaded using IncrementalLayoutFolder. Defaults to False.
+
+    Returns:
+        list[Any]:
+            Declarative objects sorted by their ids.
+    """
+    if incremental:
+        return [cls.from_dict(layout) for layout in IncrementalLayoutFolder(folder).load().values()]
+    return [cls.load_from_disk(file) for file in get_sorted_yaml_files(folder)]
+
+
 def camel_to_snake(camel_case_str: str) -> str:
     return re.sub(r"([A-Z]+)", r"_\1", camel_case_str).lower()
 
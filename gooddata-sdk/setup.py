@@ -29,6 +29,11 @@ setup(
     license_file="LICENSE.txt",
     license_files=("LICENSE.txt",),
     install_requires=REQUIRES,
+    extras_require={
+        "arrow": ["pyarrow>=16.1.0"],
+        "async": ["aiohttp>=3.9.0"],
+        "fast-json": ["orjson>=3.8.5,<4.0.0"],
+    },
     packages=find_packages(exclude=["tests*"]),
     package_data={"gooddata_sdk.cli": ["package.json"]},
     python_requires=">=3.9.0",
@@ -0,0 +1,141 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+import asyncio
+import ssl
+from pathlib import Path
+
+import attrs
+import pytest
+from gooddata_api_client.exceptions import NotFoundException, ServiceException
+from gooddata_sdk import (
+    AsyncGoodDataSdk,
+    Attribute,
+    ExecutionDefinition,
+    ExportCustomLabel,
+    ExportCustomMetric,
+    ExportCustomOverride,
+    ExportRequest,
+    ObjId,
+    SimpleMetric,
+    TableDimension,
+)
+from gooddata_sdk.aio.client import AsyncGoodDataApiClient, AsyncResponse, _raise_for_status, _ssl_context
+from gooddata_sdk.client import GoodDataApiClient
+from tests_support.vcrpy_utils import get_vcr
+
+pytest.importorskip("aiohttp")
+
+gd_vcr = get_vcr()
+
+# the async SDK sends the same requests as the synchronous one, so it replays their cassettes
+_tests_dir = Path(__file__).parent.parent.absolute()
+_table_fixtures_dir = _tests_dir / "table" / "fixtures"
+_catalog_fixtures_dir = _tests_dir / "catalog" / "fixtures" / "workspace_content"
+_export_fixtures_dir = _tests_dir / "export" / "fixtures"
+
+
+def _exec_def() -> ExecutionDefinition:
+    return ExecutionDefinition(
+        attributes=[Attribute(local_id="attr1", label="region")],
+        metrics=[SimpleMetric(local_id="metric1", item=ObjId(type="metric", id="order_amount"))],
+        filters=[],
+        dimensions=[TableDimension(item_ids=["attr1"]), TableDimension(item_ids=["measureGroup"])],
+    )
+
+
+@gd_vcr.use_cassette(str(_table_fixtures_dir / "table_with_attribute_and_metric.yaml"))
+def test_async_compute(test_config):
+    async def _compute():
+        async with AsyncGoodDataSdk.create(host_=test_config["host"], token_=test_config["token"]) as sdk:
+            execution = await sdk.compute.for_exec_def(test_config["workspace"], _exec_def())
+            return [page async for page in execution.read_result_pages(limit=[512, 256])]
+
+    pages = asyncio.run(_compute())
+
+    assert len(pages) == 1
+    assert pages[0].get_all_header_values(0, 0) == ["Midwest", "Northeast", "South", "Unknown", "West"]
+
+
+@gd_vcr.use_cassette(str(_catalog_fixtures_dir / "demo_catalog.yaml"))
+def test_async_full_catalog(test_config):
+    async def _catalog():
+        async with AsyncGoodDataSdk.create(host_=test_config["host"], token_=test_config["token"]) as sdk:
+            return await sdk.catalog_workspace_content.get_full_catalog(test_config["workspace"])
+
+    catalog = asyncio.run(_catalog())
+
+    assert len(catalog.metrics) == 24
+    assert len(catalog.datasets) == 6
+
+
+@gd_vcr.use_cassette(str(_catalog_fixtures_dir / "demo_catalog_list_metrics.yaml"))
+def test_async_catalog_list_metrics(test_config):
+    async def _metrics():
+        async with AsyncGoodDataSdk.create(host_=test_config["host"], token_=test_config["token"]) as sdk:
+            return await sdk.catalog_workspace_content.get_metrics_catalog(test_config["workspace"])
+
+    assert len(asyncio.run(_metrics())) == 24
+
+
+@gd_vcr.use_cassette(str(_export_fixtures_dir / "test_export_csv.yaml"))
+def test_async_export_tabular(test_config, tmp_path):
+    workspace_id = test_config["workspace"]
+    # the export needs an execution result; it is computed the same way as in the synchronous export tests
+    exec_def = ExecutionDefinition(
+        attributes=[Attribute(local_id="region", label="region"), Attribute(local_id="state", label="state")],
+        metrics=[
+            SimpleMetric(local_id="price", item=ObjId(id="price", type="fact")),
+            SimpleMetric(local_id="order_amount", item=ObjId(id="order_amount", type="metric")),
+        ],
+        filters=[],
+        dimensions=[TableDimension(item_ids=["state", "region"]), TableDimension(item_ids=["measureGroup"])],
+    )
+
+    async def _export():
+        async with AsyncGoodDataSdk.create(host_=test_config["host"], token_=test_config["token"]) as sdk:
+            execution = await sdk.compute.for_exec_def(workspace_id, exec_def)
+            export_request = ExportRequest(
+                format="CSV",
+                execution_result=execution.result_id,
+                file_name="test_csv",
+                custom_override=ExportCustomOverride(
+                    labels={"region": ExportCustomLabel(title="Custom Title Region")},
+                    metrics={
+                        "price": ExportCustomMetric(title="Sum Of Price", format=""),
+                        "order_amount": ExportCustomMetric(title="Order Amount Metric", format="#,##0.00"),
+                    },
+                ),
+            )
+            await sdk.export.export_tabular(workspace_id, export_request, tmp_path, retry=0.01)
+            return tmp_path / export_request.file
+
+    assert asyncio.run(_export()).stat().st_size > 0
+
+
+def test_async_client_errors():
+    response = AsyncResponse(status=404, reason="Not Found", data=b"", headers={})
+
+    with pytest.raises(NotFoundException):
+        _raise_for_status(response)
+    with pytest.raises(ServiceException):
+        _raise_for_status(attrs.evolve(response, status=503))
+    _raise_for_status(attrs.evolve(response, status=202))
+
+
+def test_async_client_ssl_and_proxy():
+    client = GoodDataApiClient(host="https://localhost:3000", token="token")
+    configuration = client.actions_api.api_client.configuration
+    async_client = AsyncGoodDataApiClient(client)
+
+    assert _ssl_context(configuration).verify_mode == ssl.CERT_REQUIRED
+    assert async_client._proxy() == (None, None)
+
+    # the settings of the generated client apply to the async client as well
+    configuration.verify_ssl = False
+    configuration.proxy = "http://proxy:8080"
+    assert _ssl_context(configuration) is False
+    assert async_client._proxy() == ("http://proxy:8080", None)
+
+    configuration.no_proxy = "localhost"
+    assert async_client._proxy() == (None, None)
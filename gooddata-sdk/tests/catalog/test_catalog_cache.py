@@ -0,0 +1,157 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from gooddata_sdk import CatalogCache, CatalogMetric, GoodDataSdk
+from tests_support.vcrpy_utils import get_vcr
+
+gd_vcr = get_vcr()
+
+_current_dir = Path(__file__).parent.absolute()
+_fixtures_dir = _current_dir / "fixtures" / "workspace_content"
+
+
+class _Loader:
+    def __init__(self, value: str) -> None:
+        self.value = value
+        self.calls = 0
+
+    def __call__(self) -> list[str]:
+        self.calls += 1
+        return [self.value]
+
+
+def test_catalog_cache_hit():
+    cache = CatalogCache()
+    loader = _Loader("a")
+
+    assert cache.get_or_load("demo", "labels", loader) == ["a"]
+    assert cache.get_or_load("demo", "labels", loader) == ["a"]
+    assert loader.calls == 1
+
+    # different workspace, kind or params do not share entries
+    cache.get_or_load("other", "labels", loader)
+    cache.get_or_load("demo", "facts", loader)
+    cache.get_or_load("demo", "labels", loader, params=("datasets",))
+    assert loader.calls == 4
+
+
+def test_catalog_cache_ttl():
+    cache = CatalogCache(ttl=10)
+    loader = _Loader("a")
+
+    with mock.patch("gooddata_sdk.catalog.workspace.catalog_cache.time.time", return_value=100.0):
+        cache.get_or_load("demo", "labels", loader)
+    with mock.patch("gooddata_sdk.catalog.workspace.catalog_cache.time.time", return_value=105.0):
+        cache.get_or_load("demo", "labels", loader)
+    assert loader.calls == 1
+
+    with mock.patch("gooddata_sdk.catalog.workspace.catalog_cache.time.time", return_value=111.0):
+        cache.get_or_load("demo", "labels", loader)
+    assert loader.calls == 2
+
+
+def test_catalog_cache_lru():
+    cache = CatalogCache(max_entries=2)
+    loader = _Loader("a")
+
+    cache.get_or_load("ws1", "labels", loader)
+    cache.get_or_load("ws2", "labels", loader)
+    # touch ws1 so that ws2 becomes the least recently used entry
+    cache.get_or_load("ws1", "labels", loader)
+    cache.get_or_load("ws3", "labels", loader)
+    assert len(cache) == 2
+    assert loader.calls == 3
+
+    cache.get_or_load("ws1", "labels", loader)
+    assert loader.calls == 3
+    cache.get_or_load("ws2", "labels", loader)
+    assert loader.calls == 4
+
+
+def test_catalog_cache_invalidate():
+    cache = CatalogCache()
+    loader = _Loader("a")
+
+    cache.get_or_load("ws1", "labels", loader)
+    cache.get_or_load("ws1", "facts", loader)
+    cache.get_or_load("ws2", "labels", loader)
+
+    cache.invalidate("ws1")
+    assert len(cache) == 1
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_catalog_cache_persistence(tmp_path):
+    cache = CatalogCache(persist_dir=tmp_path)
+    cache.get_or_load("ws1", "labels", _Loader("a"))
+    cache.get_or_load("ws2", "labels", _Loader("b"))
+
+    restored = CatalogCache(persist_dir=tmp_path)
+    loader = _Loader("c")
+    assert restored.get_or_load("ws1", "labels", loader) == ["a"]
+    assert loader.calls == 0
+
+    restored.invalidate("ws1")
+    assert CatalogCache(persist_dir=tmp_path).get_or_load("ws1", "labels", loader) == ["c"]
+    assert CatalogCache(persist_dir=tmp_path).get_or_load("ws2", "labels", loader) == ["b"]
+
+
+def test_catalog_cache_persistence_expired(tmp_path):
+    with mock.patch("gooddata_sdk.catalog.workspace.catalog_cache.time.time", return_value=100.0):
+        CatalogCache(ttl=10, persist_dir=tmp_path).get_or_load("ws1", "labels", _Loader("a"))
+
+    loader = _Loader("b")
+    with mock.patch("gooddata_sdk.catalog.workspace.catalog_cache.time.time", return_value=200.0):
+        assert CatalogCache(ttl=10, persist_dir=tmp_path).get_or_load("ws1", "labels", loader) == ["b"]
+    assert loader.calls == 1
+
+
+def test_catalog_cache_persistence_catalog_objects(tmp_path):
+    metrics = [CatalogMetric(id="revenue", title="Revenue", tags=["sales"])]
+    CatalogCache(persist_dir=tmp_path).get_or_load("ws1", "metrics", lambda: metrics)
+
+    # entries are stored as JSON, never pickled
+    assert [path.suffix for path in tmp_path.iterdir()] == [".json"]
+
+    loader = _Loader("a")
+    assert CatalogCache(persist_dir=tmp_path).get_or_load("ws1", "metrics", loader) == metrics
+    assert loader.calls == 0
+
+
+def test_catalog_cache_invalidated_by_workspace_service():
+    cache = CatalogCache()
+    sdk = GoodDataSdk.create(host_="http://localhost:3000", token_="token", catalog_cache_=cache)
+    cache.get_or_load("ws1", "labels", _Loader("a"))
+    cache.get_or_load("ws2", "labels", _Loader("b"))
+
+    with mock.patch.object(sdk.catalog_workspace, "_layout_api") as layout_api:
+        sdk.catalog_workspace.put_declarative_workspace("ws1", mock.Mock())
+        assert len(cache) == 1
+
+        sdk.catalog_workspace.put_declarative_workspaces(mock.Mock())
+        assert len(cache) == 0
+        assert layout_api.set_workspaces_layout.called
+
+
+def test_catalog_cache_invalid_config():
+    with pytest.raises(ValueError):
+        CatalogCache(ttl=0)
+    with pytest.raises(ValueError):
+        CatalogCache(max_entries=0)
+
+
+@gd_vcr.use_cassette(str(_fixtures_dir / "demo_catalog_list_labels.yaml"))
+def test_catalog_list_labels_cached(test_config):
+    sdk = GoodDataSdk.create(host_=test_config["host"], token_=test_config["token"], catalog_cache_=CatalogCache())
+    labels_list = sdk.catalog_workspace_content.get_labels_catalog(test_config["workspace"])
+    assert len(labels_list) == 31
+
+    # the cassette contains the requests only once, the second call must be served from the cache
+    cached_labels_list = sdk.catalog_workspace_content.get_labels_catalog(test_config["workspace"])
+    assert cached_labels_list == labels_list
+    assert cached_labels_list is not labels_list
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+import time
 from pathlib import Path
 from xml.etree import ElementTree as ET
 
@@ -123,6 +124,32 @@ def test_store_declarative_workspaces(test_config):
     assert workspaces_e.to_dict(camel_case=True) == workspaces_o.to_dict(camel_case=True)
 
 
+def test_store_and_load_declarative_workspaces_incrementally(tmp_path):
+    expected = CatalogDeclarativeWorkspaces.load_from_disk(_current_dir / "load" / "gooddata_layouts" / "default")
+
+    expected.store_to_disk(tmp_path, incremental=True)
+    assert CatalogDeclarativeWorkspaces.load_from_disk(tmp_path) == expected
+    assert CatalogDeclarativeWorkspaces.load_from_disk(tmp_path, incremental=True) == expected
+
+    metrics_folder = tmp_path / "workspaces" / "demo" / "analytics_model" / "metrics"
+    mtimes = {p.name: p.stat().st_mtime_ns for p in metrics_folder.glob("*.yaml")}
+    demo = next(workspace for workspace in expected.workspaces if workspace.id == "demo")
+    assert demo.model is not None and demo.model.analytics is not None
+    removed_metric = demo.model.analytics.metrics.pop()
+    changed_metric = demo.model.analytics.metrics[0]
+    changed_metric.title = "Changed title"
+    expected.workspaces = [workspace for workspace in expected.workspaces if workspace.id != "demo_west_california"]
+
+    time.sleep(0.01)
+    expected.store_to_disk(tmp_path, incremental=True)
+
+    assert not (tmp_path / "workspaces" / "demo_west_california").exists()
+    assert not (metrics_folder / f"{removed_metric.id}.yaml").exists()
+    for path in metrics_folder.glob("*.yaml"):
+        assert (path.stat().st_mtime_ns == mtimes[path.name]) == (path.stem != changed_metric.id)
+    assert CatalogDeclarativeWorkspaces.load_from_disk(tmp_path, incremental=True) == expected
+
+
 @gd_vcr.use_cassette(str(_fixtures_dir / "demo_put_declarative_workspaces.yaml"))
 def test_put_declarative_workspaces(test_config):
     sdk = GoodDataSdk.create(host_=test_config["host"], token_=test_config["token"])
@@ -7,6 +7,7 @@ from pathlib import Path
 from unittest.mock import MagicMock
 
 import attrs
+import pytest
 from gooddata_sdk import (
     CatalogDatasetWorkspaceDataFilterIdentifier,
     CatalogDeclarativeAnalytics,
@@ -21,6 +22,7 @@ from gooddata_sdk import (
     CatalogValidateByItem,
     CatalogWorkspace,
     DataSourceValidator,
+    GoodDataApiClient,
     GoodDataSdk,
     ObjId,
 )
@@ -247,8 +249,10 @@ def test_put_declarative_ldm(test_config):
 
 
 @gd_vcr.use_cassette(str(_fixtures_dir / "demo_get_declarative_analytics_model.yaml"))
-def test_get_declarative_analytics_model(test_config):
-    sdk = GoodDataSdk.create(host_=test_config["host"], token_=test_config["token"])
+@pytest.mark.parametrize("raw_responses", [True, False])
+def test_get_declarative_analytics_model(test_config, raw_responses):
+    client = GoodDataApiClient(test_config["host"], test_config["token"], raw_responses=raw_responses)
+    sdk = GoodDataSdk(client)
     path = _current_dir / "expected" / "declarative_analytics_model.json"
     analytics_model_o = sdk.catalog_workspace_content.get_declarative_analytics_model(
         test_config["workspace"], exclude=["ACTIVITY_INFO"]
@@ -281,8 +285,10 @@ def test_get_declarative_analytics_model_child(test_config):
 
 
 @gd_vcr.use_cassette(str(_fixtures_dir / "demo_get_declarative_ldm.yaml"))
-def test_get_declarative_ldm(test_config):
-    sdk = GoodDataSdk.create(host_=test_config["host"], token_=test_config["token"])
+@pytest.mark.parametrize("raw_responses", [True, False])
+def test_get_declarative_ldm(test_config, raw_responses):
+    client = GoodDataApiClient(test_config["host"], test_config["token"], raw_responses=raw_responses)
+    sdk = GoodDataSdk(client)
     path = _current_dir / "expected" / "declarative_ldm.json"
     ldm_o = sdk.catalog_workspace_content.get_declarative_ldm(test_config["workspace"])
 
@@ -312,6 +318,17 @@ def test_catalog_load(test_config):
     assert customer is not None
     assert customer.find_label_attribute(ObjId(id="region", type="label"))
 
+    state = catalog.find_label_attribute("label/geo__state__location")
+    assert state is not None
+    assert state.id == "state"
+    assert state.find_label({"id": "geo__state__location", "type": "label"}) is not None
+    assert catalog.find_label_attribute(ObjId(id="state", type="attribute")) is None
+    assert catalog.get_attribute_dataset("state") == customer
+    assert catalog.get_attribute_dataset(ObjId(id="date.year", type="attribute")) == catalog.get_dataset("date")
+    assert catalog.get_fact("fact/price") is not None
+    assert catalog.get_fact(ObjId(id="budget", type="fact")) is not None
+    assert catalog.get_fact("missing") is None
+
 
 @gd_vcr.use_cassette(str(_fixtures_dir / "demo_catalog_availability.yaml"))
 def test_catalog_availability(test_config):
@@ -325,6 +342,13 @@ def test_catalog_availability(test_config):
     assert len(filtered_catalog.metrics) == 24
     assert len(filtered_catalog.datasets) == 3
 
+    # lookup indexes are rebuilt for the filtered catalog
+    assert catalog.find_label_attribute("label/region") is not None
+    assert filtered_catalog.find_label_attribute("label/region") is None
+    assert filtered_catalog.find_label_attribute("label/campaign_name") is not None
+    assert filtered_catalog.get_attribute_dataset("campaign_name") == filtered_catalog.get_dataset("campaigns")
+    assert filtered_catalog.get_fact("spend") is not None
+
 
 @gd_vcr.use_cassette(str(_fixtures_dir / "demo_get_dependent_entities_graph.yaml"))
 def test_get_dependent_entities_graph(test_config):
@@ -433,6 +457,21 @@ def test_label_elements(test_config):
     assert label_values == ["Delivered"]
 
 
+def test_label_elements_count():
+    sdk = GoodDataSdk.create(host_="http://localhost:3000", token_="token")
+    actions_api = MagicMock()
+    actions_api.compute_label_elements_post.return_value = {
+        "elements": [{"title": "Canceled"}],
+        "paging": {"count": 1, "offset": 0, "total": 3},
+    }
+    sdk.catalog_workspace_content._actions_api = actions_api
+
+    assert sdk.catalog_workspace_content.get_label_elements_count("demo", "label/order_status") == 3
+    args, kwargs = actions_api.compute_label_elements_post.call_args
+    assert args[1].label == "order_status"
+    assert kwargs["limit"] == 1
+
+
 @gd_vcr.use_cassette(str(_fixtures_dir / "explicit_workspace_data_filter.yaml"))
 def test_explicit_workspace_data_filter(test_config):
     """
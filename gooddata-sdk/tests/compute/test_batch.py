@@ -0,0 +1,87 @@
+# (C) 2024 GoodData Corporation
+import threading
+from unittest import mock
+
+import pytest
+from gooddata_sdk import Attribute, ComputeService, ObjId, SimpleMetric
+from gooddata_sdk.compute.batch import run_batch
+from gooddata_sdk.table import _prepare_tabular_definition
+
+
+def _exec_def(label: str):
+    return _prepare_tabular_definition(
+        attributes=[Attribute(local_id="a", label=label)],
+        filters=[],
+        metrics=[SimpleMetric(local_id="m", item=ObjId(id="price", type="fact"))],
+    )
+
+
+def _label(exec_def) -> str:
+    return exec_def.attributes[0].label.id
+
+
+def test_run_batch_ordered():
+    exec_defs = [_exec_def(label) for label in ("region", "state", "region", "city")]
+    processed = []
+
+    def _process(exec_def):
+        processed.append(_label(exec_def))
+        if _label(exec_def) == "state":
+            raise ValueError("failed")
+        return _label(exec_def)
+
+    items = list(run_batch(exec_defs, _process, max_concurrency=2))
+
+    assert [item.index for item in items] == [0, 1, 2, 3]
+    assert [item.result for item in items] == ["region", None, "region", "city"]
+    assert [item.is_success for item in items] == [True, False, True, True]
+    assert items[2].exec_def is exec_defs[2]
+    # equal execution definitions are processed just once
+    assert sorted(processed) == ["city", "region", "state"]
+    with pytest.raises(ValueError):
+        items[1].unwrap()
+
+
+def test_run_batch_copies_shared_results():
+    exec_defs = [_exec_def("region"), _exec_def("region"), _exec_def("region")]
+
+    shared = list(run_batch(exec_defs, lambda exec_def: [_label(exec_def)]))
+    copied = list(run_batch(exec_defs, lambda exec_def: [_label(exec_def)], copy_result=list))
+
+    assert shared[0].result is shared[1].result is shared[2].result
+    assert [item.result for item in copied] == [["region"]] * 3
+    assert len({id(item.result) for item in copied}) == 3
+
+
+def test_run_batch_as_completed():
+    exec_defs = [_exec_def("region"), _exec_def("state")]
+    state_consumed = threading.Event()
+
+    def _process(exec_def):
+        # region is processed only once state was yielded to the consumer
+        if _label(exec_def) == "region":
+            assert state_consumed.wait(timeout=5)
+        return _label(exec_def)
+
+    items = run_batch(exec_defs, _process, max_concurrency=2, ordered=False)
+    first = next(items)
+    state_consumed.set()
+
+    assert [(item.index, item.result) for item in [first, *items]] == [(1, "state"), (0, "region")]
+
+
+def test_run_batch_invalid_concurrency():
+    with pytest.raises(ValueError):
+        list(run_batch([_exec_def("region")], lambda exec_def: None, max_concurrency=0))
+
+
+def test_compute_for_exec_defs():
+    api_client = mock.Mock(name="api_client", custom_headers={})
+    api_client.actions_api.compute_report.return_value = {"execution_response": {"links": {"executionResult": "r"}}}
+    compute = ComputeService(api_client)
+
+    items = list(compute.for_exec_defs("demo", [_exec_def("region"), _exec_def("state")], max_concurrency=2))
+
+    assert [item.unwrap().workspace_id for item in items] == ["demo", "demo"]
+    assert [item.unwrap().exec_def for item in items] == [_exec_def("region"), _exec_def("state")]
+    assert api_client.actions_api.compute_report.call_count == 2
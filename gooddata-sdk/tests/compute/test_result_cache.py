@@ -0,0 +1,158 @@
+# (C) 2024 GoodData Corporation
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+from gooddata_api_client.exceptions import ApiException
+from gooddata_sdk import Attribute, ComputeService, ExecutionResult, ExecutionResultCache, ObjId, SimpleMetric
+from gooddata_sdk.table import _prepare_tabular_definition
+
+
+def _exec_def(label: str = "region"):
+    return _prepare_tabular_definition(
+        attributes=[Attribute(local_id="a", label=label)],
+        filters=[],
+        metrics=[SimpleMetric(local_id="m", item=ObjId(id="price", type="fact"))],
+    )
+
+
+def _page(offset: int) -> ExecutionResult:
+    return ExecutionResult(
+        {
+            "data": [[offset]],
+            "dimension_headers": [],
+            "grand_totals": [],
+            "paging": {"count": [1, 1], "offset": [offset, 0], "total": [2, 1]},
+        }
+    )
+
+
+def _compute_service(result_cache: ExecutionResultCache) -> ComputeService:
+    api_client = mock.Mock(name="api_client", custom_headers={})
+    actions_api = api_client.actions_api
+    actions_api.compute_report.side_effect = lambda *args, **kwargs: {
+        "execution_response": {"links": {"executionResult": f"result{actions_api.compute_report.call_count}"}}
+    }
+    api_client.call_json.side_effect = lambda api_method, **kwargs: api_method(**kwargs)
+    actions_api.retrieve_result.side_effect = lambda **kwargs: (
+        {
+            "data": [[kwargs["offset"][0]]],
+            "dimensionHeaders": [],
+            "grandTotals": [],
+            "paging": {"count": [1, 1], "offset": kwargs["offset"], "total": [2, 1]},
+        },
+        200,
+        {},
+    )
+    return ComputeService(api_client, result_cache=result_cache)
+
+
+def test_result_cache_response():
+    compute = _compute_service(ExecutionResultCache())
+    actions_api = compute._actions_api
+
+    execution = compute.for_exec_def("demo", _exec_def())
+    # equal execution definition is served from the cache, the other ones are computed
+    assert compute.for_exec_def("demo", _exec_def()).result_id == execution.result_id
+    assert actions_api.compute_report.call_count == 1
+
+    compute.for_exec_def("demo", _exec_def(label="state"))
+    compute.for_exec_def("other", _exec_def())
+    assert actions_api.compute_report.call_count == 3
+
+
+def test_result_cache_pages():
+    compute = _compute_service(ExecutionResultCache(cache_pages=True))
+    actions_api = compute._actions_api
+
+    pages = list(compute.for_exec_def("demo", _exec_def()).read_result_pages(limit=[1, 1], max_concurrency=1))
+    cached_pages = list(compute.for_exec_def("demo", _exec_def()).read_result_pages(limit=[1, 1], max_concurrency=1))
+
+    assert [p.data for p in cached_pages] == [p.data for p in pages] == [[[0]], [[1]]]
+    assert actions_api.retrieve_result.call_count == 2
+
+
+def test_result_cache_recompute_expired_result():
+    compute = _compute_service(ExecutionResultCache())
+    actions_api = compute._actions_api
+    compute.for_exec_def("demo", _exec_def())
+
+    execution = compute.for_exec_def("demo", _exec_def())
+    retrieve_result = actions_api.retrieve_result.side_effect
+
+    def _retrieve_expired_result(**kwargs):
+        # the backend dropped the cached result, but knows the recomputed one
+        if kwargs["result_id"] == "result1":
+            raise ApiException(status=410)
+        return retrieve_result(**kwargs)
+
+    actions_api.retrieve_result.side_effect = _retrieve_expired_result
+
+    assert execution.read_result(limit=[1, 1]).data == [[0]]
+    assert execution.result_id == "result2"
+    assert compute.for_exec_def("demo", _exec_def()).result_id == "result2"
+
+
+def test_result_cache_recompute_expired_result_concurrently():
+    compute = _compute_service(ExecutionResultCache())
+    actions_api = compute._actions_api
+    compute.for_exec_def("demo", _exec_def())
+
+    execution = compute.for_exec_def("demo", _exec_def())
+    retrieve_result = actions_api.retrieve_result.side_effect
+    expired = threading.Barrier(2)
+
+    def _retrieve_expired_result(**kwargs):
+        if kwargs["result_id"] == "result1":
+            # both readers find the result expired before any of them recomputes it
+            expired.wait(timeout=10)
+            raise ApiException(status=410)
+        return retrieve_result(**kwargs)
+
+    actions_api.retrieve_result.side_effect = _retrieve_expired_result
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pages = list(executor.map(lambda offset: execution.read_result(limit=[1, 1], offset=[offset, 0]), [0, 1]))
+
+    assert [page.data for page in pages] == [[[0]], [[1]]]
+    assert actions_api.compute_report.call_count == 2
+    assert execution.result_id == "result2"
+
+
+def test_result_cache_lru_and_ttl():
+    cache = ExecutionResultCache(max_entries=1, ttl=10)
+    response = {"execution_response": {"links": {"executionResult": "r"}}}
+
+    with mock.patch("gooddata_sdk.compute.result_cache.time.time", return_value=100.0):
+        cache.put_response("demo", _exec_def(), response)
+        cache.put_response("demo", _exec_def(label="state"), response)
+        assert cache.get_response("demo", _exec_def()) is None
+        assert cache.get_response("demo", _exec_def(label="state")) is response
+    with mock.patch("gooddata_sdk.compute.result_cache.time.time", return_value=111.0):
+        assert cache.get_response("demo", _exec_def(label="state")) is None
+
+
+def test_result_cache_spill(tmp_path):
+    cache = ExecutionResultCache(cache_pages=True, max_pages=1, spill_dir=tmp_path)
+    cache.put_page("demo", "r", [0, 0], [1, 1], _page(0))
+    cache.put_page("demo", "r", [1, 0], [1, 1], _page(1))
+
+    # first page was evicted from memory to the spill directory, as JSON - never pickled
+    assert [path.suffix for path in tmp_path.iterdir()] == [".json"]
+    assert cache.get_page("demo", "r", [0, 0], [1, 1]).data == [[0]]
+    assert cache.get_page("demo", "r", [1, 0], [1, 1]).data == [[1]]
+    assert cache.get_page("demo", "r", [0, 0], [2, 1]) is None
+
+    cache.invalidate("demo")
+    assert list(tmp_path.iterdir()) == []
+    assert cache.get_page("demo", "r", [0, 0], [1, 1]) is None
+
+
+def test_result_cache_invalid_config():
+    with pytest.raises(ValueError):
+        ExecutionResultCache(ttl=0)
+    with pytest.raises(ValueError):
+        ExecutionResultCache(max_entries=0)
+    with pytest.raises(ValueError):
+        ExecutionResultCache(max_pages=0)
@@ -0,0 +1,84 @@
+# (C) 2024 GoodData Corporation
+import random
+import threading
+import time
+from typing import Optional, Union
+
+import pytest
+from gooddata_sdk import BareExecutionResponse, ExecutionResult
+
+_TOTAL = [7, 5]
+
+
+class _PagedResponse(BareExecutionResponse):
+    """
+    Serves empty pages of a result with the given total size; pages are returned with random delays so that
+    concurrently fetched pages complete out of order.
+    """
+
+    def __init__(self) -> None:
+        self.requests: list[tuple[list[int], list[int]]] = []
+        self._lock = threading.Lock()
+
+    def read_result(self, limit: Union[int, list[int]], offset: Union[None, int, list[int]] = None) -> ExecutionResult:
+        assert isinstance(limit, list) and isinstance(offset, list)
+        with self._lock:
+            self.requests.append((offset, limit))
+        time.sleep(random.uniform(0, 0.01))
+        count = [max(0, min(lim, total - off)) for off, lim, total in zip(offset, limit, _TOTAL)]
+        return ExecutionResult(
+            {
+                "data": [],
+                "dimension_headers": [],
+                "grand_totals": [],
+                "paging": {"count": count, "offset": offset, "total": _TOTAL},
+            }
+        )
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 3])
+def test_read_result_pages_in_order(max_concurrency: int):
+    response = _PagedResponse()
+
+    pages = list(response.read_result_pages(limit=[3, 2], offset=[0, 0], max_concurrency=max_concurrency))
+
+    assert [page.paging_offset for page in pages] == [
+        [row, col] for row in range(0, _TOTAL[0], 3) for col in range(0, _TOTAL[1], 2)
+    ]
+    assert all(limit == [3, 2] for _, limit in response.requests)
+
+
+def test_read_next_result_pages_first_dim_only():
+    response = _PagedResponse()
+    first_page = response.read_result(limit=[3, 2], offset=[0, 0])
+
+    pages = list(response.read_next_result_pages(after=first_page, first_dim_only=True))
+
+    assert [page.paging_offset for page in pages] == [[3, 0], [6, 0]]
+    assert [limit for _, limit in response.requests[1:]] == [[3, 2], [3, 2]]
+
+
+def test_read_result_pages_stops_fetching_when_closed():
+    response = _PagedResponse()
+    pages = response.read_result_pages(limit=[1, 1], offset=[0, 0], max_concurrency=2)
+
+    first: Optional[ExecutionResult] = next(pages)
+    assert first is not None and first.paging_offset == [0, 0]
+    pages.close()
+
+    # nothing else gets requested once the consumer stops reading
+    requested = len(response.requests)
+    time.sleep(0.05)
+    assert len(response.requests) == requested
+
+
+def test_read_next_result_pages_stop():
+    response = _PagedResponse()
+    first_page = response.read_result(limit=[2, 2], offset=[0, 0])
+
+    pages = list(response.read_next_result_pages(after=first_page, stop=[5]))
+
+    # pages starting at or beyond row 5 are not read, all columns are
+    assert [page.paging_offset for page in pages] == [
+        [row, col] for row in range(0, 5, 2) for col in range(0, _TOTAL[1], 2)
+    ][1:]
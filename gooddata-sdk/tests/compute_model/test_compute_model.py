@@ -8,8 +8,8 @@ from typing import Optional
 import pytest
 from gooddata_sdk.compute.model.attribute import Attribute
 from gooddata_sdk.compute.model.base import Filter, ObjId
-from gooddata_sdk.compute.model.execution import compute_model_to_api_model
-from gooddata_sdk.compute.model.filter import AbsoluteDateFilter, PositiveAttributeFilter
+from gooddata_sdk.compute.model.execution import ExecutionDefinition, TableDimension, compute_model_to_api_model
+from gooddata_sdk.compute.model.filter import AbsoluteDateFilter, AllTimeFilter, PositiveAttributeFilter
 from gooddata_sdk.compute.model.metric import (
     Metric,
     PopDate,
@@ -99,3 +99,59 @@ def test_attribute_filters_to_api_model(
         json.dumps(afm.to_dict(), indent=4, sort_keys=True),
         _scenario_to_snapshot_name(scenario),
     )
+
+
+def _exec_def(
+    attributes: list[Attribute], metrics: list[Metric], filters: list[Filter], dims: Optional[list[list[str]]] = None
+) -> ExecutionDefinition:
+    dims = dims or [["attribute_local_id", "attribute_local_id2"], ["measureGroup"]]
+    return ExecutionDefinition(
+        attributes=attributes,
+        metrics=metrics,
+        filters=filters,
+        dimensions=[TableDimension(item_ids=dim) for dim in dims],
+    )
+
+
+def test_exec_def_fingerprint():
+    attribute2 = Attribute(local_id="attribute_local_id2", label="label2.id")
+    exec_def = _exec_def([_attribute, attribute2], [_simple_metric, _pop_date_metric], [_positive_filter])
+
+    # order of attributes, filters and attribute filter values does not matter, noop filters are ignored
+    same_exec_def = _exec_def(
+        [attribute2, _attribute],
+        [_simple_metric, _pop_date_metric],
+        [
+            AllTimeFilter(dataset=ObjId(type="dataset", id="dataset.id")),
+            PositiveAttributeFilter(label=_attribute, values=["val2", "val1"]),
+        ],
+    )
+    assert exec_def.fingerprint() == same_exec_def.fingerprint()
+    assert exec_def == same_exec_def
+    assert len({exec_def, same_exec_def}) == 1
+
+    # order of metrics and of items in dimensions determines layout of the result
+    assert exec_def != _exec_def([_attribute, attribute2], [_pop_date_metric, _simple_metric], [_positive_filter])
+    assert exec_def != _exec_def(
+        [_attribute, attribute2],
+        [_simple_metric, _pop_date_metric],
+        [_positive_filter],
+        dims=[["attribute_local_id2", "attribute_local_id"], ["measureGroup"]],
+    )
+    assert exec_def != _exec_def([_attribute, attribute2], [_simple_metric, _pop_date_metric], [_absolute_date_filter])
+
+
+def test_entity_fingerprint():
+    assert _attribute.fingerprint() == Attribute(local_id="attribute_local_id", label="label.id").fingerprint()
+    assert _attribute.fingerprint() != Attribute(local_id="attribute_local_id", label="label2.id").fingerprint()
+    assert _simple_metric.fingerprint() != _pop_date_metric.fingerprint()
+    assert (
+        _positive_filter.fingerprint()
+        == PositiveAttributeFilter(label=_attribute, values=["val2", "val1"]).fingerprint()
+    )
+
+
+def test_exec_def_api_model_memoized():
+    exec_def = _exec_def([_attribute], [_simple_metric], [_positive_filter], dims=[["attribute_local_id"]])
+
+    assert exec_def.as_api_model() is exec_def.as_api_model()
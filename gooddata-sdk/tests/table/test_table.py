@@ -80,6 +80,40 @@ def test_table_with_attribute_metric_and_filter(test_config):
     assert len(values) == 2
 
 
+@gd_vcr.use_cassette(str(_fixtures_dir / "table_with_just_metric.yaml"))
+def test_table_with_just_measure_arrow(test_config):
+    pytest.importorskip("pyarrow")
+    sdk = GoodDataSdk.create(host_=test_config["host"], token_=test_config["token"])
+    table = sdk.tables.for_items(
+        test_config["workspace"],
+        items=[SimpleMetric(local_id="metric1", item=ObjId(type="metric", id="order_amount"))],
+    )
+
+    arrow_table = table.read_all_arrow()
+
+    assert arrow_table.column_names == ["metric1"]
+    assert arrow_table.num_rows == 1
+    assert arrow_table.column("metric1")[0].as_py() > 0
+
+
+@gd_vcr.use_cassette(str(_fixtures_dir / "table_with_attribute_and_metric.yaml"))
+def test_table_with_attribute_and_metric_arrow(test_config):
+    pytest.importorskip("pyarrow")
+    sdk = GoodDataSdk.create(host_=test_config["host"], token_=test_config["token"])
+    table = sdk.tables.for_items(
+        test_config["workspace"],
+        items=[
+            Attribute(local_id="attr1", label="region"),
+            SimpleMetric(local_id="metric1", item=ObjId(type="metric", id="order_amount")),
+        ],
+    )
+
+    arrow_table = table.read_all_arrow()
+
+    assert arrow_table.column_names == ["attr1", "metric1"]
+    assert arrow_table.column("attr1").to_pylist() == ["Midwest", "Northeast", "South", "Unknown", "West"]
+
+
 @gd_vcr.use_cassette(str(_fixtures_dir / "table_with_attribute_show_all_values.yaml"))
 def test_table_with_attribute_show_all_values(test_config: dict):
     sdk = GoodDataSdk.create(host_=test_config["host"], token_=test_config["token"])
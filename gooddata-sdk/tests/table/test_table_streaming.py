@@ -0,0 +1,171 @@
+# (C) 2024 GoodData Corporation
+from __future__ import annotations
+
+import gc
+import weakref
+from typing import Union
+
+import pytest
+from gooddata_sdk import Attribute, BareExecutionResponse, ExecutionResult, ObjId, SimpleMetric, SortDirection
+from gooddata_sdk.table import _as_table, _prepare_tabular_definition
+
+_ROWS = 20
+
+
+class _TableResponse:
+    """
+    Serves result of a table with two attributes and optionally one metric. Row `i` contains
+    values `a{i}`, `b{i}` and `i`.
+    """
+
+    read_next_result_pages = BareExecutionResponse.read_next_result_pages
+
+    def __init__(self, with_metrics: bool = True) -> None:
+        self.exec_def = _prepare_tabular_definition(
+            attributes=[Attribute(local_id="a", label="a"), Attribute(local_id="b", label="b")],
+            metrics=[SimpleMetric(local_id="m", item=ObjId(id="m", type="fact"))] if with_metrics else [],
+            filters=[],
+        )
+        self.result_id = "result"
+        self.pages: weakref.WeakSet = weakref.WeakSet()
+
+    def read_result(self, limit: Union[int, list[int]], offset: Union[None, int, list[int]] = None) -> ExecutionResult:
+        assert isinstance(limit, list) and isinstance(offset, list)
+        rows = range(offset[0], min(offset[0] + limit[0], _ROWS))
+        headers = [
+            {
+                "headerGroups": [
+                    {"headers": [{"attributeHeader": {"labelValue": f"{p}{i}"}} for i in rows]} for p in "ab"
+                ]
+            }
+        ]
+        page = ExecutionResult(
+            {
+                "data": [[float(i)] for i in rows] if self.exec_def.has_metrics() else [],
+                "dimension_headers": headers,
+                "grand_totals": [],
+                "paging": {
+                    "count": [len(rows), *limit[1:]],
+                    "offset": offset,
+                    "total": [_ROWS, *limit[1:]],
+                },
+            }
+        )
+        self.pages.add(page)
+        return page
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+@pytest.mark.parametrize("batch_size", [1, 3, 512])
+def test_table_rows(streaming: bool, batch_size: int):
+    table = _as_table(_TableResponse(), batch_size=batch_size, streaming=streaming)  # type: ignore[arg-type]
+
+    assert len(table) == _ROWS
+    assert list(table.read_all()) == [{"a": f"a{i}", "b": f"b{i}", "m": float(i)} for i in range(_ROWS)]
+
+
+def test_table_tuples_without_metrics():
+    table = _as_table(_TableResponse(with_metrics=False), batch_size=2)  # type: ignore[arg-type]
+
+    assert list(table.read_all_tuples()) == [(f"a{i}", f"b{i}") for i in range(_ROWS)]
+    # non-streaming table can be read repeatedly
+    assert list(table.read_all_tuples()) == [(f"a{i}", f"b{i}") for i in range(_ROWS)]
+
+
+def test_streaming_table_releases_pages():
+    response = _TableResponse()
+    table = _as_table(response, batch_size=1, streaming=True)  # type: ignore[arg-type]
+
+    # first page is held by the table, the later ones are just being prefetched
+    rows = table.read_all_tuples()
+    for i, row in enumerate(rows):
+        assert row == (f"a{i}", f"b{i}", float(i))
+        gc.collect()
+        assert len(response.pages) <= 2 + 4
+
+    with pytest.raises(ValueError):
+        list(table.read_all_tuples())
+
+
+def test_table_invalid_batch_size():
+    with pytest.raises(ValueError):
+        _as_table(_TableResponse(), batch_size=0)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("with_metrics", [False, True])
+def test_table_record_batch_reader(with_metrics: bool):
+    pa = pytest.importorskip("pyarrow")
+    table = _as_table(_TableResponse(with_metrics), batch_size=8, streaming=True)  # type: ignore[arg-type]
+
+    reader = table.to_record_batch_reader()
+    batches = list(reader)
+
+    assert [batch.num_rows for batch in batches] == [8, 8, 4]
+    assert reader.schema == table.arrow_schema()
+    assert reader.schema.field("a").type == pa.dictionary(pa.int32(), pa.string())
+    arrow_table = pa.Table.from_batches(batches)
+    assert arrow_table.column("a").to_pylist() == [f"a{i}" for i in range(_ROWS)]
+    assert arrow_table.column("b").to_pylist() == [f"b{i}" for i in range(_ROWS)]
+    if with_metrics:
+        assert reader.schema.field("m").type == pa.float64()
+        assert arrow_table.column("m").to_pylist() == [float(i) for i in range(_ROWS)]
+    else:
+        assert arrow_table.column_names == ["a", "b"]
+
+
+def test_table_read_all_arrow_nulls():
+    pa = pytest.importorskip("pyarrow")
+    response = _TableResponse()
+    read_result = response.read_result
+
+    def _read_result_with_nulls(limit, offset=None):
+        page = read_result(limit, offset)
+        page.data[0][0] = None
+        page.headers[0]["headerGroups"][1]["headers"][0]["attributeHeader"]["labelValue"] = None
+        return page
+
+    response.read_result = _read_result_with_nulls  # type: ignore[method-assign]
+    arrow_table = _as_table(response, batch_size=10).read_all_arrow()  # type: ignore[arg-type]
+
+    assert arrow_table.num_rows == _ROWS
+    assert arrow_table.column("m").null_count == 2
+    assert arrow_table.column("b").null_count == 2
+    assert arrow_table.column("b").type == pa.dictionary(pa.int32(), pa.string())
+
+
+@pytest.mark.parametrize("row_limit, batch_size", [(0, 4), (3, 8), (5, 2), (8, 4), (100, 8)])
+def test_table_row_limit(row_limit: int, batch_size: int):
+    response = _TableResponse()
+    requested: list[list[int]] = []
+    read_result = response.read_result
+
+    def _read_result(limit, offset=None):
+        requested.append(list(offset))
+        return read_result(limit, offset)
+
+    response.read_result = _read_result  # type: ignore[method-assign]
+    table = _as_table(response, batch_size=batch_size, row_limit=row_limit)  # type: ignore[arg-type]
+
+    expected_rows = min(row_limit, _ROWS)
+    assert len(table) == expected_rows
+    assert [row[0] for row in table.read_all_tuples()] == [f"a{i}" for i in range(expected_rows)]
+    # pages beyond the limit are never requested
+    assert all(offset[0] < max(row_limit, 1) for offset in requested)
+
+
+def test_tabular_definition_sorting():
+    attributes = [Attribute(local_id="a", label="a"), Attribute(local_id="b", label="b")]
+    metrics = [SimpleMetric(local_id="m", item=ObjId(id="m", type="fact"))]
+
+    exec_def = _prepare_tabular_definition(
+        attributes, [], metrics, sort_by=[("m", SortDirection.DESC), ("a", SortDirection.ASC)]
+    )
+
+    assert exec_def.dimensions[0].sorting == [
+        {"value": {"dataColumnLocators": {"dim_1": {"measureGroup": "m"}}, "direction": "DESC"}},
+        {"attribute": {"attributeIdentifier": "a", "direction": "ASC", "sortType": "DEFAULT"}},
+    ]
+    assert exec_def.dimensions[1].sorting == []
+
+    with pytest.raises(ValueError):
+        _prepare_tabular_definition(attributes, [], metrics, sort_by=[("x", SortDirection.ASC)])
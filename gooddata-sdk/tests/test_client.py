@@ -1,5 +1,10 @@
 # (C) 2021 GoodData Corporation
-from gooddata_sdk import GoodDataApiClient
+import socket
+from unittest import mock
+
+from gooddata_api_client import rest
+from gooddata_sdk import GoodDataApiClient, HttpConfig
+from gooddata_sdk.client import loads_json
 
 
 def test_http_headers_precedence():
@@ -12,3 +17,51 @@ def test_http_headers_precedence():
     agent = c._api_client.default_headers["User-Agent"]
     assert agent.startswith("gooddata")
     assert agent.endswith("yes")
+
+
+def test_http_config():
+    http_config = HttpConfig(max_connections_per_host=16, connect_timeout=5, read_timeout=30, retries=2)
+    c = GoodDataApiClient("http://host", "token", http_config=http_config)
+
+    rest_client = c._api_client.rest_client
+    pool = rest_client.pool_manager.connection_from_url("http://host")
+    assert pool.pool.maxsize == 16
+    assert rest_client._default_timeout == (5, 30)
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in rest_client.pool_manager.connection_pool_kw["socket_options"]
+
+    retry = rest_client.pool_manager.connection_pool_kw["retries"]
+    assert retry.total == 2
+    assert retry.is_retry("GET", 503)
+    assert not retry.is_retry("POST", 503)
+
+    # raw requests share one pooled session
+    adapter = c._session.get_adapter("http://host")
+    assert adapter._pool_maxsize == 16
+    assert adapter.max_retries.total == 2
+
+
+def test_http_config_no_retries_by_default():
+    c = GoodDataApiClient("http://host", "token")
+
+    # the generated client keeps the default retries of urllib3, the raw requests are not retried
+    assert "retries" not in c._api_client.rest_client.pool_manager.connection_pool_kw
+    assert c._session.get_adapter("http://host").max_retries.total == 0
+
+
+def test_http_config_default_timeout():
+    c = GoodDataApiClient("http://host", "token", http_config=HttpConfig(read_timeout=10))
+    rest_client = c._api_client.rest_client
+
+    with mock.patch.object(rest.RESTClientObject, "request") as request:
+        rest_client.request("GET", "http://host/api")
+        rest_client.request("GET", "http://host/api", _request_timeout=1)
+
+    assert [call.kwargs["_request_timeout"] for call in request.call_args_list] == [(10, 10), 1]
+
+
+def test_loads_json_without_orjson():
+    document = b'{"data": [{"id": "revenue", "attributes": {"areRelationsValid": true}}]}'
+    expected = {"data": [{"id": "revenue", "attributes": {"areRelationsValid": True}}]}
+    assert loads_json(document) == expected
+    with mock.patch("gooddata_sdk.client._import_orjson", return_value=None):
+        assert loads_json(document) == expected
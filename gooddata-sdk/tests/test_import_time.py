@@ -0,0 +1,42 @@
+# (C) 2024 GoodData Corporation
+import os
+import subprocess
+import sys
+
+# the SDK directly uses only a fraction of the ~830 generated models
+_MAX_IMPORTED_MODELS = 250
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """
+    Imports the module in a fresh interpreter and returns cumulative import times of all the imported modules
+    in microseconds.
+    """
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_import_time():
+    times = _import_times("gooddata_sdk")
+
+    imported_apis = [name for name in times if name.startswith("gooddata_api_client.api.")]
+    imported_models = [name for name in times if name.startswith("gooddata_api_client.model.")]
+    # the APIs and models are imported lazily, when they are used
+    assert imported_apis == []
+    assert (
+        len(imported_models) <= _MAX_IMPORTED_MODELS
+    ), f"import gooddata_sdk: {times['gooddata_sdk'] / 1000:.0f} ms, {len(imported_models)} models"
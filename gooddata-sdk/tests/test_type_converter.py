@@ -26,6 +26,22 @@ class TestConverter:
         assert sc.to_external_type(test_value) == f"String:{str(test_value)}"
         assert ic.to_external_type(test_value) == f"Integer:{str(test_value)}"
 
+    def test_to_external_type_batch(self):
+        class _Converter(conv.Converter):
+            def to_type(self, value):
+                return int(value)
+
+        c = _Converter()
+        _Converter.set_external_fnc(lambda obj, value: value * 2)
+        assert c.to_external_type_batch(["1", None, "3"]) == [2, None, 6]
+
+        _Converter.set_external_batch_fnc(lambda obj, values: tuple(values))
+        assert c.to_external_type_batch(["1", "2"]) == (1, 2)
+
+        # setting scalar function drops the batch one so that they can't get out of sync
+        _Converter.set_external_fnc(lambda obj, value: -value)
+        assert c.to_external_type_batch(["1", "2"]) == [-1, -2]
+
 
 class TestStringConverter:
     def test_to_type(self):
@@ -59,6 +75,17 @@ class TestDateConverter:
         with pytest.raises(ValueError):
             c.to_type(test_value)
 
+    def test_to_type_batch(self):
+        c = conv.DateConverter()
+        assert c.to_type_batch(["2021-03-15", "2021-01", "1992", None]) == [
+            datetime.date(2021, 3, 15),
+            datetime.date(2021, 1, 1),
+            datetime.date(1992, 1, 1),
+            None,
+        ]
+        with pytest.raises(ValueError):
+            c.to_type_batch(["2021-13-01"])
+
 
 class TestDatetimeConverter:
     def test_to_type_ok(self):
@@ -72,6 +99,13 @@ class TestDatetimeConverter:
         with pytest.raises(ValueError):
             c.to_type(test_value)
 
+    def test_to_type_batch(self):
+        c = conv.DatetimeConverter()
+        values = ["2021-10-20 11", "2021-10-20 12:34", None]
+        assert c.to_type_batch(values) == [c.to_type(values[0]), c.to_type(values[1]), None]
+        with pytest.raises(ValueError):
+            c.to_type_batch(["2021-10-20"])
+
 
 class TestTypeConverterRegistry:
     def test_register_default(self):
@@ -1,10 +1,26 @@
 # (C) 2022 GoodData Corporation
 from __future__ import annotations
 
+import functools
 import json
+import threading
+import time
 from pathlib import Path
+from typing import Any, Optional
+from unittest import mock
 
-from gooddata_sdk.utils import camel_to_snake, change_case, snake_to_camel
+import gooddata_sdk.utils
+import pytest
+from gooddata_api_client import ApiClient
+from gooddata_api_client.model.json_api_metric_out_list import JsonApiMetricOutList
+from gooddata_sdk.utils import (
+    IncrementalLayoutFolder,
+    camel_to_snake,
+    change_case,
+    load_all_entities,
+    snake_to_camel,
+    write_layout_to_file,
+)
 
 _current_dir = Path(__file__).parent.absolute()
 
@@ -25,3 +41,104 @@ def test_snake_to_camel(test_config):
 def test_camel_to_snake(test_config):
     value = "thisIsAnExampleOfCamelCase"
     assert camel_to_snake(value) == "this_is_an_example_of_camel_case"
+
+
+class _PagedEntities:
+    """
+    Fake of paged entities API endpoint serving `total` entities. The pages are either raw JSON or the models
+    of the generated client deserialized with `_check_return_type=False` - their metadata are plain dicts.
+    """
+
+    def __init__(self, total: int, report_total_pages: bool = True, as_models: bool = False) -> None:
+        self.total = total
+        self.report_total_pages = report_total_pages
+        self.as_models = as_models
+        self.requested_pages: list[int] = []
+        self.threads: set[int] = set()
+        self._lock = threading.Lock()
+
+    def __call__(self, page: int, size: int, meta_include: Optional[list[str]] = None) -> Any:
+        with self._lock:
+            self.requested_pages.append(page)
+            self.threads.add(threading.get_ident())
+        # later pages are faster, so that they complete out of order
+        time.sleep(0.01 / (page + 1))
+        data = [
+            {"id": str(i), "type": "metric", "attributes": {"content": {"maql": "SELECT 1"}}}
+            for i in range(page * size, min((page + 1) * size, self.total))
+        ]
+        result: dict[str, Any] = {"data": data, "included": [{"page": page}], "links": {"self": "/"}}
+        if meta_include is not None and self.report_total_pages:
+            result["meta"] = {"page": {"totalPages": -(-self.total // size), "number": page, "size": size}}
+        if not self.as_models:
+            return result
+        # the included entities are not part of the metrics listing; keep them to check the order of pages
+        included = result.pop("included")
+        response = mock.Mock(data=json.dumps(result).encode(), getheader=lambda name, default=None: "application/json")
+        model = ApiClient().deserialize(response, (JsonApiMetricOutList,), False)
+        model["included"] = included
+        return model
+
+
+@pytest.mark.parametrize("total", [0, 5, 10, 23])
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+@pytest.mark.parametrize("report_total_pages", [True, False])
+@pytest.mark.parametrize("as_models", [False, True])
+def test_load_all_entities(total, max_concurrency, report_total_pages, as_models):
+    get_page = _PagedEntities(total, report_total_pages, as_models)
+    entities = load_all_entities(functools.partial(get_page), page_size=5, max_concurrency=max_concurrency)
+
+    assert [e["id"] for e in entities.data] == [str(i) for i in range(total)]
+    assert [i["page"] for i in entities.included] == sorted(get_page.requested_pages)
+    # a page is never requested twice
+    assert len(set(get_page.requested_pages)) == len(get_page.requested_pages)
+
+
+@pytest.mark.parametrize("as_models", [False, True])
+def test_load_all_entities_concurrently(as_models):
+    get_page = _PagedEntities(100, as_models=as_models)
+    load_all_entities(functools.partial(get_page), page_size=5, max_concurrency=4)
+
+    assert sorted(get_page.requested_pages) == list(range(20))
+    assert len(get_page.threads) > 1
+
+
+def test_incremental_layout_folder_store(tmp_path):
+    folder = IncrementalLayoutFolder(tmp_path / "objects")
+    folder.store({"a": {"id": "a", "title": "A"}, "b": {"id": "b", "title": "B"}})
+    mtime_a = (tmp_path / "objects" / "a.yaml").stat().st_mtime_ns
+
+    time.sleep(0.01)
+    folder.store({"a": {"title": "A", "id": "a"}, "c": {"id": "c", "title": "C"}})
+
+    assert sorted(p.name for p in (tmp_path / "objects").glob("*.yaml")) == ["a.yaml", "c.yaml"]
+    assert (tmp_path / "objects" / "a.yaml").stat().st_mtime_ns == mtime_a
+    assert folder.load() == {"a": {"id": "a", "title": "A"}, "c": {"id": "c", "title": "C"}}
+
+
+def test_incremental_layout_folder_rewrites_modified_file(tmp_path):
+    folder = IncrementalLayoutFolder(tmp_path)
+    folder.store({"a": {"id": "a", "title": "A"}})
+
+    write_layout_to_file(tmp_path / "a.yaml", {"id": "a", "title": "Changed"})
+    assert folder.load() == {"a": {"id": "a", "title": "Changed"}}
+
+    folder.store({"a": {"id": "a", "title": "A"}})
+    assert folder.load() == {"a": {"id": "a", "title": "A"}}
+
+
+def test_incremental_layout_folder_load_uses_cache(tmp_path, monkeypatch):
+    folder = IncrementalLayoutFolder(tmp_path)
+    folder.store({"a": {"id": "a"}, "b": {"id": "b"}})
+    assert folder.load() == {"a": {"id": "a"}, "b": {"id": "b"}}
+
+    parsed = []
+    parse_layout = gooddata_sdk.utils._parse_layout
+    monkeypatch.setattr(gooddata_sdk.utils, "_parse_layout", lambda *args: parsed.append(args) or parse_layout(*args))
+
+    assert folder.load() == {"a": {"id": "a"}, "b": {"id": "b"}}
+    assert parsed == []
+
+    write_layout_to_file(tmp_path / "b.yaml", {"id": "b", "title": "B"})
+    assert folder.load() == {"a": {"id": "a"}, "b": {"id": "b", "title": "B"}}
+    assert len(parsed) == 1
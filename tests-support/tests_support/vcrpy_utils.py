@@ -1,12 +1,17 @@
 # (C) 2022 GoodData Corporation
 from __future__ import annotations
 
+import contextlib
+import functools
 import json
+import threading
 import typing
 from json import JSONDecodeError
 from typing import Any, Optional
 
+import urllib3.connectionpool
 import vcr
+import vcr.patch
 import yaml
 
 VCR_MATCH_ON = ("method", "scheme", "host", "port", "path", "query", "body")
@@ -14,8 +19,38 @@ NON_STATIC_HEADERS = ["DATE", "X-GDC-TRACE-ID"]
 HEADERS_STR = "headers"
 PLACEHOLDER = ["PLACEHOLDER"]
 
+# vcrpy un-patches the connection classes process-wide while it creates the real connection behind a stubbed one.
+# Connections created by other threads in the meantime (e.g. result pages read in parallel) bypass the cassette.
+_vcr_patch_lock = threading.RLock()
+
+
+def _serialize_vcr_patching() -> None:
+    if getattr(vcr.patch.force_reset, "_gd_serialized", False):
+        return
+
+    force_reset = vcr.patch.force_reset
+
+    @contextlib.contextmanager
+    def serialized_force_reset() -> typing.Iterator[None]:
+        with _vcr_patch_lock, force_reset():
+            yield
+
+    serialized_force_reset._gd_serialized = True  # type: ignore[attr-defined]
+    vcr.patch.force_reset = serialized_force_reset
+
+    for pool_class in (urllib3.connectionpool.HTTPConnectionPool, urllib3.connectionpool.HTTPSConnectionPool):
+        new_conn = pool_class.__dict__["_new_conn"]
+
+        @functools.wraps(new_conn)
+        def serialized_new_conn(pool: Any, _new_conn: Any = new_conn) -> Any:
+            with _vcr_patch_lock:
+                return _new_conn(pool)
+
+        pool_class._new_conn = serialized_new_conn  # type: ignore[method-assign]
+
 
 def get_vcr() -> vcr.VCR:
+    _serialize_vcr_patching()
     gd_vcr = vcr.VCR(
         filter_headers=["authorization", "user-agent"],
         match_on=VCR_MATCH_ON,